@@ -10,6 +10,10 @@ import asyncio
 import sys
 import os
 import logging
+import tempfile
+import threading
+from dataclasses import replace
+from functools import cached_property
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
@@ -43,8 +47,16 @@ try:
     from .utils.secure_config import SecureConfigManager
     from .core.concurrent_processor import ConcurrentPlaylistProcessor, ConcurrentProcessingResult
     from .core.job_manager import JobManager, JobStatus, JobItemStatus
+    from .core.transcript_cache import TranscriptCache
+    from .core.response_cache import ResponseCache
+    from .core.quota_usage import QuotaUsageStore
+    from .core.pacing import ModelQuotas
+    from .core.playlist_manifest import PlaylistManifestStore
     from .core.exporters import ExportManager
-    from .core.models import RefinementStyle, GeminiModels
+    from .core.pipeline import Pipeline, PipelineStage
+    from .core.output_stream import MemoryStream
+    from .core.retry import ErrorCode
+    from .core.models import RefinementStyle, RefinementMode, ContextMode, GeminiModels, ProcessingConfig, ProcessingMode, ProcessingPrompts
     
 except ImportError as e:
     print(f"Error importing required modules: {e}")
@@ -87,6 +99,14 @@ class CLIError(Exception):
     pass
 
 
+# Refinement styles offered by ``process --style``
+CLI_STYLES = {
+    'summary': RefinementStyle.SUMMARY,
+    'detailed': RefinementStyle.BALANCED_DETAILED,
+    'educational': RefinementStyle.EDUCATIONAL,
+}
+
+
 class YTECli:
     """Main CLI application class."""
     
@@ -98,6 +118,29 @@ class YTECli:
         self.export_manager = ExportManager()
         self.processor = None
     
+    # The SQLite stores below are opened, and evicted, on first use only, so
+    # commands such as --help, setup and --dry-run never touch them
+    
+    @cached_property
+    def transcript_cache(self) -> TranscriptCache:
+        """Transcript cache shared by the processing commands."""
+        return TranscriptCache()
+    
+    @cached_property
+    def response_cache(self) -> ResponseCache:
+        """Gemini response cache shared by the refining commands."""
+        return ResponseCache()
+    
+    @cached_property
+    def gemini_quotas(self) -> ModelQuotas:
+        """Per-model Gemini quotas with daily usage kept across runs."""
+        return ModelQuotas(usage_store=QuotaUsageStore())
+    
+    @cached_property
+    def playlist_store(self) -> PlaylistManifestStore:
+        """Playlist manifests used for incremental playlist runs."""
+        return PlaylistManifestStore()
+    
     def setup_logging(self, verbose: bool = False, quiet: bool = False) -> None:
         """Setup logging configuration based on CLI options."""
         if quiet:
@@ -227,12 +270,28 @@ def cli(ctx, verbose, quiet, version):
 @click.option('--style', '-s', type=click.Choice(['summary', 'detailed', 'educational', 'technical']), 
               help='Refinement style')
 @click.option('--workers', '-w', default=3, type=int, help='Number of concurrent workers')
-@click.option('--chunk-size', default=3000, type=int, help='Text chunk size for processing')
+@click.option('--chunk-size', default=4000, type=int, help='Estimated transcript tokens per Gemini request')
 @click.option('--model', type=click.Choice(['gemini-1.5-flash', 'gemini-1.5-pro']), 
               help='Gemini model to use')
+@click.option('--no-cache', is_flag=True, help='Ignore cached transcripts and Gemini responses and fetch everything again')
+@click.option('--sync', is_flag=True, help='Only process playlist videos added since the last successful run')
+@click.option('--refine', is_flag=True, help='Refine transcripts with Gemini before exporting')
+@click.option('--map-reduce', 'map_reduce', is_flag=True,
+              help="Refine a long video's chunks in parallel and merge the seams (with --refine)")
+@click.option('--context', 'context_mode', type=click.Choice([mode.value for mode in ContextMode]),
+              help='What each chunk carries over from earlier responses (default depends on --style)')
+@click.option('--route-models', 'route_models', is_flag=True,
+              help='Spread requests over a cascade of Gemini models and fail over on rate limits (with --refine)')
+@click.option('--rpm', 'requests_per_minute', type=click.IntRange(min=1),
+              help="Gemini requests per minute of your API tier (default: GEMINI_REQUESTS_PER_MINUTE or the model's free-tier limit)")
+@click.option('--tpm', 'tokens_per_minute', type=click.IntRange(min=1),
+              help="Gemini tokens per minute of your API tier (default: GEMINI_TOKENS_PER_MINUTE or the model's free-tier limit)")
+@click.option('--rpd', 'requests_per_day', type=click.IntRange(min=1),
+              help='Stop refining after this many Gemini requests a day (default: GEMINI_REQUESTS_PER_DAY or no limit)')
 @click.option('--dry-run', is_flag=True, help='Show what would be processed without actually processing')
 @click.pass_context
-def process(ctx, url, output, formats, language, style, workers, chunk_size, model, dry_run):
+def process(ctx, url, output, formats, language, style, workers, chunk_size, model, no_cache, sync, refine, map_reduce,
+            context_mode, route_models, requests_per_minute, tokens_per_minute, requests_per_day, dry_run):
     """Process a YouTube playlist or video and generate formatted transcripts."""
     
     app = ctx.obj['app']
@@ -262,16 +321,81 @@ def process(ctx, url, output, formats, language, style, workers, chunk_size, mod
         console.print(f"Workers: {workers}")
         console.print(f"Language: {language or 'Default from config'}")
         console.print(f"Style: {style or 'Default from config'}")
+        console.print(f"Transcript and response cache: {'disabled' if no_cache else 'enabled'}")
+        console.print(f"Sync mode: {'enabled' if sync else 'disabled'}")
+        console.print(f"Gemini refinement: {'enabled' if refine else 'disabled'}")
+        if refine:
+            console.print(f"Chunk refinement: {'parallel map-reduce' if map_reduce else 'sequential'}")
+            if not map_reduce:
+                console.print(f"Context carry-over: {context_mode or 'default for style'}")
+            console.print(f"Model routing: {'cascade with failover' if route_models else 'configured model only'}")
+            console.print(f"Gemini quotas: {requests_per_minute or 'default'} RPM, {tokens_per_minute or 'default'} TPM, "
+                          f"{requests_per_day or 'no'} daily limit")
         return
     
     # Run the actual processing
-    asyncio.run(_process_async(app, url, output_path, valid_formats, language, style, workers, chunk_size, model, quiet))
+    asyncio.run(_process_async(app, url, output_path, valid_formats, language, style, workers, chunk_size, model, quiet,
+                               use_cache=not no_cache, sync=sync, refine=refine, map_reduce=map_reduce,
+                               context_mode=context_mode, route_models=route_models,
+                               quotas=(requests_per_minute, tokens_per_minute, requests_per_day)))
+
+
+def _create_gemini_processor(app, language, style, chunk_size, model, use_cache: bool = True,
+                             map_reduce: bool = False, context_mode: Optional[str] = None,
+                             route_models: bool = False, quotas: Tuple[Optional[int], ...] = (None, None, None)):
+    """Build a Gemini processor from CLI options and the stored configuration.
+    
+    Without ``use_cache`` cached responses are ignored, but fresh ones still
+    replace them in the response cache. ``quotas`` holds the requests per
+    minute, tokens per minute and requests per day given on the command
+    line; missing ones come from the stored configuration.
+    """
+    
+    # Imported lazily so the CLI works without the Gemini SDK unless refining
+    from .core.gemini_processor import GeminiProcessor
+    
+    api_key = app.config_manager.get_api_key()
+    if not api_key:
+        raise CLIError("Gemini API key not configured. Run 'setup' to add one.")
+    
+    requests_per_minute, tokens_per_minute, requests_per_day = quotas
+    config = ProcessingConfig(
+        mode=ProcessingMode.YOUTUBE_URL,
+        source_path="",
+        output_language=language or app.config_manager.get_language(),
+        refinement_style=CLI_STYLES.get(style) or app.config_manager.get_refinement_style(),
+        chunk_size=chunk_size,
+        gemini_model=model or app.config_manager.get_gemini_model(),
+        api_key=api_key,
+        transcript_output_file="",
+        gemini_output_file="",
+        refinement_mode=RefinementMode.MAP_REDUCE if map_reduce else RefinementMode.SEQUENTIAL,
+        context_mode=ContextMode(context_mode) if context_mode else None,
+        model_routing=route_models,
+        requests_per_minute=requests_per_minute or app.config_manager.get_requests_per_minute(),
+        tokens_per_minute=tokens_per_minute or app.config_manager.get_tokens_per_minute(),
+        requests_per_day=requests_per_day or app.config_manager.get_requests_per_day()
+    )
+    return GeminiProcessor(config, response_cache=app.response_cache, bypass_cache=not use_cache,
+                           quotas=app.gemini_quotas)
 
 
-async def _process_async(app, url, output_path, formats, language, style, workers, chunk_size, model, quiet):
-    """Async wrapper for processing."""
+async def _process_async(app, url, output_path, formats, language, style, workers, chunk_size, model, quiet,
+                         use_cache: bool = True, sync: bool = False, refine: bool = False,
+                         map_reduce: bool = False, context_mode: Optional[str] = None,
+                         route_models: bool = False, quotas: Tuple[Optional[int], ...] = (None, None, None)):
+    """Async wrapper for processing.
+    
+    Fetching, optional Gemini refinement and rendering run as pipeline
+    stages, so a video is refined while later ones are still being fetched.
+    """
     
     try:
+        gemini = _create_gemini_processor(app, language, style, chunk_size, model, use_cache, map_reduce,
+                                          context_mode, route_models, quotas) \
+            if refine else None
+        
+
         # Setup progress display
         with Progress(
             SpinnerColumn(),
@@ -289,73 +413,186 @@ async def _process_async(app, url, output_path, formats, language, style, worker
             # Initialize processor
             processor = ConcurrentPlaylistProcessor(
                 max_workers=workers,
-                rate_limit=10.0  # Default rate limit
+                rate_limit=10.0,  # Default rate limit
+                cache=app.transcript_cache if use_cache else None,
+                playlist_store=app.playlist_store
             )
             
+            # Videos in the playlist, as far as the processor knows yet
+            playlist_total = 0
+            
             # Progress callback to update the progress bar
             def progress_callback(completed: int, total: int, current_task: Optional[str] = None):
+                nonlocal playlist_total
+                playlist_total = total
                 if total > 0:
                     percentage = (completed / total) * 100
                     progress.update(task, completed=percentage)
                     if current_task and not quiet:
                         progress.update(task, description=f"Processing: {current_task}")
             
-            # Start processing
-            results = await processor.process_playlist(
-                playlist_url=url,
-                progress_callback=progress_callback
-            )
+            # Render each result into per-format spool files as it arrives,
+            # so finished transcripts are not held in memory until the end
+            spools = {format_name: tempfile.SpooledTemporaryFile(mode='w+') for format_name in formats}
+            for format_name, spool in spools.items():
+                spool.write(_transcript_header(format_name))
             
-            # Check if processing was successful
-            if not results:
-                console.print("[red]✗ Error:[/red] No results returned from processing")
-                return
+            total_results = 0
+            successful_count = 0
+            refine_failures = 0
+            quota_message: Optional[str] = None
+            refine_lock = threading.Lock()
+            error_summary = {}
+            next_number = 1
             
-            # Count successful results
-            successful_results = [r for r in results if r.success and r.transcript_video]
+            def video_chunk(result: ConcurrentProcessingResult) -> Optional[str]:
+                """Get the text Gemini refines for a result, None if it has no transcript."""
+                if not (result.success and result.transcript_video and result.transcript_video.content):
+                    return None
+                return f"Video URL: {result.task.video_url}\n{result.transcript_video.content}"
+            
+            def refine_results(group: List[ConcurrentProcessingResult]) -> List[ConcurrentProcessingResult]:
+                """Replace fetched transcripts with their Gemini refinement, one request per group."""
+                nonlocal refine_failures, quota_message, next_number
+                chunks = [video_chunk(result) for result in group]
+                if None in chunks:
+                    # Results without a transcript are never packed with others
+                    return group
+                with refine_lock:
+                    if quota_message is not None:
+                        # Gemini would reject these videos too; export them unrefined
+                        refine_failures += len(group)
+                        return group
+                    first_number = next_number
+                    next_number += len(group)
+                
+                label = group[0].task.title or group[0].task.video_id
+                if len(group) > 1:
+                    label = f"{label} and {len(group) - 1} more"
+                
+                def show_streamed(chars: int) -> None:
+                    if not quiet:
+                        progress.update(task, description=f"Refining: {label} ({chars:,} chars)")
+                
+                outcomes = gemini.refine_videos_to_streams(
+                    [MemoryStream(show_streamed) for _ in group], chunks,
+                    ProcessingPrompts.get_prompt(gemini.config.refinement_style), gemini.config.output_language,
+                    chunk_size, first_number, max(playlist_total, first_number + len(group) - 1)
+                )
+                refined = []
+                for result, outcome in zip(group, outcomes):
+                    if not outcome.success or not outcome.content:
+                        # Keep the raw transcript rather than losing the video
+                        with refine_lock:
+                            refine_failures += 1
+                            if outcome.error_code == ErrorCode.QUOTA_EXHAUSTED.value:
+                                quota_message = quota_message or outcome.error_message
+                        logger.warning(f"Refinement failed for {result.task.video_id}: {outcome.error_message}")
+                        refined.append(result)
+                    else:
+                        refined.append(replace(
+                            result, transcript_video=replace(result.transcript_video, content=outcome.content)
+                        ))
+                return refined
             
-            if not successful_results:
-                console.print("[red]✗ Error:[/red] No transcripts were successfully processed")
-                # Show error summary
-                error_summary = {}
-                for result in results:
-                    if result.error_message:
+            def render_results(group: List[ConcurrentProcessingResult]) -> List[ConcurrentProcessingResult]:
+                """Append finished results to every format, in playlist order."""
+                nonlocal total_results, successful_count
+                for result in group:
+                    total_results += 1
+                    if result.success and result.transcript_video and result.transcript_video.content:
+                        successful_count += 1
+                        for format_name, spool in spools.items():
+                            spool.write(_transcript_section(successful_count, result, format_name))
+                    elif result.error_message:
                         error_type = result.error_message.split(':')[0] if ':' in result.error_message else 'Unknown Error'
                         error_summary[error_type] = error_summary.get(error_type, 0) + 1
-                
-                if error_summary:
-                    console.print("\nError Summary:")
-                    for error_type, count in error_summary.items():
-                        console.print(f"  {error_type}: {count}")
-                return
+                return group
             
-            # Export results to different formats
-            export_manager = app.export_manager
-            export_successful = False
+            results = processor.process_playlist_stream(
+                playlist_url=url,
+                progress_callback=progress_callback,
+                sync=sync
+            )
+            stages = [PipelineStage("render", render_results, ordered=True)]
+            if gemini is not None:
+                # Runs of short videos share a Gemini request
+                groups = gemini.pack_video_stream(results, video_chunk, chunk_size)
+                stages.insert(0, PipelineStage("refine", refine_results, workers=gemini.max_concurrent_videos, blocking=True))
+            else:
+                groups = ([result] async for result in results)
             
-            for format_name in formats:
-                try:
-                    # Combine all successful transcripts
-                    combined_content = _combine_transcripts(successful_results, format_name)
-                    
-                    if combined_content:
-                        # Generate output filename
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        filename = f"playlist_transcripts_{timestamp}.{format_name}"
-                        output_file = output_path / filename
+            try:
+                await Pipeline(stages).run(groups)
+                
+                if gemini is not None and not quiet and app.response_cache.hits:
+                    console.print(f"Reused {app.response_cache.hits} cached Gemini response(s)")
+                if gemini is not None and not quiet:
+                    usage = gemini.rate_limiter.get_statistics()
+                    daily_limit = f"/{usage['requests_per_day']}" if usage["requests_per_day"] else ""
+                    console.print(f"Gemini {gemini.model_name}: {usage['requests_today']}{daily_limit} "
+                                  "requests used today")
+                    if gemini.router is not None:
+                        for model_name, stats in gemini.router.get_statistics().items():
+                            latency = f", {stats['average_latency']:.1f}s average" if stats['average_latency'] else ""
+                            console.print(f"Gemini {model_name}: {stats['successes']}/{stats['requests']} requests "
+                                          f"succeeded{latency}")
+                if quota_message:
+                    console.print(f"[yellow]Warning:[/yellow] {quota_message}; refinement stopped")
+                if refine_failures:
+                    console.print(f"[yellow]Warning:[/yellow] {refine_failures} video(s) could not be refined; raw transcripts were exported")
+                
+                # Check if processing was successful
+                if not total_results:
+                    if sync:
+                        console.print("[green]✓ Up to date:[/green] No new videos since the last sync")
+                    else:
+                        console.print("[red]✗ Error:[/red] No results returned from processing")
+                    return
+                
+                if not successful_count:
+                    console.print("[red]✗ Error:[/red] No transcripts were successfully processed")
+                    # Show error summary
+                    if error_summary:
+                        console.print("\nError Summary:")
+                        for error_type, count in error_summary.items():
+                            console.print(f"  {error_type}: {count}")
+                    return
+                
+                # Export results to different formats
+                export_manager = app.export_manager
+                export_successful = False
+                
+                for format_name, spool in spools.items():
+                    try:
+                        spool.write(_transcript_footer(format_name))
+                        spool.seek(0)
+                        combined_content = spool.read()
+                        
+                        if combined_content:
+                            # Generate output filename
+                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                            filename = f"playlist_transcripts_{timestamp}.{format_name}"
+                            output_file = output_path / filename
+                            
+                            # Export content
+                            if export_manager.export_content(combined_content, format_name, output_file):
+                                export_successful = True
+                            else:
+                                console.print(f"[yellow]Warning:[/yellow] Failed to export {format_name} format")
                         
-                        # Export content
-                        if export_manager.export_content(combined_content, format_name, output_file):
-                            export_successful = True
-                        else:
-                            console.print(f"[yellow]Warning:[/yellow] Failed to export {format_name} format")
-                    
-                except Exception as e:
-                    console.print(f"[yellow]Warning:[/yellow] Error exporting {format_name}: {str(e)}")
+                    except Exception as e:
+                        console.print(f"[yellow]Warning:[/yellow] Error exporting {format_name}: {str(e)}")
+                
+            finally:
+                for spool in spools.values():
+                    spool.close()
+                if gemini is not None:
+                    gemini.close()
             
             if export_successful:
                 console.print(f"\n[green]✓ Success![/green] Files saved to: {output_path.absolute()}")
-                console.print(f"Processed {len(successful_results)} out of {len(results)} videos")
+                console.print(f"Processed {successful_count} out of {total_results} videos")
                 
                 # Show generated files
                 if not quiet:
@@ -373,61 +610,73 @@ async def _process_async(app, url, output_path, formats, language, style, worker
 def _combine_transcripts(results: List[ConcurrentProcessingResult], format_name: str) -> str:
     """Combine transcript results into a single document."""
     
+    content_parts = [_transcript_header(format_name)]
+    
+    for i, result in enumerate(results, 1):
+        if result.transcript_video and result.transcript_video.content:
+            content_parts.append(_transcript_section(i, result, format_name))
+    
+    content_parts.append(_transcript_footer(format_name))
+    return "".join(content_parts)
+
+
+def _transcript_header(format_name: str) -> str:
+    """Opening of a combined transcript document."""
+    
     if format_name == 'markdown':
-        content_parts = ["# YouTube Playlist Transcripts\n\n"]
-        
-        for i, result in enumerate(results, 1):
-            if result.transcript_video and result.transcript_video.content:
-                title = result.transcript_video.title or f"Video {i}"
-                video_id = result.task.video_id or "unknown"
-                
-                content_parts.append(f"## {i}. {title}\n\n")
-                content_parts.append(f"**Video ID:** {video_id}\n")
-                content_parts.append(f"**URL:** {result.task.video_url}\n\n")
-                content_parts.append("### Transcript\n\n")
-                content_parts.append(result.transcript_video.content)
-                content_parts.append("\n\n---\n\n")
-        
-        return "".join(content_parts)
+        return "# YouTube Playlist Transcripts\n\n"
+    elif format_name == 'html':
+        return "<html><head><title>YouTube Playlist Transcripts</title></head><body><h1>YouTube Playlist Transcripts</h1>"
+    else:
+        # For other formats, use plain text
+        return "YouTube Playlist Transcripts\n\n"
+
+
+def _transcript_section(index: int, result: ConcurrentProcessingResult, format_name: str) -> str:
+    """Render one transcript result as a section of the combined document."""
+    
+    title = result.transcript_video.title or f"Video {index}"
+    video_id = result.task.video_id or "unknown"
+    
+    if format_name == 'markdown':
+        return (
+            f"## {index}. {title}\n\n"
+            f"**Video ID:** {video_id}\n"
+            f"**URL:** {result.task.video_url}\n\n"
+            "### Transcript\n\n"
+            f"{result.transcript_video.content}"
+            "\n\n---\n\n"
+        )
     
     elif format_name == 'html':
-        content_parts = ["<html><head><title>YouTube Playlist Transcripts</title></head><body>"]
-        content_parts.append("<h1>YouTube Playlist Transcripts</h1>")
-        
-        for i, result in enumerate(results, 1):
-            if result.transcript_video and result.transcript_video.content:
-                title = result.transcript_video.title or f"Video {i}"
-                video_id = result.task.video_id or "unknown"
-                
-                content_parts.append(f"<h2>{i}. {title}</h2>")
-                content_parts.append(f"<p><strong>Video ID:</strong> {video_id}</p>")
-                content_parts.append(f"<p><strong>URL:</strong> <a href='{result.task.video_url}'>{result.task.video_url}</a></p>")
-                content_parts.append("<h3>Transcript</h3>")
-                # Convert newlines to <br> for HTML
-                transcript_html = result.transcript_video.content.replace('\n', '<br>\n')
-                content_parts.append(f"<p>{transcript_html}</p>")
-                content_parts.append("<hr>")
-        
-        content_parts.append("</body></html>")
-        return "".join(content_parts)
+        # Convert newlines to <br> for HTML
+        transcript_html = result.transcript_video.content.replace('\n', '<br>\n')
+        return (
+            f"<h2>{index}. {title}</h2>"
+            f"<p><strong>Video ID:</strong> {video_id}</p>"
+            f"<p><strong>URL:</strong> <a href='{result.task.video_url}'>{result.task.video_url}</a></p>"
+            "<h3>Transcript</h3>"
+            f"<p>{transcript_html}</p>"
+            "<hr>"
+        )
     
     else:
-        # For other formats, use plain text
-        content_parts = ["YouTube Playlist Transcripts\n\n"]
-        
-        for i, result in enumerate(results, 1):
-            if result.transcript_video and result.transcript_video.content:
-                title = result.transcript_video.title or f"Video {i}"
-                video_id = result.task.video_id or "unknown"
-                
-                content_parts.append(f"{i}. {title}\n")
-                content_parts.append(f"Video ID: {video_id}\n")
-                content_parts.append(f"URL: {result.task.video_url}\n\n")
-                content_parts.append("Transcript:\n")
-                content_parts.append(result.transcript_video.content)
-                content_parts.append("\n\n" + "="*50 + "\n\n")
-        
-        return "".join(content_parts)
+        return (
+            f"{index}. {title}\n"
+            f"Video ID: {video_id}\n"
+            f"URL: {result.task.video_url}\n\n"
+            "Transcript:\n"
+            f"{result.transcript_video.content}"
+            "\n\n" + "="*50 + "\n\n"
+        )
+
+
+def _transcript_footer(format_name: str) -> str:
+    """Closing of a combined transcript document."""
+    
+    if format_name == 'html':
+        return "</body></html>"
+    return ""
 
 
 def _show_generated_files(output_path: Path, formats: List[str]) -> None:
@@ -601,7 +850,7 @@ def _show_basic_config(app: YTECli) -> None:
     
     table.add_row("Language", config_data.get('language', 'English'), "Environment/Default")
     table.add_row("Refinement Style", str(config_data.get('refinement_style', 'Summary')), "Environment/Default")
-    table.add_row("Chunk Size", str(config_data.get('chunk_size', 3000)), "Environment/Default")
+    table.add_row("Chunk Size", str(config_data.get('chunk_size', 4000)), "Environment/Default")
     table.add_row("Gemini Model", config_data.get('gemini_model', 'Default'), "Environment/Default")
     
     api_key = config_data.get('api_key', '')
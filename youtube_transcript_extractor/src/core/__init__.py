@@ -3,14 +3,14 @@ YouTube Transcript Extractor - Core package.
 """
 
 from .models import (
-    ProcessingConfig, ProcessingMode, RefinementStyle, GeminiModels,
+    ProcessingConfig, ProcessingMode, RefinementStyle, RefinementMode, ContextMode, GeminiModels,
     ProcessingPrompts, TranscriptVideo, ProcessingProgress, ProcessingResult
 )
 from .transcript_fetcher import TranscriptFetcher
 from .gemini_processor import GeminiProcessor
 
 __all__ = [
-    'ProcessingConfig', 'ProcessingMode', 'RefinementStyle', 'GeminiModels',
+    'ProcessingConfig', 'ProcessingMode', 'RefinementStyle', 'RefinementMode', 'ContextMode', 'GeminiModels',
     'ProcessingPrompts', 'TranscriptVideo', 'ProcessingProgress', 'ProcessingResult',
     'TranscriptFetcher', 'GeminiProcessor'
 ]
@@ -0,0 +1,239 @@
+"""
+Native asyncio transcript transport built on a pooled aiohttp session.
+
+This speaks the same protocol as ``youtube_transcript_api`` (watch page ->
+innertube player -> timedtext XML) but never blocks a thread, so concurrency
+is bounded by open sockets instead of worker threads.
+"""
+
+import re
+import logging
+from dataclasses import dataclass
+from html import unescape
+from typing import List, Optional, Sequence, Tuple, Dict, Any
+from xml.etree import ElementTree
+
+
+WATCH_URL = "https://www.youtube.com/watch?v={video_id}"
+INNERTUBE_API_URL = "https://www.youtube.com/youtubei/v1/player?key={api_key}"
+INNERTUBE_CONTEXT = {"client": {"clientName": "ANDROID", "clientVersion": "20.10.38"}}
+
+_API_KEY_PATTERN = re.compile(r'"INNERTUBE_API_KEY":\s*"([a-zA-Z0-9_-]+)"')
+_CONSENT_PATTERN = re.compile(r'name="v" value="(.*?)"')
+_HTML_TAG_PATTERN = re.compile(r"<[^>]*>")
+
+
+class TransportError(Exception):
+    """Raised when the async transport cannot fetch a transcript."""
+
+    def __init__(self, message: str, status: Optional[int] = None, blocked: bool = False):
+        super().__init__(message)
+        self.status = status
+        self.blocked = blocked
+
+
+class NoTranscriptAvailableError(TransportError):
+    """Raised when a video has no caption tracks at all."""
+
+
+class VideoUnavailableError(TransportError):
+    """Raised when a video is private, removed or otherwise unplayable."""
+
+
+class PoTokenRequiredError(TransportError):
+    """Raised when a caption track can only be fetched with a PO token."""
+
+
+@dataclass
+class CaptionTrack:
+    """A caption track advertised by the innertube player response."""
+    video_id: str
+    base_url: str
+    language: str
+    language_code: str
+    is_generated: bool
+
+    @property
+    def kind(self) -> str:
+        """Transcript kind used for cache keys."""
+        return "generated" if self.is_generated else "manual"
+
+
+class AsyncTranscriptTransport:
+    """Lists and fetches timedtext transcripts over an aiohttp session."""
+
+    def __init__(self, session: Any):
+        """Initialize the transport.
+
+        Args:
+            session: Open ``aiohttp.ClientSession`` used for every request
+        """
+        self._session = session
+        self.logger = logging.getLogger(__name__)
+
+    async def _request_text(self, method: str, url: str, video_id: str, **kwargs: Any) -> str:
+        """Issue a request and return the body, mapping HTTP failures to TransportError."""
+        async with self._session.request(method, url, **kwargs) as response:
+            if response.status == 429:
+                raise TransportError(
+                    f"YouTube is blocking requests (HTTP 429) for {video_id}",
+                    status=429,
+                    blocked=True
+                )
+            if response.status >= 400:
+                raise TransportError(
+                    f"HTTP {response.status} while fetching {video_id}",
+                    status=response.status
+                )
+            return await response.text()
+
+    async def _fetch_watch_html(self, video_id: str) -> str:
+        """Fetch the watch page, accepting the consent interstitial if shown."""
+        url = WATCH_URL.format(video_id=video_id)
+        html = unescape(await self._request_text("GET", url, video_id))
+
+        if 'action="https://consent.youtube.com/s"' in html:
+            match = _CONSENT_PATTERN.search(html)
+            if match is None:
+                raise TransportError(f"Could not accept consent page for {video_id}")
+            self._session.cookie_jar.update_cookies({"CONSENT": "YES+" + match.group(1)})
+            html = unescape(await self._request_text("GET", url, video_id))
+            if 'action="https://consent.youtube.com/s"' in html:
+                raise TransportError(f"Could not accept consent page for {video_id}")
+
+        return html
+
+    async def _fetch_captions_json(self, video_id: str) -> Dict[str, Any]:
+        """Fetch the caption track list for a video."""
+        html = await self._fetch_watch_html(video_id)
+
+        match = _API_KEY_PATTERN.search(html)
+        if not match:
+            if 'class="g-recaptcha"' in html:
+                raise TransportError(
+                    f"YouTube is blocking requests from this IP for {video_id}",
+                    blocked=True
+                )
+            raise TransportError(f"Could not parse watch page for {video_id}")
+
+        async with self._session.post(
+            INNERTUBE_API_URL.format(api_key=match.group(1)),
+            json={"context": INNERTUBE_CONTEXT, "videoId": video_id}
+        ) as response:
+            if response.status == 429:
+                raise TransportError(
+                    f"YouTube is blocking requests (HTTP 429) for {video_id}",
+                    status=429,
+                    blocked=True
+                )
+            if response.status >= 400:
+                raise TransportError(
+                    f"HTTP {response.status} from player API for {video_id}",
+                    status=response.status
+                )
+            data = await response.json(content_type=None)
+
+        playability = data.get("playabilityStatus") or {}
+        status = playability.get("status")
+        if status not in (None, "OK"):
+            reason = playability.get("reason") or status
+            if "not a bot" in str(reason):
+                raise TransportError(
+                    f"YouTube is blocking requests from this IP for {video_id}",
+                    blocked=True
+                )
+            raise VideoUnavailableError(f"Video {video_id} is unplayable: {reason}")
+
+        captions_json = (data.get("captions") or {}).get("playerCaptionsTracklistRenderer")
+        if not captions_json or "captionTracks" not in captions_json:
+            raise NoTranscriptAvailableError(f"No transcripts available for {video_id}")
+
+        return captions_json
+
+    async def list_transcripts(self, video_id: str) -> List[CaptionTrack]:
+        """List the caption tracks available for a video.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Caption tracks, manually created ones first
+
+        Raises:
+            TransportError: If the tracks cannot be listed
+        """
+        captions_json = await self._fetch_captions_json(video_id)
+
+        tracks = []
+        for caption in captions_json["captionTracks"]:
+            name = caption.get("name") or {}
+            language = name.get("simpleText") or "".join(
+                run.get("text", "") for run in name.get("runs", [])
+            )
+            tracks.append(CaptionTrack(
+                video_id=video_id,
+                base_url=caption["baseUrl"].replace("&fmt=srv3", ""),
+                language=language,
+                language_code=caption.get("languageCode", ""),
+                is_generated=caption.get("kind", "") == "asr"
+            ))
+
+        tracks.sort(key=lambda track: track.is_generated)
+        return tracks
+
+    async def fetch_track(self, track: CaptionTrack) -> str:
+        """Fetch and flatten the text of a caption track.
+
+        Args:
+            track: Caption track to fetch
+
+        Returns:
+            Transcript text with segments joined by spaces
+
+        Raises:
+            TransportError: If the track cannot be fetched or parsed
+        """
+        if "&exp=xpe" in track.base_url:
+            raise PoTokenRequiredError(f"Caption track for {track.video_id} requires a PO token")
+
+        raw = await self._request_text("GET", track.base_url, track.video_id)
+        try:
+            root = ElementTree.fromstring(raw)
+        except ElementTree.ParseError as e:
+            raise TransportError(f"Could not parse transcript for {track.video_id}: {e}")
+
+        segments = [
+            _HTML_TAG_PATTERN.sub("", unescape(element.text))
+            for element in root
+            if element.text is not None
+        ]
+        return " ".join(segments)
+
+    async def fetch(self, video_id: str, languages: Sequence[str] = ("en",)) -> Tuple[CaptionTrack, str]:
+        """Fetch the best transcript for a video.
+
+        Preferred languages are tried in order; otherwise the first available
+        track is used, matching the threaded fetcher's fallback.
+
+        Args:
+            video_id: YouTube video ID
+            languages: Preferred language codes in priority order
+
+        Returns:
+            Tuple of the chosen caption track and its text
+
+        Raises:
+            TransportError: If no transcript could be fetched
+        """
+        tracks = await self.list_transcripts(video_id)
+        if not tracks:
+            raise NoTranscriptAvailableError(f"No transcripts available for {video_id}")
+
+        chosen = tracks[0]
+        for language_code in languages:
+            match = next((track for track in tracks if track.language_code == language_code), None)
+            if match:
+                chosen = match
+                break
+
+        return chosen, await self.fetch_track(chosen)
@@ -4,9 +4,13 @@ High-performance concurrent transcript fetcher with rate limiting and retry logi
 
 import asyncio
 import logging
+import math
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Callable, Protocol
+from enum import Enum
+from typing import List, Dict, Any, Optional, Callable, Protocol, Deque, AsyncIterator, AsyncIterable, Iterable, Tuple, Union
 from datetime import datetime
 import time
 
@@ -17,20 +21,24 @@ except ImportError:
 
 # Import optional dependencies using the centralized system
 aiohttp, AIOHTTP_AVAILABLE = safe_import("aiohttp", "aiohttp")
-retry, TENACITY_AVAILABLE = safe_import("tenacity.retry", "tenacity")
 
 # Import Playlist for mocking support
 try:
     from pytube import Playlist  # type: ignore
 except ImportError:
     Playlist = None
-if TENACITY_AVAILABLE:
-    stop_after_attempt, _ = safe_import("tenacity.stop_after_attempt", "tenacity")
-    wait_exponential, _ = safe_import("tenacity.wait_exponential", "tenacity")
 
 from .models import TranscriptVideo
 from .transcript_fetcher import TranscriptFetcher
+from .transcript_cache import TranscriptCache
+from .playlist_manifest import PlaylistManifestStore
+from .async_transport import (
+    AsyncTranscriptTransport, TransportError, NoTranscriptAvailableError, PoTokenRequiredError, VideoUnavailableError
+)
+from .retry import RetryEngine, RetryBudget, ErrorCode, classify_error
+from .scheduler import TaskScheduler
 from .protocols import SimpleProgressCallback
+from .pipeline import ThreadedSource
 
 
 @dataclass
@@ -43,6 +51,7 @@ class ProcessingTask:
     retry_count: int = 0
     max_retries: int = 3
     created_at: datetime = field(default_factory=datetime.now)
+    deadline: Optional[float] = None  # Epoch seconds the task should start by
     
     def __post_init__(self):
         if not self.video_id:
@@ -62,6 +71,16 @@ class ConcurrentProcessingResult:
     error_message: Optional[str] = None
     processing_time: float = 0.0
     retry_count: int = 0
+    error_code: Optional[str] = None
+
+
+@dataclass
+class _ActiveBatch:
+    """Shared state of a running batch, used to add or cancel tasks mid-run."""
+    scheduler: TaskScheduler
+    results: asyncio.Queue
+    dispatched: int = 0
+    submitted: int = 0
 
 
 class RateLimiter:
@@ -100,6 +119,367 @@ class RateLimiter:
                 self.last_update = time.time()
 
 
+async def _iterate_async(items: Iterable[Any]) -> AsyncIterator[Any]:
+    """Adapt a plain iterable to an async iterator."""
+    for item in items:
+        yield item
+
+
+# Failures that mean YouTube is throttling or blocking us
+BLOCK_CODES = frozenset({ErrorCode.IP_BLOCKED, ErrorCode.RATE_LIMITED})
+
+# Failures that are still a real answer from YouTube
+ANSWERED_CODES = frozenset({ErrorCode.NO_TRANSCRIPT, ErrorCode.NOT_FOUND})
+
+
+@dataclass
+class RateChange:
+    """A single adjustment made by the adaptive rate limiter."""
+    timestamp: float
+    rate: float
+    reason: str
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Token bucket whose rate adapts with AIMD (additive increase, multiplicative decrease).
+    
+    The rate grows by ``increase_step`` after every ``increase_interval``
+    consecutive successful requests and is multiplied by ``decrease_factor``
+    whenever a block or 429-style failure is reported. Requests YouTube
+    answered without a transcript count as successes; other failures say
+    nothing about throttling and leave the rate alone.
+    """
+    
+    def __init__(
+        self,
+        rate_per_second: float = 10.0,
+        min_rate: float = 0.2,
+        max_rate: Optional[float] = None,
+        increase_step: float = 0.5,
+        increase_interval: int = 5,
+        decrease_factor: float = 0.5,
+        history_size: int = 200
+    ):
+        """Initialize adaptive rate limiter.
+        
+        Args:
+            rate_per_second: Initial requests per second
+            min_rate: Lower bound for the rate
+            max_rate: Upper bound for the rate (defaults to twice the initial rate)
+            increase_step: Requests per second added after a run of successes
+            increase_interval: Consecutive successes required before increasing
+            decrease_factor: Multiplier applied to the rate on a block signal
+            history_size: Number of rate changes kept in the history
+        """
+        super().__init__(rate_per_second)
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate_per_second * 2
+        self.increase_step = increase_step
+        self.increase_interval = max(1, increase_interval)
+        self.decrease_factor = decrease_factor
+        self.history: Deque[RateChange] = deque(maxlen=history_size)
+        self._consecutive_successes = 0
+        self.history.append(RateChange(time.time(), self.rate, "initial"))
+    
+    @property
+    def current_rate(self) -> float:
+        """Current requests-per-second rate."""
+        return self.rate
+    
+    def _set_rate(self, rate: float, reason: str) -> None:
+        """Apply a new rate within bounds and record it."""
+        rate = max(self.min_rate, min(self.max_rate, rate))
+        if rate != self.rate:
+            self.rate = rate
+            self.tokens = min(self.tokens, rate)
+            self.history.append(RateChange(time.time(), rate, reason))
+    
+    def record_success(self) -> None:
+        """Report a request that went through without throttling."""
+        self._consecutive_successes += 1
+        if self._consecutive_successes >= self.increase_interval:
+            self._consecutive_successes = 0
+            self._set_rate(self.rate + self.increase_step, "increase")
+    
+    def record_block(self) -> None:
+        """Report a block or 429-style failure.
+        
+        Cuts the rate and drains the bucket so every worker sharing this
+        limiter backs off together.
+        """
+        self._consecutive_successes = 0
+        self._set_rate(self.rate * self.decrease_factor, "block")
+        self.tokens = 0
+        self.last_update = time.time()
+    
+    def record_result(self, success: bool, error_code: Optional[ErrorCode] = None) -> None:
+        """Report the outcome of a request.
+        
+        Args:
+            success: Whether the request succeeded
+            error_code: Classification of a failed request
+        """
+        if success or error_code in ANSWERED_CODES:
+            self.record_success()
+        elif error_code in BLOCK_CODES:
+            self.record_block()
+    
+    def get_history(self) -> List[Dict[str, Any]]:
+        """Get the history of rate changes.
+        
+        Returns:
+            List of dictionaries with timestamp, rate and reason
+        """
+        return [
+            {"timestamp": change.timestamp, "rate": change.rate, "reason": change.reason}
+            for change in self.history
+        ]
+
+
+class LatencyTracker:
+    """Rolling window of recently observed request latencies."""
+    
+    def __init__(self, window_size: int = 200):
+        """Initialize latency tracker.
+        
+        Args:
+            window_size: Number of recent samples kept
+        """
+        self.samples: Deque[float] = deque(maxlen=window_size)
+    
+    def __len__(self) -> int:
+        """Number of samples in the window."""
+        return len(self.samples)
+    
+    def record(self, seconds: float) -> None:
+        """Add a latency sample.
+        
+        Args:
+            seconds: Observed request latency
+        """
+        self.samples.append(seconds)
+    
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Nearest-rank percentile of the window.
+        
+        Args:
+            percentile: Percentile between 0 and 100
+            
+        Returns:
+            Latency in seconds, or None without samples
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = max(0, math.ceil(percentile / 100 * len(ordered)) - 1)
+        return ordered[min(rank, len(ordered) - 1)]
+
+
+class CircuitState(Enum):
+    """States of the circuit breaker."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitTransition:
+    """A single state change of the circuit breaker."""
+    timestamp: float
+    state: CircuitState
+    reason: str
+
+
+class CircuitBreaker:
+    """Circuit breaker shared by every worker of a fetcher.
+    
+    While closed, requests flow freely and the outcome of the last
+    ``window_size`` requests is tracked. When the share of block signals in
+    that window reaches ``failure_threshold`` the circuit opens and every
+    worker waits out a cool-down instead of hitting YouTube on its own.
+    Afterwards the circuit is half-open: up to ``probe_count`` probe
+    requests go out at a time, and ``probe_count`` consecutive successes
+    close the circuit again. A block during probing re-opens it with a
+    doubled cool-down. Every request let through must be followed by
+    :meth:`record_result`, or by :meth:`release` if it never finished.
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        window_size: int = 20,
+        min_requests: int = 5,
+        open_duration: float = 30.0,
+        max_open_duration: float = 300.0,
+        probe_count: int = 2,
+        poll_interval: float = 0.5,
+        history_size: int = 100
+    ):
+        """Initialize circuit breaker.
+        
+        Args:
+            failure_threshold: Share of blocked requests in the window that opens the circuit
+            window_size: Number of recent request outcomes considered
+            min_requests: Outcomes required in the window before the circuit may open
+            open_duration: Initial cool-down in seconds once the circuit opens
+            max_open_duration: Upper bound for the cool-down after repeated failed probes
+            probe_count: Concurrent probes, and successes needed to close, while half-open
+            poll_interval: Longest single wait while blocked, so cancellation is noticed
+            history_size: Number of state transitions kept in the history
+        """
+        self.failure_threshold = failure_threshold
+        self.window_size = max(1, window_size)
+        self.min_requests = max(1, min_requests)
+        self.open_duration = open_duration
+        self.max_open_duration = max(open_duration, max_open_duration)
+        self.probe_count = max(1, probe_count)
+        self.poll_interval = poll_interval
+        self.state = CircuitState.CLOSED
+        self.history: Deque[CircuitTransition] = deque(maxlen=history_size)
+        self.logger = logging.getLogger(__name__)
+        
+        self._outcomes: Deque[bool] = deque(maxlen=self.window_size)
+        self._current_open_duration = open_duration
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self.trips = 0
+        self.total_open_time = 0.0
+        self.rejected_waits = 0
+        self.history.append(CircuitTransition(time.time(), self.state, "initial"))
+    
+    @property
+    def block_rate(self) -> float:
+        """Share of block signals among the recent requests."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+    
+    def _transition(self, state: CircuitState, reason: str) -> None:
+        """Move to a new state and record it."""
+        now = time.time()
+        if self.state == CircuitState.OPEN:
+            self.total_open_time += now - self._opened_at
+        if state == CircuitState.OPEN:
+            self._opened_at = now
+            self.trips += 1
+        if state != CircuitState.HALF_OPEN:
+            self._probes_in_flight = 0
+        self._probe_successes = 0
+        self.state = state
+        self.history.append(CircuitTransition(now, state, reason))
+        self.logger.info(f"Circuit breaker {state.value}: {reason}")
+    
+    def _open(self, reason: str) -> None:
+        """Open the circuit and clear the outcome window."""
+        self._outcomes.clear()
+        self._transition(CircuitState.OPEN, reason)
+    
+    async def acquire(self, should_abort: Optional[Callable[[], bool]] = None) -> bool:
+        """Wait until the circuit lets a request through.
+        
+        Args:
+            should_abort: Checked between waits; returning True stops waiting
+            
+        Returns:
+            True if the request may go ahead, False if waiting was aborted
+        """
+        waited = False
+        while True:
+            if should_abort and should_abort():
+                return False
+            
+            if self.state == CircuitState.CLOSED:
+                return True
+            
+            if self.state == CircuitState.OPEN:
+                remaining = self._opened_at + self._current_open_duration - time.time()
+                if remaining <= 0:
+                    self._transition(CircuitState.HALF_OPEN, "cool-down elapsed, probing")
+                    continue
+                wait_time = min(remaining, self.poll_interval)
+            elif self._probes_in_flight < self.probe_count:
+                self._probes_in_flight += 1
+                return True
+            else:
+                wait_time = self.poll_interval
+            
+            if not waited:
+                self.rejected_waits += 1
+                waited = True
+            await asyncio.sleep(wait_time)
+    
+    def release(self) -> None:
+        """Give back the slot of a request that ends without an outcome.
+        
+        A probe cancelled while in flight would otherwise hold its slot
+        forever and keep every later request waiting.
+        """
+        if self.state == CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+    
+    def record_result(self, success: bool, error_code: Optional[ErrorCode] = None) -> None:
+        """Report the outcome of a request let through by :meth:`acquire`.
+        
+        Only block and 429-style failures count against the circuit; other
+        failures still prove YouTube is answering.
+        
+        Args:
+            success: Whether the request succeeded
+            error_code: Classification of a failed request
+        """
+        blocked = not success and error_code in BLOCK_CODES
+        
+        if self.state == CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if blocked:
+                self._current_open_duration = min(self.max_open_duration, self._current_open_duration * 2)
+                self._open(f"probe blocked, cooling down {self._current_open_duration:.0f}s")
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.probe_count:
+                self._current_open_duration = self.open_duration
+                self._transition(CircuitState.CLOSED, "probes succeeded")
+            return
+        
+        if self.state == CircuitState.OPEN:
+            # A request that was already in flight when the circuit opened
+            return
+        
+        self._outcomes.append(not blocked)
+        if (len(self._outcomes) >= self.min_requests
+                and self.block_rate >= self.failure_threshold):
+            self._open(f"block rate {self.block_rate:.0%}, cooling down {self._current_open_duration:.0f}s")
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get circuit breaker statistics.
+        
+        Returns:
+            Dictionary with state, trip count, time spent open and waits
+        """
+        open_time = self.total_open_time
+        if self.state == CircuitState.OPEN:
+            open_time += time.time() - self._opened_at
+        return {
+            "state": self.state.value,
+            "block_rate": self.block_rate,
+            "trips": self.trips,
+            "total_open_time": open_time,
+            "rejected_waits": self.rejected_waits
+        }
+    
+    def get_history(self) -> List[Dict[str, Any]]:
+        """Get the history of state transitions.
+        
+        Returns:
+            List of dictionaries with timestamp, state and reason
+        """
+        return [
+            {"timestamp": change.timestamp, "state": change.state.value, "reason": change.reason}
+            for change in self.history
+        ]
+
+
 class ConcurrentTranscriptFetcher:
     """High-performance concurrent transcript fetcher."""
     
@@ -107,7 +487,26 @@ class ConcurrentTranscriptFetcher:
         self, 
         max_workers: int = 5, 
         rate_limit_per_second: float = 10.0,
-        enable_retry: bool = True
+        enable_retry: bool = True,
+        cache: Optional[TranscriptCache] = None,
+        executor_workers: Optional[int] = None,
+        use_async_transport: bool = True,
+        connections_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
+        adaptive_rate_limit: bool = True,
+        max_rate_per_second: Optional[float] = None,
+        retry_engine: Optional[RetryEngine] = None,
+        retry_budget_ratio: float = 0.2,
+        min_retry_budget: int = 10,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        enable_circuit_breaker: bool = True,
+        aging_rate: float = 0.1,
+        deadline_slack: float = 30.0,
+        hedge_requests: bool = False,
+        hedge_percentile: float = 95.0,
+        hedge_min_samples: int = 20,
+        hedge_min_delay: float = 0.5,
+        hedge_max_ratio: float = 0.1
     ):
         """Initialize concurrent fetcher.
         
@@ -115,41 +514,216 @@ class ConcurrentTranscriptFetcher:
             max_workers: Maximum number of concurrent workers
             rate_limit_per_second: Rate limit for API calls
             enable_retry: Whether to enable automatic retries
+            cache: Optional transcript cache checked before any network request
+            executor_workers: Size of the shared worker thread pool (defaults to max_workers)
+            use_async_transport: Fetch over the pooled aiohttp session when available,
+                falling back to the threaded youtube_transcript_api path
+            connections_per_host: Per-host connection limit of the pooled session
+            keepalive_timeout: Seconds an idle keep-alive connection stays open
+            adaptive_rate_limit: Adapt the rate to YouTube's block signals, starting
+                from rate_limit_per_second
+            max_rate_per_second: Upper bound for the adaptive rate
+            retry_engine: Retry engine deciding which failures are retried
+            retry_budget_ratio: Retries each batch may spend per video
+            min_retry_budget: Retries each batch may always spend
+            circuit_breaker: Circuit breaker shared by all workers (a default
+                one is created when enabled)
+            enable_circuit_breaker: Pause every worker while YouTube is blocking
+            aging_rate: Priority a queued task gains per second of waiting
+            deadline_slack: Seconds before its deadline a task jumps the queue
+            hedge_requests: Send a duplicate request when a fetch runs unusually long
+            hedge_percentile: Latency percentile of recent fetches after which to hedge
+            hedge_min_samples: Latency samples required before hedging starts
+            hedge_min_delay: Never hedge sooner than this many seconds
+            hedge_max_ratio: Maximum share of requests that may be hedged
         """
         self.max_workers = max_workers
-        self.rate_limiter = RateLimiter(rate_limit_per_second)
+        self.executor_workers = executor_workers or max_workers
+        self.rate_limiter: RateLimiter
+        if adaptive_rate_limit:
+            self.rate_limiter = AdaptiveRateLimiter(rate_limit_per_second, max_rate=max_rate_per_second)
+        else:
+            self.rate_limiter = RateLimiter(rate_limit_per_second)
         self.enable_retry = enable_retry
+        self.retry_engine = retry_engine or RetryEngine()
+        self.retry_budget_ratio = retry_budget_ratio
+        self.min_retry_budget = min_retry_budget
+        self._retry_budget: Optional[RetryBudget] = None
+        self.circuit_breaker = circuit_breaker
+        if self.circuit_breaker is None and enable_circuit_breaker:
+            self.circuit_breaker = CircuitBreaker()
+        self.aging_rate = aging_rate
+        self.deadline_slack = deadline_slack
+        self._active_batch: Optional[_ActiveBatch] = None
+        self.hedge_requests = hedge_requests
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_max_ratio = hedge_max_ratio
+        self.latency_tracker = LatencyTracker()
+        self.hedge_stats = {"requests": 0, "hedged": 0, "hedge_wins": 0}
+        self.cache = cache
+        self.use_async_transport = use_async_transport
+        self.connections_per_host = connections_per_host
+        self.keepalive_timeout = keepalive_timeout
         self.logger = logging.getLogger(__name__)
-        self._fetcher = TranscriptFetcher()
+        self._fetcher = TranscriptFetcher(cache=cache)
         self._session: Optional[Any] = None
+        self._transport: Optional[AsyncTranscriptTransport] = None
         self._cancelled = False
+        
+        # Shared worker pool, owned by the async context manager lifecycle
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._queued_tasks = 0
+        self._active_tasks = 0
     
     async def __aenter__(self):
         """Async context manager entry."""
         if AIOHTTP_AVAILABLE:
             import aiohttp
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=max(self.max_workers, self.connections_per_host),
+                limit_per_host=self.connections_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=60),
+                headers={"Accept-Language": "en-US"}
+            )
+            if self.use_async_transport:
+                self._transport = AsyncTranscriptTransport(self._session)
+        self._get_executor()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        self._transport = None
         if self._session:
             await self._session.close()
+            self._session = None
+        self.shutdown_executor()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared worker pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.executor_workers,
+                thread_name_prefix="yte-fetch"
+            )
+            self.logger.debug(f"Started transcript worker pool with {self.executor_workers} threads")
+        return self._executor
+    
+    def shutdown_executor(self, wait: bool = False) -> None:
+        """Shut down the shared worker pool.
+        
+        Args:
+            wait: Whether to block until running fetches finish
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+    
+    def get_executor_stats(self) -> Dict[str, int]:
+        """Get statistics about the shared worker pool.
+        
+        Returns:
+            Dictionary with pool size, started threads, active and queued tasks
+        """
+        threads_started = len(getattr(self._executor, '_threads', ())) if self._executor else 0
+        with self._executor_lock:
+            return {
+                "max_threads": self.executor_workers,
+                "threads_started": threads_started,
+                "active_tasks": self._active_tasks,
+                "queued_tasks": self._queued_tasks
+            }
+    
+    async def _run_in_executor(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking call on the shared worker pool with bookkeeping."""
+        def tracked_call() -> Any:
+            with self._executor_lock:
+                self._queued_tasks -= 1
+                self._active_tasks += 1
+            try:
+                return func(*args)
+            finally:
+                with self._executor_lock:
+                    self._active_tasks -= 1
+        
+        def release_if_cancelled(future: Any) -> None:
+            # A future cancelled before a thread picked it up never ran tracked_call
+            if future.cancelled():
+                with self._executor_lock:
+                    self._queued_tasks -= 1
+        
+        with self._executor_lock:
+            self._queued_tasks += 1
+        
+        future = self._get_executor().submit(tracked_call)
+        future.add_done_callback(release_if_cancelled)
+        return await asyncio.wrap_future(future)
     
     def cancel(self) -> None:
         """Cancel all processing."""
         self._cancelled = True
         self.logger.info("Concurrent processing cancelled")
     
-    def _apply_retry_decorator(self, func):
-        """Apply retry decorator if tenacity is available."""
-        if TENACITY_AVAILABLE and self.enable_retry:
-            from tenacity import retry, stop_after_attempt, wait_exponential
-            return retry(
-                stop=stop_after_attempt(3),
-                wait=wait_exponential(multiplier=1, min=4, max=10)
-            )(func)
-        return func
+    def submit(self, task: ProcessingTask) -> bool:
+        """Add a task to the batch that is currently running.
+        
+        The task is scheduled by its priority and deadline alongside the
+        queued backlog, so an urgent video can start before tasks that were
+        queued earlier. Its result is yielded by the running batch.
+        
+        Args:
+            task: Processing task to add
+            
+        Returns:
+            True if the task was queued, False if no batch is running
+        """
+        batch = self._active_batch
+        if batch is None or self._cancelled:
+            self.logger.warning(f"No running batch to add {task.video_id} to")
+            return False
+        
+        index = batch.dispatched
+        batch.dispatched += 1
+        batch.submitted += 1
+        batch.scheduler.add((index, task), task.priority, task.deadline, task.video_id)
+        self.logger.debug(f"Added {task.video_id} to the running batch")
+        return True
+    
+    def cancel_task(self, video_id: str) -> bool:
+        """Cancel a queued task of the running batch.
+        
+        Only tasks that have not started can be cancelled; the batch yields a
+        cancelled result for each of them.
+        
+        Args:
+            video_id: Video ID of the task
+            
+        Returns:
+            True if a queued task was cancelled
+        """
+        batch = self._active_batch
+        if batch is None:
+            return False
+        
+        entries = batch.scheduler.cancel(video_id)
+        for entry in entries:
+            index, task = entry.item
+            batch.results.put_nowait((index, ConcurrentProcessingResult(
+                task=task,
+                success=False,
+                error_message="Task was cancelled",
+                retry_count=task.retry_count,
+                error_code=ErrorCode.CANCELLED.value
+            )))
+        if entries:
+            self.logger.info(f"Cancelled queued task {video_id}")
+        return bool(entries)
     
     async def _fetch_single_transcript_async(self, task: ProcessingTask) -> ConcurrentProcessingResult:
         """Fetch single transcript asynchronously with rate limiting.
@@ -169,24 +743,94 @@ class ConcurrentTranscriptFetcher:
         
         start_time = time.time()
         
+        # Cache hits never touch the network, so they skip rate limiting too;
+        # the SQLite lookup runs on the worker pool to keep the loop free
+        if self.cache is not None:
+            cached_video = await self._run_in_executor(self._fetcher.get_cached_transcript, task.video_url)
+            if cached_video:
+                cached_video.title = task.title
+                return ConcurrentProcessingResult(
+                    task=task,
+                    transcript_video=cached_video,
+                    success=True,
+                    processing_time=time.time() - start_time,
+                    retry_count=task.retry_count
+                )
+        
+        adaptive = isinstance(self.rate_limiter, AdaptiveRateLimiter)
+        budget = self._retry_budget
+        if budget is not None:
+            budget.record_request()
+        error_code: Optional[ErrorCode] = None
+        delay = 0.0
+        # Whether a request let through by the circuit has no outcome yet
+        circuit_pending = False
+        
         try:
-            # Apply rate limiting
-            await self.rate_limiter.acquire()
-            
-            # Run the transcript fetching in a thread pool
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = loop.run_in_executor(
-                    executor,
-                    self._fetch_transcript_sync,
-                    task
+            while True:
+                # Every worker holds off while the shared circuit is open
+                if self.circuit_breaker is not None:
+                    if not await self.circuit_breaker.acquire(lambda: self._cancelled):
+                        return ConcurrentProcessingResult(
+                            task=task,
+                            success=False,
+                            error_message="Processing was cancelled",
+                            processing_time=time.time() - start_time,
+                            retry_count=task.retry_count,
+                            error_code=ErrorCode.CANCELLED.value
+                        )
+                    circuit_pending = True
+                
+                if self.hedge_requests:
+                    transcript_video = await self._fetch_hedged(task)
+                else:
+                    transcript_video = await self._fetch_attempt(task)
+                
+                success = bool(transcript_video and transcript_video.success)
+                error_msg = None
+                error_code = None
+                if not success:
+                    error_msg = transcript_video.error_message if transcript_video else "Unknown error"
+                    if transcript_video and transcript_video.error_code:
+                        error_code = ErrorCode(transcript_video.error_code)
+                    else:
+                        error_code = classify_error(error_msg)
+                
+                if adaptive:
+                    self.rate_limiter.record_result(success, error_code)
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_result(success, error_code)
+                    circuit_pending = False
+                
+                if success or not self.enable_retry or self._cancelled:
+                    break
+                
+                delay = self.retry_engine.next_delay(
+                    error_code, task.retry_count + 1, delay,
+                    max_attempts=task.max_retries + 1, budget=budget
                 )
+                if delay is None:
+                    break
                 
-                transcript_video = await future
+                task.retry_count += 1
+                if adaptive and error_code in BLOCK_CODES:
+                    # Blocked requests are paced by the shared limiter, which
+                    # has just slowed every worker down
+                    self.logger.info(
+                        f"Blocked while fetching {task.video_id}, retrying at "
+                        f"{self.rate_limiter.current_rate:.2f} req/s "
+                        f"(attempt {task.retry_count + 1}/{task.max_retries + 1})"
+                    )
+                else:
+                    self.logger.info(
+                        f"{error_code.value} error fetching {task.video_id}, retrying in {delay:.1f}s "
+                        f"(attempt {task.retry_count + 1}/{task.max_retries + 1})"
+                    )
+                    await asyncio.sleep(delay)
                 
             processing_time = time.time() - start_time
             
-            if transcript_video and transcript_video.success:
+            if success:
                 self.logger.debug(f"Successfully fetched transcript for {task.video_id}")
                 return ConcurrentProcessingResult(
                     task=task,
@@ -196,7 +840,6 @@ class ConcurrentTranscriptFetcher:
                     retry_count=task.retry_count
                 )
             else:
-                error_msg = transcript_video.error_message if transcript_video else "Unknown error"
                 self.logger.warning(f"Failed to fetch transcript for {task.video_id}: {error_msg}")
                 return ConcurrentProcessingResult(
                     task=task,
@@ -204,42 +847,225 @@ class ConcurrentTranscriptFetcher:
                     success=False,
                     error_message=error_msg,
                     processing_time=processing_time,
-                    retry_count=task.retry_count
+                    retry_count=task.retry_count,
+                    error_code=error_code.value if error_code else None
                 )
                 
         except Exception as e:
             processing_time = time.time() - start_time
             error_msg = f"Exception during processing: {str(e)}"
             self.logger.error(f"Error processing {task.video_id}: {error_msg}")
+            error_code = classify_error(e)
+            if adaptive:
+                self.rate_limiter.record_result(False, error_code)
+            if circuit_pending:
+                self.circuit_breaker.record_result(False, error_code)
+                circuit_pending = False
             
             return ConcurrentProcessingResult(
                 task=task,
                 success=False,
                 error_message=error_msg,
                 processing_time=processing_time,
-                retry_count=task.retry_count
+                retry_count=task.retry_count,
+                error_code=error_code.value
+            )
+        finally:
+            if circuit_pending:
+                # Cancelled mid-request: free the probe slot for other workers
+                self.circuit_breaker.release()
+    
+    async def _fetch_attempt(self, task: ProcessingTask) -> Optional[TranscriptVideo]:
+        """Make one rate-limited request for a transcript.
+        
+        Args:
+            task: Processing task
+            
+        Returns:
+            TranscriptVideo with the outcome
+        """
+        await self.rate_limiter.acquire()
+        started = time.time()
+        
+        # Prefer the native async transport; fall back to the worker pool
+        transcript_video = None
+        if self._transport is not None:
+            transcript_video = await self._fetch_transcript_async(task)
+            if transcript_video is None:
+                # The fallback is another request to YouTube
+                await self.rate_limiter.acquire()
+        if transcript_video is None:
+            transcript_video = await self._run_in_executor(self._fetch_transcript_sync, task, False)
+        
+        if transcript_video and transcript_video.success:
+            self.latency_tracker.record(time.time() - started)
+        return transcript_video
+    
+    def _hedge_delay(self) -> Optional[float]:
+        """Seconds after which a running fetch is hedged, or None to not hedge."""
+        if len(self.latency_tracker) < self.hedge_min_samples:
+            return None
+        if self.hedge_stats["hedged"] >= self.hedge_max_ratio * self.hedge_stats["requests"]:
+            return None
+        if self.circuit_breaker is not None and self.circuit_breaker.state != CircuitState.CLOSED:
+            return None
+        threshold = self.latency_tracker.percentile(self.hedge_percentile)
+        return max(self.hedge_min_delay, threshold or 0.0)
+    
+    async def _fetch_hedged(self, task: ProcessingTask) -> Optional[TranscriptVideo]:
+        """Fetch a transcript, racing a duplicate request if the first is slow.
+        
+        Once the first request has run longer than the configured percentile
+        of recent latencies, a second one is issued through the rate limiter.
+        The first successful answer wins and the other request is cancelled;
+        a fetch already running on a worker thread finishes in the
+        background and its result is discarded.
+        
+        Args:
+            task: Processing task
+            
+        Returns:
+            TranscriptVideo with the outcome
+        """
+        self.hedge_stats["requests"] += 1
+        delay = self._hedge_delay()
+        if delay is None:
+            return await self._fetch_attempt(task)
+        
+        primary = asyncio.ensure_future(self._fetch_attempt(task))
+        attempts = [primary]
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or self._cancelled:
+                return await primary
+            
+            self.hedge_stats["hedged"] += 1
+            self.logger.debug(f"Fetch of {task.video_id} exceeded {delay:.2f}s, sending a hedged request")
+            hedge = asyncio.ensure_future(self._fetch_attempt(task))
+            attempts.append(hedge)
+            
+            fallback: Optional[TranscriptVideo] = None
+            first_error: Optional[BaseException] = None
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    if finished.exception() is not None:
+                        first_error = first_error or finished.exception()
+                        continue
+                    transcript_video = finished.result()
+                    if transcript_video and transcript_video.success:
+                        if finished is hedge:
+                            self.hedge_stats["hedge_wins"] += 1
+                        return transcript_video
+                    fallback = fallback or transcript_video
+            
+            if fallback is None and first_error is not None:
+                raise first_error
+            return fallback
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+    
+    async def _fetch_transcript_async(self, task: ProcessingTask) -> Optional[TranscriptVideo]:
+        """Fetch a transcript over the pooled aiohttp session.
+        
+        Caption tracks that need a PO token cannot be fetched this way, and
+        YouTube hands them out for every video once it starts, so the first
+        one turns the transport off until the session ends.
+        
+        Args:
+            task: Processing task
+            
+        Returns:
+            TranscriptVideo, or None if the threaded path should be tried instead
+        """
+        if self._transport is None or not task.video_id:
+            return None
+        
+        try:
+            track, transcript_text = await self._transport.fetch(task.video_id, languages=['en'])
+        except NoTranscriptAvailableError as e:
+            return TranscriptVideo(
+                url=task.video_url,
+                title=task.title,
+                content="",
+                success=False,
+                error_message=f"No transcripts available: {e}",
+                error_code=ErrorCode.NO_TRANSCRIPT.value
+            )
+        except VideoUnavailableError as e:
+            return TranscriptVideo(
+                url=task.video_url,
+                title=task.title,
+                content="",
+                success=False,
+                error_message=str(e),
+                error_code=ErrorCode.NOT_FOUND.value
+            )
+        except PoTokenRequiredError as e:
+            if self._transport is not None:
+                self.logger.info(f"Async transport needs a PO token ({e}), using threaded fetching from now on")
+                self._transport = None
+            return None
+        except TransportError as e:
+            if e.blocked:
+                return TranscriptVideo(
+                    url=task.video_url,
+                    title=task.title,
+                    content="",
+                    success=False,
+                    error_message=f"IP blocked: {e}",
+                    error_code=classify_error(e).value
+                )
+            self.logger.debug(f"Async transport failed for {task.video_id}, using threaded fallback: {e}")
+            return None
+        except Exception as e:
+            self.logger.debug(f"Async transport error for {task.video_id}, using threaded fallback: {e}")
+            return None
+        
+        if self.cache is not None:
+            await self._run_in_executor(
+                self.cache.put, task.video_id, track.language_code, track.kind, transcript_text
             )
+        
+        return TranscriptVideo(
+            url=task.video_url,
+            title=task.title,
+            content=transcript_text,
+            success=True
+        )
     
-    def _fetch_transcript_sync(self, task: ProcessingTask) -> Optional[TranscriptVideo]:
+    def _fetch_transcript_sync(self, task: ProcessingTask, check_cache: bool = True) -> Optional[TranscriptVideo]:
         """Synchronous transcript fetching (runs in thread pool).
         
         Args:
             task: Processing task
+            check_cache: Whether to consult the transcript cache first
             
         Returns:
             TranscriptVideo or None
         """
         try:
+            if check_cache and self.cache is not None:
+                cached_video = self._fetcher.get_cached_transcript(task.video_url)
+                if cached_video:
+                    return cached_video
+            
             # Use the existing TranscriptFetcher's single video extraction method
             from youtube_transcript_api._api import YouTubeTranscriptApi
             
             ytt_api = YouTubeTranscriptApi()
+            # Retries are decided by the caller's retry engine, so a failed
+            # attempt never sleeps on this worker thread
             result = self._fetcher._extract_single_video_transcript(
                 video_url=task.video_url,
                 index=1,
                 total=1,
                 ytt_api=ytt_api,
-                status_callback=None
+                status_callback=None,
+                max_retries=1
             )
             
             return result
@@ -250,7 +1076,8 @@ class ConcurrentTranscriptFetcher:
                 title=task.title,
                 content="",
                 success=False,
-                error_message=str(e)
+                error_message=str(e),
+                error_code=classify_error(e).value
             )
     
     async def fetch_batch(
@@ -265,67 +1092,190 @@ class ConcurrentTranscriptFetcher:
             progress_callback: Optional progress callback function
             
         Returns:
-            List of processing results
+            List of processing results in completion order
         """
-        if not tasks:
-            return []
+        return [result async for result in self.fetch_batch_stream(tasks, progress_callback)]
+    
+    async def fetch_batch_stream(
+        self,
+        tasks: Union[List[ProcessingTask], AsyncIterable[ProcessingTask]],
+        progress_callback: Optional[SimpleProgressCallback] = None,
+        ordered: bool = False,
+        reorder_window: Optional[int] = None,
+        queue_size: Optional[int] = None
+    ) -> AsyncIterator[ConcurrentProcessingResult]:
+        """Fetch multiple transcripts concurrently, yielding results as they finish.
         
-        self.logger.info(f"Starting batch processing of {len(tasks)} tasks with {self.max_workers} workers")
+        Nothing is accumulated, so memory stays flat regardless of batch size.
+        ``tasks`` may also be an async iterable (e.g. a playlist still being
+        enumerated); tasks are pulled from it into a bounded queue, so fetching
+        starts with the first task instead of after the last. In ordered mode
+        results are yielded in the order tasks arrive; no more than
+        ``reorder_window`` tasks are dispatched ahead of the next result to
+        yield, which bounds the reorder buffer.
         
-        # Sort tasks by priority (highest first)
-        sorted_tasks = sorted(tasks, key=lambda x: x.priority, reverse=True)
+        Queued tasks are handed to a fixed pool of workers by a
+        :class:`TaskScheduler`: highest priority first, with aging so waiting
+        tasks are not starved and deadlines that jump the queue when close.
+        While the batch runs, :meth:`submit` adds tasks and
+        :meth:`cancel_task` cancels queued ones.
         
-        results: List[ConcurrentProcessingResult] = []
-        completed_count = 0
+        Args:
+            tasks: List or async iterable of processing tasks
+            progress_callback: Optional progress callback function; while an
+                async source is still producing, the total is the number of
+                tasks seen so far
+            ordered: Yield results in input order instead of completion order
+            reorder_window: Maximum buffered results in ordered mode
+                (defaults to four times max_workers)
+            queue_size: Maximum tasks waiting for a worker (defaults to twice
+                max_workers)
+            
+        Yields:
+            ConcurrentProcessingResult for each task
+        """
+        if isinstance(tasks, list):
+            if not tasks:
+                return
+            total: Optional[int] = len(tasks)
+            source = _iterate_async(tasks)
+            self.logger.info(f"Starting batch processing of {total} tasks with {self.max_workers} workers")
+        else:
+            total = None
+            source = tasks
+            self.logger.info(f"Starting streaming batch processing with {self.max_workers} workers")
+        
+        window = max(reorder_window or self.max_workers * 4, self.max_workers) if ordered else None
+        # A list is already in memory, so queue all of it and let the scheduler
+        # order the whole batch; async sources are pulled with backpressure
+        bounded = total is None
+        scheduler = TaskScheduler(
+            maxsize=queue_size or self.max_workers * 2,
+            aging_rate=self.aging_rate,
+            deadline_slack=self.deadline_slack
+        )
+        results_queue: asyncio.Queue = asyncio.Queue()
+        batch = _ActiveBatch(scheduler=scheduler, results=results_queue)
+        source_done = object()
+        next_to_yield = 0
+        window_open = asyncio.Condition()
+        
+        async def feeder() -> None:
+            """Pull tasks from the source into the scheduler."""
+            try:
+                async for task in source:
+                    if self._cancelled:
+                        break
+                    if window is not None:
+                        async with window_open:
+                            await window_open.wait_for(lambda: batch.dispatched < next_to_yield + window)
+                    index = batch.dispatched
+                    batch.dispatched += 1
+                    if bounded:
+                        await scheduler.put((index, task), task.priority, task.deadline, task.video_id)
+                    else:
+                        scheduler.add((index, task), task.priority, task.deadline, task.video_id)
+            except Exception as e:
+                self.logger.error(f"Error producing tasks: {e}")
+            finally:
+                await results_queue.put(source_done)
         
-        # Create semaphore to limit concurrent workers
-        semaphore = asyncio.Semaphore(self.max_workers)
+        async def worker() -> None:
+            """Take the next task and push its result to the queue.
+
+            Workers run until cancelled once every dispatched task is done.
+            """
+            while not self._cancelled:
+                entry = await scheduler.get()
+                index, task = entry.item
+                if task.deadline is not None and time.time() > task.deadline:
+                    self.logger.warning(f"Task {task.video_id} started after its deadline")
+                try:
+                    result = await self._fetch_single_transcript_async(task)
+                except Exception as e:
+                    self.logger.error(f"Error in batch processing: {e}")
+                    result = ConcurrentProcessingResult(task=task, success=False, error_message=str(e))
+                await results_queue.put((index, result))
         
-        async def process_with_semaphore(task: ProcessingTask) -> ConcurrentProcessingResult:
-            """Process task with semaphore control."""
-            async with semaphore:
-                return await self._fetch_single_transcript_async(task)
+        # Every batch gets its own retry budget
+        previous_budget = self._retry_budget
+        self._retry_budget = RetryBudget(self.retry_budget_ratio, self.min_retry_budget)
+        previous_batch = self._active_batch
+        self._active_batch = batch
         
-        # Create all coroutines
-        coroutines = [process_with_semaphore(task) for task in sorted_tasks]
+        feeder_task = asyncio.ensure_future(feeder())
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(self.max_workers, total or self.max_workers))]
+        buffer: Dict[int, ConcurrentProcessingResult] = {}
+        completed_count = 0
+        success_count = 0
+        producing = True
         
-        # Process tasks with progress tracking
-        for future in asyncio.as_completed(coroutines):
-            if self._cancelled:
-                break
+        try:
+            while producing or completed_count < batch.dispatched:
+                if self._cancelled:
+                    break
                 
-            try:
-                result = await future
-                results.append(result)
+                try:
+                    item = await asyncio.wait_for(results_queue.get(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
+                
+                if item is source_done:
+                    producing = False
+                    continue
+                
+                index, result = item
                 completed_count += 1
+                if result.success:
+                    success_count += 1
+                expected = total + batch.submitted if total is not None else batch.dispatched
                 
                 # Call progress callback
                 if progress_callback:
                     current_task = f"{result.task.title or result.task.video_id}"
-                    progress_callback(completed_count, len(tasks), current_task)
+                    progress_callback(completed_count, expected, current_task)
                 
                 # Log progress
-                if completed_count % 5 == 0 or completed_count == len(tasks):
-                    success_count = sum(1 for r in results if r.success)
+                if completed_count % 5 == 0 or completed_count == expected:
                     self.logger.info(
-                        f"Progress: {completed_count}/{len(tasks)} completed, "
+                        f"Progress: {completed_count}/{expected} completed, "
                         f"{success_count} successful"
                     )
-                    
-            except Exception as e:
-                self.logger.error(f"Error in batch processing: {e}")
-                # Create a failed result for this task
-                failed_result = ConcurrentProcessingResult(
-                    task=sorted_tasks[len(results)],  # Approximate task
-                    success=False,
-                    error_message=str(e)
-                )
-                results.append(failed_result)
-                completed_count += 1
+                
+                if not ordered:
+                    yield result
+                    continue
+                
+                buffer[index] = result
+                while next_to_yield in buffer:
+                    ready = buffer.pop(next_to_yield)
+                    next_to_yield += 1
+                    async with window_open:
+                        window_open.notify_all()
+                    yield ready
+        finally:
+            for pending in [feeder_task, *workers]:
+                pending.cancel()
+            await asyncio.gather(feeder_task, *workers, return_exceptions=True)
+            retry_stats = self._retry_budget.get_statistics()
+            self._retry_budget = previous_budget
+            self._active_batch = previous_batch
         
-        # Sort results back to original order if needed
-        self.logger.info(f"Batch processing completed: {len(results)} results")
-        return results
+        self.logger.info(
+            f"Batch processing completed: {completed_count} results, "
+            f"{retry_stats['retries']} retries ({retry_stats['denied']} denied by budget)"
+        )
+        if self.circuit_breaker is not None and self.circuit_breaker.trips:
+            breaker_stats = self.circuit_breaker.get_statistics()
+            self.logger.info(
+                f"Circuit breaker tripped {breaker_stats['trips']} times, "
+                f"open for {breaker_stats['total_open_time']:.1f}s"
+            )
+        if self.hedge_requests and self.hedge_stats["hedged"]:
+            self.logger.info(
+                f"Hedged {self.hedge_stats['hedged']} slow fetches, "
+                f"{self.hedge_stats['hedge_wins']} answered first by the hedge"
+            )
     
     def get_statistics(self, results: List[ConcurrentProcessingResult]) -> Dict[str, Any]:
         """Get processing statistics.
@@ -354,6 +1304,9 @@ class ConcurrentTranscriptFetcher:
             "average_processing_time": avg_time,
             "max_processing_time": max(r.processing_time for r in results) if results else 0,
             "min_processing_time": min(r.processing_time for r in results) if results else 0,
+            "current_rate_per_second": self.rate_limiter.rate,
+            "circuit_breaker": self.circuit_breaker.get_statistics() if self.circuit_breaker else None,
+            "hedging": dict(self.hedge_stats) if self.hedge_requests else None,
             "error_summary": self._get_error_summary(failed)
         }
     
@@ -390,60 +1343,158 @@ class ConcurrentTranscriptFetcher:
 class ConcurrentPlaylistProcessor:
     """Specialized processor for YouTube playlists with concurrent fetching."""
     
-    def __init__(self, max_workers: int = 5, rate_limit: float = 10.0):
+    def __init__(self, max_workers: int = 5, rate_limit: float = 10.0,
+                 cache: Optional[TranscriptCache] = None,
+                 playlist_store: Optional[PlaylistManifestStore] = None,
+                 enumeration_buffer: int = 100):
         """Initialize playlist processor.
         
         Args:
             max_workers: Maximum concurrent workers
             rate_limit: Rate limit per second
+            cache: Optional transcript cache shared by all workers
+            playlist_store: Optional manifest store used instead of
+                re-enumerating playlists on every run
+            enumeration_buffer: Maximum enumerated video URLs waiting to
+                become tasks before enumeration pauses
         """
-        self.concurrent_fetcher = ConcurrentTranscriptFetcher(max_workers, rate_limit)
+        self.concurrent_fetcher = ConcurrentTranscriptFetcher(max_workers, rate_limit, cache=cache)
+        self.playlist_store = playlist_store
+        self.enumeration_buffer = enumeration_buffer
         self.logger = logging.getLogger(__name__)
     
     async def process_playlist(
         self,
         playlist_url: str,
-        progress_callback: Optional[SimpleProgressCallback] = None
+        progress_callback: Optional[SimpleProgressCallback] = None,
+        sync: bool = False
     ) -> List[ConcurrentProcessingResult]:
         """Process entire playlist concurrently.
         
         Args:
             playlist_url: YouTube playlist URL
             progress_callback: Progress callback function
+            sync: Only process videos added since the last successful sync
+                (requires a playlist store)
             
         Returns:
-            List of processing results
+            List of processing results in completion order
         """
         try:
-            # First, get all videos in the playlist
-            if not Playlist:
-                raise ImportError("pytube not available")
-                
-            self.logger.info(f"Extracting video list from playlist: {playlist_url}")
-            playlist = Playlist(playlist_url)
-            
-            # Create processing tasks
-            tasks = []
-            for i, video_url in enumerate(playlist.video_urls):
-                # Simple video title
-                video_title = f"Video {i+1}"
-                
-                task = ProcessingTask(
-                    video_id="",  # Will be extracted from URL
-                    video_url=video_url,
-                    title=video_title,
-                    priority=len(playlist.video_urls) - i  # Earlier videos have higher priority
+            return [
+                result async for result in self.process_playlist_stream(
+                    playlist_url, progress_callback, ordered=False, sync=sync
                 )
-                tasks.append(task)
+            ]
             
-            self.logger.info(f"Created {len(tasks)} processing tasks")
+        except Exception as e:
+            self.logger.error(f"Error processing playlist: {e}")
+            return []
+    
+    async def process_playlist_stream(
+        self,
+        playlist_url: str,
+        progress_callback: Optional[SimpleProgressCallback] = None,
+        ordered: bool = True,
+        reorder_window: Optional[int] = None,
+        sync: bool = False
+    ) -> AsyncIterator[ConcurrentProcessingResult]:
+        """Process a playlist, yielding results as soon as they are available.
+        
+        Enumeration runs alongside fetching: each page of the playlist is
+        turned into tasks as it arrives, so the first transcript does not
+        wait for the whole playlist to be listed.
+        
+        Args:
+            playlist_url: YouTube playlist URL
+            progress_callback: Progress callback function
+            ordered: Yield results in playlist order
+            reorder_window: Maximum buffered results in ordered mode
+            sync: Only process videos added since the last successful sync
+                (requires a playlist store)
             
-            # Process all tasks concurrently
+        Yields:
+            ConcurrentProcessingResult for each video
+        """
+        synced_ids = []
+        try:
             async with self.concurrent_fetcher:
-                results = await self.concurrent_fetcher.fetch_batch(tasks, progress_callback)
+                async for result in self.concurrent_fetcher.fetch_batch_stream(
+                    self._stream_playlist_tasks(playlist_url, sync=sync),
+                    progress_callback,
+                    ordered=ordered,
+                    reorder_window=reorder_window
+                ):
+                    if result.success:
+                        synced_ids.append(result.task.video_id)
+                    yield result
+        finally:
+            if self.playlist_store and synced_ids:
+                self.playlist_store.mark_synced(playlist_url, synced_ids)
+    
+    async def _stream_playlist_tasks(self, playlist_url: str, sync: bool = False) -> AsyncIterator[ProcessingTask]:
+        """Yield one processing task per playlist video as videos are enumerated.
+        
+        Args:
+            playlist_url: YouTube playlist URL
+            sync: Only yield videos not yet processed by a sync run
             
-            return results
+        Yields:
+            Processing tasks in playlist order; earlier videos have higher priority
+        """
+        self.logger.info(f"Extracting video list from playlist: {playlist_url}")
+        
+        manifest = self.playlist_store.get(playlist_url) if self.playlist_store else None
+        if manifest is not None:
+            self.logger.info(f"Using cached manifest for playlist {manifest.playlist_id}")
+            video_urls = _iterate_async(manifest.pending_urls if sync else manifest.video_urls)
+            skip_ids = set()
+        else:
+            video_urls = self._enumerate_playlist_urls(playlist_url)
+            previous = self.playlist_store.get(playlist_url, allow_stale=True) if self.playlist_store else None
+            skip_ids = set(previous.video_ids) - set(previous.pending_ids) if sync and previous else set()
+        
+        index = 0
+        async for video_url in video_urls:
+            task = ProcessingTask(
+                video_id="",  # Will be extracted from URL
+                video_url=video_url,
+                title=f"Video {index + 1}",
+                priority=-index  # Earlier videos have higher priority
+            )
+            index += 1
+            if task.video_id in skip_ids:
+                continue
+            yield task
+        
+        self.logger.info(f"Enumerated {index} playlist videos")
+    
+    async def _enumerate_playlist_urls(self, playlist_url: str) -> AsyncIterator[str]:
+        """Enumerate a playlist page by page without blocking the event loop.
+        
+        pytube paginates lazily while ``video_urls`` is iterated, so the
+        pages are walked by a ThreadedSource whose bounded hand-over holds
+        pagination back to the consumer's pace. When the listing completes
+        it is stored in the playlist store, if one is configured.
+        
+        Args:
+            playlist_url: YouTube playlist URL
             
-        except Exception as e:
-            self.logger.error(f"Error processing playlist: {e}")
-            return []
+        Yields:
+            Video URLs in playlist order
+        """
+        if not Playlist:
+            raise ImportError("pytube not available")
+        
+        def enumerate_pages(emit: Callable[[Any], None]) -> None:
+            """Walk the playlist pages in a worker thread."""
+            playlist = Playlist(playlist_url)
+            seen = []
+            for video_url in playlist.video_urls:
+                seen.append(video_url)
+                emit(video_url)
+            if self.playlist_store:
+                self.playlist_store.save(playlist_url, getattr(playlist, "title", None), seen)
+        
+        async for video_url in ThreadedSource(enumerate_pages, maxsize=self.enumeration_buffer):
+            yield video_url
@@ -0,0 +1,191 @@
+"""
+Context carried over between the sequential chunks of a video.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import List
+
+from .models import ContextMode
+from .tokens import estimate_tokens, split_sentences
+
+
+# Markdown headings, whole-line bold labels and numbered bold items
+_HEADING = re.compile(r"^\s*(#{1,6}\s+\S|\*\*[^*]+\*\*:?\s*$|\d+\.\s+\*\*)")
+_MARKUP = re.compile(r"[*_#>`]+")
+_LIST_MARKER = re.compile(r"^([-*+]|\d+\.)\s+")
+# Words long enough to carry meaning in most languages
+_KEYWORD = re.compile(r"\w{4,}")
+
+
+def tail_of(text: str, max_tokens: int) -> str:
+    """Return the end of a text that fits a token budget.
+
+    Whole lines are kept where possible; the first line that does not fit
+    contributes its trailing sentences.
+
+    Args:
+        text: Text to shorten
+        max_tokens: Token budget of the result
+
+    Returns:
+        The last lines and sentences of the text
+    """
+    kept: List[str] = []
+    used = 0
+    for line in reversed(text.strip().splitlines()):
+        cost = estimate_tokens(line) + 1
+        if used + cost <= max_tokens:
+            kept.append(line)
+            used += cost
+            continue
+        sentences: List[str] = []
+        for sentence in reversed(split_sentences(line)):
+            cost = estimate_tokens(sentence) + 1
+            if used + cost > max_tokens:
+                break
+            sentences.append(sentence)
+            used += cost
+        if sentences:
+            kept.append(" ".join(reversed(sentences)))
+        break
+    return "\n".join(reversed(kept)).strip()
+
+
+def outline_of(text: str) -> List[str]:
+    """Reduce a response to outline entries.
+
+    Each paragraph contributes its heading, or its first sentence when it
+    has none.
+
+    Args:
+        text: Refined text in Markdown
+
+    Returns:
+        Outline entries in order
+    """
+    entries = []
+    for block in re.split(r"\n\s*\n", text):
+        lines = [line.strip() for line in block.strip().splitlines() if line.strip()]
+        if not lines:
+            continue
+        if _HEADING.match(lines[0]) or lines[0].endswith("?"):
+            entries.append(lines[0])
+        else:
+            sentences = split_sentences(_LIST_MARKER.sub("", lines[0]))
+            if sentences:
+                entries.append(f"- {sentences[0]}")
+    return entries
+
+
+def extractive_summary(text: str, max_tokens: int) -> str:
+    """Pick the sentences that best represent a text within a token budget.
+
+    Sentences are scored by how often their words occur in the whole text,
+    normalized for length. The best ones scoring at least the average are
+    returned in their original order. No model call is needed.
+
+    Args:
+        text: Text to summarize
+        max_tokens: Token budget of the summary
+
+    Returns:
+        Selected sentences joined by spaces
+    """
+    sentences = [
+        " ".join(_MARKUP.sub(" ", sentence).split())
+        for line in text.splitlines() for sentence in split_sentences(line)
+    ]
+    sentences = [sentence for sentence in sentences if sentence]
+    words = [set(_KEYWORD.findall(sentence.lower())) for sentence in sentences]
+    frequencies = Counter(word for sentence_words in words for word in sentence_words)
+
+    def score(index: int) -> float:
+        if not words[index]:
+            return 0.0
+        return sum(frequencies[word] for word in words[index]) / math.sqrt(len(words[index]))
+
+    scores = [score(index) for index in range(len(sentences))]
+    threshold = sum(scores) / len(scores) if scores else 0.0
+    chosen = []
+    used = 0
+    for index in sorted(range(len(sentences)), key=scores.__getitem__, reverse=True):
+        if scores[index] < threshold:
+            break
+        cost = estimate_tokens(sentences[index]) + 1
+        if used + cost <= max_tokens:
+            chosen.append(index)
+            used += cost
+    return " ".join(sentences[index] for index in sorted(chosen))
+
+
+class ContextCarrier:
+    """Builds what a chunk's prompt carries over from earlier responses.
+
+    Resending the whole previous response makes every prompt grow with the
+    previous output. The other modes bound the carried text to a token
+    budget: the end of the previous response, a running outline of every
+    response so far, or an extractive summary of them.
+    """
+
+    LABELS = {
+        ContextMode.FULL: "Previous response",
+        ContextMode.TAIL: "End of the previous response",
+        ContextMode.OUTLINE: "Outline of the previous responses",
+        ContextMode.SUMMARY: "Summary of the previous responses",
+    }
+
+    def __init__(self, mode: ContextMode = ContextMode.FULL, max_tokens: int = 500):
+        """Initialize the carrier for one video.
+
+        Args:
+            mode: What to carry over
+            max_tokens: Token budget of the carried text (ignored in FULL mode)
+        """
+        self.mode = mode
+        self.max_tokens = max(1, max_tokens)
+        self._previous = ""
+        self._outline: List[str] = []
+        self._responses: List[str] = []
+
+    def add(self, response: str) -> None:
+        """Record a chunk's response.
+
+        Args:
+            response: Refined text of the chunk
+        """
+        self._previous = response
+        if self.mode == ContextMode.OUTLINE:
+            self._outline.extend(outline_of(response))
+        elif self.mode == ContextMode.SUMMARY:
+            self._responses.append(response)
+
+    def context(self) -> str:
+        """Return the text carried over to the next chunk."""
+        if self.mode == ContextMode.TAIL:
+            return tail_of(self._previous, self.max_tokens)
+        if self.mode == ContextMode.OUTLINE:
+            # The most recent entries matter most for continuing
+            kept: List[str] = []
+            used = 0
+            for entry in reversed(self._outline):
+                cost = estimate_tokens(entry) + 1
+                if used + cost > self.max_tokens:
+                    break
+                kept.append(entry)
+                used += cost
+            return "\n".join(reversed(kept))
+        if self.mode == ContextMode.SUMMARY:
+            return extractive_summary("\n\n".join(self._responses), self.max_tokens)
+        return self._previous
+
+    def prompt(self) -> str:
+        """Return the prompt prefix for the next chunk, empty before the first response."""
+        context = self.context()
+        if not context:
+            return ""
+        return (
+            "The following text is a continuation... "
+            f"{self.LABELS[self.mode]}:\n{context}\n\nNew text to process (Do Not Repeat the Previous response):\n"
+        )
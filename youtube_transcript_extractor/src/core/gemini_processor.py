@@ -2,12 +2,13 @@
 Gemini AI processing service for refining transcripts.
 """
 
-import os
 import re
-import time
 import asyncio
 import logging
-from typing import List, Optional, Callable, Protocol
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Hashable, List, Optional, Callable, Protocol, Tuple
 
 try:
     from ..utils.dependencies import safe_import, require_dependency
@@ -17,21 +18,94 @@ except ImportError:
 # Import required dependency using the centralized system
 genai, GENAI_AVAILABLE = safe_import("google.generativeai", "google-generativeai")
 
-from .models import ProcessingProgress, ProcessingResult, RefinementStyle, ProcessingPrompts
-from .protocols import ProgressCallback, StatusCallback
+from .models import ProcessingProgress, ProcessingResult, RefinementStyle, RefinementMode, ProcessingPrompts
+from .protocols import ProgressCallback, StatusCallback, TextStream
+from .retry import RetryEngine, RetryBudget, ErrorCode, classify_error
+from .pacing import ModelQuotas, QuotaLimiter, DailyQuotaExceeded
+from .response_cache import ResponseCache
+from .output_stream import OrderedOutputStream, VideoStream
+from .tokens import estimate_tokens, split_by_tokens
+from .context import ContextCarrier
+from .prompt_cache import PromptPrefixCache
+from .routing import ModelRouter
+from .packing import pack_videos, pack_stream, build_packed_prompt, split_packed_response
+
+
+def _normalize_unit(text: str) -> str:
+    """Reduce a sentence or paragraph to a form that survives light rewording."""
+    return re.sub(r"[^\w]+", " ", text.lower()).strip()
+
+
+def merge_refined_parts(parts: List[str], seam_window: int = 5) -> List[str]:
+    """Merge independently refined parts, dropping repeats at the seams.
+    
+    Neighbouring parts saw each other's raw text as context, so a part may
+    start by repeating what the previous one ended with. Leading paragraphs
+    or sentences of a part that already appear among the last
+    ``seam_window`` ones of the previous part's untrimmed output are
+    removed. No Gemini call is made.
+    
+    Args:
+        parts: Refined parts in order
+        seam_window: Trailing paragraphs and sentences compared at each seam
+        
+    Returns:
+        Parts with duplicated seam text removed (empty parts dropped)
+    """
+    merged: List[str] = []
+    previous = ""
+    for raw_part in parts:
+        part = raw_part.strip()
+        if previous and part:
+            for separator in (r"\n\s*\n", r"(?<=[.!?])\s+"):
+                tail = {_normalize_unit(unit) for unit in re.split(separator, previous)[-seam_window:]}
+                tail.discard("")
+                position = 0
+                for unit in re.split(separator, part):
+                    if _normalize_unit(unit) not in tail:
+                        break
+                    position = part.index(unit, position) + len(unit)
+                part = part[position:].strip()
+        if part:
+            merged.append(part)
+        previous = raw_part.strip() or previous
+    return merged
 
 
 class GeminiProcessor:
     """Service for processing transcripts using Google's Gemini AI."""
     
-    DEFAULT_CHUNK_SIZE = 3000
+    DEFAULT_CHUNK_SIZE = 4000  # estimated tokens of transcript per request
+    DEFAULT_CONCURRENT_VIDEOS = 3
+    DEFAULT_CONCURRENT_REQUESTS = 4
+    DEFAULT_OVERLAP_WORDS = 100
+    DEFAULT_CONTEXT_TOKENS = 500
+    DEFAULT_VIDEOS_PER_REQUEST = 10
     
-    def __init__(self, config, progress_callback: Optional[ProgressCallback] = None):
+    def __init__(self, config, progress_callback: Optional[ProgressCallback] = None,
+                 retry_engine: Optional[RetryEngine] = None,
+                 rate_limiter: Optional[QuotaLimiter] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 bypass_cache: bool = False,
+                 quotas: Optional[ModelQuotas] = None,
+                 prefix_cache: Optional[PromptPrefixCache] = None,
+                 router: Optional[ModelRouter] = None):
         """Initialize the Gemini processor.
         
         Args:
             config: Processing configuration containing API key and model settings
             progress_callback: Optional callback for progress updates
+            retry_engine: Retry engine applied to Gemini API calls
+            rate_limiter: Request and token quota for the configured model
+                (built from its published limits and the config's overrides by default)
+            response_cache: Optional cache consulted before every Gemini call
+            bypass_cache: Skip cache lookups but still store fresh responses
+            quotas: Per-model quota limiters, possibly shared with other processors
+            prefix_cache: Optional cache holding the style prompt every chunk
+                starts with, so requests only send the text after it
+            router: Optional router spreading requests over several models
+                (built over the processor's quotas when the config enables
+                model_routing)
             
         Raises:
             ImportError: If google.generativeai is not installed
@@ -56,10 +130,41 @@ class GeminiProcessor:
         self.model_name = getattr(config, 'gemini_model', 'gemini-2.5-flash')
         self.is_cancelled = False
         self.logger = logging.getLogger(__name__)
+        self.retry_engine = retry_engine or RetryEngine()
+        self._retry_budget: Optional[RetryBudget] = None
+        self.max_concurrent_videos = max(1, getattr(config, 'max_concurrent_videos', self.DEFAULT_CONCURRENT_VIDEOS))
+        self.max_concurrent_requests = max(1, getattr(config, 'max_concurrent_requests', self.DEFAULT_CONCURRENT_REQUESTS))
+        self.refinement_mode = getattr(config, 'refinement_mode', RefinementMode.SEQUENTIAL)
+        self.overlap_words = max(0, getattr(config, 'overlap_words', self.DEFAULT_OVERLAP_WORDS))
+        self.context_mode = getattr(config, 'context_mode', None) or ProcessingPrompts.get_context_mode(
+            getattr(config, 'refinement_style', RefinementStyle.BALANCED_DETAILED)
+        )
+        self.context_tokens = max(1, getattr(config, 'context_tokens', self.DEFAULT_CONTEXT_TOKENS))
+        self.max_videos_per_request = max(1, getattr(config, 'max_videos_per_request', self.DEFAULT_VIDEOS_PER_REQUEST))
+        self.quotas = quotas or ModelQuotas()
+        if rate_limiter is not None:
+            self.quotas.register(self.model_name, rate_limiter)
+        elif any(getattr(config, name, None) for name in ('requests_per_minute', 'tokens_per_minute', 'requests_per_day')):
+            self.quotas.configure(
+                self.model_name,
+                requests_per_minute=getattr(config, 'requests_per_minute', None),
+                tokens_per_minute=getattr(config, 'tokens_per_minute', None),
+                requests_per_day=getattr(config, 'requests_per_day', None)
+            )
+        
+        self.response_cache = response_cache
+        self.bypass_cache = bypass_cache
+        self.prefix_cache = prefix_cache
+        if router is None and getattr(config, 'model_routing', False):
+            router = ModelRouter(self.quotas, self.model_name)
+        self.router = router
         
-        # Rate limiting attributes
-        self._last_request_time = 0.0
-        self._min_request_interval = 1.0  # Minimum seconds between requests
+        # Models are built once per name and generation config and reused, so
+        # their API clients and connections survive across chunks and videos
+        self._models: Dict[Tuple[str, Hashable], Any] = {}
+        self._model_lock = threading.Lock()
+        self._client_configured = False
+        self._executor: Optional[ThreadPoolExecutor] = None
         
         # Set up logging
         logging.basicConfig(
@@ -76,23 +181,35 @@ class GeminiProcessor:
                           output_language: str, refinement_style: RefinementStyle,
                           chunk_size: int = DEFAULT_CHUNK_SIZE,
                           progress_callback: Optional[ProgressCallback] = None,
-                          status_callback: Optional[StatusCallback] = None) -> ProcessingResult:
+                          status_callback: Optional[StatusCallback] = None,
+                          max_workers: Optional[int] = None) -> ProcessingResult:
         """Process transcripts using Gemini AI.
         
+        Up to ``max_workers`` videos are refined at the same time, all sharing
+        the processor's quota limiter. The earliest unfinished video streams
+        into the output as Gemini generates it; later videos follow in their
+        original order as soon as every earlier video is done. Runs of short
+        videos are packed into a single request (see
+        :meth:`refine_videos_to_streams`).
+        
         Args:
             input_file: Path to the input transcript file
             output_file: Path to the output file
             output_language: Target language for output
             refinement_style: Style of refinement to apply
-            chunk_size: Size of text chunks for processing
+            chunk_size: Estimated tokens of transcript per chunk
             progress_callback: Optional callback for progress updates
             status_callback: Optional callback for status messages
+            max_workers: Videos refined in parallel (defaults to the config's
+                max_concurrent_videos)
             
         Returns:
             ProcessingResult with operation outcome
         """
         try:
             self.is_cancelled = False
+            # Every run gets its own retry budget
+            self._retry_budget = RetryBudget()
             
             if status_callback:
                 status_callback("Starting Gemini AI processing...")
@@ -116,67 +233,103 @@ class GeminiProcessor:
             # Get the prompt for the selected refinement style
             prompt_template = ProcessingPrompts.get_prompt(refinement_style)
             
-            # Create response file paths
-            response_file_path = output_file.replace(".txt", "_temp_response.txt")
+            workers = max(1, max_workers or self.max_concurrent_videos)
+            videos_processed = 0
             
-            # Initialize the output file
-            with open(output_file, "w", encoding="utf-8") as final_output_file:
-                final_output_file.write("")
+            # Short videos share a request up to one chunk's worth of tokens
+            groups = pack_videos(
+                [estimate_tokens(video_chunk) for video_chunk in video_chunks_to_process],
+                chunk_size, self.max_videos_per_request, max_video_tokens=chunk_size // 4
+            )
+            if status_callback and len(groups) < total_videos:
+                status_callback(f"Packed {total_videos} video(s) into {len(groups)} Gemini request group(s)")
             
-            # Process each video
-            videos_processed = 0
+            # Set by the first group that finds the daily quota used up, so
+            # groups queued behind it do not spend more requests
+            quota_exhausted = threading.Event()
             
-            for video_index, video_chunk in enumerate(video_chunks_to_process):
-                if self.is_cancelled:
-                    if status_callback:
-                        status_callback("Operation cancelled by user")
-                    return ProcessingResult(
-                        success=False,
-                        error_message="Operation cancelled by user",
-                        videos_processed=videos_processed,
-                        total_videos=total_videos
-                    )
-                
-                # Update progress
-                if progress_callback:
-                    progress = ProcessingProgress(
-                        current_item=video_index + 1,
-                        total_items=total_videos,
-                        current_operation="Processing with Gemini AI",
-                        percentage=int(((video_index + 1) / total_videos) * 100),
-                        message=f"Processing video {video_index + 1}/{total_videos}"
-                    )
-                    progress_callback(progress)
-                
+            def refine(group_index: int) -> List[ProcessingResult]:
+                group = groups[group_index]
+                if quota_exhausted.is_set():
+                    return [ProcessingResult(success=False, error_message="Daily quota used up",
+                                             error_code=ErrorCode.QUOTA_EXHAUSTED.value) for _ in group]
                 if status_callback:
-                    preview = video_chunk[:50].replace('\n', ' ')
-                    status_callback(f"Processing Video {video_index + 1}/{total_videos}: {preview}...")
-                    
-                    word_count = len(video_chunk.split())
-                    status_callback(f"Word Count: {word_count} words")
-                    status_callback(f"Chunk Size: {chunk_size} words")
+                    for video_index in group:
+                        video_chunk = video_chunks_to_process[video_index]
+                        preview = video_chunk[:50].replace('\n', ' ')
+                        status_callback(f"Processing Video {video_index + 1}/{total_videos}: {preview}...")
+                        status_callback(f"Word Count: {len(video_chunk.split())} words")
+                    status_callback(f"Chunk Size: {chunk_size} tokens")
                 
-                # Process this video
-                result = self._process_single_video(
-                    video_chunk, prompt_template, output_language, chunk_size,
-                    video_index + 1, total_videos, response_file_path, output_file,
-                    status_callback
+                results = self.refine_videos_to_streams(
+                    [output.video(video_index) for video_index in group],
+                    [video_chunks_to_process[video_index] for video_index in group],
+                    prompt_template, output_language, chunk_size, group[0] + 1, total_videos, status_callback
                 )
-                
-                if result.success:
-                    videos_processed += 1
-                    if status_callback:
-                        status_callback(f"✅ Video {video_index + 1} processed successfully")
-                else:
-                    if status_callback:
-                        status_callback(f"⚠️ Error processing video {video_index + 1}: {result.error_message}")
+                if any(result.error_code == ErrorCode.QUOTA_EXHAUSTED.value for result in results):
+                    quota_exhausted.set()
+                return results
             
-            # Clean up temporary file
-            if os.path.exists(response_file_path):
-                try:
-                    os.remove(response_file_path)
-                except OSError:
-                    pass  # Ignore cleanup errors
+            # Videos stream into the output in order; keep a bounded window in
+            # flight so text waiting behind a slow video never piles up
+            with OrderedOutputStream(output_file, truncate=True) as output, \
+                    ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yte-gemini") as executor:
+                pending: Dict[int, Future] = {}
+                next_to_submit = 0
+                
+                for group_index, group in enumerate(groups):
+                    while next_to_submit < len(groups) and len(pending) < workers * 2 and not self.is_cancelled:
+                        pending[next_to_submit] = executor.submit(refine, next_to_submit)
+                        next_to_submit += 1
+                    
+                    if self.is_cancelled:
+                        for future in pending.values():
+                            future.cancel()
+                        if status_callback:
+                            status_callback("Operation cancelled by user")
+                        return ProcessingResult(
+                            success=False,
+                            error_message="Operation cancelled by user",
+                            videos_processed=videos_processed,
+                            total_videos=total_videos
+                        )
+                    
+                    results = pending.pop(group_index).result()
+                    if any(result.error_code == ErrorCode.QUOTA_EXHAUSTED.value for result in results):
+                        # Later videos would fail the same way, so stop here
+                        self.is_cancelled = True
+                        for future in pending.values():
+                            future.cancel()
+                        message = next(result.error_message for result in results if result.error_code)
+                        if status_callback:
+                            status_callback(f"⛔ {message}")
+                        return ProcessingResult(
+                            success=False,
+                            error_message=message,
+                            videos_processed=videos_processed + sum(result.success for result in results),
+                            total_videos=total_videos,
+                            error_code=ErrorCode.QUOTA_EXHAUSTED.value
+                        )
+                    
+                    for video_index, result in zip(group, results):
+                        if result.success:
+                            videos_processed += 1
+                            if status_callback:
+                                status_callback(f"✅ Video {video_index + 1} processed successfully")
+                        else:
+                            if status_callback:
+                                status_callback(f"⚠️ Error processing video {video_index + 1}: {result.error_message}")
+                        
+                        # Update progress
+                        if progress_callback:
+                            progress = ProcessingProgress(
+                                current_item=video_index + 1,
+                                total_items=total_videos,
+                                current_operation="Processing with Gemini AI",
+                                percentage=int(((video_index + 1) / total_videos) * 100),
+                                message=f"Processed video {video_index + 1}/{total_videos}"
+                            )
+                            progress_callback(progress)
             
             if status_callback:
                 status_callback(f"✅ Processing complete! {videos_processed}/{total_videos} videos processed successfully")
@@ -199,18 +352,17 @@ class GeminiProcessor:
     def _process_single_video(self, video_chunk: str, prompt_template: str,
                             output_language: str, chunk_size: int,
                             video_number: int, total_videos: int,
-                            response_file_path: str, final_output_path: str,
+                            final_output_path: str,
                             status_callback: Optional[StatusCallback] = None) -> ProcessingResult:
-        """Process a single video's transcript.
+        """Process a single video's transcript, streaming it onto the output.
         
         Args:
             video_chunk: The video transcript content
             prompt_template: The prompt template to use
             output_language: Target output language
-            chunk_size: Size of text chunks
+            chunk_size: Estimated tokens of transcript per chunk
             video_number: Current video number
             total_videos: Total number of videos
-            response_file_path: Path for temporary responses
             final_output_path: Path for final output
             status_callback: Optional callback for status messages
             
@@ -218,18 +370,220 @@ class GeminiProcessor:
             ProcessingResult for this video
         """
         try:
-            # Clear the temporary response file
-            with open(response_file_path, "w", encoding="utf-8") as response_file:
-                response_file.write("")
+            with OrderedOutputStream(final_output_path) as output:
+                return self.refine_video_to_stream(
+                    output.video(0), video_chunk, prompt_template, output_language, chunk_size,
+                    video_number, total_videos, status_callback
+                )
+        except OSError as file_error:
+            error_msg = f"Error writing final output for video {video_number}: {str(file_error)}"
+            self.logger.error(error_msg)
+            return ProcessingResult(
+                success=False,
+                error_message=error_msg
+            )
+    
+    def pack_video_stream(self, items: AsyncIterable[Any], video_chunk: Callable[[Any], Optional[str]],
+                          chunk_size: int) -> AsyncIterator[List[Any]]:
+        """Group neighbouring short videos of a stream for :meth:`refine_videos_to_streams`.
+        
+        Videos are packed as in :meth:`process_transcripts`, but as they
+        arrive: a short video waits for the next one before its group is
+        passed on, unless the group is already full.
+        
+        Args:
+            items: Videos in order
+            video_chunk: Gets a video's transcript content, or None for an
+                item that is passed on alone
+            chunk_size: Estimated tokens of transcript per chunk
+            
+        Returns:
+            Async iterator over groups of videos, in order
+        """
+        def tokens(item: Any) -> Optional[int]:
+            content = video_chunk(item)
+            return estimate_tokens(content) if content else None
+        
+        return pack_stream(items, tokens, chunk_size, self.max_videos_per_request, max_video_tokens=chunk_size // 4)
+    
+    def refine_videos_to_streams(self, streams: List[VideoStream], video_chunks: List[str], prompt_template: str,
+                                 output_language: str, chunk_size: int,
+                                 first_video_number: int, total_videos: int,
+                                 status_callback: Optional[StatusCallback] = None) -> List[ProcessingResult]:
+        """Refine several short videos with one request and stream each into its place.
+        
+        The transcripts are sent together, each behind a numbered marker
+        line, and the response is split at the same markers. If the request
+        fails or the response cannot be split into one output per video,
+        every video is refined on its own instead. A single video is always
+        refined on its own.
+        
+        Args:
+            streams: Handles of the videos in an OrderedOutputStream
+            video_chunks: The videos' transcript contents
+            prompt_template: The prompt template to use
+            output_language: Target output language
+            chunk_size: Estimated tokens of transcript per chunk
+            first_video_number: Number of the first video
+            total_videos: Total number of videos
+            status_callback: Optional callback for status messages
+            
+        Returns:
+            ProcessingResult of each video, in order
+        """
+        def refine_each() -> List[ProcessingResult]:
+            return [
+                self.refine_video_to_stream(
+                    stream, video_chunk, prompt_template, output_language, chunk_size,
+                    first_video_number + offset, total_videos, status_callback
+                )
+                for offset, (stream, video_chunk) in enumerate(zip(streams, video_chunks))
+            ]
+        
+        if len(video_chunks) < 2:
+            return refine_each()
+        
+        last_video_number = first_video_number + len(video_chunks) - 1
+        if status_callback:
+            status_callback(f"Generating one Gemini response for Videos {first_video_number}-{last_video_number}/{total_videos}")
+        
+        formatted_prompt = prompt_template.replace("[Language]", output_language)
+        outcome = self.retry_engine.execute(
+            self._generate_text, build_packed_prompt(video_chunks),
+            prefix=f"{formatted_prompt}\n\n", budget=self._retry_budget
+        )
+        if outcome.error_code == ErrorCode.QUOTA_EXHAUSTED:
+            for stream in streams:
+                stream.discard()
+            return [
+                ProcessingResult(success=False, error_message=outcome.error_message,
+                                 error_code=ErrorCode.QUOTA_EXHAUSTED.value)
+                for _ in video_chunks
+            ]
+        parts = split_packed_response(outcome.value, len(video_chunks)) if outcome.success else None
+        if parts is None:
+            reason = outcome.error_message if not outcome.success else "response could not be split per video"
+            self.logger.warning(f"Packed request for videos {first_video_number}-{last_video_number} failed: {reason}")
+            if status_callback:
+                status_callback(f"⚠️ Packed request failed ({reason}); refining videos {first_video_number}-{last_video_number} one by one")
+            return refine_each()
+        
+        results = []
+        for stream, video_chunk, part in zip(streams, video_chunks, parts):
+            # Same layout as refine_video_to_stream
+            video_url_line = self._video_url_line(video_chunk)
+            if video_url_line:
+                stream.write(f"{video_url_line}\n")
+            stream.write(f"{part}\n\n\n\n")
+            stream.finish()
+            results.append(ProcessingResult(success=True, content=f"{part}\n\n"))
+        return results
+    
+    def refine_video_to_stream(self, stream: VideoStream, video_chunk: str, prompt_template: str,
+                               output_language: str, chunk_size: int,
+                               video_number: int, total_videos: int,
+                               status_callback: Optional[StatusCallback] = None) -> ProcessingResult:
+        """Refine a video and stream it, URL line first, into an ordered output.
+        
+        The output matches :meth:`write_video_output`. A failed video is
+        discarded from the output.
+        
+        Args:
+            stream: Handle of the video in an OrderedOutputStream
+            video_chunk: The video transcript content
+            prompt_template: The prompt template to use
+            output_language: Target output language
+            chunk_size: Estimated tokens of transcript per chunk
+            video_number: Current video number
+            total_videos: Total number of videos
+            status_callback: Optional callback for status messages
+            
+        Returns:
+            ProcessingResult whose content is the refined text
+        """
+        try:
+            video_url_line = self._video_url_line(video_chunk)
+            if video_url_line:
+                stream.write(f"{video_url_line}\n")
+            
+            result = self.refine_video(
+                video_chunk, prompt_template, output_language, chunk_size,
+                video_number, total_videos, status_callback, stream=stream
+            )
+            if not result.success:
+                stream.discard()
+                return result
+            
+            stream.write("\n\n")
+            stream.finish()
+            return result
+            
+        except Exception as e:
+            error_msg = f"Error streaming output for video {video_number}: {str(e)}"
+            self.logger.error(error_msg)
+            stream.discard()
+            return ProcessingResult(
+                success=False,
+                error_message=error_msg
+            )
+    
+    def refine_video(self, video_chunk: str, prompt_template: str,
+                     output_language: str, chunk_size: int,
+                     video_number: int, total_videos: int,
+                     status_callback: Optional[StatusCallback] = None,
+                     stream: Optional[TextStream] = None) -> ProcessingResult:
+        """Refine a single video's transcript chunk by chunk.
+        
+        In sequential mode each chunk's prompt carries context from the
+        earlier responses, bounded as the processor's context mode says
+        (by default per refinement style). In map-reduce mode chunks are refined in
+        parallel, each seeing a little raw text from its neighbours, and the
+        parts are merged afterwards. Chunks that fail are logged and skipped,
+        but a used-up daily quota fails the whole video.
+        
+        With a stream, sequential mode writes each response to it as Gemini
+        generates it; map-reduce mode writes the merged text once done.
+        
+        Args:
+            video_chunk: The video transcript content
+            prompt_template: The prompt template to use
+            output_language: Target output language
+            chunk_size: Estimated tokens of transcript per chunk
+            video_number: Current video number
+            total_videos: Total number of videos
+            status_callback: Optional callback for status messages
+            stream: Optional stream receiving the refined text as it arrives
             
+        Returns:
+            ProcessingResult whose content is the refined text
+        """
+        try:
             # Split the video transcript into chunks
             video_transcript_chunks = self._split_text_into_chunks(video_chunk, chunk_size)
             
             if status_callback:
                 status_callback(f"Video split into {len(video_transcript_chunks)} chunks")
             
+            # Replace [Language] placeholder with actual language
+            formatted_prompt = prompt_template.replace("[Language]", output_language)
+            
+            if self.refinement_mode == RefinementMode.MAP_REDUCE and len(video_transcript_chunks) > 1:
+                responses = self._refine_chunks_parallel(
+                    video_transcript_chunks, formatted_prompt, video_number, total_videos, status_callback
+                )
+                if self.is_cancelled:
+                    return ProcessingResult(
+                        success=False,
+                        error_message="Operation cancelled by user"
+                    )
+                content = "".join(part + "\n\n" for part in merge_refined_parts(responses))
+                if stream is not None:
+                    stream.write(content)
+                return ProcessingResult(success=True, content=content)
+            
             # Process each chunk
-            previous_response = ""
+            responses = []
+            carrier = ContextCarrier(self.context_mode, self.context_tokens)
             
             for chunk_index, chunk in enumerate(video_transcript_chunks):
                 if self.is_cancelled:
@@ -238,83 +592,31 @@ class GeminiProcessor:
                         error_message="Operation cancelled by user"
                     )
                 
-                # Build the prompt
-                if previous_response:
-                    context_prompt = (
-                        "The following text is a continuation... "
-                        f"Previous response:\n{previous_response}\n\nNew text to process (Do Not Repeat the Previous response):\n"
-                    )
-                else:
-                    context_prompt = ""
-                
-                # Replace [Language] placeholder with actual language
-                formatted_prompt = prompt_template.replace("[Language]", output_language)
-                full_prompt = f"{context_prompt}{formatted_prompt}\n\n{chunk}"
+                # The style prompt leads so that every chunk shares it as a prefix
+                full_prompt = f"{carrier.prompt()}{chunk}"
                 
                 # Generate response using Gemini
                 if status_callback:
                     status_callback(f"Generating Gemini response for Video {video_number}/{total_videos}, Chunk {chunk_index + 1}/{len(video_transcript_chunks)}")
                 
-                try:
-                    model = genai.GenerativeModel(model_name=self.model_name)  # type: ignore
-                    response = model.generate_content(full_prompt)  # type: ignore
-                    
-                    if not response.text:
-                        raise ValueError("Empty response from Gemini")
-                    
-                    # Save the response to temporary file
-                    with open(response_file_path, "a", encoding="utf-8") as response_file:
-                        response_file.write(response.text + "\n\n")
-                    
-                    previous_response = response.text
-                    
-                    if status_callback:
-                        status_callback(f"✅ Chunk {chunk_index + 1}/{len(video_transcript_chunks)} processed")
-                    
-                    # Add a small delay to avoid rate limiting
-                    time.sleep(1)
-                    
-                except Exception as api_error:
-                    error_msg = f"Gemini API error for chunk {chunk_index + 1}: {str(api_error)}"
-                    self.logger.error(error_msg)
-                    if status_callback:
-                        status_callback(f"⚠️ {error_msg}")
-                    
-                    # Continue with the next chunk rather than failing completely
-                    continue
-            
-            # Read the complete video response and append to final output
-            try:
-                with open(response_file_path, "r", encoding="utf-8") as response_file:
-                    video_response_content = response_file.read()
-                
-                with open(final_output_path, "a", encoding="utf-8") as final_output_file:
-                    # Extract video URL from the chunk (first line)
-                    video_lines = video_chunk.splitlines()
-                    video_url_line = ""
-                    for line in video_lines:
-                        if line.startswith("Video URL:"):
-                            video_url_line = line
-                            break
-                    
-                    if video_url_line:
-                        final_output_file.write(f"{video_url_line}\n")
-                    
-                    final_output_file.write(video_response_content + "\n\n")
-                
-                if status_callback:
-                    status_callback(f"Final output for video {video_number} appended to {final_output_path}")
-                
-                return ProcessingResult(success=True)
-                
-            except Exception as file_error:
-                error_msg = f"Error writing final output for video {video_number}: {str(file_error)}"
-                self.logger.error(error_msg)
-                return ProcessingResult(
-                    success=False,
-                    error_message=error_msg
+                response = self._refine_chunk(
+                    full_prompt, chunk_index, len(video_transcript_chunks), status_callback, stream,
+                    prefix=f"{formatted_prompt}\n\n"
                 )
+                if response is not None:
+                    responses.append(response + "\n\n")
+                    carrier.add(response)
+            
+            return ProcessingResult(success=True, content="".join(responses))
             
+        except DailyQuotaExceeded as e:
+            error_msg = f"Gemini quota used up at video {video_number}: {str(e)}"
+            self.logger.error(error_msg)
+            return ProcessingResult(
+                success=False,
+                error_message=error_msg,
+                error_code=ErrorCode.QUOTA_EXHAUSTED.value
+            )
         except Exception as e:
             error_msg = f"Error processing video {video_number}: {str(e)}"
             self.logger.error(error_msg)
@@ -323,26 +625,428 @@ class GeminiProcessor:
                 error_message=error_msg
             )
     
-    def _split_text_into_chunks(self, text: str, chunk_size: int, min_chunk_size: int = 500) -> List[str]:
-        """Split text into chunks of specified size.
+    def _refine_chunk(self, full_prompt: str, chunk_index: int, total_chunks: int,
+                      status_callback: Optional[StatusCallback] = None,
+                      stream: Optional[TextStream] = None, prefix: str = "") -> Optional[str]:
+        """Refine one chunk with retries.
+        
+        With a stream, the response is streamed into it followed by a blank
+        line. Text from an attempt that fails is rolled back, so retries and
+        skipped chunks leave nothing behind.
         
         Args:
-            text: Text to split
-            chunk_size: Maximum size of each chunk in words
-            min_chunk_size: Minimum size for the last chunk
+            full_prompt: Prompt for the chunk, after the prefix
+            chunk_index: Zero-based chunk index
+            total_chunks: Number of chunks in the video
+            status_callback: Optional callback for status messages
+            stream: Optional stream receiving the response as it arrives
+            prefix: Style prompt shared by every chunk
             
         Returns:
-            List of text chunks
+            Refined text, or None if the chunk failed
+            
+        Raises:
+            DailyQuotaExceeded: If the daily request quota is used up
         """
-        words = text.split()
-        chunks = [" ".join(words[i:i+chunk_size]) for i in range(0, len(words), chunk_size)]
+        def announce_retry(code: ErrorCode, attempt: int, delay: float) -> None:
+            if status_callback:
+                status_callback(f"⏳ {code.value} error on chunk {chunk_index + 1}, retry {attempt} in {delay:.1f}s")
         
-        # Merge small last chunk with previous chunk
-        if len(chunks) > 1 and len(chunks[-1].split()) < min_chunk_size:
-            chunks[-2] += " " + chunks[-1]
-            chunks.pop()
+        mark = stream.mark() if stream is not None else 0
         
-        return chunks
+        def attempt() -> str:
+            if stream is None:
+                return self._generate_text(full_prompt, prefix=prefix)
+            stream.rollback(mark)
+            return self._generate_text(full_prompt, on_text=stream.write, prefix=prefix)
+        
+        try:
+            outcome = self.retry_engine.execute(
+                attempt, on_retry=announce_retry, budget=self._retry_budget
+            )
+            if not outcome.success:
+                if stream is not None:
+                    stream.rollback(mark)
+                raise outcome.error or RuntimeError(outcome.error_message)
+            
+            if stream is not None:
+                stream.write("\n\n")
+            if status_callback:
+                status_callback(f"✅ Chunk {chunk_index + 1}/{total_chunks} processed")
+            return outcome.value
+            
+        except DailyQuotaExceeded:
+            # Every later chunk would fail the same way
+            raise
+        except Exception as api_error:
+            error_msg = f"Gemini API error for chunk {chunk_index + 1}: {str(api_error)}"
+            self.logger.error(error_msg)
+            if status_callback:
+                status_callback(f"⚠️ {error_msg}")
+            
+            # Continue with the next chunk rather than failing completely
+            return None
+    
+    def _refine_chunks_parallel(self, chunks: List[str], formatted_prompt: str,
+                                video_number: int, total_videos: int,
+                                status_callback: Optional[StatusCallback] = None) -> List[str]:
+        """Refine a video's chunks concurrently (the map step of map-reduce mode).
+        
+        Instead of the previous response, each prompt shows the last and
+        first ``overlap_words`` raw words of the neighbouring chunks, so
+        prompts stay small and no chunk waits for another.
+        
+        Args:
+            chunks: Raw transcript chunks in order
+            formatted_prompt: Style prompt with the language filled in
+            video_number: Current video number
+            total_videos: Total number of videos
+            status_callback: Optional callback for status messages
+            
+        Returns:
+            Refined parts in chunk order, without the chunks that failed
+        """
+        def refine(chunk_index: int) -> Optional[str]:
+            if self.is_cancelled:
+                return None
+            
+            context_prompt = ""
+            if chunk_index > 0 and self.overlap_words:
+                before = " ".join(chunks[chunk_index - 1].split()[-self.overlap_words:])
+                context_prompt += f"For context only, the transcript just before this part ends with:\n{before}\n\n"
+            if chunk_index + 1 < len(chunks) and self.overlap_words:
+                after = " ".join(chunks[chunk_index + 1].split()[:self.overlap_words])
+                context_prompt += f"For context only, the transcript continues with:\n{after}\n\n"
+            if context_prompt:
+                context_prompt += "Only process the new text below; do not process or repeat the context passages.\n\n"
+            
+            if status_callback:
+                status_callback(f"Generating Gemini response for Video {video_number}/{total_videos}, Chunk {chunk_index + 1}/{len(chunks)}")
+            return self._refine_chunk(
+                f"{context_prompt}{chunks[chunk_index]}",
+                chunk_index, len(chunks), status_callback, prefix=f"{formatted_prompt}\n\n"
+            )
+        
+        workers = min(self.max_concurrent_requests, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yte-gemini-map") as executor:
+            responses = list(executor.map(refine, range(len(chunks))))
+        return [response for response in responses if response]
+    
+    def write_video_output(self, final_output_path: str, video_chunk: str, content: str,
+                           video_number: int,
+                           status_callback: Optional[StatusCallback] = None) -> ProcessingResult:
+        """Append a refined video to the final output file.
+        
+        Args:
+            final_output_path: Path for final output
+            video_chunk: The video transcript content, used for its URL line
+            content: Refined text for the video
+            video_number: Current video number
+            status_callback: Optional callback for status messages
+            
+        Returns:
+            ProcessingResult for the write
+        """
+        try:
+            with open(final_output_path, "a", encoding="utf-8") as final_output_file:
+                video_url_line = self._video_url_line(video_chunk)
+                if video_url_line:
+                    final_output_file.write(f"{video_url_line}\n")
+                
+                final_output_file.write(content + "\n\n")
+            
+            if status_callback:
+                status_callback(f"Final output for video {video_number} appended to {final_output_path}")
+            
+            return ProcessingResult(success=True)
+            
+        except Exception as file_error:
+            error_msg = f"Error writing final output for video {video_number}: {str(file_error)}"
+            self.logger.error(error_msg)
+            return ProcessingResult(
+                success=False,
+                error_message=error_msg
+            )
+    
+    def _generate_text(self, prompt: str, on_text: Optional[Callable[[str], None]] = None,
+                       prefix: str = "") -> str:
+        """Make a single Gemini call and return the response text.
+        
+        Cached responses are returned without a call. Otherwise the call
+        waits for room in the request and token quotas first; the response's
+        tokens are charged once it arrives. With ``on_text`` the response is
+        streamed and every piece is passed on as soon as it arrives.
+        
+        With a model router the request goes to the first model it picks.
+        A rate limit, used-up quota, timeout or unknown model passes the
+        request on to the next one, unless text was already passed on.
+        
+        Args:
+            prompt: Prompt to send after the prefix
+            on_text: Optional callback receiving the text piece by piece
+            prefix: Start of the prompt shared with other requests, taken
+                from the prefix cache when it holds it
+            
+        Returns:
+            Generated text
+            
+        Raises:
+            ValueError: If Gemini returns an empty response
+            DailyQuotaExceeded: If every routed model is out of daily quota
+        """
+        model_names = self._route(prefix + prompt)
+        cached = self._cached_response(prefix + prompt, model_names)
+        if cached is not None:
+            if on_text:
+                on_text(cached)
+            return cached
+        
+        for index, model_name in enumerate(model_names):
+            pieces: List[str] = []
+            try:
+                return self._send(model_name, prompt, prefix, on_text, pieces)
+            except Exception as e:
+                if not self._fail_over(model_name, e, last=index + 1 == len(model_names) or bool(pieces)):
+                    raise
+        raise DailyQuotaExceeded("No Gemini model is available")
+    
+    def _send(self, model_name: str, prompt: str, prefix: str,
+              on_text: Optional[Callable[[str], None]], pieces: List[str]) -> str:
+        """Send a request to one model, paced by that model's quotas.
+        
+        Args:
+            model_name: Gemini model name
+            prompt: Prompt to send after the prefix
+            prefix: Start of the prompt shared with other requests
+            on_text: Optional callback receiving the text piece by piece
+            pieces: Filled with the streamed pieces as they arrive
+            
+        Returns:
+            Generated text
+            
+        Raises:
+            ValueError: If Gemini returns an empty response
+        """
+        full_prompt = prefix + prompt
+        limiter = self.quotas.limiter(model_name)
+        tokens = estimate_tokens(full_prompt)
+        limiter.acquire(tokens)
+        
+        started = time.monotonic()
+        try:
+            model, prompt = self._model_for_prefix(prefix, prompt, model_name)
+            if on_text is None:
+                response = model.generate_content(prompt)  # type: ignore
+                text = response.text if response else ""
+            else:
+                for piece in model.generate_content(prompt, stream=True):  # type: ignore
+                    if piece.text:
+                        pieces.append(piece.text)
+                        on_text(piece.text)
+                text = "".join(pieces)
+            
+            if not text:
+                raise ValueError("Empty response from Gemini")
+        except BaseException:
+            # Only answered requests count against the daily quota
+            limiter.refund(tokens)
+            raise
+        
+        limiter.consume(estimate_tokens(text))
+        if self.router is not None:
+            self.router.record_success(model_name, time.monotonic() - started)
+        self._store_response(full_prompt, text, model_name)
+        return text
+    
+    def _route(self, full_prompt: str) -> List[str]:
+        """Get the models to try for a prompt, in order.
+        
+        Args:
+            full_prompt: Complete prompt
+            
+        Returns:
+            The router's choice, or just the configured model
+            
+        Raises:
+            DailyQuotaExceeded: If every routed model is out of daily quota
+        """
+        if self.router is None:
+            return [self.model_name]
+        style = getattr(self.config, 'refinement_style', RefinementStyle.BALANCED_DETAILED)
+        model_names = self.router.route(style, estimate_tokens(full_prompt))
+        if not model_names:
+            raise DailyQuotaExceeded("Daily quota of every Gemini model in the cascade is used up")
+        return model_names
+    
+    def _fail_over(self, model_name: str, error: Exception, last: bool) -> bool:
+        """Record a failed request and decide whether the next model takes it.
+        
+        Args:
+            model_name: Gemini model that failed
+            error: The failure
+            last: Whether no other model can take the request
+            
+        Returns:
+            True to try the next model, False to raise the error
+        """
+        if self.router is None:
+            return False
+        return self.router.record_failure(model_name, classify_error(error)) and not last
+    
+    @staticmethod
+    def _video_url_line(video_chunk: str) -> str:
+        """Return the "Video URL:" line of a video's transcript, if any."""
+        for line in video_chunk.splitlines():
+            if line.startswith("Video URL:"):
+                return line
+        return ""
+    
+    def _cached_response(self, prompt: str, model_names: Optional[List[str]] = None) -> Optional[str]:
+        """Return the cached response for a prompt, unless the cache is bypassed.
+        
+        Args:
+            prompt: Complete prompt to send
+            model_names: Models whose responses are acceptable (defaults to
+                the configured model)
+            
+        Returns:
+            Cached response text or None
+        """
+        if self.response_cache is None or self.bypass_cache:
+            return None
+        for model_name in model_names or [self.model_name]:
+            cached = self.response_cache.get(model_name, prompt)
+            if cached is not None:
+                return cached
+        return None
+    
+    def _store_response(self, prompt: str, text: str, model_name: Optional[str] = None) -> None:
+        """Remember a fresh response for a prompt.
+        
+        Args:
+            prompt: Complete prompt that was sent
+            text: Response text
+            model_name: Model that generated it (defaults to the configured model)
+        """
+        if self.response_cache is not None:
+            self.response_cache.put(model_name or self.model_name, prompt, text)
+    
+    async def _generate_text_async(self, prompt: str, prefix: str = "") -> str:
+        """Async counterpart of :meth:`_generate_text`.
+        
+        Waits for quota without blocking the event loop and uses the SDK's
+        async generation call. Models without one run on the processor's
+        own executor rather than the loop's default pool.
+        
+        Args:
+            prompt: Prompt to send after the prefix
+            prefix: Start of the prompt shared with other requests
+            
+        Returns:
+            Generated text
+            
+        Raises:
+            ValueError: If Gemini returns an empty response
+            DailyQuotaExceeded: If every routed model is out of daily quota
+        """
+        model_names = self._route(prefix + prompt)
+        cached = self._cached_response(prefix + prompt, model_names)
+        if cached is not None:
+            return cached
+        
+        for index, model_name in enumerate(model_names):
+            try:
+                return await self._send_async(model_name, prompt, prefix)
+            except Exception as e:
+                if not self._fail_over(model_name, e, last=index + 1 == len(model_names)):
+                    raise
+        raise DailyQuotaExceeded("No Gemini model is available")
+    
+    async def _send_async(self, model_name: str, prompt: str, prefix: str) -> str:
+        """Async counterpart of :meth:`_send`."""
+        full_prompt = prefix + prompt
+        limiter = self.quotas.limiter(model_name)
+        tokens = estimate_tokens(full_prompt)
+        await limiter.acquire_async(tokens)
+        
+        started = time.monotonic()
+        try:
+            # Uploading a prefix is a blocking call, made once per prefix
+            model, prompt = self._model_for_prefix(prefix, prompt, model_name)
+            if asyncio.iscoroutinefunction(model.generate_content):
+                response = await model.generate_content(prompt)  # type: ignore
+            elif hasattr(type(model), "generate_content_async"):
+                response = await model.generate_content_async(prompt)  # type: ignore
+            else:
+                loop = asyncio.get_running_loop()
+                response = await loop.run_in_executor(self._get_executor(), model.generate_content, prompt)
+            
+            if not response or not response.text:
+                raise ValueError("Empty response from Gemini")
+        except BaseException:
+            # Only answered requests count against the daily quota
+            limiter.refund(tokens)
+            raise
+        
+        limiter.consume(estimate_tokens(response.text))
+        if self.router is not None:
+            self.router.record_success(model_name, time.monotonic() - started)
+        self._store_response(full_prompt, response.text, model_name)
+        return response.text
+    
+    def _model_for_prefix(self, prefix: str, prompt: str, model_name: Optional[str] = None) -> Tuple[Any, str]:
+        """Pick the model for a request and the text it still has to be sent.
+        
+        Args:
+            prefix: Start of the prompt shared with other requests
+            prompt: Prompt after the prefix
+            model_name: Gemini model name (defaults to the configured model)
+            
+        Returns:
+            Tuple of (model, prompt to send): a model bound to the cached
+            prefix with only the prompt, or the plain model with both
+        """
+        model_name = model_name or self.model_name
+        if prefix and self.prefix_cache is not None:
+            self._configure_client()
+            model = self.prefix_cache.model_for(model_name, prefix)
+            if model is not None:
+                return model, prompt
+        return self._get_model(model_name), prefix + prompt
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the executor for blocking Gemini calls made from coroutines."""
+        with self._model_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_requests, thread_name_prefix="yte-gemini-async"
+                )
+            return self._executor
+    
+    def close(self) -> None:
+        """Release the executor used for blocking calls from coroutines and any cached prefixes."""
+        with self._model_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if self.prefix_cache is not None:
+            self.prefix_cache.close()
+    
+    def _split_text_into_chunks(self, text: str, chunk_size: int, min_chunk_size: Optional[int] = None) -> List[str]:
+        """Split text into chunks that fit a token budget, at sentence boundaries.
+        
+        Args:
+            text: Text to split
+            chunk_size: Maximum estimated tokens of each chunk
+            min_chunk_size: Size the last chunk is evened out to
+                (a quarter of chunk_size by default)
+            
+        Returns:
+            List of text chunks
+        """
+        if min_chunk_size is None:
+            min_chunk_size = chunk_size // 4
+        return split_by_tokens(text, chunk_size, min_chunk_size)
     
     def _split_videos(self, file_path: str) -> List[str]:
         """Split the transcript file into individual video chunks.
@@ -374,10 +1078,10 @@ class GeminiProcessor:
                 raise ImportError("google.generativeai package is required but not installed")
             
             # Configure with API key
-            genai.configure(api_key=self.api_key)  # type: ignore
+            self._configure_client(force=True)
             
             # Initialize the model
-            self.model = genai.GenerativeModel(self.model_name)  # type: ignore
+            self.model = self._get_model()
             
             # Test the connection by listing models
             models = genai.list_models()  # type: ignore
@@ -388,6 +1092,62 @@ class GeminiProcessor:
             self.logger.error(error_msg)
             raise ValueError(error_msg)
 
+    @property
+    def rate_limiter(self) -> QuotaLimiter:
+        """Quota limiter of the model requests currently go to."""
+        return self.quotas.limiter(self.model_name)
+    
+    def _configure_client(self, force: bool = False) -> None:
+        """Configure the Gemini client with this processor's API key once.
+        
+        Args:
+            force: Configure again even if already done
+        """
+        with self._model_lock:
+            if self._client_configured and not force:
+                return
+            genai.configure(api_key=self.api_key)  # type: ignore
+            self._client_configured = True
+    
+    @staticmethod
+    def _generation_config_key(generation_config: Any) -> Hashable:
+        """Turn a generation config into a hashable cache key."""
+        if generation_config is None:
+            return None
+        if isinstance(generation_config, dict):
+            return tuple(sorted((key, repr(value)) for key, value in generation_config.items()))
+        return repr(generation_config)
+    
+    def _get_model(self, model_name: Optional[str] = None, generation_config: Any = None) -> Any:
+        """Return the cached model for a name and generation config.
+        
+        The model is built on first use and shared by every later call,
+        including calls from other worker threads.
+        
+        Args:
+            model_name: Gemini model name (defaults to the configured model)
+            generation_config: Optional generation config for the model
+            
+        Returns:
+            GenerativeModel instance
+        """
+        model_name = model_name or self.model_name
+        key = (model_name, self._generation_config_key(generation_config))
+        model = self._models.get(key)
+        if model is not None:
+            return model
+        
+        self._configure_client()
+        with self._model_lock:
+            model = self._models.get(key)
+            if model is None:
+                if generation_config is None:
+                    model = genai.GenerativeModel(model_name)  # type: ignore
+                else:
+                    model = genai.GenerativeModel(model_name, generation_config=generation_config)  # type: ignore
+                self._models[key] = model
+            return model
+    
     def _get_refinement_prompt(self, refinement_style: Optional[RefinementStyle] = None, language: Optional[str] = None) -> str:
         """Get the refinement prompt for the specified style.
         
@@ -452,48 +1212,69 @@ class GeminiProcessor:
         return chunks
 
     async def process_transcript_chunks(self, chunks, refinement_style: Optional[RefinementStyle] = None, 
-                                output_language: str = "English") -> str:
-        """Process transcript chunks directly (async version for tests)."""
+                                output_language: str = "English",
+                                max_concurrency: Optional[int] = None) -> str:
+        """Process transcript chunks concurrently without blocking the event loop.
+        
+        Chunks are independent here, so up to ``max_concurrency`` of them are
+        in flight at once; results keep the input order.
+        
+        Args:
+            chunks: Chunks to refine, or a transcript string to split first
+            refinement_style: Style of refinement (defaults to config value)
+            output_language: Target language for the output
+            max_concurrency: Concurrent Gemini calls (defaults to the config's
+                max_concurrent_requests)
+            
+        Returns:
+            Refined chunks joined by blank lines
+            
+        Raises:
+            RuntimeError: If a chunk fails after retries
+        """
         try:
             if isinstance(chunks, str):
                 # If a string is passed, treat it as content to be chunked
-                chunks = self._split_text_into_chunks(chunks, 3000)
+                chunks = self._split_text_into_chunks(chunks, self.DEFAULT_CHUNK_SIZE)
             
             if refinement_style is None:
                 refinement_style = getattr(self.config, 'refinement_style', RefinementStyle.BALANCED_DETAILED)
             
-            results = []
+            assert refinement_style is not None
+            prompt_template = ProcessingPrompts.get_prompt(refinement_style)
+            formatted_prompt = prompt_template.replace("[Language]", output_language)
+            semaphore = asyncio.Semaphore(max(1, max_concurrency or self.max_concurrent_requests))
             total_chunks = len(chunks)
+            completed = 0
             
-            for i, chunk in enumerate(chunks):
+            async def refine_chunk(chunk: str) -> Optional[str]:
+                nonlocal completed
+                async with semaphore:
+                    outcome = await self.retry_engine.execute_async(
+                        self._generate_text_async, chunk, prefix=f"{formatted_prompt}\n\n",
+                        budget=self._retry_budget
+                    )
+                
+                completed += 1
                 # Call progress callback if available
                 if self.progress_callback:
                     progress = ProcessingProgress(
-                        current_item=i + 1,
+                        current_item=completed,
                         total_items=total_chunks,
                         current_operation="Processing chunk",
-                        percentage=int(((i + 1) / total_chunks) * 100),
-                        message=f"Processing chunk {i + 1}/{total_chunks}"
+                        percentage=int((completed / total_chunks) * 100),
+                        message=f"Processed chunk {completed}/{total_chunks}"
                     )
                     self.progress_callback(progress)
                 
-                assert refinement_style is not None
-                prompt_template = ProcessingPrompts.get_prompt(refinement_style)
-                formatted_prompt = prompt_template.replace("[Language]", output_language)
-                full_prompt = f"{formatted_prompt}\n\n{chunk}"
-                
-                model = genai.GenerativeModel(model_name=self.model_name)  # type: ignore
-                
-                # Check if generate_content is async (for testing) or sync (for real usage)
-                if asyncio.iscoroutinefunction(model.generate_content):
-                    response = await model.generate_content(full_prompt)  # type: ignore
-                else:
-                    response = model.generate_content(full_prompt)  # type: ignore
-                
-                if response and response.text:
-                    results.append(response.text)
+                if outcome.success:
+                    return outcome.value
+                if outcome.error_code == ErrorCode.EMPTY_RESPONSE:
+                    return None
+                raise outcome.error or RuntimeError(outcome.error_message)
             
-            return '\n\n'.join(results)
+            results = await asyncio.gather(*(refine_chunk(chunk) for chunk in chunks))
+            return '\n\n'.join(result for result in results if result)
         except Exception as e:
             raise RuntimeError(f"Failed to process chunks: {str(e)}")
 
@@ -511,11 +1292,11 @@ class GeminiProcessor:
                 formatted_prompt = prompt_template.replace("[Language]", output_language)
                 full_prompt = f"{formatted_prompt}\n\n{chunk}"
                 
-                model = genai.GenerativeModel(model_name=self.model_name)  # type: ignore
-                response = model.generate_content(full_prompt)  # type: ignore
-                
-                if response and response.text:
-                    results.append(response.text)
+                outcome = self.retry_engine.execute(self._generate_text, full_prompt, budget=self._retry_budget)
+                if outcome.success:
+                    results.append(outcome.value)
+                elif outcome.error_code != ErrorCode.EMPTY_RESPONSE:
+                    raise outcome.error or RuntimeError(outcome.error_message)
             
             return ProcessingResult(
                 success=True,
@@ -528,7 +1309,7 @@ class GeminiProcessor:
             )
 
     def process_transcript(self, content: str, refinement_style: Optional[RefinementStyle] = None,
-                         output_language: str = "English", chunk_size: int = 3000) -> ProcessingResult:
+                         output_language: str = "English", chunk_size: int = DEFAULT_CHUNK_SIZE) -> ProcessingResult:
         """Process a single transcript (for testing)."""
         try:
             if refinement_style is None:
@@ -545,34 +1326,18 @@ class GeminiProcessor:
     async def _process_single_chunk(self, chunk: str) -> str:
         """Async version for test compatibility - processes a single chunk and returns content."""
         try:
-            # Enforce rate limiting
-            import time
-            current_time = time.time()
-            time_since_last_request = current_time - self._last_request_time
-            if time_since_last_request < self._min_request_interval:
-                sleep_time = self._min_request_interval - time_since_last_request
-                time.sleep(sleep_time)
-            self._last_request_time = time.time()
-            
             refinement_style = getattr(self.config, 'refinement_style', RefinementStyle.BALANCED_DETAILED)
             output_language = getattr(self.config, 'output_language', 'English')
             
             prompt_template = ProcessingPrompts.get_prompt(refinement_style)
             formatted_prompt = prompt_template.replace("[Language]", output_language)
-            full_prompt = f"{formatted_prompt}\n\n{chunk}"
             
-            model = genai.GenerativeModel(model_name=self.model_name)  # type: ignore
-            
-            # Check if generate_content is async (for testing) or sync (for real usage)
-            if asyncio.iscoroutinefunction(model.generate_content):
-                response = await model.generate_content(full_prompt)  # type: ignore
-            else:
-                response = model.generate_content(full_prompt)  # type: ignore
-            
-            if not response or not response.text:
-                raise ValueError("Empty response from Gemini")
-            
-            return response.text
+            outcome = await self.retry_engine.execute_async(
+                self._generate_text_async, chunk, prefix=f"{formatted_prompt}\n\n", budget=self._retry_budget
+            )
+            if not outcome.success:
+                raise outcome.error or RuntimeError(outcome.error_message)
+            return outcome.value
         except ValueError:
             # Re-raise ValueError without wrapping
             raise
@@ -593,18 +1358,16 @@ class GeminiProcessor:
             formatted_prompt = prompt_template.replace("[Language]", output_language)
             full_prompt = f"{formatted_prompt}\n\n{chunk}"
             
-            model = genai.GenerativeModel(model_name=self.model_name)  # type: ignore
-            response = model.generate_content(full_prompt)  # type: ignore
-            
-            if not response or not response.text:
+            outcome = self.retry_engine.execute(self._generate_text, full_prompt, budget=self._retry_budget)
+            if not outcome.success:
                 return ProcessingResult(
                     success=False,
-                    error_message="Empty response from Gemini"
+                    error_message=outcome.error_message
                 )
             
             return ProcessingResult(
                 success=True,
-                content=response.text
+                content=outcome.value
             )
         except Exception as e:
             return ProcessingResult(
@@ -22,6 +22,20 @@ class RefinementStyle(Enum):
     QA_GENERATION = "Q&A Generation"
 
 
+class RefinementMode(Enum):
+    """Enumeration for how a video's chunks are refined."""
+    SEQUENTIAL = "sequential"  # Each chunk sees the previous response
+    MAP_REDUCE = "map_reduce"  # Chunks refined in parallel, seams merged
+
+
+class ContextMode(Enum):
+    """Enumeration for what a sequential chunk's prompt carries over from earlier responses."""
+    FULL = "full"  # The whole previous response
+    TAIL = "tail"  # The end of the previous response
+    OUTLINE = "outline"  # Headings and lead sentences of every earlier response
+    SUMMARY = "summary"  # Key sentences extracted from every earlier response
+
+
 @dataclass
 class ProcessingConfig:
     """Configuration for processing transcripts."""
@@ -29,11 +43,23 @@ class ProcessingConfig:
     source_path: str  # URL for YouTube, folder path for local
     output_language: str
     refinement_style: RefinementStyle
-    chunk_size: int
+    chunk_size: int  # estimated transcript tokens per Gemini request
     gemini_model: str
     api_key: str
     transcript_output_file: str
     gemini_output_file: str
+    max_concurrent_videos: int = 3  # Videos refined by Gemini in parallel
+    max_concurrent_requests: int = 4  # Gemini calls in flight for independent chunks
+    # Gemini quotas; None uses the published limits of gemini_model
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    requests_per_day: Optional[int] = None
+    refinement_mode: RefinementMode = RefinementMode.SEQUENTIAL
+    overlap_words: int = 100  # Raw neighbouring words shown to each chunk in map-reduce mode
+    context_mode: Optional[ContextMode] = None  # None uses the refinement style's default
+    context_tokens: int = 500  # Budget of the carried-over context
+    max_videos_per_request: int = 10  # Short videos packed into one Gemini request; 1 disables packing
+    model_routing: bool = False  # Route chunks across GeminiModels.FALLBACK_CASCADE instead of only gemini_model
 
 
 @dataclass
@@ -44,6 +70,8 @@ class TranscriptVideo:
     content: str
     success: bool
     error_message: Optional[str] = None
+    error_code: Optional[str] = None
+    attempts: int = 1
 
 
 @dataclass
@@ -65,6 +93,7 @@ class ProcessingResult:
     videos_processed: int = 0
     total_videos: int = 0
     content: Optional[str] = None
+    error_code: Optional[str] = None
 
 
 class ProcessingPrompts:
@@ -125,12 +154,32 @@ class ProcessingPrompts:
     Transcript:"""
     }
 
+    # Estimated transcript tokens per request
     CATEGORY_CHUNK_SIZES = {
-        RefinementStyle.BALANCED_DETAILED: 3000,
-        RefinementStyle.SUMMARY: 10000,
-        RefinementStyle.EDUCATIONAL: 3000,
-        RefinementStyle.NARRATIVE_REWRITING: 5000,
-        RefinementStyle.QA_GENERATION: 3000
+        RefinementStyle.BALANCED_DETAILED: 4000,
+        RefinementStyle.SUMMARY: 13000,
+        RefinementStyle.EDUCATIONAL: 4000,
+        RefinementStyle.NARRATIVE_REWRITING: 6500,
+        RefinementStyle.QA_GENERATION: 4000
+    }
+
+    # What each chunk carries over from earlier responses of the same video
+    CATEGORY_CONTEXT_MODES = {
+        RefinementStyle.BALANCED_DETAILED: ContextMode.TAIL,
+        RefinementStyle.SUMMARY: ContextMode.SUMMARY,
+        RefinementStyle.EDUCATIONAL: ContextMode.OUTLINE,
+        RefinementStyle.NARRATIVE_REWRITING: ContextMode.TAIL,
+        RefinementStyle.QA_GENERATION: ContextMode.OUTLINE
+    }
+
+    # Largest prompt, in estimated tokens, that is routed to a fast model
+    # first; styles that must keep every detail stay on the configured model
+    CATEGORY_FAST_MODEL_TOKENS = {
+        RefinementStyle.BALANCED_DETAILED: 0,
+        RefinementStyle.SUMMARY: 14000,
+        RefinementStyle.EDUCATIONAL: 0,
+        RefinementStyle.NARRATIVE_REWRITING: 0,
+        RefinementStyle.QA_GENERATION: 5000
     }
 
     @classmethod
@@ -140,8 +189,26 @@ class ProcessingPrompts:
 
     @classmethod
     def get_default_chunk_size(cls, style: RefinementStyle) -> int:
-        """Get the default chunk size for a specific refinement style."""
-        return cls.CATEGORY_CHUNK_SIZES.get(style, 3000)
+        """Get the default chunk size, in tokens, for a specific refinement style."""
+        return cls.CATEGORY_CHUNK_SIZES.get(style, 4000)
+
+    @classmethod
+    def get_context_mode(cls, style: RefinementStyle) -> ContextMode:
+        """Get the default context carry-over for a specific refinement style."""
+        return cls.CATEGORY_CONTEXT_MODES.get(style, ContextMode.TAIL)
+
+    @classmethod
+    def get_fast_model_tokens(cls, style: RefinementStyle) -> int:
+        """Get the largest prompt, in tokens, a style sends to a fast model first."""
+        return cls.CATEGORY_FAST_MODEL_TOKENS.get(style, 0)
+
+
+@dataclass(frozen=True)
+class ModelLimits:
+    """Rate limits of a Gemini model (None means unlimited)."""
+    requests_per_minute: int
+    tokens_per_minute: Optional[int] = None
+    requests_per_day: Optional[int] = None
 
 
 class GeminiModels:
@@ -159,6 +226,34 @@ class GeminiModels:
     ]
     
     DEFAULT_MODEL = "gemini-2.5-flash"
+    
+    # Models that take over, in order, when the configured one is rate
+    # limited, out of daily quota or unavailable. Stable releases only,
+    # since preview and experimental models can be withdrawn at any time.
+    FALLBACK_CASCADE = [
+        "gemini-2.5-flash",
+        "gemini-2.0-flash",
+        "gemini-2.0-flash-lite",
+        "gemini-1.5-flash"
+    ]
+    
+    # Lowest-latency stable models, tried first for light work
+    FAST_MODELS = [
+        "gemini-2.0-flash-lite"
+    ]
+    
+    # Published free tier limits, matched by longest model name prefix
+    MODEL_LIMITS: Dict[str, ModelLimits] = {
+        "gemini-2.5-pro": ModelLimits(5, 250_000, 100),
+        "gemini-2.5-flash": ModelLimits(10, 250_000, 250),
+        "gemini-2.5-flash-lite": ModelLimits(15, 250_000, 1_000),
+        "gemini-2.0-flash": ModelLimits(15, 1_000_000, 200),
+        "gemini-2.0-flash-lite": ModelLimits(30, 1_000_000, 200),
+        "gemini-2.0-flash-thinking": ModelLimits(10, 4_000_000, 1_500),
+        "gemini-1.5-flash": ModelLimits(15, 1_000_000, 1_500),
+        "gemini-1.5-pro": ModelLimits(2, 32_000, 50),
+    }
+    DEFAULT_LIMITS = ModelLimits(10, 250_000, 250)
 
     @classmethod
     def get_models(cls) -> List[str]:
@@ -169,3 +264,37 @@ class GeminiModels:
     def get_default_model(cls) -> str:
         """Get the default model."""
         return cls.DEFAULT_MODEL
+    
+    @classmethod
+    def get_limits(cls, model_name: str) -> ModelLimits:
+        """Get the rate limits of a model.
+        
+        Args:
+            model_name: Gemini model name, possibly with a version suffix
+            
+        Returns:
+            Limits of the longest matching model family, or DEFAULT_LIMITS
+        """
+        family = cls._family(model_name, cls.MODEL_LIMITS)
+        return cls.MODEL_LIMITS[family] if family else cls.DEFAULT_LIMITS
+    
+    @classmethod
+    def get_cascade(cls, primary_model: str, fast_first: bool = False) -> List[str]:
+        """Get the models to try for a request, in order of preference.
+        
+        Args:
+            primary_model: Configured model, tried before the fallbacks
+            fast_first: Try the fast models before the configured one
+            
+        Returns:
+            Model names without duplicates
+        """
+        models = cls.FAST_MODELS + [primary_model] if fast_first else [primary_model]
+        return list(dict.fromkeys(models + cls.FALLBACK_CASCADE))
+    
+    @staticmethod
+    def _family(model_name: str, table: Dict[str, Any]) -> Optional[str]:
+        """Return the longest key of a table that the model name starts with."""
+        name = model_name[len("models/"):] if model_name.startswith("models/") else model_name
+        matches = [family for family in table if name.startswith(family)]
+        return max(matches, key=len) if matches else None
@@ -0,0 +1,240 @@
+"""
+Streaming output for refined videos produced concurrently.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Dict, List, Optional
+
+# Called with a stream's current length in characters after every change
+LengthListener = Callable[[int], None]
+
+
+class MemoryStream:
+    """Text stream collected in memory, reporting its length as it grows.
+
+    It can also stand in for a :class:`VideoStream` when refined text is
+    not written to a file.
+    """
+
+    def __init__(self, listener: Optional[LengthListener] = None):
+        """Initialize the stream.
+
+        Args:
+            listener: Optional callback receiving the length after each change
+        """
+        self.listener = listener
+        self._parts: List[str] = []
+        self._length = 0
+
+    @property
+    def text(self) -> str:
+        """Everything written so far."""
+        return "".join(self._parts)
+
+    def write(self, text: str) -> None:
+        """Append text to the stream."""
+        if not text:
+            return
+        self._parts.append(text)
+        self._length += len(text)
+        if self.listener:
+            self.listener(self._length)
+
+    def mark(self) -> int:
+        """Return a position that :meth:`rollback` can return to."""
+        return self._length
+
+    def rollback(self, mark: int) -> None:
+        """Drop everything written after a mark."""
+        if mark >= self._length:
+            return
+        self._parts = [self.text[:mark]]
+        self._length = mark
+        if self.listener:
+            self.listener(self._length)
+
+    def finish(self) -> None:
+        """Mark the text complete; nothing to do in memory."""
+
+    def discard(self) -> None:
+        """Drop everything written so far."""
+        self.rollback(0)
+
+
+@dataclass
+class _VideoOutput:
+    """Text of one video, kept until every earlier video is written."""
+    parts: List[str] = field(default_factory=list)
+    length: int = 0
+    finished: bool = False
+    discarded: bool = False
+
+
+class VideoStream:
+    """Write handle for one video of an :class:`OrderedOutputStream`."""
+
+    def __init__(self, output: "OrderedOutputStream", index: int, listener: Optional[LengthListener] = None):
+        """Initialize the handle.
+
+        Args:
+            output: Stream the video belongs to
+            index: Position of the video in the output
+            listener: Optional callback receiving the video's length after each change
+        """
+        self.output = output
+        self.index = index
+        self.listener = listener
+
+    def write(self, text: str) -> None:
+        """Append text to the video."""
+        self._notify(self.output._write(self.index, text))
+
+    def mark(self) -> int:
+        """Return a position that :meth:`rollback` can return to."""
+        return self.output._mark(self.index)
+
+    def rollback(self, mark: int) -> None:
+        """Drop everything written to the video after a mark."""
+        self._notify(self.output._rollback(self.index, mark))
+
+    def finish(self) -> None:
+        """Mark the video complete so later videos can follow it."""
+        self.output._finish(self.index)
+
+    def discard(self) -> None:
+        """Drop the video entirely, including text already in the file."""
+        self.output._discard(self.index)
+
+    def _notify(self, length: Optional[int]) -> None:
+        if self.listener and length is not None:
+            self.listener(length)
+
+
+class OrderedOutputStream:
+    """Appends videos to one file in order while they are produced concurrently.
+
+    The earliest unfinished video is written to the file and flushed as its
+    text arrives; text for later videos is buffered until every video
+    before them is finished or discarded. Each video's text can be rolled
+    back to a mark, so a retried Gemini call does not leave a partial
+    response behind, even if it was already flushed to disk.
+    """
+
+    def __init__(self, path: str, first_index: int = 0, truncate: bool = False):
+        """Open the output file.
+
+        Args:
+            path: File the videos are appended to
+            first_index: Index of the first video
+            truncate: Empty the file first instead of appending to it
+        """
+        self.path = path
+        self._file: Optional[BinaryIO] = open(path, "wb" if truncate else "ab")
+        self._lock = threading.Lock()
+        self._videos: Dict[int, _VideoOutput] = {}
+        self._head = first_index
+        self._head_start = self._file.tell()
+        self.logger = logging.getLogger(__name__)
+
+    def __enter__(self) -> "OrderedOutputStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def video(self, index: int, listener: Optional[LengthListener] = None) -> VideoStream:
+        """Return the write handle for a video.
+
+        Args:
+            index: Position of the video in the output
+            listener: Optional callback receiving the video's length after each change
+
+        Returns:
+            VideoStream for the video
+        """
+        return VideoStream(self, index, listener)
+
+    def close(self, discard_unfinished: bool = True) -> None:
+        """Close the file.
+
+        Args:
+            discard_unfinished: Remove the partial text of an unfinished
+                video that was already written
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            head = self._videos.get(self._head)
+            if discard_unfinished and head is not None and head.length:
+                self._file.truncate(self._head_start)
+            self._file.close()
+            self._file = None
+            self._videos.clear()
+
+    def _video(self, index: int) -> _VideoOutput:
+        if index < self._head:
+            raise ValueError(f"Video {index} was already written")
+        return self._videos.setdefault(index, _VideoOutput())
+
+    def _write(self, index: int, text: str) -> Optional[int]:
+        if not text:
+            return None
+        with self._lock:
+            video = self._video(index)
+            video.parts.append(text)
+            video.length += len(text)
+            if index == self._head and self._file is not None:
+                self._file.write(text.encode("utf-8"))
+                self._file.flush()
+            return video.length
+
+    def _mark(self, index: int) -> int:
+        with self._lock:
+            return self._video(index).length
+
+    def _rollback(self, index: int, mark: int) -> Optional[int]:
+        with self._lock:
+            video = self._video(index)
+            if mark >= video.length:
+                return None
+            kept = "".join(video.parts)[:mark]
+            video.parts = [kept]
+            video.length = mark
+            if index == self._head and self._file is not None:
+                self._file.truncate(self._head_start + len(kept.encode("utf-8")))
+                self._file.seek(0, 2)
+            return video.length
+
+    def _finish(self, index: int) -> None:
+        with self._lock:
+            self._video(index).finished = True
+            self._advance()
+
+    def _discard(self, index: int) -> None:
+        with self._lock:
+            video = self._video(index)
+            if index == self._head and self._file is not None and video.length:
+                self._file.truncate(self._head_start)
+                self._file.seek(0, 2)
+            video.parts = []
+            video.length = 0
+            video.discarded = True
+            self._advance()
+
+    def _advance(self) -> None:
+        """Move past completed videos and flush the next one's buffered text."""
+        while True:
+            head = self._videos.get(self._head)
+            if head is None or not (head.finished or head.discarded):
+                return
+            del self._videos[self._head]
+            self._head += 1
+            if self._file is None:
+                continue
+            self._head_start = self._file.tell()
+            following = self._videos.get(self._head)
+            if following is not None and following.parts:
+                self._file.write("".join(following.parts).encode("utf-8"))
+                self._file.flush()
@@ -0,0 +1,435 @@
+"""
+Blocking request pacing for the sequential transcript fetch path and Gemini calls.
+"""
+
+import time
+import bisect
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .models import GeminiModels
+from .quota_usage import QuotaUsageStore, quota_day
+
+
+class RequestPacer:
+    """Synchronous token bucket that paces requests to a target rate.
+
+    Time spent doing the request itself refills the bucket, so a caller
+    only sleeps for whatever remains of its slot instead of a fixed delay
+    on top of every request. Up to ``burst`` requests may go out back to
+    back before pacing kicks in.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = 0.5,
+        burst: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """Initialize the pacer.
+
+        Args:
+            rate_per_second: Target sustained request rate
+            burst: Number of requests allowed without waiting
+            clock: Monotonic clock returning seconds
+            sleep: Function used to wait
+        """
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+
+        self.rate = rate_per_second
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._last_update = clock()
+        self._blocked_until = 0.0
+        self.total_wait = 0.0
+        self.logger = logging.getLogger(__name__)
+
+    def _refill(self) -> float:
+        """Add tokens for the time elapsed since the last update."""
+        now = self._clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._last_update) * self.rate)
+        self._last_update = now
+        return now
+
+    def wait(self) -> float:
+        """Block until a request may be made, then consume a token.
+
+        Returns:
+            Seconds spent sleeping
+        """
+        now = self._refill()
+
+        wait_time = max(0.0, self._blocked_until - now)
+        if self.tokens < 1:
+            wait_time = max(wait_time, (1 - self.tokens) / self.rate)
+
+        if wait_time > 0:
+            self._sleep(wait_time)
+            self.total_wait += wait_time
+            self._refill()
+
+        self.tokens = max(0.0, self.tokens - 1)
+        return wait_time
+
+    def backoff(self, seconds: float) -> None:
+        """Hold off the next request after a block or failure.
+
+        The delay is measured from now, so work done before the next
+        ``wait()`` counts towards it.
+
+        Args:
+            seconds: Minimum time before the next request
+        """
+        self._refill()
+        self.tokens = 0.0
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+        self.logger.debug(f"Request pacer backing off for {seconds:.1f}s")
+
+
+class DailyQuotaExceeded(Exception):
+    """Raised when a model's daily request quota has been used up."""
+
+
+class QuotaLimiter:
+    """Thread-safe limiter for a model's per-minute and per-day quotas.
+
+    Requests and tokens are counted over a rolling 60 second window, the
+    way Gemini enforces them. A caller reserves its request and estimated
+    tokens up front at the earliest time both budgets leave room for it,
+    then sleeps outside the lock until then. Reservations are handed out
+    in order, so concurrent callers queue up behind each other instead of
+    all waking at once. Tokens only known after a call, such as the
+    response length, are charged with :meth:`consume`. Threads wait with
+    :meth:`acquire` and coroutines with :meth:`acquire_async`, against the
+    same quotas.
+
+    A daily request quota is never waited for: once it is used up,
+    :meth:`reserve` raises :class:`DailyQuotaExceeded`. Requests that fail
+    are given back with :meth:`refund`, so only answered ones use it up.
+    With a usage store the daily counters survive restarts.
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(
+        self,
+        requests_per_minute: float = 60,
+        tokens_per_minute: Optional[float] = None,
+        requests_per_day: Optional[int] = None,
+        usage_store: Optional[QuotaUsageStore] = None,
+        usage_key: str = "default",
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        today: Callable[[], str] = quota_day
+    ):
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Request quota per rolling minute
+            tokens_per_minute: Token quota per rolling minute (None for no token limit)
+            requests_per_day: Request quota per day (None for no daily limit)
+            usage_store: Optional store that persists daily usage
+            usage_key: Name the usage is recorded under, usually the model name
+            clock: Monotonic clock returning seconds
+            sleep: Function used to wait
+            async_sleep: Coroutine function used to wait in :meth:`acquire_async`
+            today: Function returning the current quota day
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if tokens_per_minute is not None and tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be positive")
+        if requests_per_day is not None and requests_per_day <= 0:
+            raise ValueError("requests_per_day must be positive")
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.requests_per_day = requests_per_day
+        self.usage_store = usage_store
+        self.usage_key = usage_key
+        self._clock = clock
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+        self._today = today
+        # (time, requests, tokens) sorted by time; reservations may lie in the future
+        self._events: List[Tuple[float, int, int]] = []
+        self._last_reserved = float("-inf")
+        self._day: Optional[str] = None
+        self.requests_today = 0
+        self.tokens_today = 0
+        self._lock = threading.Lock()
+        self.total_wait = 0.0
+        self.logger = logging.getLogger(__name__)
+
+    def _roll_day(self) -> str:
+        """Start counting a new day, loading what earlier runs already used."""
+        day = self._today()
+        if day != self._day:
+            self._day = day
+            if self.usage_store is not None:
+                self.requests_today, self.tokens_today = self.usage_store.get(self.usage_key, day)
+            else:
+                self.requests_today, self.tokens_today = 0, 0
+        return day
+
+    def _record(self, requests: int, tokens: int) -> None:
+        """Count usage against today and persist it."""
+        day = self._roll_day()
+        self.requests_today += requests
+        self.tokens_today += tokens
+        if self.usage_store is not None:
+            self.usage_store.add(self.usage_key, day, requests, tokens)
+
+    def _earliest_start(self, start: float, tokens: int) -> float:
+        """Find the first time from ``start`` at which a request fits both budgets."""
+        t = start
+        # Events still in the window at t, and their running totals as the
+        # oldest ones leave it
+        first = bisect.bisect_right(self._events, (t - self.WINDOW_SECONDS, float("inf"), float("inf")))
+        requests = sum(event[1] for event in self._events[first:])
+        used_tokens = sum(event[2] for event in self._events[first:])
+        while first < len(self._events):
+            fits_requests = requests + 1 <= self.requests_per_minute
+            fits_tokens = not self.tokens_per_minute or used_tokens + tokens <= self.tokens_per_minute
+            if fits_requests and fits_tokens:
+                return t
+            # Nothing changes until the oldest event leaves the window
+            t = self._events[first][0] + self.WINDOW_SECONDS
+            while first < len(self._events) and self._events[first][0] <= t - self.WINDOW_SECONDS:
+                requests -= self._events[first][1]
+                used_tokens -= self._events[first][2]
+                first += 1
+        return t
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Take quota for one request without waiting.
+
+        Args:
+            tokens: Estimated tokens the request will use
+
+        Returns:
+            Seconds the caller must wait before sending the request
+
+        Raises:
+            DailyQuotaExceeded: If the daily request quota is used up
+        """
+        with self._lock:
+            now = self._clock()
+            self._roll_day()
+            if self.requests_per_day is not None and self.requests_today >= self.requests_per_day:
+                raise DailyQuotaExceeded(
+                    f"Daily quota of {self.requests_per_day} requests for {self.usage_key} is used up"
+                )
+
+            # Events that left the window can no longer affect any reservation
+            cutoff = max(now, self._last_reserved) - self.WINDOW_SECONDS
+            self._events = [event for event in self._events if event[0] > cutoff]
+
+            if self.tokens_per_minute:
+                # A request larger than the whole quota still has to go out eventually
+                tokens = min(tokens, int(self.tokens_per_minute))
+            start = self._earliest_start(max(now, self._last_reserved), tokens)
+            bisect.insort(self._events, (start, 1, tokens))
+            self._last_reserved = start
+            self._record(1, tokens)
+            return start - now
+
+    def refund(self, tokens: int = 0) -> None:
+        """Give back the daily quota of a reserved request that got no answer.
+
+        The request keeps its place in the per-minute window, since it may
+        still have reached the server.
+
+        Args:
+            tokens: Estimated tokens the request was reserved with
+        """
+        with self._lock:
+            self._roll_day()
+            if self.requests_today <= 0:
+                return
+            if self.tokens_per_minute:
+                tokens = min(tokens, int(self.tokens_per_minute))
+            self._record(-1, -min(tokens, self.tokens_today))
+
+    def peek(self, tokens: int = 0) -> Optional[float]:
+        """Check how long a request would wait, without taking quota.
+
+        Args:
+            tokens: Estimated tokens the request would use
+
+        Returns:
+            Seconds until the request would fit, or None if the daily
+            request quota is used up
+        """
+        with self._lock:
+            now = self._clock()
+            self._roll_day()
+            if self.requests_per_day is not None and self.requests_today >= self.requests_per_day:
+                return None
+            if self.tokens_per_minute:
+                tokens = min(tokens, int(self.tokens_per_minute))
+            return self._earliest_start(max(now, self._last_reserved), tokens) - now
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until a request using ``tokens`` tokens fits in the quotas.
+
+        Args:
+            tokens: Estimated tokens the request will use
+
+        Returns:
+            Seconds spent sleeping
+
+        Raises:
+            DailyQuotaExceeded: If the daily request quota is used up
+        """
+        wait_time = self.reserve(tokens)
+        if wait_time > 0:
+            self.logger.debug(f"Quota limiter for {self.usage_key} waiting {wait_time:.2f}s")
+            self._sleep(wait_time)
+            with self._lock:
+                self.total_wait += wait_time
+        return wait_time
+
+    async def acquire_async(self, tokens: int = 0) -> float:
+        """Wait without blocking the event loop until a request fits the quotas.
+
+        Args:
+            tokens: Estimated tokens the request will use
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            DailyQuotaExceeded: If the daily request quota is used up
+        """
+        wait_time = self.reserve(tokens)
+        if wait_time > 0:
+            self.logger.debug(f"Quota limiter for {self.usage_key} waiting {wait_time:.2f}s")
+            await self._async_sleep(wait_time)
+            with self._lock:
+                self.total_wait += wait_time
+        return wait_time
+
+    def consume(self, tokens: int) -> None:
+        """Charge tokens that were only known after the request.
+
+        Args:
+            tokens: Additional tokens used
+        """
+        if tokens <= 0:
+            return
+        with self._lock:
+            if self.tokens_per_minute:
+                bisect.insort(self._events, (self._clock(), 0, tokens))
+            self._record(0, tokens)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get the limits and today's usage.
+
+        Returns:
+            Dictionary with the configured quotas, daily usage and time spent waiting
+        """
+        with self._lock:
+            self._roll_day()
+            return {
+                "requests_per_minute": self.requests_per_minute,
+                "tokens_per_minute": self.tokens_per_minute,
+                "requests_per_day": self.requests_per_day,
+                "requests_today": self.requests_today,
+                "tokens_today": self.tokens_today,
+                "total_wait": self.total_wait
+            }
+
+
+class ModelQuotas:
+    """One :class:`QuotaLimiter` per Gemini model.
+
+    Each model has its own quotas, so a slow model does not hold back a
+    fast one. Limiters are built on first use from the per-minute limits
+    published in :class:`GeminiModels`, or from overrides registered for a
+    model, and share one usage store. Published daily limits are only
+    advisory: paid tiers allow far more, so a daily quota is enforced only
+    when one is configured.
+    """
+
+    def __init__(self, usage_store: Optional[QuotaUsageStore] = None, **limiter_options: Any):
+        """Initialize the registry.
+
+        Args:
+            usage_store: Optional store that persists daily usage of every model
+            **limiter_options: Extra QuotaLimiter arguments such as clock or sleep
+        """
+        self.usage_store = usage_store
+        self._limiter_options = limiter_options
+        self._limiters: Dict[str, QuotaLimiter] = {}
+        self._lock = threading.RLock()
+
+    def configure(
+        self,
+        model_name: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        requests_per_day: Optional[int] = None
+    ) -> QuotaLimiter:
+        """Build a model's limiter, overriding some of its published limits.
+
+        Args:
+            model_name: Gemini model name
+            requests_per_minute: Request quota per minute (None for the published one)
+            tokens_per_minute: Token quota per minute (None for the published one)
+            requests_per_day: Request quota per day (None for no daily limit)
+
+        Returns:
+            The model's new limiter
+        """
+        limits = GeminiModels.get_limits(model_name)
+        limiter = QuotaLimiter(
+            requests_per_minute=requests_per_minute or limits.requests_per_minute,
+            tokens_per_minute=tokens_per_minute or limits.tokens_per_minute,
+            requests_per_day=requests_per_day,
+            usage_store=self.usage_store,
+            usage_key=model_name,
+            **self._limiter_options
+        )
+        self.register(model_name, limiter)
+        return limiter
+
+    def register(self, model_name: str, limiter: QuotaLimiter) -> None:
+        """Use a ready-made limiter for a model.
+
+        Args:
+            model_name: Gemini model name
+            limiter: Limiter for the model's requests
+        """
+        with self._lock:
+            self._limiters[model_name] = limiter
+
+    def limiter(self, model_name: str) -> QuotaLimiter:
+        """Get the limiter for a model, building it on first use.
+
+        Args:
+            model_name: Gemini model name
+
+        Returns:
+            QuotaLimiter for the model
+        """
+        with self._lock:
+            limiter = self._limiters.get(model_name)
+            return limiter or self.configure(model_name)
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Get limits and usage of every model used so far.
+
+        Returns:
+            Dictionary mapping model names to limiter statistics
+        """
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {name: limiter.get_statistics() for name, limiter in limiters.items()}
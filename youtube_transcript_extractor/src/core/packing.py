@@ -0,0 +1,162 @@
+"""
+Packing several short videos into one Gemini request.
+"""
+
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Callable, List, Optional
+
+
+# Line that introduces each video, in the prompt and in the response
+_MARKER = "===== VIDEO {number} ====="
+_MARKER_LINE = re.compile(r"^[ \t]*=+[ \t]*VIDEO[ \t]+(\d+)[ \t]*=+[ \t]*$", re.MULTILINE | re.IGNORECASE)
+
+
+def pack_videos(token_counts: List[int], budget: int, max_videos: int, max_video_tokens: int) -> List[List[int]]:
+    """Group consecutive short videos into requests that fit a token budget.
+
+    Only neighbouring videos are grouped, so every group can be written to
+    the output as soon as it is done. Videos above ``max_video_tokens``
+    are refined on their own and end the current group.
+
+    Args:
+        token_counts: Estimated tokens of each video's transcript
+        budget: Estimated transcript tokens of one packed request
+        max_videos: Most videos in one request
+        max_video_tokens: Largest transcript that is packed with others
+
+    Returns:
+        Groups of video indices in order; groups of one are refined alone
+    """
+    packer = VideoPacker(budget, max_videos, max_video_tokens)
+    groups: List[List[int]] = []
+    for index, tokens in enumerate(token_counts):
+        groups.extend(packer.add(index, tokens))
+    groups.extend(packer.flush())
+    return groups
+
+
+class VideoPacker:
+    """Groups videos as they arrive, the same way :func:`pack_videos` does.
+
+    A group is handed back as soon as it cannot grow any more: when it is
+    full, or when the next video does not fit into it.
+    """
+
+    def __init__(self, budget: int, max_videos: int, max_video_tokens: int):
+        """Initialize the packer.
+
+        Args:
+            budget: Estimated transcript tokens of one packed request
+            max_videos: Most videos in one request
+            max_video_tokens: Largest transcript that is packed with others
+        """
+        self.budget = budget
+        self.max_videos = max_videos
+        self.max_video_tokens = max_video_tokens
+        self._group: List[Any] = []
+        self._group_tokens = 0
+
+    def add(self, item: Any, tokens: Optional[int]) -> List[List[Any]]:
+        """Add the next video.
+
+        Args:
+            item: The video
+            tokens: Estimated tokens of its transcript, or None for an item
+                that must not be packed with others
+
+        Returns:
+            Groups completed by this video, in order
+        """
+        if tokens is None or self.max_videos < 2 or tokens > self.max_video_tokens:
+            return self.flush() + [[item]]
+
+        done = []
+        if self._group and self._group_tokens + tokens > self.budget:
+            done = self.flush()
+        self._group.append(item)
+        self._group_tokens += tokens
+        if len(self._group) >= self.max_videos:
+            done.extend(self.flush())
+        return done
+
+    def flush(self) -> List[List[Any]]:
+        """Hand back the group being filled, if any.
+
+        Returns:
+            The unfinished group, or nothing
+        """
+        group, self._group, self._group_tokens = self._group, [], 0
+        return [group] if group else []
+
+
+async def pack_stream(items: AsyncIterable[Any], tokens: Callable[[Any], Optional[int]],
+                      budget: int, max_videos: int, max_video_tokens: int) -> AsyncIterator[List[Any]]:
+    """Group neighbouring short videos of a stream as they arrive.
+
+    A short video waits for the next one to arrive before its group moves
+    on, unless the group is already full.
+
+    Args:
+        items: Videos in order
+        tokens: Estimated transcript tokens of a video, or None for an item
+            passed on alone (e.g. a video without transcript)
+        budget: Estimated transcript tokens of one packed request
+        max_videos: Most videos in one request
+        max_video_tokens: Largest transcript that is packed with others
+
+    Yields:
+        Groups of videos in order
+    """
+    packer = VideoPacker(budget, max_videos, max_video_tokens)
+    async for item in items:
+        for group in packer.add(item, tokens(item)):
+            yield group
+    for group in packer.flush():
+        yield group
+
+
+def build_packed_prompt(transcripts: List[str]) -> str:
+    """Build the part of a request that follows the style prompt.
+
+    Args:
+        transcripts: Transcripts of the packed videos in order
+
+    Returns:
+        Instructions followed by the delimited transcripts
+    """
+    sections = "".join(
+        f"{_MARKER.format(number=number)}\n{transcript.strip()}\n\n"
+        for number, transcript in enumerate(transcripts, 1)
+    )
+    return (
+        f"The transcripts of {len(transcripts)} separate videos follow, each introduced by a line like "
+        f"\"{_MARKER.format(number=1)}\". Refine every video on its own as instructed above. "
+        "Start the output for each video with its marker line, exactly as given and in the same order, "
+        "and write nothing outside the videos' outputs.\n\n"
+        f"{sections}"
+    )
+
+
+def split_packed_response(text: str, count: int) -> Optional[List[str]]:
+    """Split a packed response into the outputs of its videos.
+
+    Args:
+        text: Response to a prompt from :func:`build_packed_prompt`
+        count: Number of packed videos
+
+    Returns:
+        Output of each video in order, or None unless every video has
+        exactly one marker, in order, followed by some text
+    """
+    markers = list(_MARKER_LINE.finditer(text))
+    if [int(marker.group(1)) for marker in markers] != list(range(1, count + 1)):
+        return None
+
+    parts = []
+    for marker, following in zip(markers, markers[1:] + [None]):
+        end = following.start() if following else len(text)
+        part = text[marker.end():end].strip()
+        if not part:
+            return None
+        parts.append(part)
+    return parts
@@ -0,0 +1,278 @@
+"""
+Staged processing pipeline connecting fetch, refine and export work.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, List, Optional, Union
+
+
+# Marks an item dropped by an earlier stage; it still flows through so that
+# ordered stages do not wait for it
+_DROPPED = object()
+
+
+@dataclass
+class PipelineStage:
+    """A step of the pipeline.
+
+    The handler receives an item and returns the item for the next stage;
+    returning None drops the item. Blocking handlers run on the pipeline's
+    worker threads so they do not stall the event loop. An ordered stage
+    sees items in source order and runs a single worker.
+    """
+    name: str
+    handler: Callable[[Any], Any]
+    workers: int = 1
+    blocking: bool = False
+    ordered: bool = False
+
+
+@dataclass
+class StageStatistics:
+    """Counters for one pipeline stage."""
+    processed: int = 0
+    dropped: int = 0
+    failed: int = 0
+    busy_time: float = 0.0
+
+
+@dataclass
+class PipelineStatistics:
+    """Outcome of a pipeline run."""
+    items: int = 0
+    completed: int = 0
+    elapsed: float = 0.0
+    cancelled: bool = False
+    stages: Dict[str, StageStatistics] = field(default_factory=dict)
+
+
+class ThreadedSource:
+    """Async iterator over items a blocking producer emits from a thread.
+
+    The producer is called with an ``emit`` function and runs on a worker
+    thread. ``emit`` blocks while the hand-over queue is full, so a fast
+    producer is held back by the pipeline instead of buffering everything.
+    The producer's return value is kept in :attr:`result`.
+    """
+
+    def __init__(self, producer: Callable[[Callable[[Any], None]], Any], maxsize: int = 2):
+        """Initialize the source.
+
+        Args:
+            producer: Blocking function called with the emit function
+            maxsize: Items that may wait between the thread and the pipeline
+        """
+        self.producer = producer
+        self.maxsize = max(1, maxsize)
+        self.result: Any = None
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        """Run the producer and yield what it emits."""
+        loop = asyncio.get_running_loop()
+        items: asyncio.Queue = asyncio.Queue(maxsize=self.maxsize)
+        stop = threading.Event()
+        finished = object()
+
+        def hand_over(item: Any) -> bool:
+            """Put an item on the queue from the producer thread."""
+            future = asyncio.run_coroutine_threadsafe(items.put(item), loop)
+            while True:
+                try:
+                    future.result(timeout=0.1)
+                    return True
+                except FutureTimeoutError:
+                    if stop.is_set():
+                        future.cancel()
+                        return False
+
+        def emit(item: Any) -> None:
+            if not hand_over(item):
+                raise RuntimeError("Pipeline stopped")
+
+        def produce() -> None:
+            try:
+                self.result = self.producer(emit)
+                hand_over(finished)
+            except Exception as e:
+                hand_over(e)
+
+        producer = loop.run_in_executor(None, produce)
+        try:
+            while True:
+                item = await items.get()
+                if item is finished:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            await asyncio.gather(producer, return_exceptions=True)
+
+
+class Pipeline:
+    """Runs items through stages connected by bounded queues.
+
+    Every stage works on a different item at the same time, so video N can
+    be refined while video N+1 is still being fetched and exports start as
+    soon as the first item is through. At most ``max_in_flight`` items are
+    inside the pipeline at once, which bounds memory no matter how fast the
+    source is and keeps the reorder buffer of ordered stages small.
+    """
+
+    def __init__(self, stages: List[PipelineStage], queue_size: int = 2,
+                 max_in_flight: Optional[int] = None):
+        """Initialize the pipeline.
+
+        Args:
+            stages: Stages in processing order
+            queue_size: Capacity of the queue in front of each stage
+            max_in_flight: Items allowed between the source and the end of the
+                last stage (defaults to every stage's workers plus its queue)
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.max_in_flight = max_in_flight or sum(
+            (1 if stage.ordered else max(1, stage.workers)) + self.queue_size for stage in stages
+        )
+        self.logger = logging.getLogger(__name__)
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Stop taking new items from the source."""
+        self._cancelled = True
+
+    async def run(self, source: Union[Iterable[Any], AsyncIterable[Any]]) -> PipelineStatistics:
+        """Push every item from the source through all stages.
+
+        Args:
+            source: Iterable or async iterable of items for the first stage
+
+        Returns:
+            PipelineStatistics for the run
+        """
+        self._cancelled = False
+        stats = PipelineStatistics(stages={stage.name: StageStatistics() for stage in self.stages})
+        queues: List[asyncio.Queue] = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+        slots = asyncio.Semaphore(self.max_in_flight)
+        all_done = asyncio.Event()
+        producing = True
+        start_time = time.time()
+
+        blocking_workers = sum(max(1, stage.workers) for stage in self.stages if stage.blocking)
+        executor = ThreadPoolExecutor(max_workers=blocking_workers, thread_name_prefix="yte-pipeline") \
+            if blocking_workers else None
+        loop = asyncio.get_running_loop()
+
+        def finish_item() -> None:
+            stats.completed += 1
+            slots.release()
+            if not producing and stats.completed == stats.items:
+                all_done.set()
+
+        async def forward(position: int, sequence: int, item: Any) -> None:
+            if position + 1 < len(self.stages):
+                await queues[position + 1].put((sequence, item))
+            else:
+                finish_item()
+
+        async def apply(stage: PipelineStage, item: Any) -> Any:
+            stage_stats = stats.stages[stage.name]
+            started = time.time()
+            try:
+                if stage.blocking:
+                    result = await loop.run_in_executor(executor, stage.handler, item)
+                else:
+                    result = stage.handler(item)
+                    if asyncio.iscoroutine(result):
+                        result = await result
+            except Exception as e:
+                self.logger.error(f"Pipeline stage '{stage.name}' failed: {e}")
+                stage_stats.failed += 1
+                return _DROPPED
+            finally:
+                stage_stats.busy_time += time.time() - started
+
+            if result is None:
+                stage_stats.dropped += 1
+                return _DROPPED
+            stage_stats.processed += 1
+            return result
+
+        async def worker(position: int) -> None:
+            stage = self.stages[position]
+            while True:
+                sequence, item = await queues[position].get()
+                if item is not _DROPPED:
+                    item = await apply(stage, item)
+                await forward(position, sequence, item)
+
+        async def ordered_worker(position: int) -> None:
+            stage = self.stages[position]
+            pending: Dict[int, Any] = {}
+            expected = 0
+            while True:
+                sequence, item = await queues[position].get()
+                pending[sequence] = item
+                while expected in pending:
+                    item = pending.pop(expected)
+                    if item is not _DROPPED:
+                        item = await apply(stage, item)
+                    await forward(position, expected, item)
+                    expected += 1
+
+        workers = []
+        for position, stage in enumerate(self.stages):
+            if stage.ordered:
+                workers.append(asyncio.ensure_future(ordered_worker(position)))
+            else:
+                workers.extend(asyncio.ensure_future(worker(position)) for _ in range(max(1, stage.workers)))
+
+        try:
+            if isinstance(source, AsyncIterable):
+                async for item in source:
+                    if self._cancelled:
+                        break
+                    await slots.acquire()
+                    await queues[0].put((stats.items, item))
+                    stats.items += 1
+            else:
+                for item in source:
+                    if self._cancelled:
+                        break
+                    await slots.acquire()
+                    await queues[0].put((stats.items, item))
+                    stats.items += 1
+
+            producing = False
+            if stats.completed == stats.items:
+                all_done.set()
+            while not all_done.is_set():
+                if self._cancelled:
+                    break
+                try:
+                    await asyncio.wait_for(all_done.wait(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+        stats.cancelled = self._cancelled
+        stats.elapsed = time.time() - start_time
+        self.logger.info(
+            f"Pipeline finished {stats.completed}/{stats.items} items in {stats.elapsed:.1f}s "
+            + ", ".join(f"{name}: {stage.busy_time:.1f}s busy" for name, stage in stats.stages.items())
+        )
+        return stats
@@ -0,0 +1,325 @@
+"""
+Persisted playlist manifests so playlists are not re-enumerated on every run.
+"""
+
+import re
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple, Dict, Any
+import logging
+
+
+WATCH_URL = "https://www.youtube.com/watch?v={video_id}"
+
+_VIDEO_ID_PATTERN = re.compile(r"(?:v=|youtu\.be/|/shorts/)([a-zA-Z0-9_-]{11})")
+_PLAYLIST_ID_PATTERN = re.compile(r"[?&]list=([a-zA-Z0-9_-]+)")
+
+PlaylistLoader = Callable[[str], Tuple[Optional[str], Sequence[str]]]
+
+
+@dataclass
+class PlaylistManifest:
+    """Ordered snapshot of a playlist's videos."""
+    playlist_id: str
+    playlist_url: str
+    title: Optional[str]
+    video_ids: List[str]
+    fetched_at: float
+    last_seen: float
+    last_synced_at: Optional[float] = None
+    pending_ids: List[str] = field(default_factory=list)
+
+    @property
+    def video_urls(self) -> List[str]:
+        """Watch URLs for every video, in playlist order."""
+        return [WATCH_URL.format(video_id=video_id) for video_id in self.video_ids]
+
+    @property
+    def pending_urls(self) -> List[str]:
+        """Watch URLs for videos not yet processed by a sync run."""
+        return [WATCH_URL.format(video_id=video_id) for video_id in self.pending_ids]
+
+
+def extract_playlist_id(playlist_url: str) -> str:
+    """Get the playlist ID from a URL, falling back to the URL itself."""
+    match = _PLAYLIST_ID_PATTERN.search(playlist_url)
+    return match.group(1) if match else playlist_url
+
+
+def extract_video_id(video_url: str) -> Optional[str]:
+    """Get the video ID from a watch URL."""
+    match = _VIDEO_ID_PATTERN.search(video_url)
+    return match.group(1) if match else None
+
+
+class PlaylistManifestStore:
+    """SQLite store of playlist manifests with a freshness TTL.
+
+    Each video remembers whether a sync run has processed it, so a sync can
+    enqueue only the videos added since the last successful run.
+    """
+
+    DEFAULT_TTL_HOURS = 6
+
+    def __init__(self, db_path: Optional[Path] = None, ttl_hours: float = DEFAULT_TTL_HOURS):
+        """Initialize the manifest store.
+
+        Args:
+            db_path: Path to the SQLite database file (defaults to sit next to
+                the job database)
+            ttl_hours: Manifests older than this are re-enumerated
+        """
+        if db_path is None:
+            db_path = Path.home() / ".yte_playlists.db"
+
+        self.db_path = db_path
+        self.ttl_seconds = ttl_hours * 60 * 60
+        self.logger = logging.getLogger(__name__)
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize the manifest database schema."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS playlists (
+                        playlist_id TEXT PRIMARY KEY,
+                        playlist_url TEXT NOT NULL,
+                        title TEXT,
+                        fetched_at REAL NOT NULL,
+                        last_seen REAL NOT NULL,
+                        last_synced_at REAL
+                    )
+                """)
+
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS playlist_videos (
+                        playlist_id TEXT NOT NULL,
+                        video_id TEXT NOT NULL,
+                        position INTEGER NOT NULL,
+                        first_seen REAL NOT NULL,
+                        synced INTEGER DEFAULT 0,
+                        PRIMARY KEY (playlist_id, video_id),
+                        FOREIGN KEY(playlist_id) REFERENCES playlists(playlist_id) ON DELETE CASCADE
+                    )
+                """)
+
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_playlist_videos_position ON playlist_videos(playlist_id, position)")
+                conn.commit()
+
+        except Exception as e:
+            self.logger.error(f"Failed to initialize playlist manifest store: {e}")
+            raise
+
+    def get(self, playlist_url: str, allow_stale: bool = False) -> Optional[PlaylistManifest]:
+        """Load a stored manifest.
+
+        Args:
+            playlist_url: YouTube playlist URL
+            allow_stale: Return the manifest even if it is older than the TTL
+
+        Returns:
+            PlaylistManifest, or None if missing or expired
+        """
+        playlist_id = extract_playlist_id(playlist_url)
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                row = conn.execute(
+                    "SELECT * FROM playlists WHERE playlist_id = ?", (playlist_id,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if not allow_stale and time.time() - row["fetched_at"] > self.ttl_seconds:
+                    return None
+
+                videos = conn.execute("""
+                    SELECT video_id, synced FROM playlist_videos
+                    WHERE playlist_id = ? ORDER BY position
+                """, (playlist_id,)).fetchall()
+
+                now = time.time()
+                conn.execute(
+                    "UPDATE playlists SET last_seen = ? WHERE playlist_id = ?", (now, playlist_id)
+                )
+                conn.commit()
+
+            return PlaylistManifest(
+                playlist_id=playlist_id,
+                playlist_url=row["playlist_url"],
+                title=row["title"],
+                video_ids=[video["video_id"] for video in videos],
+                fetched_at=row["fetched_at"],
+                last_seen=now,
+                last_synced_at=row["last_synced_at"],
+                pending_ids=[video["video_id"] for video in videos if not video["synced"]]
+            )
+
+        except Exception as e:
+            self.logger.error(f"Failed to read playlist manifest for {playlist_id}: {e}")
+            return None
+
+    def save(self, playlist_url: str, title: Optional[str], video_urls: Sequence[str]) -> Optional[PlaylistManifest]:
+        """Store a freshly enumerated playlist.
+
+        Videos already known keep their sync state; new ones are pending and
+        videos no longer in the playlist are dropped.
+
+        Args:
+            playlist_url: YouTube playlist URL
+            title: Playlist title
+            video_urls: Video URLs in playlist order
+
+        Returns:
+            The stored PlaylistManifest, or None on failure
+        """
+        playlist_id = extract_playlist_id(playlist_url)
+        video_ids = []
+        for video_url in video_urls:
+            video_id = extract_video_id(video_url)
+            if video_id and video_id not in video_ids:
+                video_ids.append(video_id)
+
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    INSERT INTO playlists (playlist_id, playlist_url, title, fetched_at, last_seen)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(playlist_id) DO UPDATE SET
+                        playlist_url = excluded.playlist_url,
+                        title = excluded.title,
+                        fetched_at = excluded.fetched_at,
+                        last_seen = excluded.last_seen
+                """, (playlist_id, playlist_url, title, now, now))
+
+                conn.executemany("""
+                    INSERT INTO playlist_videos (playlist_id, video_id, position, first_seen)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(playlist_id, video_id) DO UPDATE SET position = excluded.position
+                """, [(playlist_id, video_id, position, now) for position, video_id in enumerate(video_ids)])
+
+                placeholders = ",".join("?" * len(video_ids))
+                conn.execute(
+                    f"DELETE FROM playlist_videos WHERE playlist_id = ? AND video_id NOT IN ({placeholders})",
+                    (playlist_id, *video_ids)
+                )
+                conn.commit()
+
+            self.logger.info(f"Stored manifest for playlist {playlist_id} with {len(video_ids)} videos")
+
+        except Exception as e:
+            self.logger.error(f"Failed to store playlist manifest for {playlist_id}: {e}")
+            return None
+
+        return self.get(playlist_url, allow_stale=True)
+
+    def resolve(self, playlist_url: str, loader: PlaylistLoader, refresh: bool = False) -> PlaylistManifest:
+        """Return the playlist manifest, enumerating the playlist only when needed.
+
+        Args:
+            playlist_url: YouTube playlist URL
+            loader: Called with the URL when enumeration is needed; returns the
+                playlist title and its video URLs in order
+            refresh: Ignore any stored manifest
+
+        Returns:
+            PlaylistManifest for the playlist
+        """
+        if not refresh:
+            manifest = self.get(playlist_url)
+            if manifest is not None:
+                self.logger.info(f"Using cached manifest for playlist {manifest.playlist_id}")
+                return manifest
+
+        title, video_urls = loader(playlist_url)
+        video_urls = list(video_urls)
+        manifest = self.save(playlist_url, title, video_urls)
+        if manifest is None:
+            # Storage failed; still hand back what was enumerated
+            video_ids = [video_id for video_id in map(extract_video_id, video_urls) if video_id]
+            now = time.time()
+            manifest = PlaylistManifest(
+                playlist_id=extract_playlist_id(playlist_url),
+                playlist_url=playlist_url,
+                title=title,
+                video_ids=video_ids,
+                fetched_at=now,
+                last_seen=now,
+                pending_ids=list(video_ids)
+            )
+        return manifest
+
+    def mark_synced(self, playlist_url: str, video_ids: Sequence[str]) -> bool:
+        """Record videos as processed so later sync runs skip them.
+
+        Args:
+            playlist_url: YouTube playlist URL
+            video_ids: IDs of the videos processed successfully
+
+        Returns:
+            True if updated successfully
+        """
+        playlist_id = extract_playlist_id(playlist_url)
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    "UPDATE playlist_videos SET synced = 1 WHERE playlist_id = ? AND video_id = ?",
+                    [(playlist_id, video_id) for video_id in video_ids]
+                )
+                conn.execute(
+                    "UPDATE playlists SET last_synced_at = ? WHERE playlist_id = ?",
+                    (time.time(), playlist_id)
+                )
+                conn.commit()
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to mark playlist {playlist_id} as synced: {e}")
+            return False
+
+    def delete(self, playlist_url: str) -> bool:
+        """Forget a playlist manifest.
+
+        Args:
+            playlist_url: YouTube playlist URL
+
+        Returns:
+            True if deleted successfully
+        """
+        playlist_id = extract_playlist_id(playlist_url)
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("DELETE FROM playlist_videos WHERE playlist_id = ?", (playlist_id,))
+                conn.execute("DELETE FROM playlists WHERE playlist_id = ?", (playlist_id,))
+                conn.commit()
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to delete playlist manifest for {playlist_id}: {e}")
+            return False
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get manifest store statistics.
+
+        Returns:
+            Dictionary with playlist and video counts
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                playlists = conn.execute("SELECT COUNT(*) FROM playlists").fetchone()[0]
+                videos, pending = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(synced = 0), 0) FROM playlist_videos"
+                ).fetchone()
+        except Exception as e:
+            self.logger.error(f"Failed to get playlist manifest statistics: {e}")
+            playlists, videos, pending = 0, 0, 0
+
+        return {
+            "playlists": playlists,
+            "videos": videos,
+            "pending_videos": pending,
+            "database_path": str(self.db_path)
+        }
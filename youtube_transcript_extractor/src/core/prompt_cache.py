@@ -0,0 +1,178 @@
+"""
+Prompt prefixes uploaded once and reused by every chunk.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class PromptPrefixCache(ABC):
+    """Uploads each prompt prefix once per model and reuses it by reference.
+
+    Every chunk of every video starts with the same rendered style prompt.
+    A prefix cache stores that prefix and hands out a model bound to it,
+    so each request only sends the text that follows. Prefixes that cannot
+    be cached are remembered as such and sent inline instead; prefixes
+    whose upload failed are tried again after a while.
+
+    Subclasses implement :meth:`_upload` and may implement :meth:`_delete`.
+    """
+
+    def __init__(self, ttl_seconds: float = 3600, retry_seconds: float = 300,
+                 clock: Callable[[], float] = time.monotonic):
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of an uploaded prefix; it is uploaded
+                again shortly before it expires
+            retry_seconds: How long a prefix whose upload failed is sent
+                inline before the upload is tried again
+            clock: Monotonic clock returning seconds
+        """
+        self.ttl_seconds = ttl_seconds
+        self.retry_seconds = retry_seconds
+        self._clock = clock
+        # (model, prefix hash) -> (bound model or None, resource, expiry)
+        self._entries: Dict[Tuple[str, str], Tuple[Optional[Any], Any, float]] = {}
+        # Uploads in progress, so concurrent workers wait for one upload per
+        # prefix while uploads of other prefixes go ahead
+        self._pending: Dict[Tuple[str, str], threading.Event] = {}
+        self._lock = threading.Lock()
+        self.uploads = 0
+        self.hits = 0
+        self.logger = logging.getLogger(__name__)
+
+    def model_for(self, model_name: str, prefix: str) -> Optional[Any]:
+        """Return a model that continues from a cached prefix.
+
+        Args:
+            model_name: Gemini model name
+            prefix: Prompt text every request starts with
+
+        Returns:
+            Model whose requests only need the text after the prefix, or
+            None if the prefix has to be sent inline
+        """
+        key = (model_name, hashlib.sha256(prefix.encode("utf-8")).hexdigest())
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                now = self._clock()
+                if entry is not None and entry[0] is None and now < entry[2]:
+                    return None
+                # Re-upload a minute before the server would drop the prefix
+                if entry is not None and entry[0] is not None and now < entry[2] - 60:
+                    self.hits += 1
+                    return entry[0]
+
+                pending = self._pending.get(key)
+                if pending is None:
+                    pending = self._pending[key] = threading.Event()
+                    break
+                # The old upload stays usable while another worker renews it
+                if entry is not None and entry[0] is not None and now < entry[2]:
+                    self.hits += 1
+                    return entry[0]
+            pending.wait()
+
+        # Failures are sent inline until the retry time, unless replaced below
+        result = (None, None, self._clock() + self.retry_seconds)
+        try:
+            uploaded = self._upload(model_name, prefix)
+            if uploaded is None:
+                result = (None, None, float("inf"))
+            else:
+                result = (uploaded[0], uploaded[1], self._clock() + self.ttl_seconds)
+        except Exception as e:
+            self.logger.info(f"Prompt prefix caching unavailable for {model_name}, sending it inline: {e}")
+        finally:
+            with self._lock:
+                self._entries[key] = result
+                del self._pending[key]
+                if result[0] is not None:
+                    self.uploads += 1
+            pending.set()
+
+        if entry is not None and entry[0] is not None:
+            self._delete(entry[1])
+        return result[0]
+
+    def close(self) -> None:
+        """Release every uploaded prefix."""
+        with self._lock:
+            entries, self._entries = list(self._entries.values()), {}
+        for model, resource, _ in entries:
+            if model is not None:
+                self._delete(resource)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with upload and reuse counters
+        """
+        with self._lock:
+            cached = sum(1 for model, _, _ in self._entries.values() if model is not None)
+            return {
+                "cached_prefixes": cached,
+                "inline_prefixes": len(self._entries) - cached,
+                "uploads": self.uploads,
+                "hits": self.hits
+            }
+
+    @abstractmethod
+    def _upload(self, model_name: str, prefix: str) -> Optional[Tuple[Any, Any]]:
+        """Store a prefix.
+
+        Called without the cache lock held, at most once at a time per
+        model and prefix.
+
+        Args:
+            model_name: Gemini model name
+            prefix: Prompt prefix
+
+        Returns:
+            Tuple of (bound model, resource passed to :meth:`_delete`), or
+            None if the prefix cannot be cached
+        """
+        pass
+
+    def _delete(self, resource: Any) -> None:
+        """Release an uploaded prefix."""
+
+
+class _PrefixedModel:
+    """Model wrapper that puts a stored prefix back in front of each request."""
+
+    def __init__(self, model: Any, prefix: str):
+        self.model = model
+        self.prefix = prefix
+
+    def generate_content(self, prompt: str, **kwargs: Any) -> Any:
+        return self.model.generate_content(self.prefix + prompt, **kwargs)
+
+
+class LocalPrefixCache(PromptPrefixCache):
+    """Prefix cache kept in memory, standing in for a server-side cache.
+
+    Requests still reach the underlying model with the prefix in front, so
+    results match inline prompts while upload and reuse behave as with a
+    real prefix cache.
+    """
+
+    def __init__(self, model_factory: Callable[[str], Any], **kwargs: Any):
+        """Initialize the cache.
+
+        Args:
+            model_factory: Function returning the model for a model name
+            **kwargs: Arguments for PromptPrefixCache
+        """
+        super().__init__(**kwargs)
+        self.model_factory = model_factory
+
+    def _upload(self, model_name: str, prefix: str) -> Optional[Tuple[Any, Any]]:
+        return _PrefixedModel(self.model_factory(model_name), prefix), prefix
@@ -42,3 +42,38 @@ class SimpleProgressCallback(Protocol):
             current_task: Optional description of current task
         """
         ...
+
+
+class VideoCallback(Protocol):
+    """Protocol for callbacks receiving each transcript as soon as it is extracted."""
+    def __call__(self, video_url: str, content: str) -> None:
+        """Handle an extracted transcript.
+        
+        Args:
+            video_url: URL (or local file label) of the video
+            content: Transcript text
+        """
+        ...
+
+
+class TextStream(Protocol):
+    """Protocol for outputs receiving refined text as Gemini generates it."""
+    def write(self, text: str) -> None:
+        """Append text to the stream.
+        
+        Args:
+            text: Newly generated text
+        """
+        ...
+    
+    def mark(self) -> int:
+        """Return the current position of the stream."""
+        ...
+    
+    def rollback(self, mark: int) -> None:
+        """Drop everything written after a position returned by mark.
+        
+        Args:
+            mark: Position to return to
+        """
+        ...
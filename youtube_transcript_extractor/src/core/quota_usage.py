@@ -0,0 +1,163 @@
+"""
+Persistent record of daily Gemini quota usage.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+import logging
+
+try:
+    from zoneinfo import ZoneInfo
+    # Gemini daily quotas reset at midnight Pacific time
+    _QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except Exception:
+    _QUOTA_TIMEZONE = timezone.utc
+
+
+def quota_day() -> str:
+    """Return the quota day that is currently being counted.
+
+    Returns:
+        ISO date in the timezone in which Gemini resets daily quotas
+    """
+    return datetime.now(_QUOTA_TIMEZONE).date().isoformat()
+
+
+class QuotaUsageStore:
+    """Requests and tokens sent to each model per day, kept across runs.
+
+    A playlist processed in several sittings shares one daily quota, so
+    the counters live on disk instead of in the limiter.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """Initialize the usage store.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        if db_path is None:
+            db_path = Path.home() / ".yte_gemini_usage.db"
+
+        self.db_path = db_path
+        # Limiters of concurrent workers record into one store
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize the usage database schema."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS usage (
+                        model_name TEXT NOT NULL,
+                        day TEXT NOT NULL,
+                        requests INTEGER NOT NULL DEFAULT 0,
+                        tokens INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (model_name, day)
+                    )
+                """)
+                conn.commit()
+
+        except Exception as e:
+            self.logger.error(f"Failed to initialize quota usage store: {e}")
+            raise
+
+    def get(self, model_name: str, day: str) -> Tuple[int, int]:
+        """Read the usage of a model on a day.
+
+        Args:
+            model_name: Gemini model name
+            day: Quota day as returned by :func:`quota_day`
+
+        Returns:
+            Tuple of (requests, tokens), zeros if nothing was recorded
+        """
+        try:
+            with self._lock, sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT requests, tokens FROM usage WHERE model_name = ? AND day = ?",
+                    (model_name, day)
+                ).fetchone()
+                return (row[0], row[1]) if row else (0, 0)
+
+        except Exception as e:
+            self.logger.error(f"Failed to read quota usage: {e}")
+            return 0, 0
+
+    def add(self, model_name: str, day: str, requests: int = 0, tokens: int = 0) -> None:
+        """Add to the usage of a model on a day.
+
+        Args:
+            model_name: Gemini model name
+            day: Quota day as returned by :func:`quota_day`
+            requests: Requests sent
+            tokens: Tokens used
+        """
+        if not requests and not tokens:
+            return
+        try:
+            with self._lock, sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    INSERT INTO usage (model_name, day, requests, tokens) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(model_name, day) DO UPDATE SET
+                        requests = requests + excluded.requests,
+                        tokens = tokens + excluded.tokens
+                """, (model_name, day, requests, tokens))
+                conn.commit()
+
+        except Exception as e:
+            self.logger.error(f"Failed to record quota usage: {e}")
+
+    def prune(self, keep_days: int = 30) -> int:
+        """Remove usage older than the most recent days.
+
+        Args:
+            keep_days: Number of most recent days to keep
+
+        Returns:
+            Number of rows removed
+        """
+        try:
+            with self._lock, sqlite3.connect(self.db_path) as conn:
+                removed = conn.execute("""
+                    DELETE FROM usage WHERE day NOT IN (
+                        SELECT DISTINCT day FROM usage ORDER BY day DESC LIMIT ?
+                    )
+                """, (keep_days,)).rowcount
+                conn.commit()
+                return removed
+
+        except Exception as e:
+            self.logger.error(f"Failed to prune quota usage: {e}")
+            return 0
+
+    def get_statistics(self, day: Optional[str] = None) -> Dict[str, Any]:
+        """Get usage of every model on a day.
+
+        Args:
+            day: Quota day, today if None
+
+        Returns:
+            Dictionary with the day and per-model request and token counts
+        """
+        day = day or quota_day()
+        try:
+            with self._lock, sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    "SELECT model_name, requests, tokens FROM usage WHERE day = ? ORDER BY model_name",
+                    (day,)
+                ).fetchall()
+        except Exception as e:
+            self.logger.error(f"Failed to get quota usage statistics: {e}")
+            rows = []
+
+        return {
+            "day": day,
+            "models": {name: {"requests": requests, "tokens": tokens} for name, requests, tokens in rows},
+            "database_path": str(self.db_path)
+        }
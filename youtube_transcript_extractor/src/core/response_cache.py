@@ -0,0 +1,247 @@
+"""
+Persistent on-disk cache for Gemini responses.
+"""
+
+import sqlite3
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any
+import logging
+
+
+class ResponseCache:
+    """Content-addressed cache of Gemini responses with LRU size eviction.
+
+    Entries are keyed by a hash of the model name and the fully rendered
+    prompt. The prompt already contains the chunk text and any carried-over
+    context, so re-running a playlist with the same style and language
+    returns every chunk from disk, while a changed prompt, model or previous
+    response misses.
+    """
+
+    DEFAULT_MAX_SIZE_BYTES = 100 * 1024 * 1024
+    DEFAULT_MAX_AGE_DAYS = 90
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS
+    ):
+        """Initialize response cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            max_size_bytes: Maximum total size of cached response text
+            max_age_days: Entries older than this are treated as expired
+        """
+        if db_path is None:
+            db_path = Path.home() / ".yte_response_cache.db"
+
+        self.db_path = db_path
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+        self.hits = 0
+        self.misses = 0
+        # Refinement workers share one cache
+        self._lock = threading.Lock()
+        # Size of cached text as of the last eviction plus later writes;
+        # replaced entries are counted twice until the next eviction
+        self._size_bytes = 0
+        self.logger = logging.getLogger(__name__)
+        self._init_db()
+        self.evict()
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str) -> str:
+        """Build the content address for a response.
+
+        Args:
+            model_name: Gemini model name
+            prompt: Complete prompt sent to the model
+
+        Returns:
+            Hex digest identifying the entry
+        """
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return hashlib.sha256(f"{model_name}\x00{prompt_hash}".encode("utf-8")).hexdigest()
+
+    def _init_db(self) -> None:
+        """Initialize the cache database schema."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS responses (
+                        cache_key TEXT PRIMARY KEY,
+                        model_name TEXT NOT NULL,
+                        content TEXT NOT NULL,
+                        size_bytes INTEGER NOT NULL,
+                        created_at REAL NOT NULL,
+                        last_accessed REAL NOT NULL
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(last_accessed)")
+                conn.commit()
+
+        except Exception as e:
+            self.logger.error(f"Failed to initialize response cache: {e}")
+            raise
+
+    def get(self, model_name: str, prompt: str) -> Optional[str]:
+        """Look up a cached response.
+
+        Args:
+            model_name: Gemini model name
+            prompt: Complete prompt sent to the model
+
+        Returns:
+            Cached response text or None on a miss
+        """
+        cache_key = self.make_key(model_name, prompt)
+        try:
+            with self._lock, sqlite3.connect(self.db_path) as conn:
+                row = conn.execute("""
+                    SELECT content FROM responses
+                    WHERE cache_key = ? AND created_at >= ?
+                """, (cache_key, time.time() - self.max_age_seconds)).fetchone()
+
+                if row is None:
+                    self.misses += 1
+                    return None
+
+                conn.execute("""
+                    UPDATE responses SET last_accessed = ? WHERE cache_key = ?
+                """, (time.time(), cache_key))
+                conn.commit()
+                self.hits += 1
+                return row[0]
+
+        except Exception as e:
+            self.logger.error(f"Failed to read response cache: {e}")
+            self.misses += 1
+            return None
+
+    def put(self, model_name: str, prompt: str, content: str) -> bool:
+        """Store a response in the cache.
+
+        Args:
+            model_name: Gemini model name
+            prompt: Complete prompt sent to the model
+            content: Response text
+
+        Returns:
+            True if stored successfully
+        """
+        if not content:
+            return False
+
+        now = time.time()
+        size_bytes = len(content.encode("utf-8"))
+        try:
+            with self._lock, sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO responses (
+                        cache_key, model_name, content, size_bytes, created_at, last_accessed
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                """, (
+                    self.make_key(model_name, prompt),
+                    model_name,
+                    content,
+                    size_bytes,
+                    now,
+                    now
+                ))
+                conn.commit()
+                self._size_bytes += size_bytes
+                over_limit = self._size_bytes > self.max_size_bytes
+
+            if over_limit:
+                self.evict()
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to write response cache: {e}")
+            return False
+
+    def evict(self) -> int:
+        """Remove expired entries and trim the cache to its size limit.
+
+        Least recently accessed entries are removed first.
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            with self._lock, sqlite3.connect(self.db_path) as conn:
+                cutoff = time.time() - self.max_age_seconds
+                removed = conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?", (cutoff,)
+                ).rowcount
+
+                total_size = conn.execute(
+                    "SELECT COALESCE(SUM(size_bytes), 0) FROM responses"
+                ).fetchone()[0]
+
+                if total_size > self.max_size_bytes:
+                    cursor = conn.execute("""
+                        SELECT cache_key, size_bytes FROM responses
+                        ORDER BY last_accessed ASC
+                    """)
+                    stale_keys = []
+                    for cache_key, size_bytes in cursor.fetchall():
+                        if total_size <= self.max_size_bytes:
+                            break
+                        stale_keys.append((cache_key,))
+                        total_size -= size_bytes
+
+                    conn.executemany("DELETE FROM responses WHERE cache_key = ?", stale_keys)
+                    removed += len(stale_keys)
+
+                conn.commit()
+                self._size_bytes = total_size
+
+            if removed:
+                self.logger.info(f"Evicted {removed} response cache entries")
+            return removed
+
+        except Exception as e:
+            self.logger.error(f"Failed to evict response cache entries: {e}")
+            return 0
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        try:
+            with self._lock, sqlite3.connect(self.db_path) as conn:
+                conn.execute("DELETE FROM responses")
+                conn.commit()
+                self._size_bytes = 0
+        except Exception as e:
+            self.logger.error(f"Failed to clear response cache: {e}")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, size and hit/miss counters
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                entries, size_bytes = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM responses"
+                ).fetchone()
+        except Exception as e:
+            self.logger.error(f"Failed to get response cache statistics: {e}")
+            entries, size_bytes = 0, 0
+
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "size_bytes": size_bytes,
+            "max_size_bytes": self.max_size_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups * 100) if lookups else 0.0,
+            "database_path": str(self.db_path)
+        }
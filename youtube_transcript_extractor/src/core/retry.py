@@ -0,0 +1,431 @@
+"""
+Shared retry engine for transcript fetching and Gemini calls.
+
+Errors are classified into structured codes; each code has its own retry
+policy with decorrelated jitter, and an optional per-batch budget caps how
+many retries a whole batch may spend.
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+
+class ErrorCode(Enum):
+    """Structured classification of a failed call."""
+    RATE_LIMITED = "rate_limited"
+    QUOTA_EXHAUSTED = "quota_exhausted"
+    IP_BLOCKED = "ip_blocked"
+    TRANSIENT = "transient"
+    NO_TRANSCRIPT = "no_transcript"
+    NOT_FOUND = "not_found"
+    INVALID_REQUEST = "invalid_request"
+    AUTH = "auth"
+    EMPTY_RESPONSE = "empty_response"
+    CANCELLED = "cancelled"
+    UNKNOWN = "unknown"
+
+
+# Exception class names from youtube_transcript_api and google.api_core,
+# matched by name so neither package is imported here
+_EXCEPTION_CODES = {
+    "RequestBlocked": ErrorCode.IP_BLOCKED,
+    "IpBlocked": ErrorCode.IP_BLOCKED,
+    "TooManyRequests": ErrorCode.RATE_LIMITED,
+    "ResourceExhausted": ErrorCode.RATE_LIMITED,
+    "DailyQuotaExceeded": ErrorCode.QUOTA_EXHAUSTED,
+    "NoTranscriptFound": ErrorCode.NO_TRANSCRIPT,
+    "TranscriptsDisabled": ErrorCode.NO_TRANSCRIPT,
+    "NoTranscriptAvailable": ErrorCode.NO_TRANSCRIPT,
+    "NoTranscriptAvailableError": ErrorCode.NO_TRANSCRIPT,
+    "VideoUnavailable": ErrorCode.NOT_FOUND,
+    "VideoUnavailableError": ErrorCode.NOT_FOUND,
+    "InvalidVideoId": ErrorCode.INVALID_REQUEST,
+    "NotFound": ErrorCode.NOT_FOUND,
+    "InvalidArgument": ErrorCode.INVALID_REQUEST,
+    "FailedPrecondition": ErrorCode.INVALID_REQUEST,
+    "PermissionDenied": ErrorCode.AUTH,
+    "Unauthenticated": ErrorCode.AUTH,
+    "ServiceUnavailable": ErrorCode.TRANSIENT,
+    "InternalServerError": ErrorCode.TRANSIENT,
+    "DeadlineExceeded": ErrorCode.TRANSIENT,
+    "GatewayTimeout": ErrorCode.TRANSIENT,
+    "TimeoutError": ErrorCode.TRANSIENT,
+    "ConnectionError": ErrorCode.TRANSIENT,
+    "ClientConnectionError": ErrorCode.TRANSIENT,
+    "ServerDisconnectedError": ErrorCode.TRANSIENT,
+    "CancelledError": ErrorCode.CANCELLED,
+}
+
+def _status(code: int) -> str:
+    """Pattern for an HTTP status code that is not part of a URL, ID or number."""
+    return rf"(?:status|code)[ :=]*{code}\b|(?<![\w/=?&.%-]){code}(?![\w/=?&.%-])"
+
+
+# Ordered message patterns used when the exception type says nothing useful
+_MESSAGE_CODES = tuple((re.compile(pattern), code) for pattern, code in (
+    (r"blocking requests", ErrorCode.IP_BLOCKED),
+    (r"ip blocked", ErrorCode.IP_BLOCKED),
+    (r"not a bot", ErrorCode.IP_BLOCKED),
+    (_status(429), ErrorCode.RATE_LIMITED),
+    (r"too many requests", ErrorCode.RATE_LIMITED),
+    (r"rate limit", ErrorCode.RATE_LIMITED),
+    (r"resource exhausted", ErrorCode.RATE_LIMITED),
+    (r"\bquota\b", ErrorCode.QUOTA_EXHAUSTED),
+    (r"\bcancelled\b", ErrorCode.CANCELLED),
+    (r"no transcript", ErrorCode.NO_TRANSCRIPT),
+    (r"transcripts are disabled", ErrorCode.NO_TRANSCRIPT),
+    (r"subtitles are disabled", ErrorCode.NO_TRANSCRIPT),
+    (r"unplayable", ErrorCode.NOT_FOUND),
+    (r"video unavailable", ErrorCode.NOT_FOUND),
+    (r"video is unavailable", ErrorCode.NOT_FOUND),
+    (r"unavailable", ErrorCode.TRANSIENT),
+    (_status(404), ErrorCode.NOT_FOUND),
+    (r"api key", ErrorCode.AUTH),
+    (_status(401), ErrorCode.AUTH),
+    (_status(403), ErrorCode.AUTH),
+    (r"\bpermission", ErrorCode.AUTH),
+    (r"empty response", ErrorCode.EMPTY_RESPONSE),
+    (r"timed out", ErrorCode.TRANSIENT),
+    (r"\btimeout", ErrorCode.TRANSIENT),
+    (r"\bconnection", ErrorCode.TRANSIENT),
+    (r"\btemporarily", ErrorCode.TRANSIENT),
+    (_status(500), ErrorCode.TRANSIENT),
+    (_status(502), ErrorCode.TRANSIENT),
+    (_status(503), ErrorCode.TRANSIENT),
+    (_status(504), ErrorCode.TRANSIENT),
+    (_status(400), ErrorCode.INVALID_REQUEST),
+    # Last, so that a failure whose message also says "invalid" keeps its cause
+    (r"\binvalid (?:argument|request|value|parameter|input|video id|url)\b", ErrorCode.INVALID_REQUEST),
+))
+
+def classify_error(error: Union[BaseException, str, None]) -> ErrorCode:
+    """Classify an exception or error message into an ErrorCode.
+
+    Args:
+        error: Exception instance or error message
+
+    Returns:
+        The matching ErrorCode, UNKNOWN if nothing matched
+    """
+    if error is None:
+        return ErrorCode.UNKNOWN
+
+    if isinstance(error, BaseException):
+        # Transport errors carry structured status information
+        if getattr(error, "blocked", False):
+            return ErrorCode.IP_BLOCKED
+        status = getattr(error, "status", None) or getattr(error, "code", None)
+        if status == 429:
+            return ErrorCode.RATE_LIMITED
+        if isinstance(status, int) and status >= 500:
+            return ErrorCode.TRANSIENT
+
+        for cls in type(error).__mro__:
+            if cls.__name__ in _EXCEPTION_CODES:
+                return _EXCEPTION_CODES[cls.__name__]
+
+    message = str(error).lower()
+    for pattern, code in _MESSAGE_CODES:
+        if pattern.search(message):
+            return code
+    return ErrorCode.UNKNOWN
+
+
+@dataclass
+class RetryPolicy:
+    """How a class of errors is retried."""
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+
+    @property
+    def retryable(self) -> bool:
+        """Whether errors under this policy are retried at all."""
+        return self.max_attempts > 1
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+DEFAULT_POLICIES: Dict[ErrorCode, RetryPolicy] = {
+    ErrorCode.RATE_LIMITED: RetryPolicy(max_attempts=5, base_delay=2.0, max_delay=60.0),
+    ErrorCode.IP_BLOCKED: RetryPolicy(max_attempts=3, base_delay=4.0, max_delay=60.0),
+    ErrorCode.TRANSIENT: RetryPolicy(max_attempts=4, base_delay=0.5, max_delay=10.0),
+    ErrorCode.EMPTY_RESPONSE: RetryPolicy(max_attempts=2, base_delay=1.0, max_delay=5.0),
+    ErrorCode.UNKNOWN: RetryPolicy(max_attempts=2, base_delay=1.0, max_delay=10.0),
+    ErrorCode.NO_TRANSCRIPT: NO_RETRY,
+    ErrorCode.NOT_FOUND: NO_RETRY,
+    ErrorCode.INVALID_REQUEST: NO_RETRY,
+    ErrorCode.AUTH: NO_RETRY,
+    ErrorCode.QUOTA_EXHAUSTED: NO_RETRY,
+    ErrorCode.CANCELLED: NO_RETRY,
+}
+
+
+class RetryBudget:
+    """Caps the retries a batch may spend.
+
+    A batch may retry ``min_retries`` times plus ``ratio`` retries per
+    first attempt, so a burst of failures cannot multiply the load on an
+    already struggling service. Safe to share between threads.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        """Initialize the budget.
+
+        Args:
+            ratio: Retries allowed per first attempt
+            min_retries: Retries always allowed regardless of volume
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.requests = 0
+        self.retries = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Record a first attempt."""
+        with self._lock:
+            self.requests += 1
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget.
+
+        Returns:
+            True if the retry may go ahead
+        """
+        with self._lock:
+            if self.retries < self.min_retries + self.ratio * self.requests:
+                self.retries += 1
+                return True
+            self.denied += 1
+            return False
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get budget usage.
+
+        Returns:
+            Dictionary with request, retry and denial counts
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "denied": self.denied,
+                "allowed": self.min_retries + self.ratio * self.requests
+            }
+
+
+@dataclass
+class RetryOutcome:
+    """Result of running a call through the retry engine."""
+    value: Any = None
+    error: Optional[BaseException] = None
+    error_message: Optional[str] = None
+    error_code: Optional[ErrorCode] = None
+    attempts: int = 0
+    total_delay: float = 0.0
+    delays: list = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        """Whether the final attempt succeeded."""
+        return self.error_code is None
+
+
+FailureCheck = Callable[[Any], Optional[Union[BaseException, str]]]
+RetryCallback = Callable[[ErrorCode, int, float], None]
+
+
+class RetryEngine:
+    """Runs calls with per-error-class retry policies."""
+
+    def __init__(
+        self,
+        policies: Optional[Dict[ErrorCode, RetryPolicy]] = None,
+        budget: Optional[RetryBudget] = None,
+        max_attempts: Optional[int] = None,
+        rng: Optional[random.Random] = None
+    ):
+        """Initialize the retry engine.
+
+        Args:
+            policies: Overrides merged over DEFAULT_POLICIES
+            budget: Optional retry budget shared by every call
+            max_attempts: Upper bound on attempts for any error class
+            rng: Random source for jitter
+        """
+        self.policies = dict(DEFAULT_POLICIES)
+        if policies:
+            self.policies.update(policies)
+        self.budget = budget
+        self.max_attempts = max_attempts
+        self._rng = rng or random.Random()
+        self.logger = logging.getLogger(__name__)
+
+    def policy_for(self, code: ErrorCode) -> RetryPolicy:
+        """Get the policy applied to an error class."""
+        return self.policies.get(code, self.policies.get(ErrorCode.UNKNOWN, NO_RETRY))
+
+    def next_delay(
+        self,
+        code: ErrorCode,
+        attempt: int,
+        previous_delay: float = 0.0,
+        max_attempts: Optional[int] = None,
+        budget: Optional[RetryBudget] = None
+    ) -> Optional[float]:
+        """Decide whether to retry and how long to wait first.
+
+        Delays use decorrelated jitter: a random value between the policy's
+        base delay and three times the previous delay, capped at max_delay.
+
+        Args:
+            code: Classification of the failure
+            attempt: Number of attempts made so far
+            previous_delay: Delay used before the previous attempt
+            max_attempts: Per-call cap on attempts
+            budget: Budget to spend from (defaults to the engine's)
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        policy = self.policy_for(code)
+        limit = policy.max_attempts
+        for cap in (self.max_attempts, max_attempts):
+            if cap is not None:
+                limit = min(limit, cap)
+        if attempt >= limit:
+            return None
+
+        budget = budget or self.budget
+        if budget is not None and not budget.try_spend():
+            self.logger.warning(f"Retry budget exhausted, not retrying {code.value} error")
+            return None
+
+        upper = max(policy.base_delay, previous_delay * 3)
+        return min(policy.max_delay, self._rng.uniform(policy.base_delay, upper))
+
+    def _failure(self, value: Any, failure_check: Optional[FailureCheck]) -> Optional[Union[BaseException, str]]:
+        """Return the failure carried by a returned value, if any."""
+        return failure_check(value) if failure_check else None
+
+    def _record(self, outcome: RetryOutcome, failure: Union[BaseException, str]) -> ErrorCode:
+        """Record a failed attempt on the outcome."""
+        code = classify_error(failure)
+        outcome.error_code = code
+        outcome.error_message = str(failure)
+        outcome.error = failure if isinstance(failure, BaseException) else None
+        return code
+
+    def execute(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        failure_check: Optional[FailureCheck] = None,
+        on_retry: Optional[RetryCallback] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        max_attempts: Optional[int] = None,
+        budget: Optional[RetryBudget] = None,
+        **kwargs: Any
+    ) -> RetryOutcome:
+        """Call ``func`` until it succeeds or its error class stops retrying.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+            failure_check: Maps a returned value to an error when the call
+                reports failure without raising
+            on_retry: Called with (code, next attempt number, delay) before
+                each retry
+            sleep: Function used to wait between attempts
+            max_attempts: Per-call cap on attempts
+            budget: Budget to spend from (defaults to the engine's)
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            RetryOutcome with the last value or error and the attempt count
+        """
+        outcome = RetryOutcome()
+        budget = budget or self.budget
+        if budget is not None:
+            budget.record_request()
+
+        delay = 0.0
+        while True:
+            outcome.attempts += 1
+            try:
+                outcome.value = func(*args, **kwargs)
+                failure = self._failure(outcome.value, failure_check)
+            except Exception as e:
+                outcome.value = None
+                failure = e
+
+            if failure is None:
+                outcome.error_code = None
+                outcome.error_message = None
+                outcome.error = None
+                return outcome
+
+            code = self._record(outcome, failure)
+            delay = self.next_delay(code, outcome.attempts, delay, max_attempts, budget)
+            if delay is None:
+                return outcome
+
+            if on_retry:
+                on_retry(code, outcome.attempts + 1, delay)
+            outcome.delays.append(delay)
+            outcome.total_delay += delay
+            sleep(delay)
+
+    async def execute_async(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        failure_check: Optional[FailureCheck] = None,
+        on_retry: Optional[RetryCallback] = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        max_attempts: Optional[int] = None,
+        budget: Optional[RetryBudget] = None,
+        **kwargs: Any
+    ) -> RetryOutcome:
+        """Async counterpart of :meth:`execute` for coroutine functions."""
+        outcome = RetryOutcome()
+        budget = budget or self.budget
+        if budget is not None:
+            budget.record_request()
+
+        delay = 0.0
+        while True:
+            outcome.attempts += 1
+            try:
+                outcome.value = await func(*args, **kwargs)
+                failure = self._failure(outcome.value, failure_check)
+            except Exception as e:
+                outcome.value = None
+                failure = e
+
+            if failure is None:
+                outcome.error_code = None
+                outcome.error_message = None
+                outcome.error = None
+                return outcome
+
+            code = self._record(outcome, failure)
+            delay = self.next_delay(code, outcome.attempts, delay, max_attempts, budget)
+            if delay is None:
+                return outcome
+
+            if on_retry:
+                on_retry(code, outcome.attempts + 1, delay)
+            outcome.delays.append(delay)
+            outcome.total_delay += delay
+            if delay > 0:
+                await sleep(delay)
@@ -0,0 +1,161 @@
+"""
+Routing Gemini requests across models, with failover between them.
+"""
+
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .models import GeminiModels, ProcessingPrompts, RefinementStyle
+from .pacing import ModelQuotas
+from .retry import ErrorCode
+
+
+# Errors that say nothing about the request, only about the model serving it
+FAILOVER_CODES = {ErrorCode.RATE_LIMITED, ErrorCode.QUOTA_EXHAUSTED, ErrorCode.TRANSIENT, ErrorCode.NOT_FOUND}
+
+
+@dataclass
+class ModelStats:
+    """Outcomes and latency of the requests sent to one model."""
+    requests: int = 0
+    successes: int = 0
+    failures: Dict[str, int] = field(default_factory=dict)
+    average_latency: Optional[float] = None
+    cooldown_until: float = 0.0
+
+
+class ModelRouter:
+    """Picks the models a request is tried on, best first.
+
+    The preferred order is the configured model followed by
+    ``GeminiModels.FALLBACK_CASCADE``; styles that tolerate a lighter model
+    put the fast models first for prompts up to their size limit. Models
+    are then ranked by live quota headroom: those with room in their
+    per-minute quotas keep their order, those that would have to wait
+    follow by expected wait plus average latency, and those out of daily
+    quota are left out. A model that answered with a rate limit or timeout
+    cools down and is tried last until the cooldown ends; a model that
+    does not exist is dropped.
+    """
+
+    # Weight of the newest request in the average latency
+    LATENCY_WEIGHT = 0.3
+
+    def __init__(
+        self,
+        quotas: ModelQuotas,
+        primary_model: str,
+        cooldown_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the router.
+
+        Args:
+            quotas: Quota limiters of every model, shared with the processor
+            primary_model: Configured model
+            cooldown_seconds: How long a model that failed is tried last
+            clock: Monotonic clock returning seconds
+        """
+        self.quotas = quotas
+        self.primary_model = primary_model
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._stats: Dict[str, ModelStats] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def route(self, style: RefinementStyle, tokens: int) -> List[str]:
+        """Get the models to try for a request, in order.
+
+        Args:
+            style: Refinement style of the request
+            tokens: Estimated tokens of the prompt
+
+        Returns:
+            Model names, empty if every model is out of daily quota
+        """
+        fast_first = tokens <= ProcessingPrompts.get_fast_model_tokens(style)
+        preferred = GeminiModels.get_cascade(self.primary_model, fast_first)
+        now = self._clock()
+
+        ready, waiting, cooling = [], [], []
+        for model_name in preferred:
+            wait_time = self.quotas.limiter(model_name).peek(tokens)
+            if wait_time is None:
+                continue
+            with self._lock:
+                stats = self._stats.get(model_name, ModelStats())
+                cooldown_until = stats.cooldown_until
+                latency = stats.average_latency or 0.0
+            if cooldown_until > now:
+                if cooldown_until != float("inf"):
+                    cooling.append((cooldown_until, model_name))
+            elif wait_time <= 0:
+                ready.append(model_name)
+            else:
+                waiting.append((wait_time + latency, model_name))
+
+        return ready + [name for _, name in sorted(waiting)] + [name for _, name in sorted(cooling)]
+
+    def record_success(self, model_name: str, latency: float) -> None:
+        """Record a request a model answered.
+
+        Args:
+            model_name: Gemini model name
+            latency: Seconds from sending the request to the full response
+        """
+        with self._lock:
+            stats = self._stats.setdefault(model_name, ModelStats())
+            stats.requests += 1
+            stats.successes += 1
+            stats.cooldown_until = 0.0
+            if stats.average_latency is None:
+                stats.average_latency = latency
+            else:
+                stats.average_latency += self.LATENCY_WEIGHT * (latency - stats.average_latency)
+
+    def record_failure(self, model_name: str, code: ErrorCode) -> bool:
+        """Record a failed request and decide whether another model should take it.
+
+        Args:
+            model_name: Gemini model name
+            code: Classification of the failure
+
+        Returns:
+            True if the request should fail over to the next model
+        """
+        with self._lock:
+            stats = self._stats.setdefault(model_name, ModelStats())
+            stats.requests += 1
+            stats.failures[code.value] = stats.failures.get(code.value, 0) + 1
+            if code not in FAILOVER_CODES:
+                return False
+            if code == ErrorCode.NOT_FOUND:
+                stats.cooldown_until = float("inf")
+            elif code != ErrorCode.QUOTA_EXHAUSTED:
+                # Daily quota is already tracked by the model's limiter
+                stats.cooldown_until = self._clock() + self.cooldown_seconds
+        self.logger.warning(f"Gemini model {model_name} failed with {code.value}, routing around it")
+        return True
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Get request outcomes and latency of every model used so far.
+
+        Returns:
+            Dictionary mapping model names to their statistics
+        """
+        now = self._clock()
+        with self._lock:
+            return {
+                model_name: {
+                    "requests": stats.requests,
+                    "successes": stats.successes,
+                    "failures": dict(stats.failures),
+                    "average_latency": stats.average_latency,
+                    "cooling_down": stats.cooldown_until > now
+                }
+                for model_name, stats in self._stats.items()
+            }
@@ -0,0 +1,216 @@
+"""
+Priority and deadline aware scheduling for concurrent transcript fetching.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+@dataclass(eq=False)
+class ScheduledEntry:
+    """An item waiting in the scheduler."""
+    item: Any
+    priority: float
+    deadline: Optional[float]
+    enqueued_at: float
+    sequence: int
+    key: Optional[str] = None
+    cancelled: bool = False
+    taken: bool = False
+
+    @property
+    def pending(self) -> bool:
+        """Whether the entry is still waiting for a consumer."""
+        return not (self.cancelled or self.taken)
+
+
+class TaskScheduler:
+    """Async queue ordered by aged priority, with deadlines and cancellation.
+
+    Higher priorities are served first. Every second an item waits raises
+    its effective priority by ``aging_rate``, so a long low-priority backlog
+    keeps moving behind a stream of urgent work. All waiting items age at
+    the same rate, which means their relative order never changes after
+    insertion and one heap keyed on ``aging_rate * enqueued_at - priority``
+    is enough.
+
+    An item with a deadline jumps the priority order once its deadline is
+    less than ``deadline_slack`` seconds away; such items are served
+    earliest deadline first. Items can be cancelled by key until a consumer
+    takes them.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        aging_rate: float = 0.1,
+        deadline_slack: float = 30.0,
+        clock: Callable[[], float] = time.time
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            maxsize: Pending items at which :meth:`put` waits (0 for unbounded);
+                :meth:`add` ignores the bound
+            aging_rate: Priority gained per second of waiting
+            deadline_slack: Seconds before its deadline an item becomes urgent
+            clock: Clock returning seconds, on the same scale as deadlines
+        """
+        self.maxsize = maxsize
+        self.aging_rate = aging_rate
+        self.deadline_slack = deadline_slack
+        self._clock = clock
+        self._epoch = clock()
+        self._sequence = itertools.count()
+        self._priority_heap: List[Tuple[float, int, ScheduledEntry]] = []
+        self._deadline_heap: List[Tuple[float, int, ScheduledEntry]] = []
+        self._by_key: Dict[str, List[ScheduledEntry]] = {}
+        self._pending = 0
+        self._getters: Deque[asyncio.Future] = deque()
+        self._putters: Deque[asyncio.Future] = deque()
+        self.logger = logging.getLogger(__name__)
+
+    def __len__(self) -> int:
+        """Number of items waiting for a consumer."""
+        return self._pending
+
+    @staticmethod
+    def _notify(waiters: Deque[asyncio.Future]) -> None:
+        """Wake every coroutine waiting on a change."""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+    @staticmethod
+    async def _wait(waiters: Deque[asyncio.Future]) -> None:
+        """Wait until woken by :meth:`_notify`."""
+        waiter = asyncio.get_event_loop().create_future()
+        waiters.append(waiter)
+        await waiter
+
+    def add(
+        self,
+        item: Any,
+        priority: float = 0,
+        deadline: Optional[float] = None,
+        key: Optional[str] = None
+    ) -> ScheduledEntry:
+        """Queue an item immediately, regardless of ``maxsize``.
+
+        Args:
+            item: Item to schedule
+            priority: Higher values are served first
+            deadline: Time (on the scheduler's clock) the item should start by
+            key: Identifier used to cancel the item
+
+        Returns:
+            The queued ScheduledEntry
+        """
+        now = self._clock()
+        entry = ScheduledEntry(
+            item=item,
+            priority=priority,
+            deadline=deadline,
+            enqueued_at=now,
+            sequence=next(self._sequence),
+            key=key
+        )
+        aged_key = self.aging_rate * (now - self._epoch) - priority
+        heapq.heappush(self._priority_heap, (aged_key, entry.sequence, entry))
+        if deadline is not None:
+            heapq.heappush(self._deadline_heap, (deadline, entry.sequence, entry))
+        if key is not None:
+            self._by_key.setdefault(key, []).append(entry)
+
+        self._pending += 1
+        self._notify(self._getters)
+        return entry
+
+    async def put(
+        self,
+        item: Any,
+        priority: float = 0,
+        deadline: Optional[float] = None,
+        key: Optional[str] = None
+    ) -> ScheduledEntry:
+        """Queue an item, waiting while ``maxsize`` items are pending.
+
+        Args:
+            item: Item to schedule
+            priority: Higher values are served first
+            deadline: Time (on the scheduler's clock) the item should start by
+            key: Identifier used to cancel the item
+
+        Returns:
+            The queued ScheduledEntry
+        """
+        while self.maxsize and self._pending >= self.maxsize:
+            await self._wait(self._putters)
+        return self.add(item, priority, deadline, key)
+
+    async def get(self) -> ScheduledEntry:
+        """Take the most urgent pending item, waiting if there is none.
+
+        Returns:
+            The ScheduledEntry to run
+        """
+        while not self._pending:
+            await self._wait(self._getters)
+
+        entry = self._pop()
+        self._notify(self._putters)
+        return entry
+
+    def cancel(self, key: str) -> List[ScheduledEntry]:
+        """Cancel every pending item queued under a key.
+
+        Args:
+            key: Key the items were queued with
+
+        Returns:
+            The cancelled entries (empty if none were still pending)
+        """
+        entries = self._by_key.pop(key, [])
+        for entry in entries:
+            entry.cancelled = True
+        self._pending -= len(entries)
+        if entries:
+            self._notify(self._putters)
+        return entries
+
+    def _take(self, entry: ScheduledEntry) -> ScheduledEntry:
+        """Mark an entry as handed to a consumer."""
+        entry.taken = True
+        self._pending -= 1
+        if entry.key is not None:
+            siblings = self._by_key.get(entry.key, [])
+            if entry in siblings:
+                siblings.remove(entry)
+            if not siblings:
+                self._by_key.pop(entry.key, None)
+        return entry
+
+    def _pop(self) -> ScheduledEntry:
+        """Remove and return the most urgent pending entry."""
+        now = self._clock()
+        while self._deadline_heap:
+            deadline, _, entry = self._deadline_heap[0]
+            if not entry.pending:
+                heapq.heappop(self._deadline_heap)
+                continue
+            if deadline - now <= self.deadline_slack:
+                heapq.heappop(self._deadline_heap)
+                return self._take(entry)
+            break
+
+        while True:
+            _, _, entry = heapq.heappop(self._priority_heap)
+            if entry.pending:
+                return self._take(entry)
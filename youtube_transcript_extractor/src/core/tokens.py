@@ -0,0 +1,179 @@
+"""
+Local token estimates and token-budgeted transcript chunking.
+"""
+
+import math
+import re
+from typing import Dict, List, Tuple
+
+
+# Characters per Gemini token for each writing system. Latin-script
+# languages average about four characters per token, Cyrillic and Greek
+# about three; Chinese and Japanese come close to a token per character.
+SCRIPT_CHARS_PER_TOKEN: Dict[str, float] = {
+    "latin": 4.0,
+    "cyrillic": 3.0,
+    "greek": 3.0,
+    "arabic": 3.0,
+    "hebrew": 3.0,
+    "devanagari": 2.5,
+    "thai": 2.5,
+    "hangul": 1.5,
+    "cjk": 1.2,
+}
+
+# Characters of every script except Latin, which is whatever is left
+_SCRIPT_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    "cyrillic": re.compile(r"[\u0400-\u052f]"),
+    "greek": re.compile(r"[\u0370-\u03ff]"),
+    "arabic": re.compile(r"[\u0600-\u06ff\u0750-\u077f]"),
+    "hebrew": re.compile(r"[\u0590-\u05ff]"),
+    "devanagari": re.compile(r"[\u0900-\u097f]"),
+    "thai": re.compile(r"[\u0e00-\u0e7f]"),
+    "hangul": re.compile(r"[\u1100-\u11ff\uac00-\ud7af]"),
+    "cjk": re.compile(r"[\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff00-\uffef]"),
+}
+
+# Whitespace after sentence-ending punctuation, or right after CJK full stops
+_CJK_STOPS = ("。", "！", "？")
+_SENTENCE_END = re.compile(r"(?<=[.!?…])\s+|(?<=[.!?…][\"')\]])\s+|(?<=[。！？])")
+
+
+def _token_weight(text: str) -> float:
+    """Fractional token estimate of a text."""
+    if text.isascii():
+        return len(text) / SCRIPT_CHARS_PER_TOKEN["latin"]
+
+    remaining = len(text)
+    tokens = 0.0
+    for script, pattern in _SCRIPT_PATTERNS.items():
+        count = len(pattern.findall(text))
+        if count:
+            tokens += count / SCRIPT_CHARS_PER_TOKEN[script]
+            remaining -= count
+    return tokens + remaining / SCRIPT_CHARS_PER_TOKEN["latin"]
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens Gemini will count for a text.
+
+    Runs in linear time without a tokenizer. Each character is weighted by
+    the typical token density of its writing system, so transcripts in
+    languages that use fewer characters per token are not underestimated.
+
+    Args:
+        text: Prompt, transcript or response text
+
+    Returns:
+        Approximate token count
+    """
+    # Rounded first so that float noise does not push a full chunk over its budget
+    return math.ceil(round(_token_weight(text), 6))
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences with whitespace collapsed.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Non-empty sentences in order
+    """
+    sentences = (" ".join(sentence.split()) for sentence in _SENTENCE_END.split(text))
+    return [sentence for sentence in sentences if sentence]
+
+
+def _split_oversized(unit: str, max_tokens: int) -> List[Tuple[str, float]]:
+    """Break a sentence longer than the budget at word, or failing that, character boundaries."""
+    space = _token_weight(" ")
+    pieces: List[Tuple[str, float]] = []
+    current: List[str] = []
+    current_tokens = 0.0
+
+    for word in unit.split(" "):
+        tokens = _token_weight(word)
+        if tokens > max_tokens:
+            # Unspaced scripts have no word boundaries to respect
+            if current:
+                pieces.append((" ".join(current), current_tokens))
+                current, current_tokens = [], 0.0
+            chars_per_piece = max(1, int(len(word) * max_tokens / tokens))
+            for start in range(0, len(word), chars_per_piece):
+                piece = word[start:start + chars_per_piece]
+                pieces.append((piece, _token_weight(piece)))
+            continue
+        if current and current_tokens + space + tokens > max_tokens:
+            pieces.append((" ".join(current), current_tokens))
+            current, current_tokens = [], 0.0
+        current_tokens += tokens + (space if current else 0.0)
+        current.append(word)
+    if current:
+        pieces.append((" ".join(current), current_tokens))
+    return pieces
+
+
+def _join(units: List[Tuple[str, float]]) -> str:
+    """Join sentences with spaces, except after CJK full stops."""
+    parts: List[str] = []
+    for sentence, _ in units:
+        if parts and not parts[-1].endswith(_CJK_STOPS):
+            parts.append(" ")
+        parts.append(sentence)
+    return "".join(parts)
+
+
+def split_by_tokens(text: str, max_tokens: int, min_tokens: int = 0) -> List[str]:
+    """Split text into chunks that fit a token budget.
+
+    Chunks end at sentence boundaries wherever a sentence fits the budget;
+    only sentences longer than the whole budget, as in unpunctuated
+    auto-generated captions, are broken between words. Each sentence is
+    estimated once, so the split is linear in the length of the text.
+    Whitespace inside the text is collapsed to single spaces.
+
+    Args:
+        text: Text to split
+        max_tokens: Estimated token budget of each chunk
+        min_tokens: Sentences are moved from the previous chunk into a
+            smaller last chunk until it reaches this size
+
+    Returns:
+        List of text chunks
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be positive")
+
+    units: List[Tuple[str, float]] = []
+    for sentence in split_sentences(text):
+        tokens = _token_weight(sentence)
+        if tokens > max_tokens:
+            units.extend(_split_oversized(sentence, max_tokens))
+        else:
+            units.append((sentence, tokens))
+
+    # Sentences are joined with a space, which counts towards the budget
+    space = _token_weight(" ")
+    chunks: List[List[Tuple[str, float]]] = []
+    totals: List[float] = []
+    for unit in units:
+        if chunks and totals[-1] + space + unit[1] <= max_tokens:
+            chunks[-1].append(unit)
+            totals[-1] += space + unit[1]
+        else:
+            chunks.append([unit])
+            totals.append(unit[1])
+
+    # Even out a short last chunk without pushing the previous one under it
+    moved: List[Tuple[str, float]] = []
+    while (len(chunks) > 1 and totals[-1] < min_tokens and len(chunks[-2]) > 1
+           and totals[-1] + space + chunks[-2][-1][1] <= max_tokens
+           and totals[-2] - space - chunks[-2][-1][1] >= totals[-1] + space + chunks[-2][-1][1]):
+        unit = chunks[-2].pop()
+        totals[-2] -= space + unit[1]
+        totals[-1] += space + unit[1]
+        moved.append(unit)
+    if moved:
+        chunks[-1][:0] = reversed(moved)
+
+    return [_join(chunk) for chunk in chunks]
@@ -0,0 +1,307 @@
+"""
+Persistent on-disk cache for fetched YouTube transcripts.
+"""
+
+import sqlite3
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence, Dict, Any
+import logging
+
+
+@dataclass
+class CachedTranscript:
+    """A transcript entry stored in the cache."""
+    video_id: str
+    language_code: str
+    kind: str  # "manual" or "generated"
+    content: str
+    created_at: float
+
+
+class TranscriptCache:
+    """Content-addressed transcript cache with size and age based eviction.
+
+    Entries are keyed by video ID, language code and transcript kind, so a
+    manually created English transcript and an auto-generated one never
+    collide. The total size is tracked as entries are written, so the
+    eviction scan only runs when the cache outgrows its limit.
+    """
+
+    DEFAULT_MAX_SIZE_BYTES = 200 * 1024 * 1024
+    DEFAULT_MAX_AGE_DAYS = 30
+    KINDS = ("manual", "generated")
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS
+    ):
+        """Initialize transcript cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            max_size_bytes: Maximum total size of cached transcript text
+            max_age_days: Entries older than this are treated as expired
+        """
+        if db_path is None:
+            db_path = Path.home() / ".yte_transcript_cache.db"
+
+        self.db_path = db_path
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+        self.hits = 0
+        self.misses = 0
+        # Size of cached text as of the last eviction plus later writes;
+        # replaced entries are counted twice until the next eviction
+        self._size_bytes = 0
+        self._size_lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+        self._init_db()
+        self.evict()
+
+    @staticmethod
+    def make_key(video_id: str, language_code: str, kind: str) -> str:
+        """Build the content address for a transcript.
+
+        Args:
+            video_id: YouTube video ID
+            language_code: Transcript language code (e.g. "en")
+            kind: Transcript kind ("manual" or "generated")
+
+        Returns:
+            Hex digest identifying the entry
+        """
+        raw = f"{video_id}\x00{language_code}\x00{kind}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _init_db(self) -> None:
+        """Initialize the cache database schema."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS transcripts (
+                        cache_key TEXT PRIMARY KEY,
+                        video_id TEXT NOT NULL,
+                        language_code TEXT NOT NULL,
+                        kind TEXT NOT NULL,
+                        content TEXT NOT NULL,
+                        size_bytes INTEGER NOT NULL,
+                        created_at REAL NOT NULL,
+                        last_accessed REAL NOT NULL
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_transcripts_video ON transcripts(video_id)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_transcripts_accessed ON transcripts(last_accessed)")
+                conn.commit()
+
+        except Exception as e:
+            self.logger.error(f"Failed to initialize transcript cache: {e}")
+            raise
+
+    def get(
+        self,
+        video_id: str,
+        languages: Sequence[str] = ("en",),
+        allow_fallback: bool = True
+    ) -> Optional[CachedTranscript]:
+        """Look up a cached transcript.
+
+        Languages are tried in order, preferring manual over generated
+        transcripts. With ``allow_fallback`` any cached language for the
+        video is returned when none of the preferred ones are present,
+        mirroring the fetcher's "first available transcript" fallback.
+
+        Args:
+            video_id: YouTube video ID
+            languages: Preferred language codes in priority order
+            allow_fallback: Whether to return any other cached language
+
+        Returns:
+            CachedTranscript or None on a miss
+        """
+        if not video_id:
+            return None
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                cutoff = time.time() - self.max_age_seconds
+                row = None
+
+                for language_code in languages:
+                    for kind in self.KINDS:
+                        row = conn.execute("""
+                            SELECT * FROM transcripts
+                            WHERE cache_key = ? AND created_at >= ?
+                        """, (self.make_key(video_id, language_code, kind), cutoff)).fetchone()
+                        if row:
+                            break
+                    if row:
+                        break
+
+                if row is None and allow_fallback:
+                    row = conn.execute("""
+                        SELECT * FROM transcripts
+                        WHERE video_id = ? AND created_at >= ?
+                        ORDER BY kind = 'generated', created_at DESC
+                        LIMIT 1
+                    """, (video_id, cutoff)).fetchone()
+
+                if row is None:
+                    self.misses += 1
+                    return None
+
+                conn.execute("""
+                    UPDATE transcripts SET last_accessed = ? WHERE cache_key = ?
+                """, (time.time(), row["cache_key"]))
+                conn.commit()
+
+            self.hits += 1
+            return CachedTranscript(
+                video_id=row["video_id"],
+                language_code=row["language_code"],
+                kind=row["kind"],
+                content=row["content"],
+                created_at=row["created_at"]
+            )
+
+        except Exception as e:
+            self.logger.error(f"Failed to read transcript cache for {video_id}: {e}")
+            self.misses += 1
+            return None
+
+    def put(self, video_id: str, language_code: str, kind: str, content: str) -> bool:
+        """Store a transcript in the cache.
+
+        Args:
+            video_id: YouTube video ID
+            language_code: Transcript language code
+            kind: Transcript kind ("manual" or "generated")
+            content: Transcript text
+
+        Returns:
+            True if stored successfully
+        """
+        if not video_id or not content:
+            return False
+
+        now = time.time()
+        size_bytes = len(content.encode("utf-8"))
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO transcripts (
+                        cache_key, video_id, language_code, kind, content,
+                        size_bytes, created_at, last_accessed
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    self.make_key(video_id, language_code, kind),
+                    video_id,
+                    language_code,
+                    kind,
+                    content,
+                    size_bytes,
+                    now,
+                    now
+                ))
+                conn.commit()
+
+            with self._size_lock:
+                self._size_bytes += size_bytes
+                over_limit = self._size_bytes > self.max_size_bytes
+            if over_limit:
+                self.evict()
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to write transcript cache for {video_id}: {e}")
+            return False
+
+    def evict(self) -> int:
+        """Remove expired entries and trim the cache to its size limit.
+
+        Least recently accessed entries are removed first.
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cutoff = time.time() - self.max_age_seconds
+                removed = conn.execute(
+                    "DELETE FROM transcripts WHERE created_at < ?", (cutoff,)
+                ).rowcount
+
+                total_size = conn.execute(
+                    "SELECT COALESCE(SUM(size_bytes), 0) FROM transcripts"
+                ).fetchone()[0]
+
+                if total_size > self.max_size_bytes:
+                    cursor = conn.execute("""
+                        SELECT cache_key, size_bytes FROM transcripts
+                        ORDER BY last_accessed ASC
+                    """)
+                    stale_keys = []
+                    for cache_key, size_bytes in cursor.fetchall():
+                        if total_size <= self.max_size_bytes:
+                            break
+                        stale_keys.append((cache_key,))
+                        total_size -= size_bytes
+
+                    conn.executemany("DELETE FROM transcripts WHERE cache_key = ?", stale_keys)
+                    removed += len(stale_keys)
+
+                conn.commit()
+
+            with self._size_lock:
+                self._size_bytes = total_size
+
+            if removed:
+                self.logger.info(f"Evicted {removed} transcript cache entries")
+            return removed
+
+        except Exception as e:
+            self.logger.error(f"Failed to evict transcript cache entries: {e}")
+            return 0
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("DELETE FROM transcripts")
+                conn.commit()
+            with self._size_lock:
+                self._size_bytes = 0
+        except Exception as e:
+            self.logger.error(f"Failed to clear transcript cache: {e}")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, size and hit/miss counters
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                entries, size_bytes = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM transcripts"
+                ).fetchone()
+        except Exception as e:
+            self.logger.error(f"Failed to get transcript cache statistics: {e}")
+            entries, size_bytes = 0, 0
+
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "size_bytes": size_bytes,
+            "max_size_bytes": self.max_size_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups * 100) if lookups else 0.0,
+            "database_path": str(self.db_path)
+        }
@@ -5,9 +5,8 @@ Transcript fetching service for YouTube videos and local files.
 import os
 import glob
 import time
-import random
 import logging
-from typing import List, Optional, Callable, Protocol, Dict, Any
+from typing import List, Optional, Callable, Protocol, Dict, Any, Tuple
 from pytube import Playlist
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import NoTranscriptFound
@@ -19,21 +18,39 @@ except ImportError:
     youtube_transcript_api = None
 
 from .models import TranscriptVideo, ProcessingProgress, ProcessingResult, ProcessingMode
-from .protocols import ProgressCallback, StatusCallback
+from .protocols import ProgressCallback, StatusCallback, VideoCallback
+from .transcript_cache import TranscriptCache
+from .pacing import RequestPacer
+from .playlist_manifest import PlaylistManifestStore, extract_video_id
+from .retry import RetryEngine, RetryBudget, ErrorCode
 
 
 class TranscriptFetcher:
     """Service for fetching transcripts from various sources."""
     
-    def __init__(self, config=None, progress_callback: Optional[ProgressCallback] = None):
+    def __init__(self, config=None, progress_callback: Optional[ProgressCallback] = None,
+                 cache: Optional[TranscriptCache] = None,
+                 pacer: Optional[RequestPacer] = None,
+                 playlist_store: Optional[PlaylistManifestStore] = None,
+                 retry_engine: Optional[RetryEngine] = None):
         """Initialize the transcript fetcher.
         
         Args:
             config: Optional processing configuration
             progress_callback: Optional progress callback function
+            cache: Optional transcript cache consulted before any network request
+            pacer: Request pacer for sequential fetching (defaults to
+                0.5 videos per second with a burst of 3)
+            playlist_store: Optional manifest store used instead of
+                re-enumerating playlists on every run
+            retry_engine: Retry engine applied to transcript requests
         """
         self.config = config
         self.progress_callback = progress_callback
+        self.cache = cache
+        self.pacer = pacer or RequestPacer()
+        self.playlist_store = playlist_store
+        self.retry_engine = retry_engine or RetryEngine()
         self.is_cancelled = False
         self.logger = logging.getLogger(__name__)
     
@@ -41,16 +58,53 @@ class TranscriptFetcher:
         """Cancel the current operation."""
         self.is_cancelled = True
     
+    def get_cached_transcript(self, video_url: str) -> Optional[TranscriptVideo]:
+        """Return a cached transcript for the video, if one exists.
+        
+        Args:
+            video_url: YouTube video URL
+            
+        Returns:
+            TranscriptVideo built from the cache, or None on a miss
+        """
+        if not self.cache:
+            return None
+        
+        video_id = self._extract_video_id(video_url)
+        if not video_id:
+            return None
+        
+        cached = self.cache.get(video_id, languages=['en'])
+        if not cached:
+            return None
+        
+        self.logger.debug(f"Transcript cache hit for {video_id} ({cached.language_code}, {cached.kind})")
+        return TranscriptVideo(
+            url=video_url,
+            title=None,
+            content=cached.content,
+            success=True
+        )
+    
     def fetch_from_youtube(self, url: str, output_file: str,
                           progress_callback: Optional[ProgressCallback] = None,
-                          status_callback: Optional[StatusCallback] = None) -> ProcessingResult:
+                          status_callback: Optional[StatusCallback] = None,
+                          sync: bool = False,
+                          video_callback: Optional[VideoCallback] = None) -> ProcessingResult:
         """Fetch transcripts from YouTube URL.
         
+        Retries of all videos share one retry budget, so a run of failures
+        cannot multiply the requests sent to YouTube.
+        
         Args:
             url: YouTube playlist or video URL
             output_file: Output file path for transcripts
             progress_callback: Optional callback for progress updates
             status_callback: Optional callback for status messages
+            sync: Only fetch playlist videos added since the last successful
+                sync (requires a playlist store)
+            video_callback: Optional callback receiving each transcript as soon
+                as it is written, so later stages can start on it
             
         Returns:
             ProcessingResult with operation outcome
@@ -63,16 +117,19 @@ class TranscriptFetcher:
             
             # Initialize YouTube Transcript API
             ytt_api = YouTubeTranscriptApi()
+            # Every run gets its own retry budget
+            budget = RetryBudget()
             
             # Determine if it's a playlist or single video
             if "playlist?list=" in url:
-                playlist = Playlist(url)
-                video_urls = playlist.video_urls
+                playlist_name, video_urls = self.get_playlist_video_urls(url, sync=sync)
                 total_videos = len(video_urls)
-                playlist_name = playlist.title
                 
                 if status_callback:
-                    status_callback(f"Found playlist: {playlist_name} with {total_videos} videos")
+                    if sync and self.playlist_store:
+                        status_callback(f"Found playlist: {playlist_name} with {total_videos} new videos")
+                    else:
+                        status_callback(f"Found playlist: {playlist_name} with {total_videos} videos")
             elif "watch?v=" in url:
                 video_urls = [url]
                 total_videos = 1
@@ -88,6 +145,7 @@ class TranscriptFetcher:
             
             # Process videos and write transcripts
             videos_processed = 0
+            processed_ids = []
             
             with open(output_file, 'w', encoding='utf-8') as f:
                 f.write(f"Playlist Name: {playlist_name}\n\n")
@@ -114,25 +172,35 @@ class TranscriptFetcher:
                         )
                         progress_callback(progress)
                     
-                    # Extract transcript for this video
-                    video_result = self._extract_single_video_transcript(
-                        video_url, index, total_videos, ytt_api, status_callback
-                    )
+                    # Extract transcript for this video, preferring the cache
+                    video_result = self.get_cached_transcript(video_url)
+                    from_cache = video_result is not None
+                    if video_result is None:
+                        # Only sleeps for what is left of this video's slot
+                        self.pacer.wait()
+                        video_result = self._extract_single_video_transcript(
+                            video_url, index, total_videos, ytt_api, status_callback,
+                            pacer=self.pacer, budget=budget
+                        )
                     
                     if video_result.success:
                         f.write(f"Video URL: {video_url}\n")
                         f.write(video_result.content + '\n\n')
+                        if video_callback:
+                            f.flush()
+                            video_callback(video_url, video_result.content)
                         videos_processed += 1
+                        processed_ids.append(extract_video_id(video_url))
                         
                         if status_callback:
-                            status_callback(f"✅ Extracted transcript for video {index}/{total_videos}")
+                            source = " (cached)" if from_cache else ""
+                            status_callback(f"✅ Extracted transcript for video {index}/{total_videos}{source}")
                     else:
                         if status_callback:
                             status_callback(f"⚠️ {video_result.error_message}")
-                    
-                    # Add delay between videos to avoid rate limiting
-                    if index < total_videos:
-                        time.sleep(random.uniform(1, 2))
+            
+            if self.playlist_store and "playlist?list=" in url:
+                self.playlist_store.mark_synced(url, [video_id for video_id in processed_ids if video_id])
             
             return ProcessingResult(
                 success=True,
@@ -149,9 +217,33 @@ class TranscriptFetcher:
                 error_message=error_message
             )
     
+    def get_playlist_video_urls(self, playlist_url: str, sync: bool = False,
+                                refresh: bool = False) -> Tuple[Optional[str], List[str]]:
+        """Get a playlist's title and video URLs, using the manifest store if set.
+        
+        Args:
+            playlist_url: YouTube playlist URL
+            sync: Only return videos not yet processed by a sync run
+            refresh: Re-enumerate even if a fresh manifest is stored
+            
+        Returns:
+            Tuple of playlist title and video URLs in playlist order
+        """
+        if not self.playlist_store:
+            return self._enumerate_playlist(playlist_url)
+        
+        manifest = self.playlist_store.resolve(playlist_url, self._enumerate_playlist, refresh=refresh)
+        return manifest.title, manifest.pending_urls if sync else manifest.video_urls
+    
+    def _enumerate_playlist(self, playlist_url: str) -> Tuple[Optional[str], List[str]]:
+        """Enumerate a playlist with pytube."""
+        playlist = Playlist(playlist_url)
+        return playlist.title, list(playlist.video_urls)
+    
     def fetch_from_local_folder(self, folder_path: str, output_file: str,
                                progress_callback: Optional[ProgressCallback] = None,
-                               status_callback: Optional[StatusCallback] = None) -> ProcessingResult:
+                               status_callback: Optional[StatusCallback] = None,
+                               video_callback: Optional[VideoCallback] = None) -> ProcessingResult:
         """Fetch transcripts from local folder.
         
         Args:
@@ -159,6 +251,8 @@ class TranscriptFetcher:
             output_file: Output file path for combined transcripts
             progress_callback: Optional callback for progress updates
             status_callback: Optional callback for status messages
+            video_callback: Optional callback receiving each file's transcript
+                as soon as it is written
             
         Returns:
             ProcessingResult with operation outcome
@@ -220,6 +314,9 @@ class TranscriptFetcher:
                         # Write in the same format as YouTube transcripts
                         combined_file.write(f"Video URL: Local File - {filename}\n")
                         combined_file.write(content + '\n\n')
+                        if video_callback:
+                            combined_file.flush()
+                            video_callback(f"Local File - {filename}", content)
                         
                         files_processed += 1
                         
@@ -248,7 +345,10 @@ class TranscriptFetcher:
     
     def _extract_single_video_transcript(self, video_url: str, index: int, total: int,
                                        ytt_api: YouTubeTranscriptApi,
-                                       status_callback: Optional[StatusCallback] = None) -> TranscriptVideo:
+                                       status_callback: Optional[StatusCallback] = None,
+                                       max_retries: int = 3,
+                                       pacer: Optional[RequestPacer] = None,
+                                       budget: Optional[RetryBudget] = None) -> TranscriptVideo:
         """Extract transcript from a single video.
         
         Args:
@@ -257,115 +357,114 @@ class TranscriptFetcher:
             total: Total number of videos
             ytt_api: YouTube Transcript API instance
             status_callback: Optional callback for status messages
+            max_retries: Attempts made here before giving up; callers that pace
+                retries themselves (e.g. through a shared rate limiter) pass 1
+            pacer: Optional request pacer; when given, retry delays go through
+                it instead of fixed sleeps
+            budget: Optional retry budget shared with the rest of the batch
             
         Returns:
             TranscriptVideo with extraction result
         """
         try:
             video_id = video_url.split("?v=")[1].split("&")[0]
-            fetched_transcript = None
-            
-            # Enhanced transcript extraction with retry logic
-            max_retries = 3
-            retry_delay = 2
-            
-            for attempt in range(max_retries):
-                try:
-                    if attempt > 0:
-                        if status_callback:
-                            status_callback(f"Retry attempt {attempt + 1}/{max_retries} for video {index}/{total}")
-                        time.sleep(retry_delay + random.uniform(1, 3))
-                    
-                    # Get the list of all available transcripts
-                    transcript_list_obj = ytt_api.list(video_id)
-                    
-                    # Try to find and fetch English first
-                    try:
-                        transcript_object = transcript_list_obj.find_transcript(['en'])
-                        if status_callback:
-                            status_callback(f"Found English transcript for video {index}/{total}. Fetching...")
-                        fetched_transcript = transcript_object.fetch()
-                        break  # Success, exit retry loop
-                    
-                    # If English is not found, fallback to the first available transcript
-                    except NoTranscriptFound:
-                        if status_callback:
-                            status_callback(f"English not found for video {index}/{total}. Trying fallback...")
-                        # Get the first transcript object from the list
-                        first_transcript_object = next(iter(transcript_list_obj))
-                        if status_callback:
-                            status_callback(f"Found fallback: '{first_transcript_object.language}'. Fetching...")
-                        fetched_transcript = first_transcript_object.fetch()
-                        break  # Success, exit retry loop
-                
-                except Exception as fetch_error:
-                    error_msg = str(fetch_error)
-                    if "blocking requests" in error_msg or "IP" in error_msg:
-                        if attempt < max_retries - 1:
-                            if status_callback:
-                                status_callback(f"IP blocked for video {index}/{total}, waiting before retry...")
-                            time.sleep(retry_delay * (attempt + 2))  # Exponential backoff
-                            continue
-                        else:
-                            if status_callback:
-                                status_callback(f"Failed after {max_retries} attempts for video {index}/{total}: IP blocked")
-                            return TranscriptVideo(
-                                url=video_url,
-                                title=None,
-                                content="",
-                                success=False,
-                                error_message=f"Failed after {max_retries} attempts: IP blocked"
-                            )
-                    else:
-                        # Other error, don't retry
-                        raise fetch_error
-            
-            # Process the transcript if we got one
-            if fetched_transcript:
-                transcript_text = ' '.join([segment.text for segment in fetched_transcript])
-                return TranscriptVideo(
-                    url=video_url,
-                    title=None,
-                    content=transcript_text,
-                    success=True
-                )
-            else:
-                return TranscriptVideo(
-                    url=video_url,
-                    title=None,
-                    content="",
-                    success=False,
-                    error_message=f"Could not extract transcript for video {index}/{total}"
-                )
-        
-        except NoTranscriptFound:
+        except IndexError:
             return TranscriptVideo(
                 url=video_url,
                 title=None,
                 content="",
                 success=False,
-                error_message=f"No transcripts available for video {index}/{total}"
+                error_message=f"Error processing {video_url}: invalid video URL",
+                error_code=ErrorCode.INVALID_REQUEST.value
             )
         
-        except Exception as video_error:
-            error_msg = str(video_error)
-            if "blocking requests" in error_msg:
+        def fetch_transcript():
+            # Get the list of all available transcripts
+            transcript_list_obj = ytt_api.list(video_id)
+            
+            # Try to find and fetch English first
+            try:
+                transcript_object = transcript_list_obj.find_transcript(['en'])
                 if status_callback:
-                    status_callback(f"🚫 IP blocked for video {index}/{total} - Consider waiting longer between batches")
-                
-                # If we're getting blocked after processing several videos, suggest stopping
-                if "blocking requests" in error_msg and index > 5:
-                    if status_callback:
-                        status_callback("⚠️ Multiple IP blocks detected. Consider stopping and waiting 30+ minutes before continuing.")
-                        status_callback("💡 Tip: Process videos in smaller batches (10-20 at a time) with longer delays between batches.")
+                    status_callback(f"Found English transcript for video {index}/{total}. Fetching...")
             
+            # If English is not found, fallback to the first available transcript
+            except NoTranscriptFound:
+                if status_callback:
+                    status_callback(f"English not found for video {index}/{total}. Trying fallback...")
+                # Get the first transcript object from the list
+                transcript_object = next(iter(transcript_list_obj), None)
+                if transcript_object is None:
+                    raise LookupError(f"No transcripts available for video {index}/{total}")
+                if status_callback:
+                    status_callback(f"Found fallback: '{transcript_object.language}'. Fetching...")
+            
+            return transcript_object, transcript_object.fetch()
+        
+        def announce_retry(code: ErrorCode, attempt: int, delay: float) -> None:
+            if status_callback:
+                if code in (ErrorCode.IP_BLOCKED, ErrorCode.RATE_LIMITED):
+                    status_callback(f"IP blocked for video {index}/{total}, waiting before retry...")
+                status_callback(f"Retry attempt {attempt}/{max_retries} for video {index}/{total}")
+        
+        def wait(delay: float) -> None:
+            if pacer:
+                pacer.backoff(delay)
+                pacer.wait()
+            else:
+                time.sleep(delay)
+        
+        outcome = self.retry_engine.execute(
+            fetch_transcript,
+            on_retry=announce_retry,
+            sleep=wait,
+            max_attempts=max_retries,
+            budget=budget
+        )
+        
+        if outcome.success:
+            fetched_object, fetched_transcript = outcome.value
+            transcript_text = ' '.join([segment.text for segment in fetched_transcript])
+            if self.cache:
+                self.cache.put(
+                    video_id,
+                    getattr(fetched_object, 'language_code', 'unknown'),
+                    'generated' if getattr(fetched_object, 'is_generated', False) else 'manual',
+                    transcript_text
+                )
             return TranscriptVideo(
                 url=video_url,
                 title=None,
-                content="",
-                success=False,
-                error_message=f"Error processing {video_url}: {error_msg}"
+                content=transcript_text,
+                success=True,
+                attempts=outcome.attempts
             )
+        
+        code = outcome.error_code
+        if code == ErrorCode.NO_TRANSCRIPT:
+            error_message = f"No transcripts available for video {index}/{total}"
+        elif code in (ErrorCode.IP_BLOCKED, ErrorCode.RATE_LIMITED):
+            if status_callback:
+                status_callback(f"Failed after {outcome.attempts} attempts for video {index}/{total}: IP blocked")
+                status_callback(f"🚫 IP blocked for video {index}/{total} - Consider waiting longer between batches")
+                
+                # If we're getting blocked after processing several videos, suggest stopping
+                if index > 5:
+                    status_callback("⚠️ Multiple IP blocks detected. Consider stopping and waiting 30+ minutes before continuing.")
+                    status_callback("💡 Tip: Process videos in smaller batches (10-20 at a time) with longer delays between batches.")
+            error_message = f"Failed after {outcome.attempts} attempts: IP blocked"
+        else:
+            error_message = f"Error processing {video_url}: {outcome.error_message}"
+        
+        return TranscriptVideo(
+            url=video_url,
+            title=None,
+            content="",
+            success=False,
+            error_message=error_message,
+            error_code=code.value if code else None,
+            attempts=outcome.attempts
+        )
 
     # Additional methods expected by tests
     def _extract_video_id(self, url: str) -> Optional[str]:
@@ -490,8 +589,7 @@ class TranscriptFetcher:
             if status_callback:
                 status_callback(f"Fetching videos from playlist: {playlist_url}")
                 
-            playlist = Playlist(playlist_url)
-            video_urls = list(playlist.video_urls)
+            _, video_urls = self.get_playlist_video_urls(playlist_url)
             
             if status_callback:
                 status_callback(f"Found {len(video_urls)} videos in playlist")
@@ -555,8 +653,7 @@ class TranscriptFetcher:
             if status_callback:
                 status_callback(f"Fetching videos from playlist: {playlist_url}")
                 
-            playlist = Playlist(playlist_url)
-            video_urls = list(playlist.video_urls)
+            _, video_urls = self.get_playlist_video_urls(playlist_url)
             
             if status_callback:
                 status_callback(f"Found {len(video_urls)} videos in playlist")
@@ -4,6 +4,9 @@ Main window UI for the YouTube Transcript Extractor application.
 
 import os
 import sys
+import asyncio
+import itertools
+import threading
 from datetime import datetime
 from typing import Optional, Dict, Any
 
@@ -20,7 +23,15 @@ from ..core.models import (
     ProcessingPrompts, ProcessingProgress, ProcessingResult
 )
 from ..core.transcript_fetcher import TranscriptFetcher
+from ..core.transcript_cache import TranscriptCache
+from ..core.response_cache import ResponseCache
+from ..core.quota_usage import QuotaUsageStore
+from ..core.pacing import ModelQuotas
+from ..core.playlist_manifest import PlaylistManifestStore
 from ..core.gemini_processor import GeminiProcessor
+from ..core.retry import ErrorCode
+from ..core.output_stream import OrderedOutputStream
+from ..core.pipeline import Pipeline, PipelineStage, ThreadedSource
 from ..utils.config import ConfigManager, DefaultPaths
 from ..utils.validators import InputValidator
 from .styles import (
@@ -62,6 +73,7 @@ class ProcessingThread(QThread):
     status_update = pyqtSignal(str)
     processing_complete = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
+    text_streamed = pyqtSignal(int, int)  # Video number, characters received
     
     def __init__(self, config: ProcessingConfig):
         """Initialize processing thread.
@@ -71,63 +83,129 @@ class ProcessingThread(QThread):
         """
         super().__init__()
         self.config = config
-        self.transcript_fetcher = TranscriptFetcher()
+        self.transcript_fetcher = TranscriptFetcher(cache=TranscriptCache(), playlist_store=PlaylistManifestStore())
         self.gemini_processor: Optional[GeminiProcessor] = None
+        self.pipeline: Optional[Pipeline] = None
         self._is_running = True
+        self._total_videos = 0
+        self._fetch_position = 0
+        self._videos_fetched = 0
+        self._videos_refined = 0
+        self._refined_lock = threading.Lock()
     
     def run(self) -> None:
         """Run the processing pipeline."""
         try:
-            # Step 1: Extract transcripts
-            self.status_update.emit("Starting transcript extraction...")
+            asyncio.run(self._run_pipeline())
+        except Exception as e:
+            self.error_occurred.emit(f"Processing error: {str(e)}")
+    
+    async def _run_pipeline(self) -> None:
+        """Extract and refine transcripts as overlapping stages.
+        
+        Each transcript is handed to Gemini as soon as it is extracted, so a
+        video is refined while the next one is still being fetched; runs of
+        short videos are packed into one request. Refined text streams into
+        the output file as Gemini generates it, in extraction order.
+        """
+        self.status_update.emit("Starting transcript extraction...")
+        self.gemini_processor = GeminiProcessor(
+            self.config, response_cache=ResponseCache(), quotas=ModelQuotas(usage_store=QuotaUsageStore())
+        )
+        prompt_template = ProcessingPrompts.get_prompt(self.config.refinement_style)
+        output = OrderedOutputStream(self.config.gemini_output_file, first_index=1, truncate=True)
+        
+        numbers = itertools.count(1)
+        
+        def extract(emit) -> ProcessingResult:
+            """Extract transcripts on a worker thread, emitting each one."""
+            def hand_over(video_url: str, content: str) -> None:
+                emit((next(numbers), f"Video URL: {video_url}\n{content}"))
             
             if self.config.mode == ProcessingMode.YOUTUBE_URL:
-                result = self.transcript_fetcher.fetch_from_youtube(
-                    self.config.source_path,
-                    self.config.transcript_output_file,
-                    self._progress_callback,
-                    self._status_callback
-                )
-            else:  # LOCAL_FOLDER
-                result = self.transcript_fetcher.fetch_from_local_folder(
+                return self.transcript_fetcher.fetch_from_youtube(
                     self.config.source_path,
                     self.config.transcript_output_file,
                     self._progress_callback,
-                    self._status_callback
+                    self._status_callback,
+                    video_callback=hand_over
                 )
-            
-            if not result.success:
-                self.error_occurred.emit(result.error_message or "Unknown error during transcript extraction")
-                return
-            
-            # Step 2: Process with Gemini
-            if not self._is_running:
-                return
-            
-            self.status_update.emit("Starting Gemini AI processing...")
-            self.progress_update.emit(0)  # Reset progress for Gemini processing
-            
-            self.gemini_processor = GeminiProcessor(
-                self.config.api_key
-            )
-            
-            gemini_result = self.gemini_processor.process_transcripts(
+            return self.transcript_fetcher.fetch_from_local_folder(
+                self.config.source_path,
                 self.config.transcript_output_file,
-                self.config.gemini_output_file,
-                self.config.output_language,
-                self.config.refinement_style,
-                self.config.chunk_size,
                 self._progress_callback,
-                self._status_callback
+                self._status_callback,
+                video_callback=hand_over
             )
-            
-            if gemini_result.success:
-                self.processing_complete.emit(gemini_result.output_file or "")
-            else:
-                self.error_occurred.emit(gemini_result.error_message or "Unknown error during Gemini processing")
-                
-        except Exception as e:
-            self.error_occurred.emit(f"Processing error: {str(e)}")
+        
+        async def count_fetched(videos):
+            """Count extracted videos on the event loop as they enter the pipeline."""
+            async for video in videos:
+                self._videos_fetched += 1
+                yield video
+        
+        def stream_for(number: int):
+            """Get the output handle of a video, reporting its streamed text."""
+            return output.video(number, lambda chars: self._text_streamed(number, chars))
+        
+        def refine(group):
+            """Refine a group of neighbouring videos with Gemini, streaming them into the output."""
+            group_numbers = [number for number, _ in group]
+            streams = [stream_for(number) for number in group_numbers]
+            if not self._is_running:
+                for stream in streams:
+                    stream.discard()
+                return None
+            for number in group_numbers:
+                self._status_callback(f"Refining video {number} with Gemini AI...")
+            results = self.gemini_processor.refine_videos_to_streams(
+                streams, [video_chunk for _, video_chunk in group], prompt_template,
+                self.config.output_language, self.config.chunk_size,
+                group_numbers[0], max(self._total_videos, group_numbers[-1]), self._status_callback
+            )
+            refined = 0
+            for number, result in zip(group_numbers, results):
+                if not result.success:
+                    self._status_callback(f"⚠️ Error processing video {number}: {result.error_message}")
+                    if result.error_code == ErrorCode.QUOTA_EXHAUSTED.value and self._is_running:
+                        # Every later video would fail the same way
+                        self.error_occurred.emit(result.error_message or "Gemini daily quota used up")
+                        self.stop()
+                    continue
+                refined += 1
+                self._status_callback(f"✅ Video {number} processed successfully")
+            if not refined:
+                return None
+            with self._refined_lock:
+                self._videos_refined += refined
+            self._emit_progress()
+            return group
+        
+        source = ThreadedSource(extract)
+        self.pipeline = Pipeline([
+            PipelineStage("refine", refine, workers=self.gemini_processor.max_concurrent_videos, blocking=True),
+        ])
+        try:
+            stats = await self.pipeline.run(self.gemini_processor.pack_video_stream(
+                count_fetched(source), lambda item: item[1], self.config.chunk_size
+            ))
+        finally:
+            output.close()
+            self.gemini_processor.close()
+        
+        extraction = source.result
+        if not self._is_running or stats.cancelled:
+            return
+        if extraction is None or not extraction.success:
+            message = extraction.error_message if extraction else None
+            self.error_occurred.emit(message or "Unknown error during transcript extraction")
+            return
+        
+        self.progress_update.emit(100)
+        self._status_callback(
+            f"✅ Processing complete! {self._videos_refined}/{self._videos_fetched} videos processed successfully"
+        )
+        self.processing_complete.emit(self.config.gemini_output_file)
     
     def stop(self) -> None:
         """Stop the processing."""
@@ -136,11 +214,25 @@ class ProcessingThread(QThread):
             self.transcript_fetcher.cancel()
         if self.gemini_processor:
             self.gemini_processor.cancel()
+        if self.pipeline:
+            self.pipeline.cancel()
+    
+    def _emit_progress(self) -> None:
+        """Report progress across extraction and refinement together."""
+        if self._is_running and self._total_videos:
+            done = self._fetch_position + self._videos_refined
+            self.progress_update.emit(min(100, int(done / (2 * self._total_videos) * 100)))
+    
+    def _text_streamed(self, number: int, chars: int) -> None:
+        """Report how much refined text a video has received so far."""
+        if self._is_running:
+            self.text_streamed.emit(number, chars)
     
     def _progress_callback(self, progress: ProcessingProgress) -> None:
         """Handle progress updates."""
-        if self._is_running:
-            self.progress_update.emit(progress.percentage)
+        self._total_videos = progress.total_items
+        self._fetch_position = progress.current_item
+        self._emit_progress()
     
     def _status_callback(self, message: str) -> None:
         """Handle status updates."""
@@ -456,7 +548,7 @@ class MainWindow(QMainWindow):
         chunk_layout.addWidget(self.chunk_value_label)
         
         chunk_desc = QLabel(
-            "(Maximum number of words per API call. Larger chunks: Fewer calls, faster execution, "
+            "(Maximum number of tokens of transcript per API call. Larger chunks: Fewer calls, faster execution, "
             "but potentially lower detail. Good for summarizing longer videos.)"
         )
         chunk_desc.setFont(QFont(Fonts.PRIMARY_FONT, Fonts.SMALL_SIZE))
@@ -681,7 +773,7 @@ class MainWindow(QMainWindow):
                 self.selected_refinement_style = data["refinement_style"]
                 count += 1
             
-            if data["chunk_size"] != 3000:
+            if data["chunk_size"] != 4000:
                 self.chunk_slider.setValue(data["chunk_size"])
                 count += 1
             
@@ -741,6 +833,7 @@ class MainWindow(QMainWindow):
         self.processing_thread.status_update.connect(self._update_status)
         self.processing_thread.processing_complete.connect(self._handle_success)
         self.processing_thread.error_occurred.connect(self._handle_error)
+        self.processing_thread.text_streamed.connect(self._show_streamed_text)
         
         self._update_status("Starting processing...", DarkTheme.INFO)
         self.processing_thread.start()
@@ -802,12 +895,17 @@ class MainWindow(QMainWindow):
             gemini_model=self.selected_model,
             api_key=self.api_key_input.text().strip(),
             transcript_output_file=transcript_file,
-            gemini_output_file=gemini_file
+            gemini_output_file=gemini_file,
+            # Quotas of the user's API tier, from .env
+            requests_per_minute=self.config_manager.get_requests_per_minute(),
+            tokens_per_minute=self.config_manager.get_tokens_per_minute(),
+            requests_per_day=self.config_manager.get_requests_per_day()
         )
     
     def _set_processing_state(self, processing: bool) -> None:
         """Set the UI processing state."""
         self.is_processing = processing
+        self.progress_bar.setFormat("%p%")
         self.start_button.setEnabled(not processing)
         self.cancel_button.setEnabled(processing)
         self.autofill_button.setEnabled(not processing)
@@ -820,6 +918,10 @@ class MainWindow(QMainWindow):
         for input_field in inputs:
             input_field.setReadOnly(processing)
     
+    def _show_streamed_text(self, number: int, chars: int) -> None:
+        """Show live refinement output on the progress bar."""
+        self.progress_bar.setFormat(f"%p%  ·  Video {number}: {chars:,} characters refined")
+    
     def _update_status(self, message: str, color: str = DarkTheme.INFO) -> None:
         """Update status display."""
         self.status_display.append(f"<font color='{color}'>{message}</font>")
@@ -3,6 +3,7 @@ Configuration management utilities for the YouTube Transcript Extractor applicat
 """
 
 import os
+import logging
 from typing import Optional, Dict, Any
 from dotenv import load_dotenv
 
@@ -41,6 +42,13 @@ if not models_available:
 
 # RefinementStyle fallback is handled above
 
+# Chunk sizes are estimated tokens per Gemini request. The legacy CHUNK_SIZE
+# setting counted words, about three quarters of a token budget in English.
+DEFAULT_CHUNK_TOKENS = 4000
+MIN_CHUNK_TOKENS = 2000
+MAX_CHUNK_TOKENS = 50000
+TOKENS_PER_WORD = 4 / 3
+
 
 class ConfigManager:
     """Manages application configuration from environment variables and defaults."""
@@ -129,18 +137,31 @@ class ConfigManager:
         return getattr(RefinementStyle, 'SUMMARY', "Summary")
     
     def get_chunk_size(self) -> int:
-        """Get chunk size from environment or default."""
-        chunk_size_str = self.get_env_value("CHUNK_SIZE", "3000")
-        if chunk_size_str:
-            try:
-                chunk_size = int(chunk_size_str)
-                # Validate range
-                if 2000 <= chunk_size <= 50000:
-                    return chunk_size
-            except (ValueError, TypeError):
-                pass
+        """Get chunk size, in tokens, from environment or default.
+        
+        CHUNK_TOKENS holds the token budget. Without it, a legacy CHUNK_SIZE,
+        counted in words, is converted to tokens.
+        """
+        chunk_tokens_str = self.get_env_value("CHUNK_TOKENS", "")
+        chunk_words_str = self.get_env_value("CHUNK_SIZE", "")
+        try:
+            if chunk_tokens_str:
+                chunk_size = int(chunk_tokens_str)
+            elif chunk_words_str:
+                chunk_size = min(round(int(chunk_words_str) * TOKENS_PER_WORD), MAX_CHUNK_TOKENS)
+                logging.getLogger(__name__).warning(
+                    f"CHUNK_SIZE={chunk_words_str} counts words and is deprecated; "
+                    f"using CHUNK_TOKENS={chunk_size} instead"
+                )
+            else:
+                return DEFAULT_CHUNK_TOKENS
+        except (ValueError, TypeError):
+            return DEFAULT_CHUNK_TOKENS
         
-        return 3000  # Default
+        # Validate range
+        if MIN_CHUNK_TOKENS <= chunk_size <= MAX_CHUNK_TOKENS:
+            return chunk_size
+        return DEFAULT_CHUNK_TOKENS
     
     def get_gemini_model(self) -> str:
         """Get Gemini model from environment or default."""
@@ -155,6 +176,27 @@ class ConfigManager:
         # Fallback if GeminiModels not available
         return model_name or "gemini-1.5-flash"
     
+    def _get_positive_int(self, key: str) -> Optional[int]:
+        """Get a positive integer from environment, None if unset or invalid."""
+        value = self.get_env_value(key, "")
+        try:
+            number = int(value) if value else 0
+        except (ValueError, TypeError):
+            return None
+        return number if number > 0 else None
+    
+    def get_requests_per_minute(self) -> Optional[int]:
+        """Get the Gemini request quota per minute, None for the model's published limit."""
+        return self._get_positive_int("GEMINI_REQUESTS_PER_MINUTE")
+    
+    def get_tokens_per_minute(self) -> Optional[int]:
+        """Get the Gemini token quota per minute, None for the model's published limit."""
+        return self._get_positive_int("GEMINI_TOKENS_PER_MINUTE")
+    
+    def get_requests_per_day(self) -> Optional[int]:
+        """Get the Gemini request quota per day, None to not enforce one."""
+        return self._get_positive_int("GEMINI_REQUESTS_PER_DAY")
+    
     def get_auto_fill_data(self) -> Dict[str, Any]:
         """Get all configuration data for auto-fill functionality.
         
@@ -192,7 +234,7 @@ class ConfigManager:
                     count += 1
             elif key == "chunk_size":
                 # Check if it's not the default
-                if value != 3000:
+                if value != DEFAULT_CHUNK_TOKENS:
                     count += 1
         
         return count
@@ -103,7 +103,7 @@ def mock_env_file(temp_dir: str) -> str:
         f.write("""API_KEY=test_api_key_from_env
 LANGUAGE=Spanish
 REFINEMENT_STYLE=Summary
-CHUNK_SIZE=5000
+CHUNK_TOKENS=5000
 GEMINI_MODEL=gemini-1.5-pro
 TRANSCRIPT_OUTPUT_FILE=custom_transcript.txt
 GEMINI_OUTPUT_FILE=custom_output.txt
@@ -202,6 +202,28 @@ def event_loop():
     loop.close()
 
 
+# Time control for code that takes clock and sleep functions
+class FakeClock:
+    """Manually advanced clock whose sleep moves time forward."""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Fake clock that only moves when told to or slept on."""
+    return FakeClock()
+
+
 # Mock classes for complex objects
 @pytest.fixture
 def mock_transcript_fetcher():
@@ -0,0 +1,182 @@
+"""
+Tests for the async_transport module.
+"""
+
+import pytest
+import json
+from unittest.mock import MagicMock
+from youtube_transcript_extractor.src.core.retry import ErrorCode, classify_error
+from youtube_transcript_extractor.src.core.async_transport import (
+    AsyncTranscriptTransport, CaptionTrack, TransportError, NoTranscriptAvailableError, PoTokenRequiredError,
+    VideoUnavailableError
+)
+
+
+WATCH_HTML = '<html><script>var cfg = {"INNERTUBE_API_KEY": "test_key"};</script></html>'
+
+PLAYER_RESPONSE = {
+    "playabilityStatus": {"status": "OK"},
+    "captions": {
+        "playerCaptionsTracklistRenderer": {
+            "captionTracks": [
+                {
+                    "baseUrl": "https://www.youtube.com/api/timedtext?v=abc&lang=de&fmt=srv3",
+                    "name": {"runs": [{"text": "German"}]},
+                    "languageCode": "de"
+                },
+                {
+                    "baseUrl": "https://www.youtube.com/api/timedtext?v=abc&lang=en&kind=asr",
+                    "name": {"runs": [{"text": "English (auto-generated)"}]},
+                    "languageCode": "en",
+                    "kind": "asr"
+                },
+                {
+                    "baseUrl": "https://www.youtube.com/api/timedtext?v=abc&lang=en",
+                    "name": {"simpleText": "English"},
+                    "languageCode": "en"
+                }
+            ]
+        }
+    }
+}
+
+TIMEDTEXT_XML = (
+    '<?xml version="1.0" encoding="utf-8" ?><transcript>'
+    '<text start="0.0" dur="1.5">Hello &amp;amp; welcome</text>'
+    '<text start="1.5" dur="2.0">&lt;font color="#fff"&gt;to the&lt;/font&gt; show</text>'
+    '</transcript>'
+)
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response."""
+
+    def __init__(self, status=200, body=""):
+        self.status = status
+        self._body = body
+
+    async def text(self):
+        return self._body
+
+    async def json(self, content_type=None):
+        return json.loads(self._body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakeSession:
+    """Routes requests to canned responses by URL substring."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+        self.cookie_jar = MagicMock()
+
+    def _respond(self, method, url):
+        self.calls.append((method, url))
+        for fragment, response in self.routes.items():
+            if fragment in url:
+                return response
+        return FakeResponse(404)
+
+    def request(self, method, url, **kwargs):
+        return self._respond(method, url)
+
+    def post(self, url, **kwargs):
+        return self._respond("POST", url)
+
+
+def make_session(player=PLAYER_RESPONSE, watch_status=200, player_status=200):
+    return FakeSession({
+        "watch?v=": FakeResponse(watch_status, WATCH_HTML),
+        "youtubei/v1/player": FakeResponse(player_status, json.dumps(player)),
+        "lang=en&kind=asr": FakeResponse(200, "<transcript><text start='0'>auto</text></transcript>"),
+        "lang=en": FakeResponse(200, TIMEDTEXT_XML),
+        "lang=de": FakeResponse(200, "<transcript><text start='0'>Hallo</text></transcript>"),
+    })
+
+
+@pytest.mark.unit
+class TestAsyncTranscriptTransport:
+    """Tests for AsyncTranscriptTransport class."""
+
+    @pytest.mark.asyncio
+    async def test_list_transcripts(self):
+        """Test listing caption tracks, manual tracks first."""
+        transport = AsyncTranscriptTransport(make_session())
+
+        tracks = await transport.list_transcripts("abc")
+
+        assert len(tracks) == 3
+        assert [t.is_generated for t in tracks] == [False, False, True]
+        assert tracks[0].language == "German"
+        assert "&fmt=srv3" not in tracks[0].base_url
+
+    @pytest.mark.asyncio
+    async def test_fetch_prefers_manual_english(self):
+        """Test that the manual English track is chosen and parsed."""
+        transport = AsyncTranscriptTransport(make_session())
+
+        track, text = await transport.fetch("abc", languages=["en"])
+
+        assert track.language_code == "en"
+        assert track.kind == "manual"
+        assert text == "Hello & welcome to the show"
+
+    @pytest.mark.asyncio
+    async def test_fetch_falls_back_to_first_track(self):
+        """Test falling back to the first available track."""
+        transport = AsyncTranscriptTransport(make_session())
+
+        track, text = await transport.fetch("abc", languages=["fr"])
+
+        assert track.language_code == "de"
+        assert text == "Hallo"
+
+    @pytest.mark.asyncio
+    async def test_http_429_is_reported_as_blocked(self):
+        """Test that HTTP 429 surfaces as a blocked transport error."""
+        transport = AsyncTranscriptTransport(make_session(watch_status=429))
+
+        with pytest.raises(TransportError) as exc_info:
+            await transport.fetch("abc")
+
+        assert exc_info.value.blocked is True
+        assert exc_info.value.status == 429
+
+    @pytest.mark.asyncio
+    async def test_no_captions(self):
+        """Test a video without caption tracks."""
+        player = {"playabilityStatus": {"status": "OK"}, "captions": {}}
+        transport = AsyncTranscriptTransport(make_session(player=player))
+
+        with pytest.raises(NoTranscriptAvailableError):
+            await transport.fetch("abc")
+
+    @pytest.mark.asyncio
+    async def test_unplayable_video_not_found(self):
+        """Test that an unplayable video is classified like the threaded path's VideoUnavailable."""
+        player = {"playabilityStatus": {"status": "ERROR", "reason": "Video unavailable"}}
+        transport = AsyncTranscriptTransport(make_session(player=player))
+
+        with pytest.raises(VideoUnavailableError) as exc_info:
+            await transport.fetch("abc")
+
+        assert classify_error(exc_info.value) == ErrorCode.NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_po_token_track_rejected(self):
+        """Test that tracks requiring a PO token are not fetched."""
+        transport = AsyncTranscriptTransport(make_session())
+        track = CaptionTrack("abc", "https://x/timedtext?v=abc&exp=xpe", "English", "en", False)
+
+        with pytest.raises(PoTokenRequiredError):
+            await transport.fetch_track(track)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
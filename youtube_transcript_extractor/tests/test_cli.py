@@ -24,6 +24,21 @@ class TestYTECli:
         assert cli_app.job_manager is not None
         assert cli_app.export_manager is not None
     
+    @patch('youtube_transcript_extractor.src.cli.TranscriptCache')
+    @patch('youtube_transcript_extractor.src.cli.ResponseCache')
+    @patch('youtube_transcript_extractor.src.cli.QuotaUsageStore')
+    @patch('youtube_transcript_extractor.src.cli.PlaylistManifestStore')
+    def test_stores_opened_on_first_use(self, mock_playlists, mock_usage, mock_responses, mock_transcripts):
+        """Test that the SQLite stores are only opened by the commands that use them."""
+        cli_app = YTECli()
+        
+        for store in (mock_playlists, mock_usage, mock_responses, mock_transcripts):
+            store.assert_not_called()
+        
+        assert cli_app.transcript_cache is cli_app.transcript_cache
+        mock_transcripts.assert_called_once()
+        mock_responses.assert_not_called()
+    
     def test_validate_url_valid(self):
         """Test URL validation with valid URLs."""
         cli_app = YTECli()
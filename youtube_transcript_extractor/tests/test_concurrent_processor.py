@@ -5,11 +5,18 @@ Tests for the concurrent_processor module.
 import pytest
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 import asyncio
+import threading
+import time
 from youtube_transcript_extractor.src.core.concurrent_processor import (
     ConcurrentPlaylistProcessor, ConcurrentProcessingResult, ProcessingTask,
-    RateLimiter, ConcurrentTranscriptFetcher
+    RateLimiter, ConcurrentTranscriptFetcher, AdaptiveRateLimiter,
+    CircuitBreaker, CircuitState, LatencyTracker
 )
+from youtube_transcript_extractor.src.core.retry import ErrorCode
 from youtube_transcript_extractor.src.core.models import TranscriptVideo
+from youtube_transcript_extractor.src.core.transcript_cache import TranscriptCache
+from youtube_transcript_extractor.src.core.playlist_manifest import PlaylistManifestStore
+from pathlib import Path
 
 
 @pytest.mark.unit
@@ -137,6 +144,328 @@ class TestRateLimiter:
         assert end_time - start_time > 0.5  # Some wait time
 
 
+@pytest.mark.unit
+class TestAdaptiveRateLimiter:
+    """Tests for AdaptiveRateLimiter class."""
+    
+    def test_init(self):
+        """Test AdaptiveRateLimiter initialization."""
+        limiter = AdaptiveRateLimiter(rate_per_second=4.0)
+        
+        assert limiter.current_rate == 4.0
+        assert limiter.max_rate == 8.0
+        assert limiter.get_history()[0]["reason"] == "initial"
+    
+    def test_additive_increase(self):
+        """Test that the rate grows step by step after runs of successes."""
+        limiter = AdaptiveRateLimiter(rate_per_second=2.0, increase_step=0.5, increase_interval=3)
+        
+        for _ in range(2):
+            limiter.record_success()
+        assert limiter.current_rate == 2.0
+        
+        limiter.record_success()
+        assert limiter.current_rate == 2.5
+        
+        for _ in range(3):
+            limiter.record_success()
+        assert limiter.current_rate == 3.0
+    
+    def test_increase_capped_at_max_rate(self):
+        """Test that the rate never exceeds max_rate."""
+        limiter = AdaptiveRateLimiter(rate_per_second=2.0, max_rate=2.5, increase_step=1.0, increase_interval=1)
+        
+        for _ in range(5):
+            limiter.record_success()
+        
+        assert limiter.current_rate == 2.5
+    
+    def test_multiplicative_decrease_on_block(self):
+        """Test that a block signal cuts the rate and drains tokens."""
+        limiter = AdaptiveRateLimiter(rate_per_second=8.0, decrease_factor=0.5, min_rate=1.5)
+        
+        limiter.record_result(False, ErrorCode.IP_BLOCKED)
+        assert limiter.current_rate == 4.0
+        assert limiter.tokens == 0
+        
+        limiter.record_result(False, ErrorCode.RATE_LIMITED)
+        limiter.record_result(False, ErrorCode.IP_BLOCKED)
+        assert limiter.current_rate == 1.5
+        
+        reasons = [change["reason"] for change in limiter.get_history()]
+        assert reasons == ["initial", "block", "block", "block"]
+    
+    def test_non_block_failure_is_not_a_block(self):
+        """Test that ordinary failures do not slow the limiter down."""
+        limiter = AdaptiveRateLimiter(rate_per_second=4.0, increase_interval=1)
+        
+        limiter.record_result(False, ErrorCode.NO_TRANSCRIPT)
+        
+        assert limiter.current_rate > 4.0
+    
+    @pytest.mark.parametrize("error_code", [ErrorCode.TRANSIENT, ErrorCode.UNKNOWN, None])
+    def test_unanswered_failure_is_neutral(self, error_code):
+        """Test that failures which never got an answer neither speed up nor slow down."""
+        limiter = AdaptiveRateLimiter(rate_per_second=4.0, increase_interval=1)
+        
+        limiter.record_result(False, error_code)
+        
+        assert limiter.current_rate == 4.0
+        assert limiter.tokens > 0
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Tests for the shared circuit breaker."""
+    
+    BLOCKED = ErrorCode.IP_BLOCKED
+    
+    def test_opens_when_block_rate_crosses_threshold(self):
+        """Test that the circuit opens once enough requests are blocked."""
+        breaker = CircuitBreaker(failure_threshold=0.5, window_size=4, min_requests=4)
+        
+        breaker.record_result(True)
+        breaker.record_result(False, self.BLOCKED)
+        breaker.record_result(True)
+        assert breaker.state == CircuitState.CLOSED
+        
+        breaker.record_result(False, self.BLOCKED)
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.trips == 1
+    
+    def test_ordinary_failures_do_not_open(self):
+        """Test that non-block failures never trip the circuit."""
+        breaker = CircuitBreaker(window_size=4, min_requests=2)
+        
+        for _ in range(10):
+            breaker.record_result(False, ErrorCode.NO_TRANSCRIPT)
+        
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.block_rate == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_probes_close_circuit(self):
+        """Test that successful probes close the circuit after the cool-down."""
+        breaker = CircuitBreaker(min_requests=1, open_duration=0.05, probe_count=2, poll_interval=0.01)
+        breaker.record_result(False, self.BLOCKED)
+        assert breaker.state == CircuitState.OPEN
+        
+        start = asyncio.get_event_loop().time()
+        assert await breaker.acquire() is True
+        assert asyncio.get_event_loop().time() - start >= 0.04
+        assert breaker.state == CircuitState.HALF_OPEN
+        
+        # Only probe_count requests may be in flight while half-open
+        assert await breaker.acquire() is True
+        third = asyncio.ensure_future(breaker.acquire())
+        await asyncio.sleep(0.03)
+        assert not third.done()
+        
+        breaker.record_result(True)
+        breaker.record_result(True)
+        assert breaker.state == CircuitState.CLOSED
+        assert await third is True
+        
+        states = [change["state"] for change in breaker.get_history()]
+        assert states == ["closed", "open", "half_open", "closed"]
+    
+    @pytest.mark.asyncio
+    async def test_blocked_probe_reopens_with_longer_cool_down(self):
+        """Test that a blocked probe re-opens the circuit and doubles the cool-down."""
+        breaker = CircuitBreaker(min_requests=1, open_duration=0.02, poll_interval=0.01)
+        breaker.record_result(False, self.BLOCKED)
+        
+        await breaker.acquire()
+        breaker.record_result(False, self.BLOCKED)
+        
+        assert breaker.state == CircuitState.OPEN
+        assert breaker._current_open_duration == pytest.approx(0.04)
+        assert breaker.trips == 2
+    
+    @pytest.mark.asyncio
+    async def test_released_probe_frees_its_slot(self):
+        """Test that a probe ending without an outcome lets the next one through."""
+        breaker = CircuitBreaker(min_requests=1, open_duration=0.0, probe_count=1, poll_interval=0.01)
+        breaker.record_result(False, self.BLOCKED)
+        
+        assert await breaker.acquire() is True
+        breaker.release()
+        
+        assert await asyncio.wait_for(breaker.acquire(), 1.0) is True
+        assert breaker.state == CircuitState.HALF_OPEN
+    
+    @pytest.mark.asyncio
+    async def test_acquire_aborts_when_cancelled(self):
+        """Test that waiting on an open circuit stops on cancellation."""
+        breaker = CircuitBreaker(min_requests=1, open_duration=60.0, poll_interval=0.01)
+        breaker.record_result(False, self.BLOCKED)
+        cancelled = []
+        
+        waiter = asyncio.ensure_future(breaker.acquire(lambda: bool(cancelled)))
+        await asyncio.sleep(0.03)
+        cancelled.append(True)
+        
+        assert await asyncio.wait_for(waiter, 1.0) is False
+    
+    @pytest.mark.asyncio
+    async def test_workers_pause_while_open(self):
+        """Test that all workers stop requesting once the circuit opens."""
+        breaker = CircuitBreaker(min_requests=2, failure_threshold=0.5,
+                                 open_duration=0.1, probe_count=1, poll_interval=0.01)
+        fetcher = ConcurrentTranscriptFetcher(
+            max_workers=4, rate_limit_per_second=1000.0, use_async_transport=False,
+            enable_retry=False, adaptive_rate_limit=False, circuit_breaker=breaker
+        )
+        request_times = []
+        
+        def fake_fetch(task, check_cache=True):
+            request_times.append(time.time())
+            if len(request_times) <= 2:
+                return TranscriptVideo(url=task.video_url, title=None, content="",
+                                       success=False, error_message="Failed after 1 attempts: IP blocked")
+            return TranscriptVideo(url=task.video_url, title=None, content="ok", success=True)
+        
+        fetcher._fetch_transcript_sync = fake_fetch
+        tasks = [ProcessingTask(video_id=f"v{i}", video_url=f"https://www.youtube.com/watch?v=v{i}")
+                 for i in range(2)]
+        await fetcher.fetch_batch(tasks)
+        
+        tasks = [ProcessingTask(video_id=f"w{i}", video_url=f"https://www.youtube.com/watch?v=w{i}")
+                 for i in range(4)]
+        results = await fetcher.fetch_batch(tasks)
+        
+        assert all(r.success for r in results)
+        # Nothing went out until the cool-down had passed
+        assert min(request_times[2:]) - request_times[1] >= 0.09
+        assert breaker.state == CircuitState.CLOSED
+        stats = fetcher.get_statistics(results)
+        assert stats["circuit_breaker"]["trips"] == 1
+
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_releases_slot(self):
+        """Test that cancelling a worker mid-probe does not stall later requests."""
+        breaker = CircuitBreaker(min_requests=1, open_duration=0.0, probe_count=1, poll_interval=0.01)
+        breaker.record_result(False, self.BLOCKED)
+        fetcher = ConcurrentTranscriptFetcher(
+            max_workers=1, use_async_transport=False, enable_retry=False,
+            adaptive_rate_limit=False, circuit_breaker=breaker
+        )
+        
+        async def hang(task):
+            await asyncio.sleep(10)
+        
+        fetcher._fetch_attempt = hang
+        task = ProcessingTask(video_id="v1", video_url="https://www.youtube.com/watch?v=v1")
+        
+        probe = asyncio.ensure_future(fetcher._fetch_single_transcript_async(task))
+        await asyncio.sleep(0.02)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        
+        assert await asyncio.wait_for(breaker.acquire(), 1.0) is True
+
+@pytest.mark.unit
+class TestHedgedRequests:
+    """Tests for hedging slow transcript fetches."""
+    
+    def test_latency_percentile(self):
+        """Test nearest-rank percentiles over the window."""
+        tracker = LatencyTracker(window_size=10)
+        assert tracker.percentile(95) is None
+        
+        for value in range(1, 11):
+            tracker.record(float(value))
+        
+        assert tracker.percentile(50) == 5.0
+        assert tracker.percentile(95) == 10.0
+        assert tracker.percentile(0) == 1.0
+    
+    @staticmethod
+    def _fetcher(**kwargs):
+        fetcher = ConcurrentTranscriptFetcher(
+            rate_limit_per_second=1000.0, use_async_transport=False, adaptive_rate_limit=False,
+            hedge_requests=True, hedge_min_samples=3, hedge_min_delay=0.01, hedge_max_ratio=1.0, **kwargs
+        )
+        for _ in range(3):
+            fetcher.latency_tracker.record(0.02)
+        return fetcher
+    
+    @pytest.mark.asyncio
+    async def test_hedge_wins_against_straggler(self):
+        """Test that a slow fetch is hedged and the faster answer is used."""
+        fetcher = self._fetcher()
+        calls = []
+        
+        async def fake_attempt(task):
+            await fetcher.rate_limiter.acquire()
+            calls.append(time.time())
+            if len(calls) == 1:
+                await asyncio.sleep(1.0)
+                return TranscriptVideo(url=task.video_url, title=None, content="slow", success=True)
+            return TranscriptVideo(url=task.video_url, title=None, content="fast", success=True)
+        
+        fetcher._fetch_attempt = fake_attempt
+        fetcher.rate_limiter.acquire = AsyncMock()
+        task = ProcessingTask(video_id="test123", video_url="https://www.youtube.com/watch?v=test123")
+        
+        start = time.time()
+        result = await fetcher._fetch_single_transcript_async(task)
+        
+        assert result.transcript_video.content == "fast"
+        assert time.time() - start < 0.5
+        # The hedge went through the rate limiter like any other request
+        assert fetcher.rate_limiter.acquire.await_count == 2
+        assert fetcher.hedge_stats == {"requests": 1, "hedged": 1, "hedge_wins": 1}
+    
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_samples(self):
+        """Test that hedging waits for enough latency samples."""
+        fetcher = self._fetcher()
+        fetcher.latency_tracker.samples.clear()
+        fetcher._fetch_transcript_sync = Mock(return_value=TranscriptVideo(
+            url="u", title=None, content="ok", success=True
+        ))
+        task = ProcessingTask(video_id="test123", video_url="https://www.youtube.com/watch?v=test123")
+        
+        result = await fetcher._fetch_single_transcript_async(task)
+        
+        assert result.success is True
+        assert fetcher.hedge_stats["hedged"] == 0
+        assert len(fetcher.latency_tracker) == 1
+    
+    @pytest.mark.asyncio
+    async def test_hedge_falls_back_to_failure(self):
+        """Test that a failure is returned when neither request succeeds."""
+        fetcher = self._fetcher(enable_retry=False)
+        
+        async def failing_attempt(task):
+            await asyncio.sleep(0.05)
+            return TranscriptVideo(url=task.video_url, title=None, content="", success=False,
+                                   error_message="No transcripts available")
+        
+        fetcher._fetch_attempt = failing_attempt
+        task = ProcessingTask(video_id="test123", video_url="https://www.youtube.com/watch?v=test123")
+        
+        result = await fetcher._fetch_single_transcript_async(task)
+        
+        assert result.success is False
+        assert fetcher.hedge_stats["hedged"] == 1
+        assert fetcher.hedge_stats["hedge_wins"] == 0
+    
+    def test_hedge_ratio_caps_hedges(self):
+        """Test that hedges stop once the allowed share is used up."""
+        fetcher = self._fetcher()
+        fetcher.hedge_max_ratio = 0.1
+        fetcher.hedge_stats.update(requests=10, hedged=1)
+        
+        assert fetcher._hedge_delay() is None
+        
+        fetcher.hedge_stats["requests"] = 20
+        assert fetcher._hedge_delay() == pytest.approx(0.02)
+
+
 @pytest.mark.unit
 class TestConcurrentTranscriptFetcher:
     """Tests for ConcurrentTranscriptFetcher class."""
@@ -245,6 +574,317 @@ class TestConcurrentTranscriptFetcher:
         assert result.success is False
         assert result.error_message is not None
         assert "cancelled" in result.error_message.lower()
+    
+    @pytest.mark.asyncio
+    async def test_fetch_single_transcript_cache_hit(self, temp_dir):
+        """Test that cached transcripts are returned without fetching."""
+        cache = TranscriptCache(db_path=Path(temp_dir) / "cache.db")
+        cache.put("test123", "en", "manual", "Cached transcript")
+        
+        fetcher = ConcurrentTranscriptFetcher(cache=cache)
+        fetcher._fetch_transcript_sync = Mock()
+        lookup = fetcher._fetcher.get_cached_transcript
+        lookup_threads = []
+        
+        def tracked_lookup(video_url):
+            lookup_threads.append(threading.current_thread())
+            return lookup(video_url)
+        
+        fetcher._fetcher.get_cached_transcript = tracked_lookup
+        
+        task = ProcessingTask(
+            video_id="test123",
+            video_url="https://www.youtube.com/watch?v=test123",
+            title="Test Video"
+        )
+        
+        result = await fetcher._fetch_single_transcript_async(task)
+        
+        assert result.success is True
+        assert result.transcript_video.content == "Cached transcript"
+        fetcher._fetch_transcript_sync.assert_not_called()
+        # The SQLite lookup ran on the worker pool, not the event loop's thread
+        assert lookup_threads and lookup_threads[0] is not threading.main_thread()
+    
+    def test_executor_workers_default_to_max_workers(self):
+        """Test that the shared pool is sized from max_workers."""
+        assert ConcurrentTranscriptFetcher(max_workers=4).executor_workers == 4
+        assert ConcurrentTranscriptFetcher(max_workers=4, executor_workers=8).executor_workers == 8
+    
+    @pytest.mark.asyncio
+    async def test_shared_executor_lifecycle(self):
+        """Test that one executor is created on entry and shut down on exit."""
+        fetcher = ConcurrentTranscriptFetcher(max_workers=2)
+        
+        async with fetcher:
+            executor = fetcher._executor
+            assert executor is not None
+            assert fetcher._get_executor() is executor
+        
+        assert fetcher._executor is None
+    
+    @pytest.mark.asyncio
+    async def test_shared_executor_reused_across_batches(self):
+        """Test that every batch runs on the same worker pool."""
+        fetcher = ConcurrentTranscriptFetcher(
+            max_workers=2, rate_limit_per_second=1000.0, use_async_transport=False
+        )
+        seen_threads = set()
+        
+        def fake_fetch(task, check_cache=True):
+            import threading
+            seen_threads.add(threading.current_thread().name)
+            return TranscriptVideo(url=task.video_url, title=None, content="ok", success=True)
+        
+        fetcher._fetch_transcript_sync = fake_fetch
+        tasks = [
+            ProcessingTask(video_id=f"v{i}", video_url=f"https://www.youtube.com/watch?v=v{i}")
+            for i in range(6)
+        ]
+        
+        async with fetcher:
+            executor = fetcher._executor
+            await fetcher.fetch_batch(tasks[:3])
+            await fetcher.fetch_batch(tasks[3:])
+            assert fetcher._executor is executor
+            stats = fetcher.get_executor_stats()
+        
+        assert len(seen_threads) <= 2
+        assert all(name.startswith("yte-fetch") for name in seen_threads)
+        assert stats["max_threads"] == 2
+        assert stats["active_tasks"] == 0
+        assert stats["queued_tasks"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_async_transport_used_inside_context(self):
+        """Test that the pooled session transport is used when available."""
+        fetcher = ConcurrentTranscriptFetcher(rate_limit_per_second=1000.0)
+        fetcher._fetch_transcript_sync = Mock()
+        
+        track = Mock(language_code="en", kind="manual")
+        task = ProcessingTask(video_id="test123", video_url="https://www.youtube.com/watch?v=test123")
+        
+        async with fetcher:
+            assert fetcher._transport is not None
+            fetcher._transport.fetch = AsyncMock(return_value=(track, "Async transcript"))
+            result = await fetcher._fetch_single_transcript_async(task)
+        
+        assert result.success is True
+        assert result.transcript_video.content == "Async transcript"
+        fetcher._fetch_transcript_sync.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_async_transport_falls_back_to_threads(self):
+        """Test that transport failures fall back to the threaded path."""
+        from youtube_transcript_extractor.src.core.async_transport import TransportError
+        
+        fetcher = ConcurrentTranscriptFetcher(rate_limit_per_second=1000.0)
+        fetcher._fetch_transcript_sync = Mock(return_value=TranscriptVideo(
+            url="https://www.youtube.com/watch?v=test123",
+            title=None,
+            content="Threaded transcript",
+            success=True
+        ))
+        task = ProcessingTask(video_id="test123", video_url="https://www.youtube.com/watch?v=test123")
+        
+        async with fetcher:
+            fetcher._transport.fetch = AsyncMock(side_effect=TransportError("unparsable"))
+            result = await fetcher._fetch_single_transcript_async(task)
+        
+        assert result.success is True
+        assert result.transcript_video.content == "Threaded transcript"
+        fetcher._fetch_transcript_sync.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_fallback_is_rate_limited(self):
+        """Test that the threaded fallback waits for its own rate limiter token."""
+        from youtube_transcript_extractor.src.core.async_transport import TransportError
+        
+        fetcher = ConcurrentTranscriptFetcher(rate_limit_per_second=1000.0, adaptive_rate_limit=False)
+        fetcher._fetch_transcript_sync = Mock(return_value=TranscriptVideo(
+            url="u", title=None, content="Threaded transcript", success=True
+        ))
+        fetcher.rate_limiter.acquire = AsyncMock()
+        task = ProcessingTask(video_id="test123", video_url="https://www.youtube.com/watch?v=test123")
+        
+        async with fetcher:
+            fetcher._transport.fetch = AsyncMock(side_effect=TransportError("unparsable"))
+            await fetcher._fetch_attempt(task)
+        
+        assert fetcher.rate_limiter.acquire.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_po_token_failure_disables_async_transport(self):
+        """Test that the async transport is skipped once tracks need a PO token."""
+        from youtube_transcript_extractor.src.core.async_transport import PoTokenRequiredError
+        
+        fetcher = ConcurrentTranscriptFetcher(rate_limit_per_second=1000.0)
+        fetcher._fetch_transcript_sync = Mock(return_value=TranscriptVideo(
+            url="u", title=None, content="Threaded transcript", success=True
+        ))
+        tasks = [ProcessingTask(video_id=f"v{i}", video_url=f"https://www.youtube.com/watch?v=v{i}")
+                 for i in range(3)]
+        
+        async with fetcher:
+            transport_fetch = AsyncMock(side_effect=PoTokenRequiredError("requires a PO token"))
+            fetcher._transport.fetch = transport_fetch
+            results = [await fetcher._fetch_single_transcript_async(task) for task in tasks]
+        
+        assert all(result.success for result in results)
+        assert transport_fetch.await_count == 1
+        assert fetcher._fetch_transcript_sync.call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_blocked_fetch_is_retried_through_limiter(self):
+        """Test that a block slows the shared limiter and the task is retried."""
+        fetcher = ConcurrentTranscriptFetcher(rate_limit_per_second=1000.0, use_async_transport=False)
+        fetcher._fetch_transcript_sync = Mock(side_effect=[
+            TranscriptVideo(url="u", title=None, content="", success=False,
+                            error_message="Failed after 1 attempts: IP blocked"),
+            TranscriptVideo(url="u", title=None, content="Recovered", success=True),
+        ])
+        task = ProcessingTask(video_id="test123", video_url="https://www.youtube.com/watch?v=test123")
+        
+        result = await fetcher._fetch_single_transcript_async(task)
+        
+        assert result.success is True
+        assert result.retry_count == 1
+        assert fetcher.rate_limiter.current_rate == 500.0
+    
+    def test_fixed_rate_limiter_when_adaptive_disabled(self):
+        """Test opting out of the adaptive limiter."""
+        fetcher = ConcurrentTranscriptFetcher(adaptive_rate_limit=False)
+        
+        assert not isinstance(fetcher.rate_limiter, AdaptiveRateLimiter)
+
+    @staticmethod
+    def _delayed_fetch(delays, started=None):
+        """Build a fake single-task fetch that sleeps per video ID."""
+        async def fake_fetch(task):
+            if started is not None:
+                started.append(task.video_id)
+            await asyncio.sleep(delays[task.video_id])
+            return ConcurrentProcessingResult(task=task, success=True)
+        return fake_fetch
+
+    @pytest.mark.asyncio
+    async def test_fetch_batch_stream_ordered(self):
+        """Test that ordered streaming yields results in input order."""
+        fetcher = ConcurrentTranscriptFetcher(max_workers=3)
+        delays = {"a": 0.05, "b": 0.01, "c": 0.03, "d": 0.0}
+        fetcher._fetch_single_transcript_async = self._delayed_fetch(delays)
+        tasks = [ProcessingTask(video_id=v, video_url=f"https://www.youtube.com/watch?v={v}") for v in delays]
+
+        results = [r async for r in fetcher.fetch_batch_stream(tasks, ordered=True)]
+
+        assert [r.task.video_id for r in results] == ["a", "b", "c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_batch_stream_unordered_yields_on_completion(self):
+        """Test that unordered streaming yields results as they finish."""
+        fetcher = ConcurrentTranscriptFetcher(max_workers=3)
+        delays = {"a": 0.05, "b": 0.01, "c": 0.03}
+        fetcher._fetch_single_transcript_async = self._delayed_fetch(delays)
+        tasks = [ProcessingTask(video_id=v, video_url=f"https://www.youtube.com/watch?v={v}") for v in delays]
+
+        results = [r async for r in fetcher.fetch_batch_stream(tasks)]
+
+        assert [r.task.video_id for r in results] == ["b", "c", "a"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_batch_stream_reorder_window_is_bounded(self):
+        """Test that workers do not run past the reorder window."""
+        fetcher = ConcurrentTranscriptFetcher(max_workers=2)
+        delays = {"slow": 0.2, "b": 0.0, "c": 0.0, "d": 0.0, "e": 0.0}
+        started = []
+        started_while_slow = []
+        fake_fetch = self._delayed_fetch(delays, started)
+
+        async def tracking_fetch(task):
+            result = await fake_fetch(task)
+            if task.video_id == "slow":
+                started_while_slow.extend(started)
+            return result
+
+        fetcher._fetch_single_transcript_async = tracking_fetch
+        tasks = [ProcessingTask(video_id=v, video_url=f"https://www.youtube.com/watch?v={v}") for v in delays]
+
+        results = [r.task.video_id async for r in fetcher.fetch_batch_stream(tasks, ordered=True, reorder_window=3)]
+
+        # While "slow" was outstanding only the window of 3 tasks was started
+        assert started_while_slow == ["slow", "b", "c"]
+        assert results == ["slow", "b", "c", "d", "e"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_batch_starts_highest_priority_first(self):
+        """Test that the scheduler starts tasks in priority order."""
+        fetcher = ConcurrentTranscriptFetcher(max_workers=1, aging_rate=0.0)
+        delays = {"low": 0.0, "high": 0.0, "mid": 0.0}
+        started = []
+        fetcher._fetch_single_transcript_async = self._delayed_fetch(delays, started)
+        priorities = {"low": 0, "high": 10, "mid": 5}
+        tasks = [ProcessingTask(video_id=v, video_url=f"https://www.youtube.com/watch?v={v}", priority=priorities[v])
+                 for v in delays]
+
+        await fetcher.fetch_batch(tasks)
+
+        assert started == ["high", "mid", "low"]
+
+    @pytest.mark.asyncio
+    async def test_submit_jumps_running_backlog(self):
+        """Test that a task added mid-run starts ahead of the queued backlog."""
+        fetcher = ConcurrentTranscriptFetcher(max_workers=1, aging_rate=0.0)
+        delays = {f"v{i}": 0.01 for i in range(5)}
+        delays["urgent"] = 0.0
+        started = []
+        fetcher._fetch_single_transcript_async = self._delayed_fetch(delays, started)
+        tasks = [ProcessingTask(video_id=v, video_url=f"https://www.youtube.com/watch?v={v}")
+                 for v in delays if v != "urgent"]
+
+        results = []
+        async for result in fetcher.fetch_batch_stream(tasks):
+            results.append(result.task.video_id)
+            if len(results) == 1:
+                assert fetcher.submit(ProcessingTask(
+                    video_id="urgent", video_url="https://www.youtube.com/watch?v=urgent", priority=100
+                ))
+
+        # At most the task already picked up by the worker runs before it
+        assert started.index("urgent") <= 2
+        assert sorted(results) == sorted(delays)
+        assert fetcher.submit(ProcessingTask(video_id="late", video_url="u")) is False
+
+    @pytest.mark.asyncio
+    async def test_cancel_task_yields_cancelled_result(self):
+        """Test that cancelling a queued task skips it but still reports it."""
+        fetcher = ConcurrentTranscriptFetcher(max_workers=1)
+        delays = {"a": 0.01, "b": 0.01, "c": 0.01}
+        started = []
+        fetcher._fetch_single_transcript_async = self._delayed_fetch(delays, started)
+        tasks = [ProcessingTask(video_id=v, video_url=f"https://www.youtube.com/watch?v={v}") for v in delays]
+
+        results = {}
+        async for result in fetcher.fetch_batch_stream(tasks, ordered=True):
+            results[result.task.video_id] = result
+            if result.task.video_id == "a":
+                assert fetcher.cancel_task("c") is True
+
+        assert "c" not in started
+        assert results["c"].success is False
+        assert results["c"].error_code == "cancelled"
+        assert results["b"].success is True
+
+    @pytest.mark.asyncio
+    async def test_fetch_batch_delegates_to_stream(self):
+        """Test that fetch_batch still returns every result."""
+        fetcher = ConcurrentTranscriptFetcher(max_workers=2)
+        delays = {"a": 0.0, "b": 0.0, "c": 0.0}
+        fetcher._fetch_single_transcript_async = self._delayed_fetch(delays)
+        tasks = [ProcessingTask(video_id=v, video_url=f"https://www.youtube.com/watch?v={v}") for v in delays]
+
+        results = await fetcher.fetch_batch(tasks)
+
+        assert sorted(r.task.video_id for r in results) == ["a", "b", "c"]
 
 
 @pytest.mark.unit
@@ -265,6 +905,11 @@ class TestConcurrentPlaylistProcessor:
         assert processor.concurrent_fetcher.max_workers == 5
         assert processor.concurrent_fetcher.rate_limiter.rate == 10.0
     
+    @staticmethod
+    async def _succeed(task):
+        """Stand-in for a network fetch that always succeeds."""
+        return ConcurrentProcessingResult(task=task, success=True)
+    
     @patch('youtube_transcript_extractor.src.core.concurrent_processor.Playlist')
     @pytest.mark.asyncio
     async def test_process_playlist_success(self, mock_playlist_class):
@@ -277,27 +922,16 @@ class TestConcurrentPlaylistProcessor:
         ]
         mock_playlist_class.return_value = mock_playlist
         
-        # Mock concurrent fetcher
+        # Mock the per-video fetch
         processor = ConcurrentPlaylistProcessor()
         
-        with patch.object(processor.concurrent_fetcher, 'fetch_batch') as mock_fetch_batch:
-            mock_results = [
-                ConcurrentProcessingResult(
-                    task=ProcessingTask(video_id="video1", video_url="url1"),
-                    success=True
-                ),
-                ConcurrentProcessingResult(
-                    task=ProcessingTask(video_id="video2", video_url="url2"),
-                    success=True
-                )
-            ]
-            mock_fetch_batch.return_value = mock_results
-            
+        with patch.object(processor.concurrent_fetcher, '_fetch_single_transcript_async',
+                          side_effect=self._succeed) as mock_fetch:
             results = await processor.process_playlist("https://www.youtube.com/playlist?list=test")
             
             assert len(results) == 2
             assert all(isinstance(result, ConcurrentProcessingResult) for result in results)
-            mock_fetch_batch.assert_called_once()
+            assert mock_fetch.call_count == 2
     
     @patch('youtube_transcript_extractor.src.core.concurrent_processor.Playlist')
     @pytest.mark.asyncio
@@ -311,23 +945,15 @@ class TestConcurrentPlaylistProcessor:
         callback = Mock()
         processor = ConcurrentPlaylistProcessor()
         
-        with patch.object(processor.concurrent_fetcher, 'fetch_batch') as mock_fetch_batch:
-            mock_fetch_batch.return_value = [
-                ConcurrentProcessingResult(
-                    task=ProcessingTask(video_id="video1", video_url="url1"),
-                    success=True
-                )
-            ]
-            
+        with patch.object(processor.concurrent_fetcher, '_fetch_single_transcript_async',
+                          side_effect=self._succeed):
             await processor.process_playlist(
                 "https://www.youtube.com/playlist?list=test",
                 progress_callback=callback
             )
             
-            # Verify callback was passed to fetch_batch
-            mock_fetch_batch.assert_called_once()
-            call_args = mock_fetch_batch.call_args
-            assert call_args[1].get('progress_callback') == callback or call_args[0][1] == callback
+            # Verify callback was called for the completed video
+            callback.assert_called_once_with(1, 1, "Video 1")
     
     @patch('youtube_transcript_extractor.src.core.concurrent_processor.Playlist')
     @pytest.mark.asyncio
@@ -352,13 +978,12 @@ class TestConcurrentPlaylistProcessor:
         
         processor = ConcurrentPlaylistProcessor()
         
-        with patch.object(processor.concurrent_fetcher, 'fetch_batch') as mock_fetch_batch:
-            mock_fetch_batch.return_value = []
-            
+        with patch.object(processor.concurrent_fetcher, '_fetch_single_transcript_async',
+                          side_effect=self._succeed) as mock_fetch:
             results = await processor.process_playlist("https://www.youtube.com/playlist?list=empty")
             
             assert results == []
-            mock_fetch_batch.assert_called_once()
+            mock_fetch.assert_not_called()
     
     @patch('youtube_transcript_extractor.src.core.concurrent_processor.Playlist')
     @pytest.mark.asyncio
@@ -375,18 +1000,74 @@ class TestConcurrentPlaylistProcessor:
         
         processor = ConcurrentPlaylistProcessor()
         
-        with patch.object(processor.concurrent_fetcher, 'fetch_batch') as mock_fetch_batch:
-            mock_fetch_batch.return_value = []
-            
-            await processor.process_playlist("https://www.youtube.com/playlist?list=test")
-            
-            # Check that tasks were created with correct priorities
-            call_args = mock_fetch_batch.call_args[0][0]  # First argument (tasks list)
-            assert len(call_args) == 3
-            
-            # Earlier videos should have higher priority
-            assert call_args[0].priority > call_args[1].priority
-            assert call_args[1].priority > call_args[2].priority
+        tasks = [task async for task in processor._stream_playlist_tasks("https://www.youtube.com/playlist?list=test")]
+        
+        # Check that tasks were created in playlist order
+        assert [task.video_id for task in tasks] == ["video1", "video2", "video3"]
+        
+        # Earlier videos should have higher priority
+        assert tasks[0].priority > tasks[1].priority
+        assert tasks[1].priority > tasks[2].priority
+    
+    @patch('youtube_transcript_extractor.src.core.concurrent_processor.Playlist')
+    @pytest.mark.asyncio
+    async def test_fetching_overlaps_enumeration(self, mock_playlist_class):
+        """Test that the first video is fetched before enumeration finishes."""
+        enumerated = []
+        fetched_while_enumerating = []
+        
+        def slow_pages():
+            for i in range(6):
+                if i == 3:
+                    # Give the event loop time to start fetching the first page
+                    import time
+                    time.sleep(0.2)
+                enumerated.append(i)
+                yield f"https://www.youtube.com/watch?v=video{i}"
+        
+        mock_playlist = Mock()
+        mock_playlist.video_urls = slow_pages()
+        mock_playlist_class.return_value = mock_playlist
+        processor = ConcurrentPlaylistProcessor(max_workers=2)
+        
+        async def fetch(task):
+            fetched_while_enumerating.append(len(enumerated))
+            return ConcurrentProcessingResult(task=task, success=True)
+        
+        with patch.object(processor.concurrent_fetcher, '_fetch_single_transcript_async', side_effect=fetch):
+            results = [r async for r in processor.process_playlist_stream("https://www.youtube.com/playlist?list=big")]
+        
+        assert [r.task.video_id for r in results] == [f"video{i}" for i in range(6)]
+        assert fetched_while_enumerating[0] < 6
+
+    @patch('youtube_transcript_extractor.src.core.concurrent_processor.Playlist')
+    @pytest.mark.asyncio
+    async def test_sync_processes_only_new_videos(self, mock_playlist_class, temp_dir):
+        """Test that sync mode uses the manifest and skips already synced videos."""
+        mock_playlist = Mock()
+        mock_playlist.title = "Daily"
+        mock_playlist.video_urls = [
+            "https://www.youtube.com/watch?v=aaaaaaaaaaa",
+            "https://www.youtube.com/watch?v=bbbbbbbbbbb"
+        ]
+        mock_playlist_class.return_value = mock_playlist
+        store = PlaylistManifestStore(db_path=Path(temp_dir) / "playlists.db")
+        processor = ConcurrentPlaylistProcessor(playlist_store=store)
+
+        with patch.object(processor.concurrent_fetcher, '_fetch_single_transcript_async',
+                          side_effect=self._succeed) as mock_fetch:
+            first = await processor.process_playlist("https://www.youtube.com/playlist?list=daily", sync=True)
+            cached = await processor.process_playlist("https://www.youtube.com/playlist?list=daily", sync=True)
+
+            mock_playlist.video_urls.append("https://www.youtube.com/watch?v=ccccccccccc")
+            store.ttl_seconds = -1  # Force re-enumeration on the next run
+            second = await processor.process_playlist("https://www.youtube.com/playlist?list=daily", sync=True)
+
+        assert len(first) == 2
+        assert cached == []
+        assert [r.task.video_id for r in second] == ["ccccccccccc"]
+        assert mock_fetch.call_count == 3
+        assert mock_playlist_class.call_count == 2
 
 
 @pytest.mark.integration
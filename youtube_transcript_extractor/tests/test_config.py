@@ -73,21 +73,37 @@ class TestConfigManager:
         """Test getting chunk size with invalid value."""
         env_file = os.path.join(temp_dir, "invalid.env")
         with open(env_file, 'w') as f:
-            f.write("CHUNK_SIZE=invalid_number")
+            f.write("CHUNK_TOKENS=invalid_number")
         
         config = ConfigManager(env_file)
         chunk_size = config.get_chunk_size()
-        assert chunk_size == 3000  # Default value
+        assert chunk_size == 4000  # Default value
     
     def test_get_chunk_size_out_of_range(self, temp_dir):
         """Test getting chunk size with out of range value."""
         env_file = os.path.join(temp_dir, "outofrange.env")
         with open(env_file, 'w') as f:
-            f.write("CHUNK_SIZE=100")  # Too small
+            f.write("CHUNK_TOKENS=100")  # Too small
         
         config = ConfigManager(env_file)
         chunk_size = config.get_chunk_size()
-        assert chunk_size == 3000  # Default value
+        assert chunk_size == 4000  # Default value
+    
+    def test_legacy_chunk_size_converted_from_words(self, temp_dir, monkeypatch, caplog):
+        """Test that a legacy CHUNK_SIZE in words becomes a token budget with a warning."""
+        monkeypatch.delenv("CHUNK_TOKENS", raising=False)
+        monkeypatch.setenv("CHUNK_SIZE", "3000")
+        config = ConfigManager(os.path.join(temp_dir, "missing.env"))
+        
+        assert config.get_chunk_size() == 4000
+        assert "CHUNK_TOKENS=4000" in caplog.text
+        
+        monkeypatch.setenv("CHUNK_SIZE", "50000")
+        assert config.get_chunk_size() == 50000
+        
+        # The token setting wins over the legacy one
+        monkeypatch.setenv("CHUNK_TOKENS", "6000")
+        assert config.get_chunk_size() == 6000
     
     def test_get_gemini_model_from_env(self, config_manager_with_env):
         """Test getting Gemini model from environment."""
@@ -104,6 +120,17 @@ class TestConfigManager:
         model = config.get_gemini_model()
         assert model == GeminiModels.get_default_model()
     
+    def test_get_gemini_quotas(self, temp_dir):
+        """Test getting Gemini quota overrides, unset or invalid ones being None."""
+        env_file = os.path.join(temp_dir, "quotas.env")
+        with open(env_file, 'w') as f:
+            f.write("GEMINI_REQUESTS_PER_MINUTE=60\nGEMINI_TOKENS_PER_MINUTE=invalid\nGEMINI_REQUESTS_PER_DAY=0")
+        
+        config = ConfigManager(env_file)
+        assert config.get_requests_per_minute() == 60
+        assert config.get_tokens_per_minute() is None
+        assert config.get_requests_per_day() is None
+    
     def test_get_auto_fill_data(self, config_manager_with_env):
         """Test getting auto-fill data."""
         # Mock secure storage to return empty so it falls back to env file
@@ -0,0 +1,108 @@
+"""
+Unit tests for context carry-over between chunks.
+"""
+
+import pytest
+
+from youtube_transcript_extractor.src.core.context import (
+    ContextCarrier, tail_of, outline_of, extractive_summary
+)
+from youtube_transcript_extractor.src.core.models import ContextMode
+from youtube_transcript_extractor.src.core.tokens import estimate_tokens
+
+
+RESPONSE = """## Introduction
+
+The speaker introduces neural networks. They explain why networks learn.
+
+## Training
+
+Gradient descent updates the network weights. Learning rates control the step size.
+
+**Key Takeaways:**
+
+- Networks learn from data."""
+
+
+@pytest.mark.unit
+class TestContextHelpers:
+    """Test cases for the context helper functions."""
+
+    def test_tail_keeps_whole_lines_then_sentences(self):
+        """Test that the tail ends the text and fits the budget."""
+        tail = tail_of(RESPONSE, 15)
+
+        assert tail.endswith("- Networks learn from data.")
+        assert "Introduction" not in tail
+        assert estimate_tokens(tail) <= 15
+
+        text = "First sentence here. Second sentence here. Third sentence here."
+        assert tail_of(text, 13) == "Second sentence here. Third sentence here."
+
+    def test_outline_uses_headings_and_lead_sentences(self):
+        """Test that headings are kept and plain paragraphs give their first sentence."""
+        assert outline_of(RESPONSE) == [
+            "## Introduction",
+            "- The speaker introduces neural networks.",
+            "## Training",
+            "- Gradient descent updates the network weights.",
+            "**Key Takeaways:**",
+            "- Networks learn from data.",
+        ]
+
+    def test_extractive_summary_picks_central_sentences(self):
+        """Test that sentences sharing the text's frequent words win, in original order."""
+        text = (
+            "Networks learn patterns from data. The weather was nice. "
+            "Deep networks learn features from data. Lunch was served. "
+            "Networks generalize when data is plentiful."
+        )
+
+        assert extractive_summary(text, 40) == (
+            "Networks learn patterns from data. Deep networks learn features from data. "
+            "Networks generalize when data is plentiful."
+        )
+        assert estimate_tokens(extractive_summary(text, 20)) <= 20
+
+
+@pytest.mark.unit
+class TestContextCarrier:
+    """Test cases for ContextCarrier."""
+
+    def test_no_prompt_before_first_response(self):
+        """Test that the first chunk carries nothing."""
+        assert ContextCarrier(ContextMode.TAIL).prompt() == ""
+
+    def test_full_mode_resends_previous_response(self):
+        """Test that full mode keeps the original continuation prompt."""
+        carrier = ContextCarrier(ContextMode.FULL)
+        carrier.add("First")
+        carrier.add(RESPONSE)
+
+        assert carrier.prompt() == (
+            "The following text is a continuation... "
+            f"Previous response:\n{RESPONSE}\n\nNew text to process (Do Not Repeat the Previous response):\n"
+        )
+
+    @pytest.mark.parametrize("mode", [ContextMode.TAIL, ContextMode.OUTLINE, ContextMode.SUMMARY])
+    def test_bounded_modes_stay_within_budget(self, mode):
+        """Test that carried context does not grow with the responses."""
+        carrier = ContextCarrier(mode, max_tokens=40)
+        for _ in range(20):
+            carrier.add(RESPONSE)
+
+        assert carrier.context()
+        assert estimate_tokens(carrier.context()) <= 40 + carrier.context().count("\n")
+
+    def test_outline_runs_across_responses(self):
+        """Test that the outline keeps entries from earlier responses."""
+        carrier = ContextCarrier(ContextMode.OUTLINE, max_tokens=500)
+        carrier.add("## Part One\n\nAlpha.")
+        carrier.add("## Part Two\n\nBeta.")
+
+        assert carrier.context() == "## Part One\n- Alpha.\n## Part Two\n- Beta."
+        assert "Outline of the previous responses:" in carrier.prompt()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -5,8 +5,15 @@ Tests for the gemini_processor module.
 import pytest
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 import asyncio
-from youtube_transcript_extractor.src.core.gemini_processor import GeminiProcessor
-from youtube_transcript_extractor.src.core.models import ProcessingConfig, ProcessingMode, RefinementStyle
+import re
+import threading
+import time
+from pathlib import Path
+from youtube_transcript_extractor.src.core.gemini_processor import GeminiProcessor, merge_refined_parts
+from youtube_transcript_extractor.src.core.models import ProcessingConfig, ProcessingMode, RefinementStyle, RefinementMode, ContextMode, GeminiModels
+from youtube_transcript_extractor.src.core.pacing import QuotaLimiter, ModelQuotas, DailyQuotaExceeded
+from youtube_transcript_extractor.src.core.prompt_cache import LocalPrefixCache
+from youtube_transcript_extractor.src.core.retry import RetryEngine, RetryPolicy, ErrorCode
 
 
 @pytest.mark.unit
@@ -52,6 +59,25 @@ class TestGeminiProcessor:
         mock_genai.GenerativeModel.assert_called_once_with("gemini-2.5-flash")
         assert processor.model == mock_model
     
+    @patch('youtube_transcript_extractor.src.core.gemini_processor.genai')
+    def test_model_reused_across_calls(self, mock_genai):
+        """Test that models are built once per name and generation config."""
+        mock_response = Mock()
+        mock_response.text = "Refined"
+        mock_genai.GenerativeModel.return_value.generate_content.return_value = mock_response
+        
+        processor = GeminiProcessor(self.config)
+        for _ in range(3):
+            assert processor._generate_text("Prompt") == "Refined"
+        
+        mock_genai.configure.assert_called_once_with(api_key="test_api_key")
+        mock_genai.GenerativeModel.assert_called_once_with("gemini-2.5-flash")
+        
+        processor._get_model(generation_config={"temperature": 0.2})
+        processor._get_model(generation_config={"temperature": 0.2})
+        processor._get_model("gemini-2.5-pro")
+        assert mock_genai.GenerativeModel.call_count == 3
+    
     @patch('youtube_transcript_extractor.src.core.gemini_processor.genai')
     def test_setup_gemini_failure(self, mock_genai):
         """Test Gemini API setup failure."""
@@ -125,11 +151,15 @@ class TestGeminiProcessor:
         
         mock_genai.GenerativeModel.return_value = mock_model
         
-        processor = GeminiProcessor(self.config)
+        retry_engine = RetryEngine(policies={ErrorCode.RATE_LIMITED: RetryPolicy(max_attempts=3, base_delay=0, max_delay=0)})
+        processor = GeminiProcessor(self.config, retry_engine=retry_engine)
         processor._setup_gemini()
         
         with pytest.raises(Exception, match="Rate limit exceeded"):
             await processor._process_single_chunk("Test content")
+        
+        # Rate limits are retried through the shared engine before giving up
+        assert mock_model.generate_content.call_count == 3
     
     @patch('youtube_transcript_extractor.src.core.gemini_processor.genai')
     @pytest.mark.asyncio
@@ -245,16 +275,30 @@ class TestGeminiProcessor:
     def test_rate_limiting(self):
         """Test rate limiting configuration."""
         processor = GeminiProcessor(self.config)
+        limits = GeminiModels.get_limits(self.config.gemini_model)
+        
+        # The quota limiter follows the model's published limits...
+        assert processor.rate_limiter.requests_per_minute == limits.requests_per_minute
+        assert processor.rate_limiter.tokens_per_minute == limits.tokens_per_minute
+        # Published daily limits are advisory
+        assert processor.rate_limiter.requests_per_day is None
+        
+        # ...unless the config overrides them
+        self.config.requests_per_minute = 120
+        self.config.requests_per_day = 500
+        processor = GeminiProcessor(self.config)
+        assert processor.rate_limiter.requests_per_minute == 120
+        assert processor.rate_limiter.tokens_per_minute == limits.tokens_per_minute
+        assert processor.rate_limiter.requests_per_day == 500
         
-        # Test that rate limiting attributes exist
-        assert hasattr(processor, '_last_request_time')
-        assert hasattr(processor, '_min_request_interval')
+        # Switching models switches quotas
+        processor.model_name = "gemini-2.5-pro"
+        assert processor.rate_limiter.requests_per_minute == GeminiModels.get_limits("gemini-2.5-pro").requests_per_minute
     
-    @patch('youtube_transcript_extractor.src.core.gemini_processor.time.sleep')
     @patch('youtube_transcript_extractor.src.core.gemini_processor.genai')
     @pytest.mark.asyncio
-    async def test_rate_limiting_enforced(self, mock_genai, mock_sleep):
-        """Test that rate limiting is enforced between requests."""
+    async def test_rate_limiting_enforced(self, mock_genai):
+        """Test that rate limiting is enforced between requests without blocking."""
         # Mock the Gemini model
         mock_model = Mock()
         mock_response = Mock()
@@ -262,15 +306,436 @@ class TestGeminiProcessor:
         mock_model.generate_content = AsyncMock(return_value=mock_response)
         mock_genai.GenerativeModel.return_value = mock_model
         
-        processor = GeminiProcessor(self.config)
+        waits = []
+        
+        async def fake_sleep(seconds):
+            waits.append(seconds)
+        
+        limiter = QuotaLimiter(requests_per_minute=1, sleep=Mock(), async_sleep=fake_sleep)
+        processor = GeminiProcessor(self.config, rate_limiter=limiter)
         processor._setup_gemini()
         
         # Make two quick requests
         await processor._process_single_chunk("First chunk")
         await processor._process_single_chunk("Second chunk")
         
-        # Verify sleep was called for rate limiting
-        assert mock_sleep.called
+        # The second request waited on the event loop, never with time.sleep
+        assert len(waits) == 1
+        assert waits[0] == pytest.approx(60, abs=1)
+        limiter._sleep.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_process_transcript_chunks_bounded_fan_out(self):
+        """Test that chunks run concurrently up to the limit and keep their order."""
+        processor = GeminiProcessor(self.config)
+        active = 0
+        peak = 0
+        
+        async def generate(prompt, prefix=""):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return prompt.rsplit("\n\n", 1)[-1].upper()
+        
+        processor._generate_text_async = generate
+        
+        result = await processor.process_transcript_chunks(["a", "b", "c", "d", "e"], max_concurrency=2)
+        
+        assert result == "A\n\nB\n\nC\n\nD\n\nE"
+        assert peak == 2
+    
+    @patch('youtube_transcript_extractor.src.core.gemini_processor.genai')
+    @pytest.mark.asyncio
+    async def test_sync_model_runs_off_event_loop(self, mock_genai):
+        """Test that a blocking SDK call runs on the processor's executor."""
+        calling_threads = []
+        
+        def generate_content(prompt):
+            calling_threads.append(threading.current_thread().name)
+            return Mock(text="Refined")
+        
+        mock_genai.GenerativeModel.return_value = Mock(generate_content=generate_content)
+        processor = GeminiProcessor(self.config)
+        
+        try:
+            assert await processor._generate_text_async("Prompt") == "Refined"
+        finally:
+            processor.close()
+        
+        assert calling_threads[0].startswith("yte-gemini-async")
+    
+    @patch('youtube_transcript_extractor.src.core.gemini_processor.genai')
+    def test_rate_limited_model_fails_over(self, mock_genai):
+        """Test that a 429 passes the request to the next model in the cascade."""
+        models = {
+            "gemini-2.5-flash": Mock(**{"generate_content.side_effect": Exception("429 Resource exhausted")}),
+            "gemini-2.0-flash": Mock(**{"generate_content.return_value": Mock(text="From fallback")}),
+        }
+        mock_genai.GenerativeModel.side_effect = lambda name: models[name]
+        self.config.model_routing = True
+        processor = GeminiProcessor(self.config)
+        
+        assert processor._generate_text("First prompt") == "From fallback"
+        # The rate-limited model cools down, so the next request skips it
+        assert processor._generate_text("Second prompt") == "From fallback"
+        
+        assert models["gemini-2.5-flash"].generate_content.call_count == 1
+        stats = processor.router.get_statistics()
+        assert stats["gemini-2.5-flash"]["failures"] == {"rate_limited": 1}
+        assert stats["gemini-2.0-flash"]["successes"] == 2
+    
+    @patch('youtube_transcript_extractor.src.core.gemini_processor.genai')
+    def test_no_failover_after_streamed_text(self, mock_genai):
+        """Test that a stream broken midway is left to the retry engine instead of another model."""
+        def broken_stream(prompt, stream=False):
+            yield Mock(text="Partial ")
+            raise ConnectionError("connection reset")
+        
+        models = {"gemini-2.5-flash": Mock(generate_content=broken_stream), "gemini-2.0-flash": Mock()}
+        mock_genai.GenerativeModel.side_effect = lambda name: models[name]
+        self.config.model_routing = True
+        processor = GeminiProcessor(self.config)
+        
+        with pytest.raises(ConnectionError):
+            processor._generate_text("Prompt", on_text=Mock())
+        models["gemini-2.0-flash"].generate_content.assert_not_called()
+    
+    @patch('youtube_transcript_extractor.src.core.gemini_processor.genai')
+    @pytest.mark.asyncio
+    async def test_exhausted_daily_quota_routes_elsewhere(self, mock_genai):
+        """Test that work keeps flowing to another model once one model's daily quota is used up."""
+        models = {
+            "gemini-2.5-flash": Mock(generate_content=AsyncMock(return_value=Mock(text="Primary"))),
+            "gemini-2.0-flash": Mock(generate_content=AsyncMock(return_value=Mock(text="Fallback"))),
+        }
+        mock_genai.GenerativeModel.side_effect = lambda name: models[name]
+        quotas = ModelQuotas()
+        quotas.configure("gemini-2.5-flash", requests_per_day=1)
+        self.config.model_routing = True
+        processor = GeminiProcessor(self.config, quotas=quotas)
+        
+        assert await processor._generate_text_async("First") == "Primary"
+        assert await processor._generate_text_async("Second") == "Fallback"
+    
+    @patch('youtube_transcript_extractor.src.core.gemini_processor.genai')
+    def test_failed_requests_keep_daily_quota(self, mock_genai):
+        """Test that a failover hop does not use up the failed model's daily quota."""
+        models = {
+            "gemini-2.5-flash": Mock(**{"generate_content.side_effect": Exception("429 Resource exhausted")}),
+            "gemini-2.0-flash": Mock(**{"generate_content.return_value": Mock(text="From fallback")}),
+        }
+        mock_genai.GenerativeModel.side_effect = lambda name: models[name]
+        quotas = ModelQuotas()
+        quotas.configure("gemini-2.5-flash", requests_per_day=1)
+        self.config.model_routing = True
+        processor = GeminiProcessor(self.config, quotas=quotas)
+        
+        assert processor._generate_text("Prompt") == "From fallback"
+        
+        assert quotas.limiter("gemini-2.5-flash").requests_today == 0
+        assert quotas.limiter("gemini-2.0-flash").requests_today == 1
+    
+    def test_without_routing_failures_are_raised(self):
+        """Test that the configured model alone is used unless routing is enabled."""
+        processor = GeminiProcessor(self.config)
+        processor._send = Mock(side_effect=Exception("429 Resource exhausted"))
+        
+        with pytest.raises(Exception, match="429"):
+            processor._generate_text("Prompt")
+        assert processor.router is None
+        assert processor._send.call_args[0][0] == "gemini-2.5-flash"
+    
+    def test_refine_video_returns_content(self, temp_dir):
+        """Test that a video is refined in memory and appended by write_video_output."""
+        processor = GeminiProcessor(self.config)
+        processor._generate_text = Mock(side_effect=["Part one", "Part two"])
+        video_chunk = "Video URL: https://www.youtube.com/watch?v=abc\n" + "word " * 10
+        
+        result = processor.refine_video(video_chunk, "Refine in [Language]", "English", 6, 1, 1)
+        
+        assert result.success is True
+        assert result.content == "Part one\n\nPart two\n\n"
+        # The second prompt carries the first response as context
+        assert "Part one" in processor._generate_text.call_args_list[1][0][0]
+        
+        output_file = str(Path(temp_dir) / "refined.txt")
+        assert processor.write_video_output(output_file, video_chunk, result.content, 1).success
+        with open(output_file, encoding="utf-8") as f:
+            assert f.read().startswith("Video URL: https://www.youtube.com/watch?v=abc\nPart one")
+    
+    def test_context_carry_over_is_bounded(self):
+        """Test that later chunks carry a bounded part of the previous response."""
+        self.config.context_tokens = 20
+        processor = GeminiProcessor(self.config)
+        first = "Opening sentence of the response. " + "Middle filler sentence here. " * 50 + "Closing remark."
+        processor._generate_text = Mock(side_effect=[first, "Part two"])
+        
+        processor.refine_video("word " * 10, "Refine in [Language]", "English", 6, 1, 1)
+        
+        second_prompt = processor._generate_text.call_args_list[1][0][0]
+        assert processor.context_mode == ContextMode.TAIL
+        assert "End of the previous response:" in second_prompt
+        assert "Closing remark." in second_prompt
+        assert "Opening sentence" not in second_prompt
+        
+        self.config.context_mode = ContextMode.FULL
+        processor = GeminiProcessor(self.config)
+        processor._generate_text = Mock(side_effect=[first, "Part two"])
+        processor.refine_video("word " * 10, "Refine in [Language]", "English", 6, 1, 1)
+        assert first in processor._generate_text.call_args_list[1][0][0]
+    
+    @patch('youtube_transcript_extractor.src.core.gemini_processor.genai')
+    def test_style_prompt_sent_through_prefix_cache(self, mock_genai):
+        """Test that every chunk reuses one cached style prompt and sends only its own text."""
+        model = Mock()
+        model.generate_content.side_effect = lambda prompt: Mock(text=f"Refined {len(prompt)}")
+        prefix_cache = LocalPrefixCache(lambda name: model)
+        processor = GeminiProcessor(self.config, prefix_cache=prefix_cache)
+        
+        result = processor.refine_video("word " * 10, "Refine in [Language]", "English", 6, 1, 1)
+        processor.close()
+        
+        assert result.success is True
+        prompts = [call[0][0] for call in model.generate_content.call_args_list]
+        assert len(prompts) == 2
+        # The style prompt leads every request, ahead of the carried-over context
+        assert all(prompt.startswith("Refine in English\n\n") for prompt in prompts)
+        assert "previous response" in prompts[1]
+        assert prefix_cache.uploads == 1 and prefix_cache.hits == 1
+        mock_genai.GenerativeModel.return_value.generate_content.assert_not_called()
+    
+    def test_context_mode_follows_style(self):
+        """Test that the default context mode depends on the refinement style."""
+        self.config.refinement_style = RefinementStyle.SUMMARY
+        assert GeminiProcessor(self.config).context_mode == ContextMode.SUMMARY
+        
+        self.config.context_mode = ContextMode.OUTLINE
+        assert GeminiProcessor(self.config).context_mode == ContextMode.OUTLINE
+    
+    @patch('youtube_transcript_extractor.src.core.gemini_processor.genai')
+    def test_streamed_output_survives_retry(self, mock_genai, temp_dir):
+        """Test that a stream broken mid-response is rolled back before the retry."""
+        attempts = []
+        
+        def generate_content(prompt, stream=False):
+            attempts.append(stream)
+            yield Mock(text="Partial ")
+            if len(attempts) == 1:
+                raise ConnectionError("connection reset")
+            yield Mock(text="response")
+        
+        mock_genai.GenerativeModel.return_value.generate_content = generate_content
+        retry_engine = RetryEngine(policies={ErrorCode.TRANSIENT: RetryPolicy(max_attempts=2, base_delay=0, max_delay=0)})
+        processor = GeminiProcessor(self.config, retry_engine=retry_engine)
+        output_file = Path(temp_dir) / "refined.txt"
+        video_chunk = "Video URL: https://www.youtube.com/watch?v=abc\nSome words"
+        
+        result = processor._process_single_video(
+            video_chunk, "Refine in [Language]", "English", 3000, 1, 1, str(output_file)
+        )
+        
+        assert result.success is True
+        assert attempts == [True, True]
+        assert output_file.read_text(encoding="utf-8") == (
+            "Video URL: https://www.youtube.com/watch?v=abc\nPartial response\n\n\n\n"
+        )
+    
+    def test_refine_video_map_reduce(self):
+        """Test that map-reduce mode refines chunks in parallel with raw overlap context."""
+        self.config.refinement_mode = RefinementMode.MAP_REDUCE
+        self.config.overlap_words = 2
+        processor = GeminiProcessor(self.config)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        
+        def generate(prompt, prefix=""):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            chunk = prompt.rsplit("\n\n", 1)[-1]
+            # Every part repeats the sentence that ended the previous one
+            return f"Seam sentence. Refined {chunk.split()[0]}."
+        
+        processor._generate_text = Mock(side_effect=generate)
+        # Three chunks of 600 words, each word "wNNNN " estimated at 1.5 tokens
+        video_chunk = " ".join(f"w{n:04d}" for n in range(1800))
+        
+        result = processor.refine_video(video_chunk, "Refine in [Language]", "English", 900, 1, 1)
+        
+        assert result.success is True
+        assert result.content == "Seam sentence. Refined w0000.\n\nRefined w0600.\n\nRefined w1200.\n\n"
+        assert peak > 1
+        prompts = sorted(call[0][0] for call in processor._generate_text.call_args_list)
+        middle = next(prompt for prompt in prompts if prompt.endswith("w1198 w1199"))
+        assert "w0598 w0599\n" in middle and "w1200 w1201\n" in middle
+        assert all("Previous response" not in prompt for prompt in prompts)
+    
+    def test_merge_refined_parts(self):
+        """Test that repeated paragraphs and sentences at seams are dropped."""
+        parts = [
+            "## Intro\n\nAlpha beta. Gamma delta.",
+            "Gamma delta!\nEpsilon zeta.\n\nMore text.",
+            "## Intro\n\nNew section.",
+        ]
+        
+        assert merge_refined_parts(parts) == [
+            "## Intro\n\nAlpha beta. Gamma delta.",
+            "Epsilon zeta.\n\nMore text.",
+            "## Intro\n\nNew section.",
+        ]
+        assert merge_refined_parts(["One. Two.", "Two.", ""]) == ["One. Two."]
+    
+    def test_process_transcripts_concurrently_in_order(self, temp_dir):
+        """Test that videos are refined in parallel but written in input order."""
+        # One request per video, so that videos overlap
+        self.config.max_videos_per_request = 1
+        processor = GeminiProcessor(self.config)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        
+        def generate(prompt, on_text=None, prefix=""):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            # Earlier videos finish last
+            video = int(re.search(r"video(\d)", prompt).group(1))
+            time.sleep(0.02 * (5 - video))
+            with lock:
+                active -= 1
+            if on_text:
+                on_text("Refined ")
+                on_text(str(video))
+            return f"Refined {video}"
+        
+        processor._generate_text = Mock(side_effect=generate)
+        input_file = Path(temp_dir) / "transcripts.txt"
+        input_file.write_text("Header\n" + "".join(
+            f"Video URL: https://www.youtube.com/watch?v={n}\nwords of video{n}\n\n" for n in range(1, 5)
+        ), encoding="utf-8")
+        output_file = str(Path(temp_dir) / "refined.txt")
+        
+        result = processor.process_transcripts(
+            str(input_file), output_file, "English", RefinementStyle.BALANCED_DETAILED, max_workers=3
+        )
+        
+        assert result.success is True
+        assert result.videos_processed == 4
+        assert peak > 1
+        output = Path(output_file).read_text(encoding="utf-8")
+        positions = [output.index(f"Refined {n}") for n in range(1, 5)]
+        assert positions == sorted(positions)
+    
+    def test_short_videos_packed_into_one_request(self, temp_dir):
+        """Test that short videos share a request and are split back per video."""
+        processor = GeminiProcessor(self.config)
+        
+        def generate(prompt, prefix=""):
+            videos = re.findall(r"===== VIDEO (\d+) =====\n.*?words of video(\d+)", prompt, re.DOTALL)
+            return "".join(f"===== VIDEO {marker} =====\n## Refined {video}\n\n" for marker, video in videos)
+        
+        processor._generate_text = Mock(side_effect=generate)
+        input_file = Path(temp_dir) / "transcripts.txt"
+        input_file.write_text("Header\n" + "".join(
+            f"Video URL: https://www.youtube.com/watch?v={n}\nwords of video{n}\n\n" for n in range(1, 21)
+        ), encoding="utf-8")
+        output_file = Path(temp_dir) / "refined.txt"
+        
+        result = processor.process_transcripts(
+            str(input_file), str(output_file), "English", RefinementStyle.BALANCED_DETAILED
+        )
+        
+        assert result.success is True
+        assert result.videos_processed == 20
+        assert processor._generate_text.call_count == 2
+        assert processor._generate_text.call_args.kwargs["prefix"].startswith("Turn the following")
+        assert output_file.read_text(encoding="utf-8") == "".join(
+            f"Video URL: https://www.youtube.com/watch?v={n}\n## Refined {n}\n\n\n\n" for n in range(1, 21)
+        )
+    
+    @pytest.mark.asyncio
+    async def test_video_stream_packed(self):
+        """Test that a stream of videos is grouped like the videos of a file."""
+        processor = GeminiProcessor(self.config)
+        
+        async def videos():
+            for video_chunk in ["short one", None, "short two", "short three", "word " * 4000]:
+                yield video_chunk
+        
+        groups = [group async for group in processor.pack_video_stream(videos(), lambda item: item, 4000)]
+        
+        assert groups == [["short one"], [None], ["short two", "short three"], ["word " * 4000]]
+    
+    def test_unsplittable_packed_response_falls_back(self, temp_dir):
+        """Test that videos are refined one by one when a packed response lacks markers."""
+        processor = GeminiProcessor(self.config)
+        responses = iter(["One merged answer", "Refined 1", "Refined 2"])
+        
+        def generate(prompt, on_text=None, prefix=""):
+            text = next(responses)
+            if on_text:
+                on_text(text)
+            return text
+        
+        processor._generate_text = Mock(side_effect=generate)
+        input_file = Path(temp_dir) / "transcripts.txt"
+        input_file.write_text("Header\n" + "".join(
+            f"Video URL: https://www.youtube.com/watch?v={n}\nwords of video{n}\n\n" for n in range(1, 3)
+        ), encoding="utf-8")
+        output_file = Path(temp_dir) / "refined.txt"
+        
+        result = processor.process_transcripts(
+            str(input_file), str(output_file), "English", RefinementStyle.BALANCED_DETAILED
+        )
+        
+        assert result.videos_processed == 2
+        assert processor._generate_text.call_count == 3
+        assert output_file.read_text(encoding="utf-8") == (
+            "Video URL: https://www.youtube.com/watch?v=1\nRefined 1\n\n\n\n"
+            "Video URL: https://www.youtube.com/watch?v=2\nRefined 2\n\n\n\n"
+        )
+    
+    def test_used_up_daily_quota_fails_video(self):
+        """Test that a used-up daily quota fails the video instead of dropping its chunks."""
+        processor = GeminiProcessor(self.config)
+        processor._generate_text = Mock(side_effect=["Part one", DailyQuotaExceeded("Daily limit of 1 requests reached")])
+        video_chunk = "Video URL: https://www.youtube.com/watch?v=abc\n" + "word " * 10
+        
+        result = processor.refine_video(video_chunk, "Refine in [Language]", "English", 6, 1, 1)
+        
+        assert result.success is False
+        assert result.error_code == ErrorCode.QUOTA_EXHAUSTED.value
+        assert processor._generate_text.call_count == 2
+    
+    def test_used_up_daily_quota_stops_processing(self, temp_dir):
+        """Test that processing stops once Gemini's daily quota is used up."""
+        self.config.max_concurrent_videos = 1
+        processor = GeminiProcessor(self.config)
+        processor._generate_text = Mock(side_effect=DailyQuotaExceeded("Daily limit of 1 requests reached"))
+        input_file = Path(temp_dir) / "transcripts.txt"
+        input_file.write_text("Header\n" + "".join(
+            f"Video URL: https://www.youtube.com/watch?v={n}\n{'words ' * 5000}\n\n" for n in range(1, 4)
+        ), encoding="utf-8")
+        status_callback = Mock()
+        
+        result = processor.process_transcripts(
+            str(input_file), str(Path(temp_dir) / "refined.txt"), "English", RefinementStyle.BALANCED_DETAILED,
+            status_callback=status_callback
+        )
+        
+        assert result.success is False
+        assert result.error_code == ErrorCode.QUOTA_EXHAUSTED.value
+        assert result.videos_processed == 0
+        assert processor._generate_text.call_count == 1
+        assert any("Daily limit" in call[0][0] for call in status_callback.call_args_list)
     
     def test_chunk_overlap_handling(self):
         """Test that chunks have proper overlap to maintain context."""
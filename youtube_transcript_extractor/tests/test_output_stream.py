@@ -0,0 +1,103 @@
+"""
+Tests for the output_stream module.
+"""
+
+import pytest
+from pathlib import Path
+from youtube_transcript_extractor.src.core.output_stream import OrderedOutputStream, MemoryStream
+
+
+@pytest.mark.unit
+class TestOrderedOutputStream:
+    """Tests for OrderedOutputStream class."""
+
+    def test_head_streams_and_later_videos_wait(self, temp_dir):
+        """Test that only the earliest unfinished video reaches the file."""
+        path = Path(temp_dir) / "out.txt"
+        output = OrderedOutputStream(str(path), truncate=True)
+        first, second = output.video(0), output.video(1)
+
+        second.write("B1 ")
+        first.write("A1 ")
+        assert path.read_text() == "A1 "
+
+        second.write("B2 ")
+        second.finish()
+        assert path.read_text() == "A1 "
+
+        first.write("A2 ")
+        first.finish()
+        assert path.read_text() == "A1 A2 B1 B2 "
+        output.close()
+
+    def test_rollback_truncates_written_text(self, temp_dir):
+        """Test that a retried response is removed from the file."""
+        path = Path(temp_dir) / "out.txt"
+        path.write_text("Existing\n")
+        with OrderedOutputStream(str(path)) as output:
+            video = output.video(0)
+            video.write("Header\n")
+            mark = video.mark()
+            video.write("partiäl")
+            video.rollback(mark)
+            video.write("Full response")
+            video.finish()
+
+        assert path.read_text(encoding="utf-8") == "Existing\nHeader\nFull response"
+
+    def test_discard_and_unfinished_video(self, temp_dir):
+        """Test that discarded and unfinished videos leave nothing behind."""
+        path = Path(temp_dir) / "out.txt"
+        output = OrderedOutputStream(str(path), first_index=1, truncate=True)
+        failed, kept, unfinished = output.video(1), output.video(2), output.video(3)
+
+        failed.write("Broken")
+        kept.write("Kept")
+        kept.finish()
+        failed.discard()
+        unfinished.write(" partial")
+        assert path.read_text() == "Kept partial"
+
+        output.close()
+        assert path.read_text() == "Kept"
+
+    def test_listener_reports_length(self, temp_dir):
+        """Test that listeners see each video's length, including rollbacks."""
+        lengths = []
+        with OrderedOutputStream(str(Path(temp_dir) / "out.txt")) as output:
+            video = output.video(0, lengths.append)
+            video.write("abc")
+            video.write("de")
+            video.rollback(3)
+
+        assert lengths == [3, 5, 3]
+
+
+@pytest.mark.unit
+class TestMemoryStream:
+    """Tests for MemoryStream class."""
+
+    def test_write_and_rollback(self):
+        """Test collecting text and rolling it back."""
+        lengths = []
+        stream = MemoryStream(lengths.append)
+        stream.write("Hello")
+        mark = stream.mark()
+        stream.write(" wor")
+        stream.rollback(mark)
+        stream.write(" world")
+
+        assert stream.text == "Hello world"
+        assert lengths == [5, 9, 5, 11]
+
+    def test_discard(self):
+        """Test that discarding drops all text, as for a video of an ordered output."""
+        stream = MemoryStream()
+        stream.write("Partial")
+        stream.discard()
+
+        assert stream.text == ""
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,238 @@
+"""
+Tests for the pacing module.
+"""
+
+import pytest
+from pathlib import Path
+from youtube_transcript_extractor.src.core.pacing import (
+    RequestPacer, QuotaLimiter, ModelQuotas, DailyQuotaExceeded
+)
+from youtube_transcript_extractor.src.core.quota_usage import QuotaUsageStore
+from youtube_transcript_extractor.src.core.models import GeminiModels
+
+
+@pytest.mark.unit
+class TestRequestPacer:
+    """Tests for RequestPacer class."""
+
+    def test_burst_does_not_wait(self, clock):
+        """Test that the initial burst goes out without sleeping."""
+        pacer = RequestPacer(rate_per_second=1.0, burst=3, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            assert pacer.wait() == 0.0
+
+        assert clock.sleeps == []
+
+    def test_waits_after_burst(self, clock):
+        """Test that requests beyond the burst are paced to the target rate."""
+        pacer = RequestPacer(rate_per_second=2.0, burst=1, clock=clock, sleep=clock.sleep)
+
+        pacer.wait()
+        assert pacer.wait() == pytest.approx(0.5)
+        assert pacer.wait() == pytest.approx(0.5)
+        assert pacer.total_wait == pytest.approx(1.0)
+
+    def test_request_time_counts_against_slot(self, clock):
+        """Test that only the remainder of the slot is slept."""
+        pacer = RequestPacer(rate_per_second=0.5, burst=1, clock=clock, sleep=clock.sleep)
+
+        pacer.wait()
+        clock.now += 1.5  # The request itself took 1.5s of a 2s slot
+
+        assert pacer.wait() == pytest.approx(0.5)
+
+        clock.now += 3.0  # A slow request leaves nothing to sleep
+        assert pacer.wait() == 0.0
+
+    def test_backoff_delays_next_request(self, clock):
+        """Test that a backoff holds the next request and drains the burst."""
+        pacer = RequestPacer(rate_per_second=10.0, burst=5, clock=clock, sleep=clock.sleep)
+
+        pacer.backoff(4.0)
+        clock.now += 1.0
+
+        assert pacer.wait() == pytest.approx(3.0)
+
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            RequestPacer(rate_per_second=0)
+
+
+
+@pytest.mark.unit
+class TestQuotaLimiter:
+    """Tests for QuotaLimiter class."""
+
+    def test_requests_per_minute(self, clock):
+        """Test that requests beyond the minute's quota wait for the window to roll."""
+        limiter = QuotaLimiter(requests_per_minute=2, clock=clock, sleep=clock.sleep)
+
+        assert limiter.acquire() == 0.0
+        clock.now = 20.0
+        assert limiter.acquire() == 0.0
+        assert limiter.acquire() == pytest.approx(40.0)
+        assert limiter.acquire() == pytest.approx(20.0)
+        assert limiter.total_wait == pytest.approx(60.0)
+
+    def test_tokens_per_minute(self, clock):
+        """Test that a large prompt waits for the token quota."""
+        limiter = QuotaLimiter(requests_per_minute=100, tokens_per_minute=1000, clock=clock, sleep=clock.sleep)
+
+        assert limiter.acquire(800) == 0.0
+        clock.now = 15.0
+        assert limiter.acquire(100) == 0.0
+        assert limiter.acquire(400) == pytest.approx(45.0)
+
+    def test_consume_charges_response_tokens(self, clock):
+        """Test that tokens charged after a call delay the next one."""
+        limiter = QuotaLimiter(requests_per_minute=100, tokens_per_minute=600, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire(100)
+        clock.now = 10.0
+        limiter.consume(600)
+
+        # The prompt tokens leave the window at 60s, leaving room for the response's
+        assert limiter.reserve(0) == pytest.approx(50.0)
+
+    def test_concurrent_reservations_queue_up(self, clock):
+        """Test that each caller waits behind the ones already reserved."""
+        limiter = QuotaLimiter(requests_per_minute=2, clock=clock, sleep=clock.sleep)
+        limiter.reserve()
+        clock.now = 1.0
+        limiter.reserve()
+
+        assert [limiter.reserve() for _ in range(4)] == pytest.approx([59.0, 60.0, 119.0, 120.0])
+
+    def test_daily_quota(self, clock):
+        """Test that the daily quota raises instead of waiting and resets the next day."""
+        day = ["2026-01-01"]
+        limiter = QuotaLimiter(requests_per_minute=100, requests_per_day=2, clock=clock,
+                               sleep=clock.sleep, today=lambda: day[0])
+        limiter.acquire()
+        limiter.acquire()
+
+        with pytest.raises(DailyQuotaExceeded):
+            limiter.acquire()
+
+        day[0] = "2026-01-02"
+        assert limiter.acquire() == 0.0
+        assert limiter.requests_today == 1
+
+    def test_refund_returns_daily_quota(self, clock):
+        """Test that a refunded request frees its daily slot but keeps its place in the minute."""
+        limiter = QuotaLimiter(requests_per_minute=1, requests_per_day=1, clock=clock,
+                               sleep=clock.sleep, today=lambda: "2026-01-01")
+        limiter.acquire(100)
+        limiter.refund(100)
+
+        assert limiter.requests_today == 0
+        assert limiter.tokens_today == 0
+        assert limiter.acquire() == pytest.approx(60.0)
+        with pytest.raises(DailyQuotaExceeded):
+            limiter.acquire()
+
+    def test_many_reservations_keep_order(self, clock):
+        """Test that a long queue of reservations is spread over the following windows."""
+        limiter = QuotaLimiter(requests_per_minute=10, tokens_per_minute=1000, clock=clock, sleep=clock.sleep)
+
+        waits = [limiter.reserve(150) for _ in range(60)]
+
+        # Six requests of 150 tokens fit each minute
+        assert waits[:6] == [0.0] * 6
+        assert waits[6::6] == pytest.approx([60.0 * n for n in range(1, 10)])
+
+    def test_peek_takes_no_quota(self, clock):
+        """Test that peeking reports the wait without reserving anything."""
+        limiter = QuotaLimiter(requests_per_minute=1, requests_per_day=2, clock=clock,
+                               sleep=clock.sleep, today=lambda: "2026-01-01")
+
+        assert limiter.peek() == 0.0
+        assert limiter.peek() == 0.0
+        limiter.acquire()
+        clock.now = 10.0
+        assert limiter.peek() == pytest.approx(50.0)
+        clock.now = 60.0
+        limiter.acquire()
+        assert limiter.peek() is None
+
+    def test_daily_usage_persists(self, temp_dir):
+        """Test that a new limiter continues from the usage stored by an earlier run."""
+        store = QuotaUsageStore(Path(temp_dir) / "usage.db")
+        first = QuotaLimiter(requests_per_day=3, usage_store=store, usage_key="gemini-2.5-pro",
+                             today=lambda: "2026-01-01")
+        first.acquire(100)
+        first.acquire(100)
+        first.consume(50)
+
+        second = QuotaLimiter(requests_per_day=3, usage_store=store, usage_key="gemini-2.5-pro",
+                              today=lambda: "2026-01-01")
+        second.acquire()
+
+        assert store.get("gemini-2.5-pro", "2026-01-01") == (3, 250)
+        with pytest.raises(DailyQuotaExceeded):
+            second.acquire()
+        assert store.get("gemini-2.5-flash", "2026-01-01") == (0, 0)
+
+    def test_invalid_quota(self):
+        """Test that non-positive quotas are rejected."""
+        with pytest.raises(ValueError):
+            QuotaLimiter(requests_per_minute=0)
+        with pytest.raises(ValueError):
+            QuotaLimiter(tokens_per_minute=0)
+        with pytest.raises(ValueError):
+            QuotaLimiter(requests_per_day=0)
+
+
+@pytest.mark.unit
+class TestModelQuotas:
+    """Tests for ModelQuotas class."""
+
+    def test_limits_per_model(self):
+        """Test that each model gets its own limiter with its published limits."""
+        quotas = ModelQuotas()
+        pro = quotas.limiter("gemini-2.5-pro")
+        flash = quotas.limiter("gemini-2.5-flash")
+
+        assert pro is quotas.limiter("gemini-2.5-pro")
+        assert pro is not flash
+        assert pro.requests_per_minute == GeminiModels.get_limits("gemini-2.5-pro").requests_per_minute
+        assert pro.requests_per_minute < flash.requests_per_minute
+
+    def test_models_do_not_share_windows(self, clock):
+        """Test that a busy model does not delay requests to another one."""
+        quotas = ModelQuotas(clock=clock, sleep=clock.sleep)
+        limits = GeminiModels.get_limits("gemini-2.5-pro")
+        for _ in range(limits.requests_per_minute):
+            quotas.limiter("gemini-2.5-pro").reserve()
+
+        assert quotas.limiter("gemini-2.5-pro").reserve() > 0
+        assert quotas.limiter("gemini-2.5-flash").reserve() == 0.0
+
+    def test_configure_overrides_published_limits(self):
+        """Test that configured limits replace only the given values."""
+        quotas = ModelQuotas()
+        limiter = quotas.configure("gemini-2.5-flash", requests_per_minute=500)
+
+        assert quotas.limiter("gemini-2.5-flash") is limiter
+        assert limiter.requests_per_minute == 500
+        assert limiter.tokens_per_minute == GeminiModels.get_limits("gemini-2.5-flash").tokens_per_minute
+        assert limiter.requests_per_day is None
+
+    def test_daily_limit_only_when_configured(self):
+        """Test that published daily limits are advisory and configured ones are enforced."""
+        quotas = ModelQuotas()
+
+        assert quotas.limiter("gemini-2.5-flash").requests_per_day is None
+        assert quotas.configure("gemini-2.5-pro", requests_per_day=1000).requests_per_day == 1000
+
+    def test_versioned_model_names(self):
+        """Test that versioned names use their family's limits and unknown names the defaults."""
+        assert GeminiModels.get_limits("gemini-2.5-pro-preview-03-25") == GeminiModels.MODEL_LIMITS["gemini-2.5-pro"]
+        assert GeminiModels.get_limits("gemini-2.5-flash-lite-001") == GeminiModels.MODEL_LIMITS["gemini-2.5-flash-lite"]
+        assert GeminiModels.get_limits("unknown-model") == GeminiModels.DEFAULT_LIMITS
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
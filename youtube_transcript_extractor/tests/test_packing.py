@@ -0,0 +1,86 @@
+"""
+Unit tests for packing short videos into one request.
+"""
+
+import pytest
+
+from youtube_transcript_extractor.src.core.packing import (
+    VideoPacker, build_packed_prompt, pack_stream, pack_videos, split_packed_response
+)
+
+
+@pytest.mark.unit
+class TestPackVideos:
+    """Test cases for pack_videos."""
+
+    def test_groups_fit_budget_and_size(self):
+        """Test that groups respect both the token budget and the video limit."""
+        assert pack_videos([300] * 7, budget=1000, max_videos=10, max_video_tokens=500) == [
+            [0, 1, 2], [3, 4, 5], [6]
+        ]
+        assert pack_videos([10] * 5, budget=1000, max_videos=2, max_video_tokens=500) == [[0, 1], [2, 3], [4]]
+
+    def test_long_video_refined_alone(self):
+        """Test that a long video gets its own request and ends the current group."""
+        assert pack_videos([100, 100, 900, 100, 100], budget=1000, max_videos=10, max_video_tokens=500) == [
+            [0, 1], [2], [3, 4]
+        ]
+
+    def test_packing_disabled(self):
+        """Test that a limit of one video per request keeps every video alone."""
+        assert pack_videos([10, 10], budget=1000, max_videos=1, max_video_tokens=500) == [[0], [1]]
+
+
+    def test_groups_handed_back_once_complete(self):
+        """Test that a packer returns each group as soon as it cannot grow."""
+        packer = VideoPacker(budget=1000, max_videos=2, max_video_tokens=500)
+
+        assert packer.add("a", 100) == []
+        assert packer.add("b", 100) == [["a", "b"]]
+        assert packer.add("c", 100) == []
+        assert packer.add("d", None) == [["c"], ["d"]]
+        assert packer.flush() == []
+
+    @pytest.mark.asyncio
+    async def test_stream_packed_like_a_list(self):
+        """Test that packing a stream gives the same groups as packing a list."""
+        async def videos():
+            for tokens in [100, 100, 900, 100, 100]:
+                yield tokens
+
+        groups = [group async for group in pack_stream(
+            videos(), lambda tokens: tokens, budget=1000, max_videos=10, max_video_tokens=500
+        )]
+
+        assert groups == [[100, 100], [900], [100, 100]]
+
+@pytest.mark.unit
+class TestPackedResponses:
+    """Test cases for packed prompts and splitting their responses."""
+
+    def test_prompt_delimits_transcripts(self):
+        """Test that every transcript follows its numbered marker."""
+        prompt = build_packed_prompt(["First transcript", "Second transcript"])
+
+        assert "===== VIDEO 1 =====\nFirst transcript\n\n===== VIDEO 2 =====\nSecond transcript" in prompt
+        assert prompt.startswith("The transcripts of 2 separate videos follow")
+
+    def test_response_split_per_video(self):
+        """Test that a response is split at the markers, ignoring a preamble."""
+        response = "Here you go.\n===== VIDEO 1 =====\n## One\n\nText.\n\n=== Video 2 ===\n## Two\n"
+
+        assert split_packed_response(response, 2) == ["## One\n\nText.", "## Two"]
+
+    @pytest.mark.parametrize("response", [
+        "===== VIDEO 1 =====\nOne",
+        "===== VIDEO 2 =====\nTwo\n===== VIDEO 1 =====\nOne",
+        "===== VIDEO 1 =====\n\n===== VIDEO 2 =====\nTwo",
+        "One and two merged",
+    ])
+    def test_unsplittable_response(self, response):
+        """Test that missing, reordered or empty outputs reject the whole response."""
+        assert split_packed_response(response, 2) is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,135 @@
+"""
+Unit tests for the staged processing pipeline.
+"""
+
+import asyncio
+import time
+import pytest
+
+from youtube_transcript_extractor.src.core.pipeline import Pipeline, PipelineStage, ThreadedSource
+
+
+@pytest.mark.unit
+class TestPipeline:
+    """Test cases for Pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_stages_overlap(self):
+        """Test that wall time tracks the slowest stage, not the sum."""
+        written = []
+
+        def fetch_like(item):
+            time.sleep(0.05)
+            return item
+
+        def refine_like(item):
+            time.sleep(0.05)
+            return item * 10
+
+        pipeline = Pipeline([
+            PipelineStage("fetch", fetch_like, blocking=True),
+            PipelineStage("refine", refine_like, blocking=True),
+            PipelineStage("write", lambda item: written.append(item) or item, ordered=True),
+        ])
+
+        start = time.time()
+        stats = await pipeline.run(range(6))
+        elapsed = time.time() - start
+
+        assert written == [0, 10, 20, 30, 40, 50]
+        assert stats.completed == stats.items == 6
+        # Sequential stages would take 0.6s
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_ordered_stage_restores_source_order(self):
+        """Test that parallel workers still feed an ordered stage in order."""
+        written = []
+
+        async def uneven(item):
+            await asyncio.sleep(0.03 if item % 2 == 0 else 0.0)
+            return item
+
+        pipeline = Pipeline([
+            PipelineStage("work", uneven, workers=3),
+            PipelineStage("write", lambda item: written.append(item) or item, ordered=True),
+        ])
+
+        await pipeline.run(range(7))
+
+        assert written == list(range(7))
+
+    @pytest.mark.asyncio
+    async def test_dropped_and_failed_items(self):
+        """Test that dropped and failing items do not stall later stages."""
+        written = []
+
+        def maybe(item):
+            if item == 1:
+                return None
+            if item == 2:
+                raise ValueError("bad item")
+            return item
+
+        pipeline = Pipeline([
+            PipelineStage("filter", maybe),
+            PipelineStage("write", lambda item: written.append(item) or item, ordered=True),
+        ])
+
+        stats = await pipeline.run([0, 1, 2, 3])
+
+        assert written == [0, 3]
+        assert stats.stages["filter"].dropped == 1
+        assert stats.stages["filter"].failed == 1
+        assert stats.completed == 4
+
+    @pytest.mark.asyncio
+    async def test_in_flight_items_are_bounded(self):
+        """Test that a fast source is held back by a slow stage."""
+        in_flight = 0
+        peak = 0
+
+        async def source():
+            nonlocal in_flight, peak
+            for item in range(20):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                yield item
+
+        async def slow(item):
+            nonlocal in_flight
+            await asyncio.sleep(0.005)
+            in_flight -= 1
+            return item
+
+        pipeline = Pipeline([PipelineStage("slow", slow)], queue_size=1, max_in_flight=3)
+        stats = await pipeline.run(source())
+
+        assert stats.completed == 20
+        assert peak <= 4
+
+    @pytest.mark.asyncio
+    async def test_threaded_source(self):
+        """Test adapting a blocking callback producer."""
+        def producer(emit):
+            for item in range(5):
+                emit(item)
+            return "done"
+
+        source = ThreadedSource(producer, maxsize=1)
+        collected = []
+        pipeline = Pipeline([PipelineStage("collect", lambda item: collected.append(item) or item, ordered=True)])
+
+        await pipeline.run(source)
+
+        assert collected == [0, 1, 2, 3, 4]
+        assert source.result == "done"
+
+    def test_requires_stages(self):
+        """Test that an empty pipeline is rejected."""
+        with pytest.raises(ValueError):
+            Pipeline([])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,92 @@
+"""
+Tests for the playlist_manifest module.
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+from youtube_transcript_extractor.src.core.playlist_manifest import (
+    PlaylistManifestStore, extract_playlist_id, extract_video_id
+)
+
+
+PLAYLIST_URL = "https://www.youtube.com/playlist?list=PLtest123"
+
+
+def watch_urls(*video_ids):
+    return [f"https://www.youtube.com/watch?v={video_id}" for video_id in video_ids]
+
+
+@pytest.mark.unit
+class TestPlaylistManifestStore:
+    """Tests for PlaylistManifestStore class."""
+
+    def test_extract_ids(self):
+        """Test playlist and video ID extraction."""
+        assert extract_playlist_id(PLAYLIST_URL) == "PLtest123"
+        assert extract_video_id("https://www.youtube.com/watch?v=aaaaaaaaaaa&t=5") == "aaaaaaaaaaa"
+        assert extract_video_id("https://youtu.be/bbbbbbbbbbb") == "bbbbbbbbbbb"
+        assert extract_video_id("https://example.com") is None
+
+    def test_resolve_enumerates_once_within_ttl(self, temp_dir):
+        """Test that a fresh manifest is reused instead of re-enumerating."""
+        store = PlaylistManifestStore(db_path=Path(temp_dir) / "playlists.db")
+        loader = Mock(return_value=("My Playlist", watch_urls("aaaaaaaaaaa", "bbbbbbbbbbb")))
+
+        first = store.resolve(PLAYLIST_URL, loader)
+        second = store.resolve(PLAYLIST_URL, loader)
+
+        loader.assert_called_once_with(PLAYLIST_URL)
+        assert second.title == "My Playlist"
+        assert second.video_ids == ["aaaaaaaaaaa", "bbbbbbbbbbb"]
+        assert second.video_urls == first.video_urls
+
+    def test_expired_manifest_is_re_enumerated(self, temp_dir):
+        """Test that manifests older than the TTL are refreshed."""
+        store = PlaylistManifestStore(db_path=Path(temp_dir) / "playlists.db")
+        loader = Mock(return_value=("My Playlist", watch_urls("aaaaaaaaaaa")))
+        store.resolve(PLAYLIST_URL, loader)
+
+        store.ttl_seconds = -1  # Everything is now expired
+        store.resolve(PLAYLIST_URL, loader)
+
+        assert loader.call_count == 2
+        assert store.get(PLAYLIST_URL) is None
+        assert store.get(PLAYLIST_URL, allow_stale=True) is not None
+
+    def test_sync_only_returns_new_videos(self, temp_dir):
+        """Test that sync state survives a refresh so only new videos are pending."""
+        store = PlaylistManifestStore(db_path=Path(temp_dir) / "playlists.db")
+        store.save(PLAYLIST_URL, "My Playlist", watch_urls("aaaaaaaaaaa", "bbbbbbbbbbb"))
+        store.mark_synced(PLAYLIST_URL, ["aaaaaaaaaaa", "bbbbbbbbbbb"])
+
+        manifest = store.save(PLAYLIST_URL, "My Playlist", watch_urls("aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc"))
+
+        assert manifest.pending_ids == ["ccccccccccc"]
+        assert manifest.pending_urls == watch_urls("ccccccccccc")
+        assert manifest.last_synced_at is not None
+
+    def test_removed_videos_are_dropped(self, temp_dir):
+        """Test that videos removed from the playlist leave the manifest."""
+        store = PlaylistManifestStore(db_path=Path(temp_dir) / "playlists.db")
+        store.save(PLAYLIST_URL, "My Playlist", watch_urls("aaaaaaaaaaa", "bbbbbbbbbbb"))
+
+        manifest = store.save(PLAYLIST_URL, "My Playlist", watch_urls("bbbbbbbbbbb"))
+
+        assert manifest.video_ids == ["bbbbbbbbbbb"]
+
+    def test_statistics(self, temp_dir):
+        """Test manifest store statistics."""
+        store = PlaylistManifestStore(db_path=Path(temp_dir) / "playlists.db")
+        store.save(PLAYLIST_URL, "My Playlist", watch_urls("aaaaaaaaaaa", "bbbbbbbbbbb"))
+        store.mark_synced(PLAYLIST_URL, ["aaaaaaaaaaa"])
+
+        stats = store.get_statistics()
+
+        assert stats["playlists"] == 1
+        assert stats["videos"] == 2
+        assert stats["pending_videos"] == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,126 @@
+"""
+Unit tests for prompt prefix caching.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from unittest.mock import Mock
+
+from youtube_transcript_extractor.src.core.prompt_cache import LocalPrefixCache, PromptPrefixCache
+
+
+@pytest.mark.unit
+class TestPromptPrefixCache:
+    """Test cases for PromptPrefixCache."""
+
+    def test_prefix_uploaded_once_per_model(self):
+        """Test that a prefix is uploaded once and reused by later requests."""
+        factory = Mock(side_effect=lambda name: Mock(name=name))
+        cache = LocalPrefixCache(factory)
+
+        first = cache.model_for("gemini-2.5-flash", "Style prompt\n\n")
+        second = cache.model_for("gemini-2.5-flash", "Style prompt\n\n")
+        other = cache.model_for("gemini-2.5-pro", "Style prompt\n\n")
+
+        assert first is second
+        assert other is not first
+        assert cache.get_statistics() == {"cached_prefixes": 2, "inline_prefixes": 0, "uploads": 2, "hits": 1}
+
+    def test_bound_model_receives_prefix(self):
+        """Test that the local stand-in still sends the whole prompt."""
+        model = Mock()
+        cache = LocalPrefixCache(lambda name: model)
+
+        cache.model_for("gemini-2.5-flash", "Prefix. ").generate_content("Rest", stream=True)
+
+        model.generate_content.assert_called_once_with("Prefix. Rest", stream=True)
+
+    def test_prefix_uploaded_again_before_expiry(self, clock):
+        """Test that a prefix is replaced shortly before its lifetime ends."""
+        cache = LocalPrefixCache(lambda name: Mock(), ttl_seconds=300, clock=clock)
+        cache._delete = Mock()
+
+        first = cache.model_for("gemini-2.5-flash", "Prefix")
+        clock.now = 200
+        assert cache.model_for("gemini-2.5-flash", "Prefix") is first
+        clock.now = 250
+        renewed = cache.model_for("gemini-2.5-flash", "Prefix")
+
+        assert renewed is not first
+        assert cache.uploads == 2
+        cache._delete.assert_called_once_with("Prefix")
+
+    def test_failed_upload_falls_back_to_inline(self, clock):
+        """Test that a prefix whose upload failed is sent inline until the retry time."""
+        cache = LocalPrefixCache(lambda name: Mock(), retry_seconds=300, clock=clock)
+        cache._upload = Mock(side_effect=[RuntimeError("service unavailable"), (Mock(), "Prefix")])
+
+        assert cache.model_for("gemini-2.5-flash", "Prefix") is None
+        clock.now = 299
+        assert cache.model_for("gemini-2.5-flash", "Prefix") is None
+        assert cache._upload.call_count == 1
+        assert cache.get_statistics()["inline_prefixes"] == 1
+
+        clock.now = 300
+        assert cache.model_for("gemini-2.5-flash", "Prefix") is not None
+        assert cache._upload.call_count == 2
+
+    def test_uncacheable_prefix_not_retried(self, clock):
+        """Test that a prefix the backend declines is sent inline for good."""
+        cache = LocalPrefixCache(lambda name: Mock(), clock=clock)
+        cache._upload = Mock(return_value=None)
+
+        cache.model_for("gemini-2.5-flash", "Prefix")
+        clock.now = 10_000
+        assert cache.model_for("gemini-2.5-flash", "Prefix") is None
+
+        cache._upload.assert_called_once()
+
+    def test_upload_runs_outside_lock(self):
+        """Test that a slow upload holds back only requests for the same prefix."""
+        release = threading.Event()
+        started = threading.Event()
+        factory = Mock(side_effect=lambda name: Mock(name=name))
+        cache = LocalPrefixCache(factory)
+        upload = cache._upload
+
+        def slow_upload(model_name, prefix):
+            if prefix == "Slow":
+                started.set()
+                release.wait(5)
+            return upload(model_name, prefix)
+
+        cache._upload = Mock(side_effect=slow_upload)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            slow = [executor.submit(cache.model_for, "gemini-2.5-flash", "Slow") for _ in range(2)]
+            assert started.wait(5)
+            # Another prefix is uploaded while the slow one is still in flight
+            assert cache.model_for("gemini-2.5-flash", "Fast") is not None
+            release.set()
+            models = [future.result(5) for future in slow]
+
+        assert models[0] is models[1]
+        assert cache.uploads == 2
+
+    def test_subclass_must_upload(self):
+        """Test that the base class cannot be used without an upload method."""
+        with pytest.raises(TypeError):
+            PromptPrefixCache()
+
+    def test_close_deletes_uploaded_prefixes(self):
+        """Test that closing the cache releases every upload."""
+        cache = LocalPrefixCache(lambda name: Mock())
+        cache._delete = Mock()
+        cache.model_for("gemini-2.5-flash", "One")
+        cache.model_for("gemini-2.5-flash", "Two")
+
+        cache.close()
+
+        assert sorted(call[0][0] for call in cache._delete.call_args_list) == ["One", "Two"]
+        assert cache.get_statistics()["cached_prefixes"] == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,121 @@
+"""
+Tests for the response_cache module.
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import Mock, patch
+from youtube_transcript_extractor.src.core.response_cache import ResponseCache
+from youtube_transcript_extractor.src.core.gemini_processor import GeminiProcessor
+from youtube_transcript_extractor.src.core.models import ProcessingConfig, ProcessingMode, RefinementStyle
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Tests for ResponseCache class."""
+
+    def test_put_and_get(self, temp_dir):
+        """Test storing and retrieving a response."""
+        cache = ResponseCache(db_path=Path(temp_dir) / "responses.db")
+
+        assert cache.put("gemini-2.5-flash", "Prompt", "Refined") is True
+
+        assert cache.get("gemini-2.5-flash", "Prompt") == "Refined"
+        assert cache.hits == 1
+
+    def test_key_includes_model_and_prompt(self, temp_dir):
+        """Test that another model or prompt misses."""
+        cache = ResponseCache(db_path=Path(temp_dir) / "responses.db")
+        cache.put("gemini-2.5-flash", "Prompt", "Refined")
+
+        assert cache.get("gemini-2.5-pro", "Prompt") is None
+        assert cache.get("gemini-2.5-flash", "Previous response:\nx\nPrompt") is None
+        assert cache.misses == 2
+
+    def test_lru_eviction(self, temp_dir):
+        """Test that the least recently used entries go first."""
+        cache = ResponseCache(db_path=Path(temp_dir) / "responses.db", max_size_bytes=20)
+        cache.put("model", "old", "x" * 10)
+        cache.put("model", "recent", "y" * 10)
+        cache.get("model", "old")
+        cache.put("model", "new", "z" * 10)
+
+        assert cache.get("model", "recent") is None
+        assert cache.get("model", "old") == "x" * 10
+        assert cache.get("model", "new") == "z" * 10
+
+    def test_eviction_scan_only_when_over_limit(self, temp_dir):
+        """Test that writes below the size limit skip the eviction scan."""
+        cache = ResponseCache(db_path=Path(temp_dir) / "responses.db", max_size_bytes=20)
+        cache.evict = Mock(wraps=cache.evict)
+
+        cache.put("model", "first", "x" * 10)
+        cache.put("model", "second", "y" * 10)
+        cache.evict.assert_not_called()
+
+        cache.put("model", "third", "z" * 10)
+        cache.evict.assert_called_once()
+
+    def test_expired_entries_miss(self, temp_dir):
+        """Test that entries older than the age limit are ignored."""
+        cache = ResponseCache(db_path=Path(temp_dir) / "responses.db", max_age_days=-1)
+        cache.put("model", "Prompt", "Refined")
+
+        assert cache.get("model", "Prompt") is None
+
+
+@pytest.mark.unit
+class TestGeminiResponseCaching:
+    """Tests for GeminiProcessor's use of the response cache."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.config = ProcessingConfig(
+            mode=ProcessingMode.YOUTUBE_URL,
+            source_path="",
+            output_language="English",
+            refinement_style=RefinementStyle.BALANCED_DETAILED,
+            chunk_size=3000,
+            gemini_model="gemini-2.5-flash",
+            api_key="test_api_key",
+            transcript_output_file="",
+            gemini_output_file=""
+        )
+
+    @patch('youtube_transcript_extractor.src.core.gemini_processor.genai')
+    def test_repeated_prompt_served_from_cache(self, mock_genai, temp_dir):
+        """Test that a second processor reuses responses from disk."""
+        mock_response = Mock()
+        mock_response.text = "Refined chunk"
+        generate = mock_genai.GenerativeModel.return_value.generate_content
+        generate.return_value = mock_response
+        db_path = Path(temp_dir) / "responses.db"
+
+        first = GeminiProcessor(self.config, response_cache=ResponseCache(db_path=db_path))
+        assert first.process_transcript("Some transcript text").content == "Refined chunk"
+
+        second = GeminiProcessor(self.config, response_cache=ResponseCache(db_path=db_path))
+        assert second.process_transcript("Some transcript text").content == "Refined chunk"
+
+        assert generate.call_count == 1
+        assert second.response_cache.hits == 1
+
+    @patch('youtube_transcript_extractor.src.core.gemini_processor.genai')
+    def test_bypass_refreshes_cache(self, mock_genai, temp_dir):
+        """Test that bypassing skips lookups but stores the new response."""
+        responses = iter(["Old", "New"])
+        generate = mock_genai.GenerativeModel.return_value.generate_content
+        generate.side_effect = lambda prompt: Mock(text=next(responses))
+        cache = ResponseCache(db_path=Path(temp_dir) / "responses.db")
+
+        GeminiProcessor(self.config, response_cache=cache).process_transcript("Text")
+        refreshed = GeminiProcessor(self.config, response_cache=cache, bypass_cache=True).process_transcript("Text")
+        reused = GeminiProcessor(self.config, response_cache=cache).process_transcript("Text")
+
+        assert refreshed.content == "New"
+        assert reused.content == "New"
+        assert generate.call_count == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
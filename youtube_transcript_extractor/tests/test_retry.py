@@ -0,0 +1,196 @@
+"""
+Unit tests for the retry engine.
+"""
+
+import random
+import pytest
+
+from youtube_transcript_extractor.src.core.retry import (
+    RetryEngine, RetryBudget, RetryPolicy, ErrorCode, classify_error
+)
+from youtube_transcript_extractor.src.core.pacing import DailyQuotaExceeded
+
+
+class ResourceExhausted(Exception):
+    """Stand-in for the Google API quota exception."""
+
+
+class BlockedError(Exception):
+    """Error carrying the fetcher's blocked flag."""
+    blocked = True
+
+
+class HttpError(Exception):
+    """Error carrying an HTTP status."""
+
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+@pytest.mark.unit
+class TestClassifyError:
+    """Test cases for error classification."""
+
+    def test_blocked_flag(self):
+        """Test that the blocked attribute wins over the message."""
+        assert classify_error(BlockedError("something odd")) == ErrorCode.IP_BLOCKED
+
+    def test_http_status(self):
+        """Test classification by HTTP status."""
+        assert classify_error(HttpError(429)) == ErrorCode.RATE_LIMITED
+        assert classify_error(HttpError(503)) == ErrorCode.TRANSIENT
+
+    def test_exception_class_name(self):
+        """Test classification by exception class name."""
+        assert classify_error(ResourceExhausted("quota")) == ErrorCode.RATE_LIMITED
+        assert classify_error(DailyQuotaExceeded("Daily quota used up")) == ErrorCode.QUOTA_EXHAUSTED
+        assert not RetryEngine().policy_for(ErrorCode.QUOTA_EXHAUSTED).retryable
+
+    def test_message_fragments(self):
+        """Test classification of plain messages."""
+        assert classify_error("No transcripts available for video 1/3") == ErrorCode.NO_TRANSCRIPT
+        assert classify_error(ValueError("Invalid API key")) == ErrorCode.AUTH
+        assert classify_error("YouTube is blocking requests from your IP") == ErrorCode.IP_BLOCKED
+        assert classify_error("something unexpected") == ErrorCode.UNKNOWN
+
+    def test_status_codes_in_urls_ignored(self):
+        """Test that digits inside video IDs and URLs are not taken for HTTP statuses."""
+        error = RuntimeError("Failed to fetch https://www.youtube.com/watch?v=x4290Abc: connection reset")
+        assert classify_error(error) == ErrorCode.TRANSIENT
+        assert classify_error("Request for https://example.com/watch?v=404 failed") == ErrorCode.UNKNOWN
+        assert classify_error("HTTP Error 404: Not Found") == ErrorCode.NOT_FOUND
+        assert classify_error("Request failed with status=503") == ErrorCode.TRANSIENT
+
+    def test_invalid_matched_last(self):
+        """Test that only an invalid request, not any word starting with invalid, means INVALID_REQUEST."""
+        assert classify_error("Invalidated session") == ErrorCode.UNKNOWN
+        assert classify_error("Invalid argument: connection timed out") == ErrorCode.TRANSIENT
+        assert classify_error("400 Invalid argument") == ErrorCode.INVALID_REQUEST
+
+    def test_quota_message_exhausts(self):
+        """Test that a quota message is a used-up quota rather than a rate limit."""
+        assert classify_error("You exceeded your current quota") == ErrorCode.QUOTA_EXHAUSTED
+        assert classify_error("429 You exceeded your current quota") == ErrorCode.RATE_LIMITED
+
+
+@pytest.mark.unit
+class TestRetryEngine:
+    """Test cases for RetryEngine."""
+
+    def test_success_first_attempt(self):
+        """Test a call that succeeds straight away."""
+        engine = RetryEngine()
+        outcome = engine.execute(lambda: "ok", sleep=lambda s: None)
+
+        assert outcome.success
+        assert outcome.value == "ok"
+        assert outcome.attempts == 1
+        assert outcome.delays == []
+
+    def test_non_retryable_error_not_retried(self):
+        """Test that permanent errors give up immediately."""
+        calls = []
+
+        def fail():
+            calls.append(1)
+            raise LookupError("No transcripts available")
+
+        outcome = RetryEngine().execute(fail, sleep=lambda s: None)
+
+        assert not outcome.success
+        assert outcome.error_code == ErrorCode.NO_TRANSCRIPT
+        assert outcome.attempts == 1
+        assert len(calls) == 1
+
+    def test_transient_error_retried(self):
+        """Test that a transient error is retried until success."""
+        sleeps = []
+        results = iter([ConnectionError("connection reset"), "done"])
+
+        def flaky():
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        outcome = RetryEngine().execute(flaky, sleep=sleeps.append)
+
+        assert outcome.success
+        assert outcome.value == "done"
+        assert outcome.attempts == 2
+        assert len(sleeps) == 1
+
+    def test_failure_check(self):
+        """Test that returned failures are retried like raised ones."""
+        results = iter([None, "text"])
+        outcome = RetryEngine().execute(
+            lambda: next(results),
+            failure_check=lambda value: "Empty response" if value is None else None,
+            sleep=lambda s: None
+        )
+
+        assert outcome.success
+        assert outcome.attempts == 2
+
+    def test_max_attempts_cap(self):
+        """Test that the per-call cap overrides the policy."""
+        def fail():
+            raise ConnectionError("connection reset")
+
+        outcome = RetryEngine().execute(fail, sleep=lambda s: None, max_attempts=2)
+
+        assert outcome.attempts == 2
+        assert outcome.error_code == ErrorCode.TRANSIENT
+
+    def test_budget_exhaustion_stops_retries(self):
+        """Test that an empty budget stops retrying."""
+        budget = RetryBudget(ratio=0.0, min_retries=1)
+
+        def fail():
+            raise ConnectionError("connection reset")
+
+        outcome = RetryEngine(budget=budget).execute(fail, sleep=lambda s: None)
+
+        assert outcome.attempts == 2
+        stats = budget.get_statistics()
+        assert stats["retries"] == 1
+        assert stats["denied"] == 1
+
+    def test_jitter_bounds(self):
+        """Test that delays stay between the base and max delay."""
+        policy = RetryPolicy(max_attempts=10, base_delay=1.0, max_delay=8.0)
+        engine = RetryEngine(policies={ErrorCode.TRANSIENT: policy}, rng=random.Random(42))
+
+        delay = 0.0
+        for attempt in range(1, 9):
+            delay = engine.next_delay(ErrorCode.TRANSIENT, attempt, delay)
+            assert 1.0 <= delay <= 8.0
+
+        assert engine.next_delay(ErrorCode.TRANSIENT, 10, delay) is None
+
+    @pytest.mark.asyncio
+    async def test_execute_async(self):
+        """Test the async variant retries coroutine functions."""
+        attempts = []
+        sleeps = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise HttpError(429)
+            return "ok"
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        outcome = await RetryEngine().execute_async(flaky, sleep=fake_sleep)
+
+        assert outcome.success
+        assert outcome.attempts == 3
+        assert len(sleeps) == 2
+        assert outcome.total_delay == pytest.approx(sum(sleeps))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,93 @@
+"""
+Unit tests for routing Gemini requests across models.
+"""
+
+import pytest
+
+from youtube_transcript_extractor.src.core.models import GeminiModels, RefinementStyle
+from youtube_transcript_extractor.src.core.pacing import ModelQuotas, QuotaLimiter
+from youtube_transcript_extractor.src.core.retry import ErrorCode
+from youtube_transcript_extractor.src.core.routing import ModelRouter
+
+
+@pytest.fixture
+def router(clock):
+    quotas = ModelQuotas(clock=clock, sleep=clock.sleep, today=lambda: "2026-01-01")
+    return ModelRouter(quotas, "gemini-2.5-pro", cooldown_seconds=30, clock=clock)
+
+
+@pytest.mark.unit
+class TestModelRouter:
+    """Test cases for ModelRouter."""
+
+    def test_configured_model_first(self, router):
+        """Test that detailed styles start with the configured model and keep the cascade order."""
+        route = router.route(RefinementStyle.BALANCED_DETAILED, 3000)
+
+        assert route == GeminiModels.get_cascade("gemini-2.5-pro")
+        assert route[0] == "gemini-2.5-pro"
+
+    def test_fallbacks_are_stable_models(self):
+        """Test that only stable models are failover targets by default."""
+        for model in GeminiModels.FALLBACK_CASCADE + GeminiModels.FAST_MODELS:
+            assert "preview" not in model and "exp" not in model
+
+    def test_fast_model_first_for_light_work(self, router):
+        """Test that small summary prompts try a fast model before the configured one."""
+        assert router.route(RefinementStyle.SUMMARY, 3000)[0] in GeminiModels.FAST_MODELS
+        assert router.route(RefinementStyle.QA_GENERATION, 20000)[0] == "gemini-2.5-pro"
+
+    def test_models_without_headroom_move_back(self, router):
+        """Test that a model that would wait is ranked behind models with room now."""
+        router.quotas.register("gemini-2.5-pro", QuotaLimiter(
+            requests_per_minute=1, clock=router._clock, today=lambda: "2026-01-01"
+        ))
+        router.quotas.limiter("gemini-2.5-pro").reserve()
+
+        route = router.route(RefinementStyle.BALANCED_DETAILED, 100)
+
+        assert route[0] == "gemini-2.5-flash"
+        assert route[-1] == "gemini-2.5-pro"
+
+    def test_daily_quota_excludes_model(self, router):
+        """Test that a model out of daily quota is not offered at all."""
+        router.quotas.configure("gemini-2.5-pro", requests_per_day=1).reserve()
+
+        assert "gemini-2.5-pro" not in router.route(RefinementStyle.BALANCED_DETAILED, 100)
+
+    def test_rate_limited_model_cools_down(self, router, clock):
+        """Test that a rate-limited model is tried last until its cooldown ends."""
+        assert router.record_failure("gemini-2.5-pro", ErrorCode.RATE_LIMITED) is True
+        assert router.route(RefinementStyle.BALANCED_DETAILED, 100)[-1] == "gemini-2.5-pro"
+
+        clock.now = 31.0
+        assert router.route(RefinementStyle.BALANCED_DETAILED, 100)[0] == "gemini-2.5-pro"
+
+    def test_unknown_model_dropped(self, router):
+        """Test that a model that does not exist is never routed to again."""
+        router.record_failure("gemini-2.5-pro", ErrorCode.NOT_FOUND)
+
+        assert "gemini-2.5-pro" not in router.route(RefinementStyle.BALANCED_DETAILED, 100)
+
+    def test_request_errors_do_not_fail_over(self, router):
+        """Test that errors caused by the request itself stay with the model."""
+        assert router.record_failure("gemini-2.5-pro", ErrorCode.INVALID_REQUEST) is False
+        assert router.route(RefinementStyle.BALANCED_DETAILED, 100)[0] == "gemini-2.5-pro"
+
+    def test_statistics(self, router):
+        """Test that outcomes and average latency are tracked per model."""
+        router.record_success("gemini-2.5-flash", 2.0)
+        router.record_success("gemini-2.5-flash", 4.0)
+        router.record_failure("gemini-2.5-flash", ErrorCode.TRANSIENT)
+
+        stats = router.get_statistics()["gemini-2.5-flash"]
+
+        assert stats["requests"] == 3
+        assert stats["successes"] == 2
+        assert stats["failures"] == {"transient": 1}
+        assert stats["average_latency"] == pytest.approx(2.6)
+        assert stats["cooling_down"] is True
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
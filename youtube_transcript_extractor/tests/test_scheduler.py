@@ -0,0 +1,103 @@
+"""
+Unit tests for the task scheduler.
+"""
+
+import asyncio
+import pytest
+
+from youtube_transcript_extractor.src.core.scheduler import TaskScheduler
+
+
+async def drain(scheduler):
+    """Take every pending item in scheduling order."""
+    items = []
+    while len(scheduler):
+        items.append((await scheduler.get()).item)
+    return items
+
+
+@pytest.mark.unit
+class TestTaskScheduler:
+    """Test cases for TaskScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_priority_order_with_fifo_ties(self):
+        """Test that higher priorities go first and ties keep insertion order."""
+        scheduler = TaskScheduler(aging_rate=0.0)
+        scheduler.add("low", priority=0)
+        scheduler.add("high", priority=5)
+        scheduler.add("low2", priority=0)
+        scheduler.add("mid", priority=2)
+
+        assert await drain(scheduler) == ["high", "mid", "low", "low2"]
+
+    @pytest.mark.asyncio
+    async def test_aging_prevents_starvation(self, clock):
+        """Test that a long wait outranks a slightly higher priority."""
+        scheduler = TaskScheduler(aging_rate=1.0, clock=clock)
+        scheduler.add("old", priority=0)
+        clock.now += 10
+        scheduler.add("new", priority=5)
+
+        assert await drain(scheduler) == ["old", "new"]
+
+    @pytest.mark.asyncio
+    async def test_deadline_jumps_queue_when_close(self, clock):
+        """Test that an item with a near deadline is served first."""
+        scheduler = TaskScheduler(aging_rate=0.0, deadline_slack=5.0, clock=clock)
+        scheduler.add("urgent", priority=10)
+        scheduler.add("later", priority=0, deadline=clock.now + 60)
+        scheduler.add("soon", priority=0, deadline=clock.now + 3)
+
+        assert (await scheduler.get()).item == "soon"
+        assert (await scheduler.get()).item == "urgent"
+
+        clock.now += 58
+        assert (await scheduler.get()).item == "later"
+
+    @pytest.mark.asyncio
+    async def test_cancel_by_key(self):
+        """Test that cancelled items are never served."""
+        scheduler = TaskScheduler()
+        scheduler.add("a", key="a")
+        scheduler.add("b", key="b")
+
+        cancelled = scheduler.cancel("a")
+
+        assert [entry.item for entry in cancelled] == ["a"]
+        assert scheduler.cancel("a") == []
+        assert len(scheduler) == 1
+        assert await drain(scheduler) == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_put_waits_for_space(self):
+        """Test that put applies backpressure but add does not."""
+        scheduler = TaskScheduler(maxsize=1)
+        await scheduler.put("first")
+        blocked = asyncio.ensure_future(scheduler.put("second"))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        scheduler.add("urgent", priority=10)
+        assert len(scheduler) == 2
+
+        assert (await scheduler.get()).item == "urgent"
+        assert (await scheduler.get()).item == "first"
+        await asyncio.wait_for(blocked, 1.0)
+        assert (await scheduler.get()).item == "second"
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_item(self):
+        """Test that a waiting consumer is woken by a new item."""
+        scheduler = TaskScheduler()
+        getter = asyncio.ensure_future(scheduler.get())
+        await asyncio.sleep(0.01)
+        assert not getter.done()
+
+        scheduler.add("item")
+
+        assert (await asyncio.wait_for(getter, 1.0)).item == "item"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,103 @@
+"""
+Unit tests for token estimates and token-budgeted chunking.
+"""
+
+import pytest
+
+from youtube_transcript_extractor.src.core.tokens import estimate_tokens, split_by_tokens
+
+
+@pytest.mark.unit
+class TestEstimateTokens:
+    """Test cases for estimate_tokens."""
+
+    def test_latin_text(self):
+        """Test that Latin text counts about four characters per token."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd" * 100) == 100
+        assert estimate_tokens("é" * 400) == 100
+
+    def test_denser_scripts(self):
+        """Test that scripts with fewer characters per token are not underestimated."""
+        english = estimate_tokens("a" * 120)
+        russian = estimate_tokens("д" * 120)
+        chinese = estimate_tokens("字" * 120)
+
+        assert english < russian < chinese
+        assert chinese == 100
+
+    def test_mixed_scripts_add_up(self):
+        """Test that each character is weighted by its own script."""
+        assert estimate_tokens("abcd" * 10 + "字" * 12) == 20
+
+
+@pytest.mark.unit
+class TestSplitByTokens:
+    """Test cases for split_by_tokens."""
+
+    def test_chunks_fit_budget_and_keep_text(self):
+        """Test that every chunk fits the budget and no word is lost."""
+        text = " ".join(f"Sentence number {n} has a few words." for n in range(300))
+
+        chunks = split_by_tokens(text, 200)
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 200 for chunk in chunks)
+        assert " ".join(chunks) == text
+
+    def test_packs_budget_tightly(self):
+        """Test that chunks are filled up to the budget rather than a word count."""
+        text = "abc. " * 4000
+
+        chunks = split_by_tokens(text, 1000)
+
+        assert [estimate_tokens(chunk) for chunk in chunks] == [1000] * 5
+
+    def test_prefers_sentence_boundaries(self):
+        """Test that chunks end with whole sentences when they fit."""
+        text = "First sentence is here. Second one follows it. Third closes the text!"
+
+        chunks = split_by_tokens(text, 13)
+
+        assert chunks == ["First sentence is here. Second one follows it.", "Third closes the text!"]
+
+    def test_unpunctuated_text_split_between_words(self):
+        """Test that a sentence longer than the budget is broken between words."""
+        text = " ".join(f"w{n:03d}" for n in range(300))
+
+        chunks = split_by_tokens(text, 150)
+
+        assert [len(chunk.split()) for chunk in chunks] == [120, 120, 60]
+        assert " ".join(chunks) == text
+
+    def test_unspaced_text_split_between_characters(self):
+        """Test that text without spaces or punctuation is still split."""
+        chunks = split_by_tokens("字" * 30, 10)
+
+        assert chunks == ["字" * 12, "字" * 12, "字" * 6]
+
+    def test_cjk_sentence_boundaries(self):
+        """Test that CJK full stops end sentences without following whitespace."""
+        chunks = split_by_tokens("你好世界。" * 4, 10)
+
+        assert chunks == ["你好世界。你好世界。", "你好世界。你好世界。"]
+
+    def test_short_last_chunk_evened_out(self):
+        """Test that sentences move into a short last chunk up to the minimum."""
+        text = "abc. " * 440
+
+        chunks = split_by_tokens(text, 500, min_tokens=100)
+        sizes = [estimate_tokens(chunk) for chunk in chunks]
+
+        assert sizes[-1] >= 100
+        assert all(size <= 500 for size in sizes)
+        assert " ".join(chunks) == text.strip()
+
+    def test_invalid_budget(self):
+        """Test that a non-positive budget is rejected."""
+        with pytest.raises(ValueError):
+            split_by_tokens("text", 0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
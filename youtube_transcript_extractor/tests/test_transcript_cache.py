@@ -0,0 +1,120 @@
+"""
+Tests for the transcript_cache module.
+"""
+
+import pytest
+import time
+from pathlib import Path
+from unittest.mock import Mock
+from youtube_transcript_extractor.src.core.transcript_cache import TranscriptCache, CachedTranscript
+
+
+@pytest.mark.unit
+class TestTranscriptCache:
+    """Tests for TranscriptCache class."""
+
+    def test_put_and_get(self, temp_dir):
+        """Test storing and retrieving a transcript."""
+        cache = TranscriptCache(db_path=Path(temp_dir) / "cache.db")
+
+        assert cache.put("abc123", "en", "manual", "Hello world") is True
+        cached = cache.get("abc123")
+
+        assert isinstance(cached, CachedTranscript)
+        assert cached.content == "Hello world"
+        assert cached.language_code == "en"
+        assert cached.kind == "manual"
+        assert cache.hits == 1
+
+    def test_miss(self, temp_dir):
+        """Test lookup of a video that was never cached."""
+        cache = TranscriptCache(db_path=Path(temp_dir) / "cache.db")
+
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+    def test_key_includes_language_and_kind(self, temp_dir):
+        """Test that language and kind are part of the cache key."""
+        cache = TranscriptCache(db_path=Path(temp_dir) / "cache.db")
+
+        cache.put("abc123", "en", "generated", "Auto captions")
+        cache.put("abc123", "en", "manual", "Manual captions")
+        cache.put("abc123", "de", "manual", "Deutsche Untertitel")
+
+        assert cache.get("abc123", languages=["en"]).content == "Manual captions"
+        assert cache.get("abc123", languages=["de"]).content == "Deutsche Untertitel"
+        assert TranscriptCache.make_key("abc123", "en", "manual") != TranscriptCache.make_key("abc123", "en", "generated")
+
+    def test_fallback_language(self, temp_dir):
+        """Test falling back to any cached language."""
+        cache = TranscriptCache(db_path=Path(temp_dir) / "cache.db")
+        cache.put("abc123", "fr", "manual", "Bonjour")
+
+        assert cache.get("abc123", languages=["en"]).content == "Bonjour"
+        assert cache.get("abc123", languages=["en"], allow_fallback=False) is None
+
+    def test_expired_entries_are_ignored(self, temp_dir):
+        """Test that entries older than max age are not returned."""
+        cache = TranscriptCache(db_path=Path(temp_dir) / "cache.db", max_age_days=1)
+        cache.put("abc123", "en", "manual", "Old transcript")
+
+        cache.max_age_seconds = -1  # Everything is now expired
+
+        assert cache.get("abc123") is None
+        assert cache.evict() == 1
+
+    def test_size_eviction_removes_least_recently_used(self, temp_dir):
+        """Test that the cache is trimmed to its size limit."""
+        cache = TranscriptCache(db_path=Path(temp_dir) / "cache.db", max_size_bytes=25)
+
+        cache.put("first", "en", "manual", "a" * 10)
+        time.sleep(0.01)
+        cache.put("second", "en", "manual", "b" * 10)
+        time.sleep(0.01)
+        cache.get("first")  # Touch first so second becomes the LRU entry
+        time.sleep(0.01)
+        cache.put("third", "en", "manual", "c" * 10)
+
+        assert cache.get("second", allow_fallback=False) is None
+        assert cache.get("first") is not None
+        assert cache.get("third") is not None
+
+    def test_eviction_scan_only_when_over_limit(self, temp_dir):
+        """Test that writes below the size limit skip the eviction scan."""
+        cache = TranscriptCache(db_path=Path(temp_dir) / "cache.db", max_size_bytes=25)
+        cache.evict = Mock(wraps=cache.evict)
+
+        cache.put("first", "en", "manual", "a" * 10)
+        cache.put("second", "en", "manual", "b" * 10)
+        cache.evict.assert_not_called()
+
+        cache.put("third", "en", "manual", "c" * 10)
+        cache.evict.assert_called_once()
+        assert cache.get_statistics()["size_bytes"] == 20
+
+    def test_statistics(self, temp_dir):
+        """Test cache statistics."""
+        cache = TranscriptCache(db_path=Path(temp_dir) / "cache.db")
+        cache.put("abc123", "en", "manual", "Hello")
+        cache.get("abc123")
+        cache.get("missing")
+
+        stats = cache.get_statistics()
+
+        assert stats["entries"] == 1
+        assert stats["size_bytes"] == 5
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 50.0
+
+    def test_clear(self, temp_dir):
+        """Test clearing the cache."""
+        cache = TranscriptCache(db_path=Path(temp_dir) / "cache.db")
+        cache.put("abc123", "en", "manual", "Hello")
+        cache.clear()
+
+        assert cache.get("abc123") is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -5,7 +5,9 @@ Tests for the transcript_fetcher module.
 import pytest
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 import asyncio
+from pathlib import Path
 from youtube_transcript_extractor.src.core.transcript_fetcher import TranscriptFetcher
+from youtube_transcript_extractor.src.core.transcript_cache import TranscriptCache
 from youtube_transcript_extractor.src.core.models import TranscriptVideo, ProcessingConfig, ProcessingMode, RefinementStyle
 
 
@@ -231,7 +233,91 @@ class TestTranscriptFetcher:
         formatted = self.fetcher._format_transcript_content(transcript_data, preserve_timestamps=True)
         assert "0:00" in formatted or "Hello" in formatted
         assert "world" in formatted
+    
+    @patch('youtube_transcript_extractor.src.core.transcript_fetcher.time.sleep')
+    @patch('youtube_transcript_extractor.src.core.transcript_fetcher.YouTubeTranscriptApi')
+    def test_fetch_from_youtube_uses_cache(self, mock_api_class, mock_sleep, temp_dir):
+        """Test that cached transcripts skip the network entirely."""
+        cache = TranscriptCache(db_path=Path(temp_dir) / "cache.db")
+        cache.put("cached1", "en", "manual", "Cached transcript")
+        fetcher = TranscriptFetcher(self.config, cache=cache)
+        output_file = str(Path(temp_dir) / "out.txt")
+        
+        result = fetcher.fetch_from_youtube("https://www.youtube.com/watch?v=cached1", output_file)
+        
+        assert result.success is True
+        assert result.videos_processed == 1
+        mock_api_class.return_value.list.assert_not_called()
+        assert "Cached transcript" in Path(output_file).read_text(encoding='utf-8')
+    
+    def test_extract_single_video_populates_cache(self, temp_dir):
+        """Test that a fetched transcript is written to the cache."""
+        cache = TranscriptCache(db_path=Path(temp_dir) / "cache.db")
+        fetcher = TranscriptFetcher(self.config, cache=cache)
+        
+        transcript_object = Mock(language_code="en", is_generated=True)
+        transcript_object.fetch.return_value = [Mock(text="Hello"), Mock(text="world")]
+        ytt_api = Mock()
+        ytt_api.list.return_value.find_transcript.return_value = transcript_object
+        
+        result = fetcher._extract_single_video_transcript(
+            "https://www.youtube.com/watch?v=fresh1", 1, 1, ytt_api
+        )
+        
+        assert result.success is True
+        cached = cache.get("fresh1")
+        assert cached is not None
+        assert cached.content == "Hello world"
+        assert cached.kind == "generated"
+
+    @patch('youtube_transcript_extractor.src.core.transcript_fetcher.time.sleep')
+    @patch('youtube_transcript_extractor.src.core.transcript_fetcher.Playlist')
+    @patch('youtube_transcript_extractor.src.core.transcript_fetcher.YouTubeTranscriptApi')
+    def test_fetch_from_youtube_paces_with_pacer(self, mock_api_class, mock_playlist_class, mock_sleep, temp_dir):
+        """Test that sequential fetching is paced by the pacer, not fixed sleeps."""
+        mock_playlist = Mock()
+        mock_playlist.video_urls = [f"https://www.youtube.com/watch?v=vid{i}" for i in range(3)]
+        mock_playlist.title = "Paced"
+        mock_playlist_class.return_value = mock_playlist
+
+        transcript_object = Mock(language_code="en", is_generated=False)
+        transcript_object.fetch.return_value = [Mock(text="Hello")]
+        mock_api_class.return_value.list.return_value.find_transcript.return_value = transcript_object
+
+        pacer = Mock()
+        fetcher = TranscriptFetcher(self.config, pacer=pacer)
+        output_file = str(Path(temp_dir) / "out.txt")
+
+        handed_over = []
+        result = fetcher.fetch_from_youtube(
+            "https://www.youtube.com/playlist?list=paced", output_file,
+            video_callback=lambda url, content: handed_over.append(url)
+        )
+
+        assert result.videos_processed == 3
+        assert pacer.wait.call_count == 3
+        mock_sleep.assert_not_called()
+        assert handed_over == mock_playlist.video_urls
+
+
+    @patch('youtube_transcript_extractor.src.core.transcript_fetcher.Playlist')
+    @patch('youtube_transcript_extractor.src.core.transcript_fetcher.YouTubeTranscriptApi')
+    def test_fetch_from_youtube_shares_retry_budget(self, mock_api_class, mock_playlist_class, temp_dir):
+        """Test that retries across a playlist are capped by one retry budget."""
+        mock_playlist = Mock()
+        mock_playlist.video_urls = [f"https://www.youtube.com/watch?v=vid{i}" for i in range(20)]
+        mock_playlist.title = "Failing"
+        mock_playlist_class.return_value = mock_playlist
+        mock_api_class.return_value.list.side_effect = ConnectionError("Connection reset")
+
+        fetcher = TranscriptFetcher(self.config, pacer=Mock())
+        result = fetcher.fetch_from_youtube(
+            "https://www.youtube.com/playlist?list=failing", str(Path(temp_dir) / "out.txt")
+        )
 
+        assert result.videos_processed == 0
+        # 20 first attempts plus the budget's 10 + 20% retries, not 2 retries per video
+        assert mock_api_class.return_value.list.call_count == 20 + 14
 
 @pytest.mark.integration
 class TestTranscriptFetcherIntegration: